@@ -0,0 +1,80 @@
+import random
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from OfferListings.request_stats import request_stats, template_timer, install_template_timer
+
+
+class RequestStatsMiddleware(object):
+    """
+    Records the statistics of a sample of the requests (REQUEST_STATS_SAMPLE_RATE) per url name, see
+    ``OfferListings.request_stats``.
+
+    The queries are counted with the debug cursor of the connection, which is only turned on for the sampled requests.
+    The cache hits and misses are the change of the counters of the cache during the request, these are counted per
+    process, so with threaded workers they include the cache use of the requests served at the same time.
+    """
+    def __init__(self):
+        install_template_timer()
+
+    def process_request(self, request):
+        if not settings.REQUEST_STATS_ENABLED or random.random() >= settings.REQUEST_STATS_SAMPLE_RATE:
+            return
+
+        request._stats = {
+            "start": time.time(),
+            "use_debug_cursor": connection.use_debug_cursor,
+            "queries": len(connection.queries),
+            "cache": self.get_cache_counters(),
+        }
+        connection.use_debug_cursor = True
+        template_timer.start()
+
+    def process_response(self, request, response):
+        stats = getattr(request, '_stats', None)
+        if stats is None:
+            return response
+        del request._stats
+
+        template_time = template_timer.stop()
+        queries = connection.queries[stats["queries"]:]
+        connection.use_debug_cursor = stats["use_debug_cursor"]
+        hits, misses = [after - before for before, after in zip(stats["cache"], self.get_cache_counters())]
+
+        request_stats.record(
+            self.get_view_name(request),
+            wall_time=round((time.time() - stats["start"]) * 1000, 3),
+            queries=len(queries),
+            sql_time=round(sum(float(query["time"]) for query in queries) * 1000, 3),
+            template_time=round(template_time, 3),
+            cache_hits=hits,
+            cache_misses=misses,
+            result_size=self.get_result_size(request),
+        )
+        request_stats.flush()
+        return response
+
+    def get_view_name(self, request):
+        """
+        The url name of the view, the api urls are told apart by their resource
+        """
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            return 'unresolved'
+        name = match.view_name or match.func.__module__ + '.' + getattr(match.func, '__name__', 'view')
+        if 'resource_name' in match.kwargs:
+            name += ':' + match.kwargs['resource_name']
+        return name
+
+    def get_result_size(self, request):
+        """
+        The number of objects the view shows, when it sets ``request.result_size``
+        """
+        return getattr(request, 'result_size', None)
+
+    def get_cache_counters(self):
+        if not hasattr(cache, 'get_stats'):
+            return 0, 0
+        stats = cache.get_stats()
+        return stats["hits"], stats["misses"]
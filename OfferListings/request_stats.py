@@ -0,0 +1,318 @@
+"""
+Statistics of the requests the site serves, per url name.
+
+For a sample of the requests ``RequestStatsMiddleware`` records the wall time, the number of queries and their time,
+the template render time, the cache hits and misses and, for the views that set ``request.result_size``, the number
+of objects they show. Every process keeps the last REQUEST_STATS_WINDOW samples of every url name in memory and
+regularly stores a summary of them in the shared cache, so the staff endpoint and the ``request_stats`` command can
+show the numbers of all processes.
+
+A view whose query count grows with the size of its result probably queries once per object, it is flagged when the
+two are strongly correlated over the window. Only the views that set ``request.result_size`` are checked; the pages
+served from the page cache run no view, so they have no result size either.
+"""
+import socket
+import os
+import threading
+import time
+from collections import deque
+from django.conf import settings
+from django.core.cache import get_cache
+from django.template.base import Template
+from django.utils import timezone
+
+# The upper bounds of the wall time histogram buckets in milliseconds, slower requests go in a last bucket
+WALL_TIME_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+SAMPLE_FIELDS = ('wall_time', 'queries', 'sql_time', 'template_time', 'cache_hits', 'cache_misses', 'result_size')
+
+PROCESSES_CACHE_KEY = 'request-stats-processes'
+
+# A view is flagged when its query count varies by at least this much and correlates this strongly with the result size
+QUERY_GROWTH_MIN_RANGE = 3
+QUERY_GROWTH_MIN_CORRELATION = 0.8
+
+
+def get_stats_cache():
+    return get_cache(settings.REQUEST_STATS_CACHE)
+
+
+def percentile(values, fraction):
+    """
+    The value below which the fraction of the values falls, interpolated between the two nearest values
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    position = (len(values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def correlation(xs, ys):
+    """
+    The Pearson correlation of two lists of numbers, None when either doesn't vary
+    """
+    count = len(xs)
+    if count < 2:
+        return None
+    mean_x = sum(xs) / float(count)
+    mean_y = sum(ys) / float(count)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    variance_x = sum((x - mean_x) ** 2 for x in xs)
+    variance_y = sum((y - mean_y) ** 2 for y in ys)
+    if not variance_x or not variance_y:
+        return None
+    return covariance / (variance_x * variance_y) ** 0.5
+
+
+def get_bucket(wall_time):
+    for index, bound in enumerate(WALL_TIME_BUCKETS):
+        if wall_time <= bound:
+            return index
+    return len(WALL_TIME_BUCKETS)
+
+
+class ViewStats(object):
+    """
+    The samples of one url name
+    """
+    def __init__(self, window):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.histogram = [0] * (len(WALL_TIME_BUCKETS) + 1)
+
+    def add(self, sample):
+        # Only the views that set ``request.result_size`` have a result size
+        self.samples.append(tuple(
+            sample.get(field) if field == 'result_size' else sample.get(field) or 0 for field in SAMPLE_FIELDS
+        ))
+        self.count += 1
+        self.histogram[get_bucket(sample.get('wall_time') or 0)] += 1
+
+    def query_growth(self):
+        """
+        How the query count follows the result size over the samples that have one
+        """
+        samples = [sample for sample in self.samples if sample[6] is not None]
+        queries = [sample[1] for sample in samples]
+        sizes = [sample[6] for sample in samples]
+        growth = correlation(sizes, queries)
+        return {
+            "correlation": round(growth, 3) if growth is not None else None,
+            "suspect": bool(
+                growth is not None and growth >= QUERY_GROWTH_MIN_CORRELATION and
+                max(queries) - min(queries) >= QUERY_GROWTH_MIN_RANGE
+            ),
+        }
+
+    def summary(self):
+        fields = {}
+        for index, field in enumerate(SAMPLE_FIELDS):
+            values = [sample[index] for sample in self.samples if sample[index] is not None]
+            fields[field] = {
+                "samples": len(values),
+                "mean": round(sum(values) / float(len(values)), 3) if values else None,
+                "p50": percentile(values, 0.5),
+                "p95": percentile(values, 0.95),
+                "max": max(values) if values else None,
+            }
+        return {
+            "count": self.count,
+            "window": len(self.samples),
+            "histogram": list(self.histogram),
+            "fields": fields,
+            "query_growth": self.query_growth(),
+        }
+
+
+class RequestStats(object):
+    """
+    The samples of all url names of this process
+    """
+    def __init__(self, window=None):
+        self._window = window
+        self._lock = threading.Lock()
+        self.process = '{0}:{1}'.format(socket.gethostname(), os.getpid())
+        self.reset()
+
+    @property
+    def window(self):
+        return self._window if self._window is not None else settings.REQUEST_STATS_WINDOW
+
+    def reset(self):
+        with self._lock:
+            self.views = {}
+            self.started_at = timezone.now()
+            self.last_flush = time.time()
+
+    def record(self, view_name, **sample):
+        with self._lock:
+            if view_name not in self.views:
+                self.views[view_name] = ViewStats(self.window)
+            self.views[view_name].add(sample)
+
+    def summary(self):
+        with self._lock:
+            views = dict((name, stats.summary()) for name, stats in self.views.items())
+        return {
+            "process": self.process,
+            "since": self.started_at.isoformat(),
+            "views": views,
+        }
+
+    def flush(self, force=False):
+        """
+        Stores the summary of this process in the shared cache, at most every REQUEST_STATS_FLUSH_INTERVAL seconds
+        unless forced
+        """
+        if not force and time.time() - self.last_flush < settings.REQUEST_STATS_FLUSH_INTERVAL:
+            return
+        self.last_flush = time.time()
+
+        stats_cache = get_stats_cache()
+        timeout = settings.REQUEST_STATS_CACHE_TIMEOUT
+        processes = stats_cache.get(PROCESSES_CACHE_KEY) or []
+        if self.process not in processes:
+            stats_cache.set(PROCESSES_CACHE_KEY, processes + [self.process], timeout)
+        stats_cache.set(get_process_cache_key(self.process), self.summary(), timeout)
+
+
+def get_process_cache_key(process):
+    return 'request-stats-{0}'.format(process)
+
+
+def get_process_summaries():
+    """
+    The stored summaries of all processes
+
+    :rtype: list
+    """
+    stats_cache = get_stats_cache()
+    processes = stats_cache.get(PROCESSES_CACHE_KEY) or []
+    summaries = stats_cache.get_many([get_process_cache_key(process) for process in processes])
+    return [summaries[key] for key in sorted(summaries)]
+
+
+def clear_process_summaries():
+    stats_cache = get_stats_cache()
+    processes = stats_cache.get(PROCESSES_CACHE_KEY) or []
+    stats_cache.delete_many([get_process_cache_key(process) for process in processes] + [PROCESSES_CACHE_KEY])
+
+
+def merge_summaries(summaries):
+    """
+    Combines the summaries of several processes per url name. The counts and histograms are added up and the means
+    weighted by the number of samples. The percentiles of the wall time are taken from the combined histogram, as the
+    upper bound of the bucket they fall in, the other fields keep the highest percentiles of the processes.
+
+    :rtype: dict
+    """
+    merged = {}
+    for summary in summaries:
+        for name, view in summary["views"].items():
+            merged.setdefault(name, []).append(view)
+
+    result = {}
+    for name, views in merged.items():
+        window = sum(view["window"] for view in views)
+        histogram = [sum(counts) for counts in zip(*[view["histogram"] for view in views])]
+
+        fields = {}
+        for field in SAMPLE_FIELDS:
+            stats = [(view["fields"][field].get("samples", view["window"]), view["fields"][field]) for view in views
+                     if view["fields"][field]["mean"] is not None]
+            samples = sum(weight for weight, stat in stats)
+            fields[field] = {
+                "samples": samples,
+                "mean": round(sum(weight * stat["mean"] for weight, stat in stats) / float(samples), 3)
+                if stats else None,
+                "p50": max(stat["p50"] for weight, stat in stats) if stats else None,
+                "p95": max(stat["p95"] for weight, stat in stats) if stats else None,
+                "max": max(stat["max"] for weight, stat in stats) if stats else None,
+            }
+        fields["wall_time"]["p50"] = histogram_percentile(histogram, 0.5)
+        fields["wall_time"]["p95"] = histogram_percentile(histogram, 0.95)
+
+        correlations = [view["query_growth"]["correlation"] for view in views
+                        if view["query_growth"]["correlation"] is not None]
+        result[name] = {
+            "count": sum(view["count"] for view in views),
+            "window": window,
+            "histogram": histogram,
+            "fields": fields,
+            "query_growth": {
+                "correlation": max(correlations) if correlations else None,
+                "suspect": any(view["query_growth"]["suspect"] for view in views),
+            },
+        }
+    return result
+
+
+def histogram_percentile(histogram, fraction):
+    """
+    The upper bound of the bucket the fraction of the requests falls in, None for the last bucket
+    """
+    total = sum(histogram)
+    if not total:
+        return None
+    seen = 0
+    for index, count in enumerate(histogram):
+        seen += count
+        if seen >= total * fraction:
+            return WALL_TIME_BUCKETS[index] if index < len(WALL_TIME_BUCKETS) else None
+    return None
+
+
+class TemplateTimer(threading.local):
+    """
+    Adds up the time spent rendering templates in this thread. Only the outermost render is timed, the templates it
+    includes or extends are part of it.
+    """
+    def __init__(self):
+        self.active = False
+        self.depth = 0
+        self.total = 0.0
+
+    def start(self):
+        self.active = True
+        self.depth = 0
+        self.total = 0.0
+
+    def stop(self):
+        self.active = False
+        return self.total * 1000
+
+
+template_timer = TemplateTimer()
+_original_render = None
+
+
+def install_template_timer():
+    """
+    Wraps the rendering of templates with the template timer, once
+    """
+    global _original_render
+    if _original_render is not None:
+        return
+    _original_render = Template.render
+
+    def timed_render(self, context):
+        if not template_timer.active:
+            return _original_render(self, context)
+
+        template_timer.depth += 1
+        start = time.time()
+        try:
+            return _original_render(self, context)
+        finally:
+            template_timer.depth -= 1
+            if not template_timer.depth:
+                template_timer.total += time.time() - start
+
+    Template.render = timed_render
+
+
+# The request statistics of this process
+request_stats = RequestStats()
@@ -26,11 +26,21 @@ DATABASES = {
     }
 }
 
+# The default cache keeps a small in-process LRU in front of the shared cache below. See OfferListings/tiered_cache.py
 CACHES = {
     'default': {
+        'BACKEND': 'OfferListings.tiered_cache.TieredCache',
+        'OPTIONS': {
+            'SHARED': 'shared',
+            'LOCAL_TIMEOUT': 60,  # In seconds
+            'LOCAL_MAX_ENTRIES': 1000,
+            'LOCAL_MAX_SIZE': 16 * 1024 * 1024,  # In bytes
+        },
+    },
+    'shared': {
         'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
         'LOCATION': 'offer_listings_cache',
-    }
+    },
 }
 
 
@@ -46,8 +56,46 @@ CELERYBEAT_SCHEDULE = {
         'task': 'offers.tasks.publish_latest_offer',
         'schedule': PUBLISH_SCHEDULE,
     },
+    'resume-follower-mailings': {
+        'task': 'offers.tasks.resume_follower_mailings',
+        'schedule': crontab(minute='*/10'),
+    },
+    'send-notification-digests': {
+        'task': 'offers.tasks.send_notification_digests',
+        'schedule': crontab(minute='*/15'),
+    },
+    'update-search-index': {
+        'task': 'offers.tasks.update_search_index',
+        'schedule': crontab(minute='*'),
+    },
 }
 
+# Followers of an offer are mailed about new comments in chunks, with at most FOLLOWER_MAIL_RATE mails per second.
+# Mailings that made no progress for FOLLOWER_MAIL_RESUME_AFTER seconds are restarted.
+FOLLOWER_MAIL_CHUNK_SIZE = 100
+FOLLOWER_MAIL_RATE = 10
+FOLLOWER_MAIL_RESUME_AFTER = 60 * 15
+
+# Users who chose digest delivery get their notifications collected for NOTIFICATION_DIGEST_WINDOW seconds after the
+# first one. The digests are sent for NOTIFICATION_DIGEST_BATCH_SIZE users at a time.
+NOTIFICATION_DIGEST_WINDOW = 60 * 60
+NOTIFICATION_DIGEST_BATCH_SIZE = 100
+
+# Anonymous visitors are served cached pages, which are keyed by the version of their content. PAGE_CACHE_TIMEOUT
+# limits how old the relative times on a page get.
+PAGE_CACHE_ENABLED = True
+PAGE_CACHE_TIMEOUT = 60 * 60
+
+# The statistics of REQUEST_STATS_SAMPLE_RATE of the requests are recorded per url name, for the last
+# REQUEST_STATS_WINDOW requests of every url name. Every process stores them in REQUEST_STATS_CACHE at most every
+# REQUEST_STATS_FLUSH_INTERVAL seconds.
+REQUEST_STATS_ENABLED = True
+REQUEST_STATS_SAMPLE_RATE = 0.1
+REQUEST_STATS_WINDOW = 500
+REQUEST_STATS_FLUSH_INTERVAL = 60
+REQUEST_STATS_CACHE = 'shared'
+REQUEST_STATS_CACHE_TIMEOUT = 60 * 60 * 24
+
 # Hosts/domain names that are valid for this site; required if DEBUG is False
 # See https://docs.djangoproject.com/en/1.5/ref/settings/#allowed-hosts
 ALLOWED_HOSTS = []
@@ -119,6 +167,8 @@ TEMPLATE_LOADERS = (
 )
 
 MIDDLEWARE_CLASSES = (
+    # First, so its times include the other middleware
+    'OfferListings.middleware.RequestStatsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -194,7 +244,9 @@ INSTALLED_APPS = (
     'flatpage_extend',
 )
 
-# Haystack settings
+# Haystack settings. The offers can also be searched with SQLite FTS5, with the ENGINE
+# 'offers.sqlite_search.SQLiteSearchEngine' and a PATH to the database file, compare them with the
+# compare_search_backends command.
 HAYSTACK_CONNECTIONS = {
     'default': {
         'ENGINE': 'haystack.backends.whoosh_backend.WhooshEngine',
@@ -202,6 +254,30 @@ HAYSTACK_CONNECTIONS = {
     },
 }
 
+# Changed offers are queued for indexing and indexed by the update_search_index task in batches of
+# SEARCH_INDEX_BATCH_SIZE offers
+HAYSTACK_SIGNAL_PROCESSOR = 'offers.search_queue.QueuedSignalProcessor'
+SEARCH_INDEX_BATCH_SIZE = 100
+
+# Every process keeps the suggestions of the last AUTOCOMPLETE_CACHE_SIZE prefixes for AUTOCOMPLETE_CACHE_TIMEOUT
+# seconds. AUTOCOMPLETE_LIMIT is the default number of offer and provider suggestions.
+AUTOCOMPLETE_LIMIT = 5
+AUTOCOMPLETE_CACHE_SIZE = 1000
+AUTOCOMPLETE_CACHE_TIMEOUT = 60
+
+# The sizes (width, height) the provider logos are shown in. The thumbnails are generated by the
+# generate_logo_thumbnails task when a logo changes, run the generate_logo_thumbnails command after changing them.
+PROVIDER_LOGO_SIZES = {
+    'small': (200, 200),
+    'large': (400, 400),
+}
+# The JPEG and WebP quality of the thumbnails
+PROVIDER_LOGO_QUALITY = 85
+# The task is queued while the new logo is being saved, it waits this often for the logo to be committed, this many
+# seconds every time
+PROVIDER_LOGO_RETRIES = 5
+PROVIDER_LOGO_RETRY_DELAY = 2
+
 SITE_ID = 1
 
 AUTH_PROFILE_MODULE = 'accounts.UserProfile'
@@ -234,6 +310,12 @@ SESSION_SERIALIZER = 'django.contrib.sessions.serializers.JSONSerializer'
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 DEFAULT_FROM_EMAIL = 'test@example.com'
 
+# Every process keeps up to MAIL_POOL_SIZE idle email backend connections open (see offers/mail.py). A connection is
+# closed after MAIL_CONNECTION_MAX_MESSAGES messages or when it was idle for MAIL_CONNECTION_KEEPALIVE seconds.
+MAIL_POOL_SIZE = 2
+MAIL_CONNECTION_MAX_MESSAGES = 100
+MAIL_CONNECTION_KEEPALIVE = 60
+
 SITE_URL = 'example.com'
 SITE_NAME = 'Offer Listings'
 
@@ -19,3 +19,10 @@ DATABASES = {
 if DATABASE_TYPE == 'sqlite':
     DATABASES['default']['ENGINE'] = 'django.db.backends.sqlite3'
     DATABASES['default']['NAME'] = 'database.sqlite'
+
+# Tests that look at the request statistics turn them on, the other tests count their queries without them
+REQUEST_STATS_ENABLED = False
+REQUEST_STATS_SAMPLE_RATE = 1.0
+
+# The page cache outlives the test database, the tests of the page cache turn it on
+PAGE_CACHE_ENABLED = False
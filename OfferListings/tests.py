@@ -0,0 +1,346 @@
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.contrib.auth.models import User
+from django.core.cache import get_cache
+from django.core.management import call_command
+from django.core.urlresolvers import reverse
+from OfferListings.request_stats import request_stats, ViewStats, merge_summaries, clear_process_summaries, percentile
+from StringIO import StringIO
+from offers.models import Offer
+from offers import models as offer_models
+from model_mommy import mommy
+import tempfile
+import shutil
+import json
+import time
+
+
+SHARED_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'tiered-cache-tests',
+    },
+}
+
+
+@override_settings(CACHES=SHARED_CACHES)
+class TieredCacheTests(TestCase):
+    def setUp(self):
+        self.cache = self.make_cache()
+        self.cache.clear()
+
+    def make_cache(self, **options):
+        cache_options = {"SHARED": "shared"}
+        cache_options.update(options)
+        return get_cache('OfferListings.tiered_cache.TieredCache', OPTIONS=cache_options)
+
+    def test_get_and_set(self):
+        """
+        Test that values can be stored and read back
+        """
+        self.cache.set('key', {"value": 1})
+
+        self.assertEqual(self.cache.get('key'), {"value": 1})
+        self.assertEqual(self.cache.get('missing', 'default'), 'default')
+
+    def test_local_hits_do_not_read_the_shared_tier(self):
+        """
+        Test that a value read twice is only read from the shared tier once
+        """
+        self.cache.shared.set('key', 'value', version=self.cache.version)
+
+        self.assertEqual(self.cache.get('key'), 'value')
+        self.assertEqual(self.cache.get('key'), 'value')
+
+        stats = self.cache.get_stats()
+        self.assertEqual(stats["shared_hits"], 1)
+        self.assertEqual(stats["local_hits"], 1)
+        self.assertEqual(stats["misses"], 0)
+
+    def test_values_are_shared_between_workers(self):
+        """
+        Test that a value set by one worker can be read by another worker through the shared tier
+        """
+        other_worker = self.make_cache()
+
+        self.cache.set('key', 'value')
+
+        self.assertEqual(other_worker.get('key'), 'value')
+        self.assertEqual(other_worker.get_stats()["shared_hits"], 1)
+
+    def test_delete_removes_value_from_both_tiers(self):
+        """
+        Test that deleting a key removes it from the local and the shared tier
+        """
+        self.cache.set('key', 'value')
+        self.cache.delete('key')
+
+        self.assertIsNone(self.cache.get('key'))
+        self.assertIsNone(self.cache.shared.get('key', version=self.cache.version))
+        self.assertEqual(self.cache.get_stats()["misses"], 1)
+
+    def test_local_tier_is_bounded_by_entries(self):
+        """
+        Test that the least recently used values are evicted from the local tier when it is full
+        """
+        cache = self.make_cache(LOCAL_MAX_ENTRIES=2)
+
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        self.assertEqual(len(cache.local), 2)
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+        # The evicted value is still available from the shared tier
+        self.assertEqual(cache.get('b'), 2)
+        self.assertEqual(cache.get_stats()["shared_hits"], 1)
+
+    def test_local_tier_is_bounded_by_size(self):
+        """
+        Test that values are evicted from the local tier when it takes up too much memory
+        """
+        cache = self.make_cache(LOCAL_MAX_SIZE=1024)
+
+        cache.set('a', 'x' * 600)
+        cache.set('b', 'x' * 600)
+
+        self.assertEqual(len(cache.local), 1)
+        self.assertLessEqual(cache.local.size, 1024)
+
+    def test_local_values_expire(self):
+        """
+        Test that values in the local tier expire after LOCAL_TIMEOUT seconds
+        """
+        cache = self.make_cache(LOCAL_TIMEOUT=1)
+        cache.set('key', 'value')
+        cache.shared.delete('key', version=cache.version)
+
+        self.assertEqual(cache.get('key'), 'value')
+        time.sleep(1.1)
+        self.assertIsNone(cache.get('key'))
+
+    def test_get_many(self):
+        """
+        Test that get_many reads from both tiers
+        """
+        self.cache.set('a', 1)
+        self.cache.shared.set('b', 2, version=self.cache.version)
+
+        self.assertEqual(self.cache.get_many(['a', 'b', 'c']), {'a': 1, 'b': 2})
+
+        stats = self.cache.get_stats()
+        self.assertEqual(stats["local_hits"], 1)
+        self.assertEqual(stats["shared_hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_versioned_keys(self):
+        """
+        Test that incrementing the version of a key invalidates the old value in both tiers
+        """
+        self.cache.set('key', 'value')
+        self.cache.incr_version('key')
+
+        self.assertIsNone(self.cache.get('key'))
+        self.assertEqual(self.cache.get('key', version=self.cache.version + 1), 'value')
+
+    def test_file_based_shared_tier(self):
+        """
+        Test that a file based cache can be used as the shared tier
+        """
+        directory = tempfile.mkdtemp()
+        try:
+            caches = dict(SHARED_CACHES)
+            caches["file"] = {
+                'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': directory,
+            }
+            with self.settings(CACHES=caches):
+                cache = self.make_cache(SHARED='file')
+                other_worker = self.make_cache(SHARED='file')
+
+                cache.set('key', 'value')
+                self.assertEqual(other_worker.get('key'), 'value')
+        finally:
+            shutil.rmtree(directory)
+
+
+@override_settings(CACHES=SHARED_CACHES)
+class OfferHtmlCacheTests(TestCase):
+    def setUp(self):
+        self.old_cache = offer_models.cache
+        offer_models.cache = get_cache('OfferListings.tiered_cache.TieredCache', OPTIONS={"SHARED": "shared"})
+        self.other_worker = get_cache('OfferListings.tiered_cache.TieredCache', OPTIONS={"SHARED": "shared"})
+
+    def tearDown(self):
+        offer_models.cache = self.old_cache
+
+    def test_saving_offer_invalidates_html_in_every_worker(self):
+        """
+        Test that saving an offer changes its cache key, so other workers never serve the old content
+        """
+        offer = mommy.make(Offer, content='Old content')
+        Offer.objects.filter(pk=offer.pk).update(rendered_version='')
+        offer = Offer.objects.get(pk=offer.pk)
+        offer.html_content()
+        old_key = offer.get_cache_key()
+        self.assertIn('Old content', self.other_worker.get(old_key))
+
+        offer.content = 'New content'
+        offer.save()
+
+        self.assertNotEqual(offer.get_cache_key(), old_key)
+        self.assertIsNone(self.other_worker.get(offer.get_cache_key()))
+
+    def test_delete_html_cache_deletes_both_tiers(self):
+        """
+        Test that delete_html_cache removes the content from the local and the shared tier
+        """
+        offer = mommy.make(Offer)
+        offer.delete_html_cache()
+
+        self.assertIsNone(offer_models.cache.get(offer.get_cache_key()))
+        self.assertIsNone(self.other_worker.get(offer.get_cache_key()))
+
+
+@override_settings(CACHES=SHARED_CACHES, REQUEST_STATS_ENABLED=True, REQUEST_STATS_SAMPLE_RATE=1.0)
+class RequestStatsTests(TestCase):
+    def setUp(self):
+        request_stats.reset()
+        clear_process_summaries()
+
+    def tearDown(self):
+        request_stats.reset()
+        clear_process_summaries()
+
+    def test_middleware_records_requests_per_url_name(self):
+        """
+        Test that the queries, template time and wall time of a request are recorded under its url name
+        """
+        mommy.make(Offer, status=Offer.PUBLISHED, is_request=False)
+        self.client.get(reverse('home'))
+        self.client.get(reverse('home'))
+
+        view = request_stats.summary()["views"]["home"]
+        self.assertEqual(view["count"], 2)
+        self.assertGreater(view["fields"]["queries"]["max"], 0)
+        self.assertGreater(view["fields"]["template_time"]["max"], 0)
+        self.assertGreaterEqual(view["fields"]["wall_time"]["max"], view["fields"]["template_time"]["max"])
+        self.assertEqual(sum(view["histogram"]), 2)
+
+    def test_views_record_their_result_size(self):
+        """
+        Test that the result size is the number of objects a view shows and that the other views have none
+        """
+        mommy.make(Offer, status=Offer.PUBLISHED, is_request=False, _quantity=3)
+        self.client.get(reverse('home'))
+        self.client.get(reverse('offer:providers'))
+
+        views = request_stats.summary()["views"]
+        self.assertEqual(views["home"]["fields"]["result_size"]["max"], 3)
+        self.assertEqual(views["offer:providers"]["fields"]["result_size"]["samples"], 0)
+        self.assertIsNone(views["offer:providers"]["query_growth"]["correlation"])
+
+    def test_sampling(self):
+        """
+        Test that requests outside the sample are not recorded
+        """
+        with self.settings(REQUEST_STATS_SAMPLE_RATE=0.0):
+            self.client.get(reverse('home'))
+
+        self.assertEqual(request_stats.summary()["views"], {})
+
+    def test_query_growth_is_flagged(self):
+        """
+        Test that a view whose query count follows its result size is flagged and one with a constant count is not
+        """
+        growing = ViewStats(10)
+        constant = ViewStats(10)
+        for size in range(1, 11):
+            growing.add({"queries": 2 + size, "result_size": size})
+            constant.add({"queries": 4, "result_size": size})
+
+        self.assertTrue(growing.summary()["query_growth"]["suspect"])
+        self.assertFalse(constant.summary()["query_growth"]["suspect"])
+
+    def test_percentile(self):
+        """
+        Test that percentiles are interpolated between the nearest values
+        """
+        self.assertEqual(percentile([3, 1, 2], 0.5), 2)
+        self.assertEqual(percentile(range(1, 101), 0.95), 95.05)
+        self.assertIsNone(percentile([], 0.5))
+
+    def test_window_keeps_the_latest_samples(self):
+        """
+        Test that only the latest samples are summarized while all of them are counted
+        """
+        stats = ViewStats(3)
+        for wall_time in [1000, 1000, 1, 2, 3]:
+            stats.add({"wall_time": wall_time})
+
+        summary = stats.summary()
+        self.assertEqual(summary["count"], 5)
+        self.assertEqual(summary["window"], 3)
+        self.assertEqual(summary["fields"]["wall_time"]["max"], 3)
+
+    def test_merge_summaries(self):
+        """
+        Test that the summaries of processes are combined per url name
+        """
+        first, second = ViewStats(10), ViewStats(10)
+        first.add({"wall_time": 4, "queries": 2})
+        second.add({"wall_time": 40, "queries": 4})
+        second.add({"wall_time": 40, "queries": 4})
+
+        merged = merge_summaries([
+            {"process": "a", "views": {"home": first.summary()}},
+            {"process": "b", "views": {"home": second.summary()}},
+        ])["home"]
+        self.assertEqual(merged["count"], 3)
+        self.assertAlmostEqual(merged["fields"]["queries"]["mean"], 10 / 3.0, places=2)
+        self.assertEqual(merged["fields"]["wall_time"]["p50"], 50)
+        self.assertEqual(merged["fields"]["queries"]["max"], 4)
+
+    def test_endpoint_is_staff_only(self):
+        """
+        Test that the statistics endpoint shows the statistics to staff only
+        """
+        User.objects.create_user('user', 'user@example.com', 'password')
+        staff = User.objects.create_user('staff', 'staff@example.com', 'password')
+        staff.is_staff = True
+        staff.save()
+        self.client.get(reverse('home'))
+
+        self.client.login(username='user', password='password')
+        response = self.client.get(reverse('request_stats'))
+        self.assertNotEqual(response['Content-Type'], 'application/json')
+
+        self.client.login(username='staff', password='password')
+        response = self.client.get(reverse('request_stats'))
+        data = json.loads(response.content)
+        self.assertEqual(data["processes"], [request_stats.process])
+        self.assertEqual(data["views"]["home"]["count"], 1)
+
+    def test_command(self):
+        """
+        Test that the command prints the stored statistics and can remove them
+        """
+        self.client.get(reverse('home'))
+        request_stats.flush(force=True)
+
+        output = StringIO()
+        call_command('request_stats', json=True, stdout=output)
+        self.assertEqual(json.loads(output.getvalue())["views"]["home"]["count"], 1)
+
+        output = StringIO()
+        call_command('request_stats', reset=True, stdout=output)
+        self.assertIn('home', output.getvalue())
+
+        output = StringIO()
+        call_command('request_stats', json=True, stdout=output)
+        self.assertEqual(json.loads(output.getvalue())["views"], {})
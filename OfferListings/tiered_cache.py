@@ -0,0 +1,277 @@
+"""
+A two tier cache backend. Every worker process keeps a small, bounded LRU of recently used values in memory in front
+of a shared cache backend (configured as another entry of ``CACHES``). Reads are answered from memory when possible
+and only fall through to the shared backend on a local miss.
+
+Example configuration::
+
+    CACHES = {
+        'default': {
+            'BACKEND': 'OfferListings.tiered_cache.TieredCache',
+            'OPTIONS': {
+                'SHARED': 'shared',
+                'LOCAL_TIMEOUT': 60,
+                'LOCAL_MAX_ENTRIES': 1000,
+                'LOCAL_MAX_SIZE': 16 * 1024 * 1024,
+            },
+        },
+        'shared': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'offer_listings_cache',
+        },
+    }
+
+Values in the local tier live for at most ``LOCAL_TIMEOUT`` seconds, so a value that is deleted by one worker is only
+served by the other workers for that long. Keys that must never be served stale should be versioned instead (see
+``Offer.get_cache_key``).
+"""
+from collections import OrderedDict
+import threading
+import time
+
+try:
+    from django.utils.six.moves import cPickle as pickle
+except ImportError:
+    import pickle
+
+from django.core.cache import get_cache
+from django.core.cache.backends.base import BaseCache, DEFAULT_TIMEOUT
+
+
+class LocalLRU(object):
+    """
+    A thread safe, in memory LRU of pickled values. Entries are evicted when they expire, when there are more than
+    ``max_entries`` entries or when the pickled values take up more than ``max_size`` bytes.
+    """
+    def __init__(self, max_entries, max_size):
+        self.max_entries = max_entries
+        self.max_size = max_size
+
+        self.size = 0
+        self.evictions = 0
+
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Returns the pickled value for the key, or None if the key is missing or has expired.
+        """
+        with self._lock:
+            try:
+                expires, pickled = self._data.pop(key)
+            except KeyError:
+                return None
+
+            if expires is not None and expires <= time.time():
+                self.size -= len(pickled)
+                self.evictions += 1
+                return None
+
+            # Move the key to the most recently used end
+            self._data[key] = (expires, pickled)
+            return pickled
+
+    def set(self, key, pickled, expires):
+        if len(pickled) > self.max_size:
+            self.delete(key)
+            return
+
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.size -= len(old[1])
+
+            self._data[key] = (expires, pickled)
+            self.size += len(pickled)
+
+            while len(self._data) > self.max_entries or self.size > self.max_size:
+                evicted_key, (evicted_expires, evicted_pickled) = self._data.popitem(last=False)
+                self.size -= len(evicted_pickled)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.size -= len(old[1])
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._data)
+
+
+class TieredCache(BaseCache):
+    def __init__(self, location, params):
+        super(TieredCache, self).__init__(params)
+        options = params.get('OPTIONS', {})
+
+        self.shared_alias = options.get('SHARED', 'shared')
+        self.local_timeout = int(options.get('LOCAL_TIMEOUT', 60))
+
+        self.local = LocalLRU(
+            max_entries=int(options.get('LOCAL_MAX_ENTRIES', 1000)),
+            max_size=int(options.get('LOCAL_MAX_SIZE', 16 * 1024 * 1024)),
+        )
+
+        self._shared = None
+        self._stats_lock = threading.Lock()
+        self._stats = {}
+        self.reset_stats()
+
+    @property
+    def shared(self):
+        if self._shared is None:
+            self._shared = get_cache(self.shared_alias)
+        return self._shared
+
+    # Statistics
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._stats = {
+                "local_hits": 0,
+                "shared_hits": 0,
+                "misses": 0,
+                "sets": 0,
+                "deletes": 0,
+            }
+        self.local.evictions = 0
+
+    def _count(self, name, amount=1):
+        with self._stats_lock:
+            self._stats[name] += amount
+
+    def get_stats(self):
+        """
+        Returns the hit, miss and eviction counters of this worker together with the size of the local tier.
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["hits"] = stats["local_hits"] + stats["shared_hits"]
+        stats["evictions"] = self.local.evictions
+        stats["local_entries"] = len(self.local)
+        stats["local_size"] = self.local.size
+        return stats
+
+    # Helpers
+
+    def _version(self, version):
+        if version is None:
+            return self.version
+        return version
+
+    def _local_key(self, key, version):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        return key
+
+    def _local_expiry(self, timeout):
+        if timeout == DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        if timeout is None:
+            timeout = self.local_timeout
+        else:
+            timeout = min(timeout, self.local_timeout)
+        return time.time() + timeout
+
+    def _set_local(self, local_key, value, timeout):
+        try:
+            pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except pickle.PickleError:
+            return
+        self.local.set(local_key, pickled, self._local_expiry(timeout))
+
+    def _get_local(self, local_key):
+        pickled = self.local.get(local_key)
+        if pickled is None:
+            return None, False
+        return pickle.loads(pickled), True
+
+    # Cache API
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        version = self._version(version)
+        added = self.shared.add(key, value, timeout=timeout, version=version)
+        if added:
+            self._count("sets")
+            self._set_local(self._local_key(key, version), value, timeout)
+        return added
+
+    def get(self, key, default=None, version=None):
+        version = self._version(version)
+        local_key = self._local_key(key, version)
+
+        value, found = self._get_local(local_key)
+        if found:
+            self._count("local_hits")
+            return value
+
+        missing = object()
+        value = self.shared.get(key, missing, version=version)
+        if value is missing:
+            self._count("misses")
+            return default
+
+        self._count("shared_hits")
+        self._set_local(local_key, value, DEFAULT_TIMEOUT)
+        return value
+
+    def get_many(self, keys, version=None):
+        version = self._version(version)
+        values = {}
+        shared_keys = []
+
+        for key in keys:
+            value, found = self._get_local(self._local_key(key, version))
+            if found:
+                values[key] = value
+            else:
+                shared_keys.append(key)
+
+        self._count("local_hits", len(values))
+
+        if shared_keys:
+            shared_values = self.shared.get_many(shared_keys, version=version)
+            self._count("shared_hits", len(shared_values))
+            self._count("misses", len(shared_keys) - len(shared_values))
+            for key, value in shared_values.items():
+                self._set_local(self._local_key(key, version), value, DEFAULT_TIMEOUT)
+                values[key] = value
+
+        return values
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        version = self._version(version)
+        self._count("sets")
+        self.shared.set(key, value, timeout=timeout, version=version)
+        self._set_local(self._local_key(key, version), value, timeout)
+
+    def delete(self, key, version=None):
+        version = self._version(version)
+        self._count("deletes")
+        self.local.delete(self._local_key(key, version))
+        self.shared.delete(key, version=version)
+
+    def has_key(self, key, version=None):
+        version = self._version(version)
+        if self.local.get(self._local_key(key, version)) is not None:
+            return True
+        return self.shared.has_key(key, version=version)
+
+    def clear(self):
+        self.local.clear()
+        self.shared.clear()
+
+    def clear_local(self):
+        """
+        Only empties the in memory tier of this worker.
+        """
+        self.local.clear()
+
+    def close(self, **kwargs):
+        self.shared.close(**kwargs)
@@ -2,7 +2,8 @@ from django.conf.urls import patterns, include, url
 from django.contrib import admin
 from django.conf import settings
 
-from offers.api import OfferResource, PlanResource, LocationResource, ProviderResource, DatacenterResource
+from offers.api import OfferResource, PlanResource, LocationResource, ProviderResource, DatacenterResource, \
+    PlanSearchResource
 from tastypie.api import Api
 admin.autodiscover()
 
@@ -10,6 +11,7 @@ main_api = Api(api_name='main')
 main_api.register(ProviderResource())
 main_api.register(OfferResource())
 main_api.register(PlanResource())
+main_api.register(PlanSearchResource())
 main_api.register(LocationResource())
 main_api.register(DatacenterResource())
 
@@ -20,12 +22,15 @@ urlpatterns = patterns('',
     url(r'^offers/', include('offers.urls', namespace='offer')),
     url(r'^find/data/', include(main_api.urls)),
     url(r'^find/$', 'offers.views.plan_finder', name='find_a_plan'),
+    url(r'^find/plans/$', 'offers.views.plan_index_search', name='find_a_plan_search'),
+    url(r'^find/facets/$', 'offers.views.plan_facets', name='find_a_plan_facets'),
     url(r'^helper/', include('template_helpers.urls', namespace='helper')),
 
     url(r'^accounts/', include('accounts.urls')),
     url(r'^captcha/', include('captcha.urls')),
 
     url(r'^grappelli/', include('grappelli.urls')),
+    url(r'^admin/request-stats/$', 'OfferListings.views.request_stats_summary', name='request_stats'),
     url(r'^admin/', include(admin.site.urls)),
 )
 
@@ -0,0 +1,18 @@
+import json
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import HttpResponse
+from OfferListings.request_stats import request_stats, get_process_summaries, merge_summaries
+
+
+@staff_member_required
+def request_stats_summary(request):
+    """
+    The request statistics of all processes combined per url name, and those of the process that serves this request
+    """
+    request_stats.flush(force=True)
+    summaries = get_process_summaries()
+    return HttpResponse(json.dumps({
+        "processes": [summary["process"] for summary in summaries],
+        "views": merge_summaries(summaries),
+        "current_process": request_stats.summary(),
+    }), content_type='application/json')
@@ -4,6 +4,7 @@ from crispy_forms.helper import FormHelper
 from crispy_forms.layout import Submit, Layout, Fieldset
 from captcha.fields import CaptchaField
 from django import forms
+from accounts.models import UserProfile
 
 
 class BetterAuthenticationForm(AuthenticationForm):
@@ -17,6 +18,12 @@ class UserEditForm(forms.Form):
     first_name = forms.CharField(max_length=30)
     last_name = forms.CharField(max_length=30)
     email = forms.EmailField(max_length=75)
+    notification_mode = forms.ChoiceField(
+        choices=UserProfile.NOTIFICATION_CHOICES,
+        required=False,
+        label='Email notifications',
+        help_text='Likes, replies and new comments are mailed right away, or collected in a digest.'
+    )
 
     def __init__(self, *args, **kwargs):
         super(UserEditForm, self).__init__(*args, **kwargs)
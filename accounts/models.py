@@ -5,9 +5,17 @@ from offers.models import Provider
 
 
 class UserProfile(models.Model):
+    IMMEDIATE = 'i'
+    DIGEST = 'd'
+    NOTIFICATION_CHOICES = (
+        (IMMEDIATE, 'Immediately'),
+        (DIGEST, 'In a digest'),
+    )
+
     birthday = models.DateField(blank=True, null=True)
     user = models.OneToOneField(User, related_name='user_profile')
     provider = models.ForeignKey(Provider, blank=True, null=True, related_name="owners")
+    notification_mode = models.CharField(max_length=1, choices=NOTIFICATION_CHOICES, default=IMMEDIATE)
 
     def __unicode__(self):
         return "{0} profile".format(self.user.username)
@@ -15,6 +23,9 @@ class UserProfile(models.Model):
     def is_provider(self):
         return self.provider is not None
 
+    def wants_digest(self):
+        return self.notification_mode == self.DIGEST
+
 
 def create_user_profile(sender, instance, created, **kwargs):
     if created:
@@ -186,6 +186,20 @@ class EditAccountViewTests(TestCase):
 
         self.assertContains(response, 'You account has been successfully updated!')
 
+    def test_form_updates_notification_mode(self):
+        """
+        Test that the user can choose to get their notifications in a digest
+        """
+        data = {
+            "first_name": "Joe",
+            "last_name": "Bill",
+            "email": "test@example.com",
+            "notification_mode": UserProfile.DIGEST,
+        }
+        self.client.post(reverse('edit_account'), data)
+
+        self.assertTrue(User.objects.get(pk=self.user.pk).user_profile.wants_digest())
+
     def test_form_incorrect_does_not_update_user(self):
         """
         Test that posting incorrect form data will not update the user
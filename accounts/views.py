@@ -10,7 +10,7 @@ from crispy_forms.layout import Submit
 from django.contrib.auth import logout as logout_user
 from django.http import HttpResponseRedirect
 from django.core.urlresolvers import reverse
-from offers.models import Comment, Offer
+from offers.models import Comment, CommentThread, Offer
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 
 
@@ -21,7 +21,9 @@ def self_profile(request):
 
 def profile(request, username):
     user = get_object_or_404(User, username=username)
-    comments = user.comment_set.filter(status=Comment.PUBLISHED, offer__status=Offer.PUBLISHED).order_by('-created_at')
+    comments = CommentThread.prepare(
+        user.comment_set.filter(status=Comment.PUBLISHED, offer__status=Offer.PUBLISHED).order_by('-created_at')
+    )
 
     paginator = Paginator(comments, 5)
 
@@ -37,7 +39,7 @@ def profile(request, username):
 
     return render(request, 'accounts/profile.html', {
         "user": user,
-        "comments": comments,
+        "comments": CommentThread.for_page(comments, request.user),
     })
 
 
@@ -50,6 +52,9 @@ def edit_account(request):
             request.user.last_name = form.cleaned_data["last_name"]
             request.user.email = form.cleaned_data["email"]
             request.user.save()
+            if form.cleaned_data["notification_mode"]:
+                request.user.user_profile.notification_mode = form.cleaned_data["notification_mode"]
+                request.user.user_profile.save()
             messages.success(request, 'You account has been successfully updated!')
         else:
             messages.error(request, 'The form had errors. Please correct them and submit again.')
@@ -58,6 +63,7 @@ def edit_account(request):
             "first_name": request.user.first_name,
             "last_name": request.user.last_name,
             "email": request.user.email,
+            "notification_mode": request.user.user_profile.notification_mode,
         })
     return render(request, 'accounts/edit.html', {"form": form})
 
@@ -106,7 +112,7 @@ def deactivate_account(request):
 
 @login_required
 def comment_list(request):
-    comments_list = Comment.visible.filter(commenter=request.user).order_by('-created_at')
+    comments_list = CommentThread.prepare(Comment.visible.filter(commenter=request.user).order_by('-created_at'))
 
     paginator = Paginator(comments_list, 10)
     page = request.GET.get('page')
@@ -119,12 +125,12 @@ def comment_list(request):
         # If page is out of range (e.g. 9999), deliver last page of results.
         comments = paginator.page(paginator.num_pages)
 
-    return render(request, 'accounts/comments.html', {"comments": comments})
+    return render(request, 'accounts/comments.html', {"comments": CommentThread.for_page(comments, request.user)})
 
 
 @login_required
 def followed_list(request):
-    offer_list = Offer.visible_offers.filter(followers=request.user)
+    offer_list = Offer.visible_offers.filter(followers=request.user).select_related('provider', 'summary')
 
     paginator = Paginator(offer_list, 5)
     page = request.GET.get('page')
@@ -1,8 +1,113 @@
 from tastypie.resources import ModelResource
 from tastypie import fields
+from tastypie.paginator import Paginator
+from tastypie.exceptions import BadRequest
 from offers.models import Plan, Offer, Location, Provider, Datacenter
 from tastypie.constants import ALL, ALL_WITH_RELATIONS
-from django.template.loader import render_to_string
+from django.template import Context
+from django.template.loader import render_to_string, get_template
+from django.core.exceptions import ValidationError
+from django.db.models.fields import FieldDoesNotExist
+from django.db.models import Q
+import base64
+import json
+
+
+class CursorPaginator(Paginator):
+    """
+    Paginates by the position of the last object of the previous page instead of an offset, so deep pages are as
+    cheap as the first one and no count query is needed. The results can be ordered by a single field, ties are broken
+    by the primary key.
+    """
+    def get_ordering(self):
+        """
+        :return: The name of the field that is ordered by and whether the order is descending
+        :rtype: tuple
+        """
+        order_by = self.request_data.getlist('order_by') if hasattr(self.request_data, 'getlist') else []
+        if len(order_by) > 1:
+            raise BadRequest("Cursor pagination only supports ordering by a single field.")
+
+        field_name = order_by[0] if order_by else 'pk'
+        descending = field_name.startswith('-')
+        return field_name.lstrip('-'), descending
+
+    def get_field(self, field_name):
+        model = self.objects.model
+        if field_name == 'pk':
+            return model._meta.pk
+        try:
+            return model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            raise BadRequest("Cursor pagination can't order by '%s'." % field_name)
+
+    def encode_cursor(self, obj, field):
+        value = [field.value_to_string(obj), obj.pk]
+        return base64.urlsafe_b64encode(json.dumps(value))
+
+    def decode_cursor(self, cursor, field):
+        try:
+            value, pk = json.loads(base64.urlsafe_b64decode(str(cursor)))
+            return field.to_python(value), int(pk)
+        except (TypeError, ValueError, ValidationError):
+            raise BadRequest("Invalid cursor '%s' provided." % cursor)
+
+    def filter_after_cursor(self, objects, field, descending, value, pk):
+        lookup = 'lt' if descending else 'gt'
+        if field.primary_key:
+            return objects.filter(**{'pk__' + lookup: pk})
+        return objects.filter(
+            Q(**{field.name + '__' + lookup: value}) |
+            Q(**{field.name: value, 'pk__' + lookup: pk})
+        )
+
+    def _generate_cursor_uri(self, limit, cursor):
+        if self.resource_uri is None:
+            return None
+
+        request_params = self.request_data.copy()
+        for key in ('limit', 'offset', 'cursor'):
+            if key in request_params:
+                del request_params[key]
+        request_params.update({'limit': limit, 'cursor': cursor})
+        return '%s?%s' % (self.resource_uri, request_params.urlencode())
+
+    def page(self):
+        limit = self.get_limit()
+        field_name, descending = self.get_ordering()
+        field = self.get_field(field_name)
+
+        prefix = '-' if descending else ''
+        if field.primary_key:
+            objects = self.objects.order_by(prefix + 'pk')
+        else:
+            objects = self.objects.order_by(prefix + field.name, prefix + 'pk')
+
+        cursor = self.request_data.get('cursor')
+        if cursor:
+            value, pk = self.decode_cursor(cursor, field)
+            objects = self.filter_after_cursor(objects, field, descending, value, pk)
+
+        if limit:
+            # Fetch one more object to know if there is a next page
+            objects = list(objects[:limit + 1])
+            has_next = len(objects) > limit
+            objects = objects[:limit]
+        else:
+            objects = list(objects)
+            has_next = False
+
+        next_uri = None
+        if has_next:
+            next_uri = self._generate_cursor_uri(limit, self.encode_cursor(objects[-1], field))
+
+        return {
+            self.collection_name: objects,
+            'meta': {
+                'limit': limit,
+                'next': next_uri,
+            },
+        }
 
 
 class ProviderResource(ModelResource):
@@ -24,7 +129,7 @@ class OfferResource(ModelResource):
         queryset = Offer.objects.filter(status=Offer.PUBLISHED)
         resource_name = 'offer'
 
-        excludes = ["content"]
+        excludes = ["content", "rendered_content", "rendered_version"]
 
         filtering = {
             "name": ALL,
@@ -98,3 +203,61 @@ class PlanResource(ModelResource):
         }
 
         ordering = ['bandwidth', 'disk_space', 'memory', 'ipv4_space', 'ipv6_space', 'cost', 'created_at']
+
+
+class PlanSearchResource(ModelResource):
+    """
+    The plan finder search. A page of plans is loaded with all the relations the listing needs in a constant number of
+    queries and paginated with a cursor. Pass ``html=false`` to only get the structured data.
+    """
+    offer = fields.ForeignKey(OfferResource, 'offer', full=True)
+    locations = fields.ManyToManyField(LocationResource, 'locations', full=True)
+
+    html = fields.CharField(null=True)
+
+    _listing_template = None
+
+    @classmethod
+    def get_listing_template(cls):
+        """
+        The compiled listing template, which is only loaded once
+        """
+        if cls._listing_template is None:
+            cls._listing_template = get_template('offers/plan_find_listing.html')
+        return cls._listing_template
+
+    def wants_html(self, request):
+        return request is None or request.GET.get('html', 'true').lower() not in ('0', 'false', 'no')
+
+    def dehydrate_html(self, bundle):
+        if not self.wants_html(bundle.request):
+            return None
+        return self.get_listing_template().render(Context({"plan": bundle.obj}))
+
+    def dehydrate(self, bundle):
+        if not self.wants_html(bundle.request):
+            del bundle.data['html']
+        return bundle
+
+    def build_filters(self, filters=None):
+        filters = filters.copy() if filters is not None else {}
+        filters.pop('html', None)
+        return super(PlanSearchResource, self).build_filters(filters)
+
+    def get_object_list(self, request):
+        return super(PlanSearchResource, self).get_object_list(request).select_related(
+            'offer__provider'
+        ).prefetch_related('locations__datacenter')
+
+    class Meta:
+        queryset = Plan.objects.filter(
+            is_active=True,
+            offer__status=Offer.PUBLISHED,
+            offer__is_active=True,
+            offer__is_request=False,
+        )
+        resource_name = 'plan_search'
+        allowed_methods = ['get']
+        paginator_class = CursorPaginator
+        filtering = PlanResource.Meta.filtering
+        ordering = PlanResource.Meta.ordering
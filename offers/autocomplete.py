@@ -0,0 +1,119 @@
+"""
+Search as you type suggestions for the search box.
+
+The offers are found through the edge n-gram field of their search documents (``content_auto``) and the providers
+through the edge n-gram of the provider name (``provider_auto``). The suggestions are built from the stored fields of
+the documents, so no offers or providers are loaded. Someone typing requests the same short prefixes over and over,
+so every process keeps the suggestions of the last prefixes in a small LRU cache.
+"""
+from collections import OrderedDict
+import threading
+import time
+from django.conf import settings
+from haystack.query import SearchQuerySet
+from offers.models import Offer
+
+# The edge n-grams of a word are 2 to 15 characters long
+MIN_PREFIX_LENGTH = 2
+MAX_WORD_LENGTH = 15
+MAX_LIMIT = 10
+
+# Several offers of a provider match its name, this many documents per suggestion are scanned for distinct providers
+PROVIDER_SCAN_FACTOR = 10
+
+
+class PrefixCache(object):
+    """
+    A thread safe least recently used cache whose entries expire after a timeout
+    """
+    def __init__(self, size, timeout):
+        self.size = size
+        self.timeout = timeout
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                return None
+            # Moved to the end, the most recently used
+            self._entries[key] = entry
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.time() + self.timeout, value)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+prefix_cache = PrefixCache(settings.AUTOCOMPLETE_CACHE_SIZE, settings.AUTOCOMPLETE_CACHE_TIMEOUT)
+
+
+def normalize_prefix(prefix):
+    """
+    The words of the prefix that can match an edge n-gram, lower cased
+    """
+    words = [word[:MAX_WORD_LENGTH] for word in prefix.lower().split() if len(word) >= MIN_PREFIX_LENGTH]
+    return u' '.join(words)
+
+
+def find_suggestions(prefix, limit):
+    """
+    Searches the offers and providers whose words start with the words of the prefix
+
+    :rtype: dict
+    """
+    documents = SearchQuerySet().models(Offer)
+
+    offers = documents.autocomplete(content_auto=prefix).values('name', 'url', 'provider_name')[:limit]
+
+    providers = []
+    for name, url in documents.autocomplete(provider_auto=prefix).values_list(
+            'provider_name', 'provider_url')[:limit * PROVIDER_SCAN_FACTOR]:
+        if {"name": name, "url": url} not in providers:
+            providers.append({"name": name, "url": url})
+            if len(providers) >= limit:
+                break
+
+    return {
+        "offers": [{
+            "name": offer["name"],
+            "url": offer["url"],
+            "provider": offer["provider_name"],
+        } for offer in offers],
+        "providers": providers,
+    }
+
+
+def get_suggestions(prefix, limit=None):
+    """
+    The offer and provider suggestions for a prefix, answered from the cache of the process when the prefix was
+    requested recently
+
+    :return: The ``offers`` (``name``, ``url`` and ``provider``) and the ``providers`` (``name`` and ``url``)
+    :rtype: dict
+    """
+    prefix = normalize_prefix(prefix)
+    limit = min(limit or settings.AUTOCOMPLETE_LIMIT, MAX_LIMIT)
+    if not prefix:
+        return {"offers": [], "providers": []}
+
+    key = (prefix, limit)
+    suggestions = prefix_cache.get(key)
+    if suggestions is None:
+        suggestions = find_suggestions(prefix, limit)
+        prefix_cache.set(key, suggestions)
+    return suggestions
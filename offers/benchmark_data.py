@@ -0,0 +1,231 @@
+"""
+A synthetic dataset to measure the site against.
+
+The rows are created with ``bulk_create`` in batches, so the large scales fit in memory and none of the save signals
+run: offers are not rendered, summarized, queued or indexed while they are created. ``build_derived_data`` does that
+afterwards in bulk. The dates are spread over the past year, so the orderings on them mean something.
+"""
+import random
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from offers.models import Provider, Offer, Plan, Comment, Like, Location, Datacenter
+
+# Rows that share a date are updated together, so spreading the dates doesn't need an update per row
+DATE_BUCKETS = 100
+
+BATCH_SIZE = 500
+
+# Most locations are in a few countries, like the real ones
+COUNTRIES = ['US'] * 8 + ['NL'] * 4 + ['DE'] * 4 + ['GB'] * 3 + ['FR'] * 2 + ['CA', 'SG', 'JP', 'AU', 'SE', 'RO', 'PL']
+
+SCALES = {
+    "tiny": {
+        "providers": 5, "offers": 50, "plans_per_offer": 3, "comments_per_offer": 4, "likes_per_comment": 1,
+        "followers_per_offer": 2, "users": 20, "datacenters": 4, "locations_per_provider": 2,
+    },
+    "small": {
+        "providers": 50, "offers": 1000, "plans_per_offer": 5, "comments_per_offer": 10, "likes_per_comment": 1,
+        "followers_per_offer": 5, "users": 500, "datacenters": 20, "locations_per_provider": 3,
+    },
+    "medium": {
+        "providers": 200, "offers": 10000, "plans_per_offer": 8, "comments_per_offer": 20, "likes_per_comment": 1,
+        "followers_per_offer": 10, "users": 5000, "datacenters": 50, "locations_per_provider": 4,
+    },
+    "large": {
+        "providers": 1000, "offers": 100000, "plans_per_offer": 10, "comments_per_offer": 25, "likes_per_comment": 1,
+        "followers_per_offer": 10, "users": 50000, "datacenters": 200, "locations_per_provider": 5,
+    },
+}
+
+
+def bulk_create(model, objects, batch_size=BATCH_SIZE):
+    """
+    Creates the objects of a generator in batches, so they are never all in memory
+
+    :return: The number of created objects
+    :rtype: int
+    """
+    count = 0
+    batch = []
+    for obj in objects:
+        batch.append(obj)
+        if len(batch) >= batch_size:
+            model.objects.bulk_create(batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        model.objects.bulk_create(batch)
+        count += len(batch)
+    return count
+
+
+def get_max_pk(model):
+    return model.objects.aggregate(max_pk=Max('pk'))["max_pk"] or 0
+
+
+def spread_dates(queryset, fields, days=365):
+    """
+    Spreads the given date fields of the rows over the past days, the first row gets the oldest date
+    """
+    pks = list(queryset.order_by('pk').values_list('pk', flat=True))
+    now = timezone.now()
+    bucket_size = max(len(pks) // DATE_BUCKETS, 1)
+    for start in range(0, len(pks), bucket_size):
+        moment = now - timedelta(days=days * (1 - float(start) / len(pks)))
+        # A range of primary keys, as a long list of them is more than some databases take
+        queryset.filter(pk__gte=pks[start], pk__lte=pks[min(start + bucket_size, len(pks)) - 1]).update(
+            **dict((field, moment) for field in fields)
+        )
+
+
+def seed(offers=1000, plans_per_offer=5, comments_per_offer=5, random_seed=0, providers=None, users=None,
+         likes_per_comment=0, followers_per_offer=0, datacenters=0, locations_per_provider=0):
+    """
+    Creates providers with their locations, users, offers, their plans (in the locations of their provider), comments,
+    likes and followers. Every call creates new rows, the names are prefixed with a random tag so calls never collide.
+
+    :return: The number of rows created per model
+    :rtype: dict
+    """
+    rng = random.Random(random_seed)
+    tag = 'bench-{0}'.format(uuid.uuid4().hex[:8])
+    providers = providers or max(offers // 20, 1)
+    users = users or max(offers // 10, 1)
+    created = {}
+
+    with transaction.atomic():
+        Provider.objects.bulk_create([Provider(
+            name='{0} provider {1}'.format(tag, i),
+            name_slug='{0}-provider-{1}'.format(tag, i),
+            start_date=date(2005, 1, 1) + timedelta(days=rng.randint(0, 3000)),
+            website='http://provider{0}.example.com'.format(i),
+            tos='http://provider{0}.example.com/tos'.format(i),
+            aup='http://provider{0}.example.com/aup'.format(i),
+        ) for i in range(providers)], batch_size=BATCH_SIZE)
+        provider_pks = list(Provider.objects.filter(name__startswith=tag).values_list('pk', flat=True))
+        created["providers"] = len(provider_pks)
+
+        max_user_pk = get_max_pk(User)
+        created["users"] = bulk_create(User, (User(
+            username='{0}-{1}'.format(tag, i)[:30],
+            email='{0}-{1}@example.com'.format(tag, i),
+            password='!',
+        ) for i in range(users)))
+        user_pks = list(User.objects.filter(pk__gt=max_user_pk).values_list('pk', flat=True))
+
+        locations_by_provider = {}
+        if datacenters and locations_per_provider:
+            Datacenter.objects.bulk_create([Datacenter(
+                name='{0} datacenter {1}'.format(tag, i),
+            ) for i in range(datacenters)], batch_size=BATCH_SIZE)
+            datacenter_pks = list(Datacenter.objects.filter(name__startswith=tag).values_list('pk', flat=True))
+
+            max_location_pk = get_max_pk(Location)
+            created["locations"] = bulk_create(Location, (Location(
+                city='City {0}'.format(i),
+                country=rng.choice(COUNTRIES),
+                datacenter_id=rng.choice(datacenter_pks),
+                provider_id=provider_pk,
+            ) for provider_pk in provider_pks for i in range(locations_per_provider)))
+            for pk, provider_pk in Location.objects.filter(pk__gt=max_location_pk).values_list('pk', 'provider'):
+                locations_by_provider.setdefault(provider_pk, []).append(pk)
+
+        def make_offer(i):
+            is_request = rng.random() < 0.1
+            return Offer(
+                name='{0} offer {1}'.format(tag, i),
+                content='A **benchmark** offer with [a link](http://example.com/{0}).'.format(i),
+                provider_id=rng.choice(provider_pks),
+                status=Offer.UNPUBLISHED if is_request or rng.random() < 0.05 else Offer.PUBLISHED,
+                is_active=rng.random() < 0.85,
+                is_request=is_request,
+                is_ready=is_request and rng.random() < 0.5,
+            )
+
+        max_offer_pk = get_max_pk(Offer)
+        created["offers"] = bulk_create(Offer, (make_offer(i) for i in range(offers)))
+        new_offers = Offer.objects.filter(pk__gt=max_offer_pk)
+        offer_providers = dict(new_offers.values_list('pk', 'provider'))
+        offer_pks = sorted(offer_providers)
+        spread_dates(new_offers, ['published_at', 'created_at', 'readied_at'])
+
+        def make_plan(offer_pk, i):
+            return Plan(
+                offer_id=offer_pk,
+                server_type=rng.choice([Plan.DEDICATED, Plan.KVM, Plan.OPENVZ, Plan.XEN, Plan.VMWARE]),
+                bandwidth=rng.choice([100, 500, 1000, 2000]),
+                disk_space=rng.choice([10, 20, 50, 100]),
+                memory=rng.choice([256, 512, 1024, 2048, 4096]),
+                cpu_cores=rng.randint(1, 8),
+                ipv4_space=rng.randint(1, 4),
+                ipv6_space=rng.randint(0, 64),
+                billing_time=rng.choice([choice for choice, name in Plan.BILLING_CHOICES]),
+                url='http://example.com/order/{0}/{1}'.format(offer_pk, i),
+                cost=Decimal(rng.randint(100, 10000)) / 100,
+                is_active=rng.random() < 0.9,
+            )
+
+        max_plan_pk = get_max_pk(Plan)
+        created["plans"] = bulk_create(Plan, (
+            make_plan(offer_pk, i) for offer_pk in offer_pks for i in range(plans_per_offer)
+        ))
+
+        if locations_by_provider:
+            def make_plan_locations():
+                plans = Plan.objects.filter(pk__gt=max_plan_pk).values_list('pk', 'offer').iterator()
+                for plan_pk, offer_pk in plans:
+                    locations = locations_by_provider.get(offer_providers[offer_pk], [])
+                    for location_pk in rng.sample(locations, min(len(locations), rng.randint(1, 2))):
+                        yield Plan.locations.through(plan_id=plan_pk, location_id=location_pk)
+
+            bulk_create(Plan.locations.through, make_plan_locations())
+
+        max_comment_pk = get_max_pk(Comment)
+        created["comments"] = bulk_create(Comment, (Comment(
+            commenter_id=rng.choice(user_pks),
+            offer_id=offer_pk,
+            content='A benchmark comment',
+            bbcode_content='A benchmark comment',
+            status=Comment.PUBLISHED if rng.random() < 0.95 else Comment.UNPUBLISHED,
+        ) for offer_pk in offer_pks for i in range(comments_per_offer)))
+        spread_dates(Comment.objects.filter(pk__gt=max_comment_pk), ['created_at'])
+
+        if likes_per_comment:
+            def make_likes():
+                comments = Comment.objects.filter(pk__gt=max_comment_pk).values_list('pk', flat=True).iterator()
+                for comment_pk in comments:
+                    likes = min(len(user_pks), rng.randint(0, likes_per_comment * 2))
+                    for user_pk in rng.sample(user_pks, likes):
+                        yield Like(user_id=user_pk, comment_id=comment_pk)
+
+            created["likes"] = bulk_create(Like, make_likes())
+
+        if followers_per_offer:
+            def make_followers():
+                for offer_pk in offer_pks:
+                    for user_pk in rng.sample(user_pks, min(len(user_pks), followers_per_offer)):
+                        yield Offer.followers.through(offer_id=offer_pk, user_id=user_pk)
+
+            created["followers"] = bulk_create(Offer.followers.through, make_followers())
+
+    return created
+
+
+def build_derived_data():
+    """
+    Builds what the save signals would have built for the created rows: the offer summaries, the rendered content,
+    the publish queue and the plan index
+    """
+    from django.core.management import call_command
+    from offers.plan_index import plan_index
+    from StringIO import StringIO
+
+    call_command('rebuild_offer_summaries', stdout=StringIO())
+    call_command('rerender_offers', stdout=StringIO())
+    Offer.rebuild_queue()
+    plan_index.invalidate()
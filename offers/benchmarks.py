@@ -0,0 +1,440 @@
+"""
+A benchmark suite that requests the main pages of the site through the Django test client.
+
+Every scenario requests a list of urls, sampled from the data in the database, and records the latency, the number
+of queries and the memory of the process for every request. A scenario can also be requested by several clients at
+once, like the autocomplete of people typing at the same time. The results can be stored as a baseline and later runs
+compared against it.
+
+The search backends (Whoosh and SQLite FTS5) are compared on their own: the offers are indexed into a temporary index
+of every backend, which is then searched with the same queries.
+"""
+import json
+import os
+import random
+import resource
+import shutil
+import tempfile
+import threading
+import time
+from celery import current_app
+from django.contrib.auth.models import User
+from django.core.urlresolvers import reverse
+from django.conf import settings
+from django.db import connection, connections, reset_queries
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from haystack import connections as search_connections
+from haystack.query import SearchQuerySet
+from OfferListings.request_stats import percentile
+from offers.mail import mail_pool
+from offers.models import Offer, Provider, Comment
+from offers.search_queue import update_offers
+
+BENCHMARK_USERNAME = 'benchmark-user'
+BENCHMARK_PASSWORD = 'benchmark'
+
+# The fields of a result that are compared with the baseline, a higher value is worse for all of them
+COMPARED_FIELDS = ('p50', 'p95', 'queries')
+
+
+def get_memory_usage():
+    """
+    The resident memory of the process in kilobytes
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize() // 1024
+    except (IOError, OSError):
+        # Not on Linux, fall back to the peak memory
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class Scenario(object):
+    """
+    A page to benchmark and the urls to request it with
+
+    :param concurrency: The number of clients that request the urls at the same time, each in its own thread
+    """
+    def __init__(self, name, urls, login=False, concurrency=1):
+        self.name = name
+        self.urls = urls
+        self.login = login
+        self.concurrency = concurrency
+
+
+def get_scenarios(sample_size=20, random_seed=0):
+    """
+    The scenarios of the suite, with urls sampled from the database
+
+    :rtype: list
+    """
+    rng = random.Random(random_seed)
+
+    def sample(values):
+        values = list(values)
+        return rng.sample(values, min(len(values), sample_size))
+
+    offers = sample(Offer.active_offers.values_list('pk', 'name')[:sample_size * 20])
+    providers = sample(Provider.objects.values_list('name_slug', flat=True)[:sample_size * 20])
+    comments = sample(Comment.visible.exclude(commenter__username=BENCHMARK_USERNAME).filter(
+        offer__in=[pk for pk, name in offers]
+    ).values_list('pk', flat=True)[:sample_size * 20])
+
+    return [
+        Scenario('list_offers', [reverse('home')] + [
+            reverse('home_pagination', args=[page]) for page in range(2, sample_size + 1)
+        ]),
+        Scenario('view_offer', [Offer(pk=pk, name=name).get_absolute_url() for pk, name in offers]),
+        Scenario('provider_profile', [reverse('offer:provider', args=[slug]) for slug in providers]),
+        Scenario('plan_api', [
+            '/find/data/main/plan/?format=json&limit=20&offset={0}'.format(offset)
+            for offset in range(0, 20 * sample_size, 20)
+        ]),
+        Scenario('search', [
+            reverse('offer:search') + '?q=' + word for word in sample(['benchmark', 'offer', 'link', 'vps', 'kvm'])
+        ]),
+        Scenario('feeds', [reverse('offer:rss'), reverse('offer:atom')]),
+        # Every keystroke of a word, typed by several people at once
+        Scenario('autocomplete', [
+            reverse('offer:autocomplete') + '?q=' + word[:length]
+            for word in sample(['benchmark', 'offer', 'link', 'vps', 'kvm', 'provider'])
+            for length in range(2, len(word) + 1)
+        ], concurrency=4),
+        Scenario('like_comment', [reverse('offer:like', args=[pk]) for pk in comments], login=True),
+    ]
+
+
+def get_client(login=False):
+    client = Client()
+    if login:
+        user, created = User.objects.get_or_create(username=BENCHMARK_USERNAME)
+        if created or not user.check_password(BENCHMARK_PASSWORD):
+            user.set_password(BENCHMARK_PASSWORD)
+            user.save()
+        client.login(username=BENCHMARK_USERNAME, password=BENCHMARK_PASSWORD)
+    return client
+
+
+def request_urls(client, urls, requests, start=0):
+    """
+    Requests the urls in turn, beginning at the start index
+
+    :return: The latency of every request in milliseconds, the number of queries of every request and the number of
+             failed requests
+    :rtype: tuple
+    """
+    timings = []
+    queries = []
+    errors = 0
+    for i in range(requests):
+        reset_queries()
+        with CaptureQueriesContext(connection) as context:
+            begin = time.time()
+            response = client.get(urls[(start + i) % len(urls)])
+            timings.append((time.time() - begin) * 1000)
+        queries.append(len(context.captured_queries))
+        if response.status_code >= 400:
+            errors += 1
+    return timings, queries, errors
+
+
+def request_concurrently(scenario, requests):
+    """
+    Splits the requests over the clients of the scenario, which each start at another url and run in their own thread
+    """
+    results = []
+    lock = threading.Lock()
+
+    def run_client(index, count):
+        try:
+            result = request_urls(
+                get_client(scenario.login), scenario.urls, count, index * len(scenario.urls) // scenario.concurrency
+            )
+            with lock:
+                results.append(result)
+        finally:
+            # Every thread has its own database connections
+            for thread_connection in connections.all():
+                thread_connection.close()
+
+    threads = [
+        threading.Thread(target=run_client, args=(index, requests // scenario.concurrency +
+                                                  (1 if index < requests % scenario.concurrency else 0)))
+        for index in range(scenario.concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    timings, queries, errors = [], [], 0
+    for client_timings, client_queries, client_errors in results:
+        timings.extend(client_timings)
+        queries.extend(client_queries)
+        errors += client_errors
+    # A client that failed counts all its requests as errors
+    errors += requests - len(timings)
+    return timings, queries, errors
+
+
+def run_scenario(scenario, requests=50, warmup=2):
+    """
+    Requests the urls of a scenario in turn, with one or several clients at once
+
+    :param requests: The number of measured requests
+    :param warmup: The number of requests made before measuring
+    :return: The latency percentiles in milliseconds, the queries per request and the memory in kilobytes
+    :rtype: dict
+    """
+    if not scenario.urls:
+        return None
+
+    client = get_client(scenario.login)
+    for i in range(warmup):
+        client.get(scenario.urls[i % len(scenario.urls)])
+
+    memory_before = get_memory_usage()
+    if scenario.concurrency > 1:
+        timings, queries, errors = request_concurrently(scenario, requests)
+    else:
+        timings, queries, errors = request_urls(client, scenario.urls, requests)
+    memory_after = get_memory_usage()
+
+    if not timings:
+        return None
+
+    return {
+        "requests": requests,
+        "concurrency": scenario.concurrency,
+        "errors": errors,
+        "p50": round(percentile(timings, 0.5), 3),
+        "p95": round(percentile(timings, 0.95), 3),
+        "queries": round(sum(queries) / float(len(queries)), 2),
+        "max_queries": max(queries),
+        "memory": memory_after,
+        "memory_growth": memory_after - memory_before,
+    }
+
+
+def run_suite(scenarios, requests=50, warmup=2):
+    """
+    Runs the scenarios. Mails are kept in memory and tasks run in the process, so liking a comment needs no mail
+    server or broker, but its time includes the notification tasks.
+
+    :return: The results per scenario name
+    :rtype: dict
+    """
+    results = {}
+    always_eager = current_app.conf.CELERY_ALWAYS_EAGER
+    current_app.conf.CELERY_ALWAYS_EAGER = True
+    mail_pool.close_all()
+    try:
+        with override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend'):
+            for scenario in scenarios:
+                result = run_scenario(scenario, requests, warmup)
+                if result is not None:
+                    results[scenario.name] = result
+    finally:
+        current_app.conf.CELERY_ALWAYS_EAGER = always_eager
+        mail_pool.close_all()
+    return results
+
+
+def compare(results, baseline, tolerance=0.2):
+    """
+    Compares results with a baseline
+
+    :param tolerance: The fraction a value may grow before it counts as a regression
+    :return: Per scenario and field the baseline value, the new value, the change as a fraction and whether it
+             regressed
+    :rtype: list
+    """
+    comparison = []
+    for name in sorted(results):
+        if name not in baseline:
+            continue
+        for field in COMPARED_FIELDS:
+            old, new = baseline[name].get(field), results[name].get(field)
+            if old is None or new is None:
+                continue
+            change = (new - old) / float(old) if old else 0.0
+            comparison.append({
+                "scenario": name,
+                "field": field,
+                "baseline": old,
+                "value": new,
+                "change": change,
+                "regressed": change > tolerance,
+            })
+    return comparison
+
+
+# The temporary search connection of every compared backend, in a directory
+SEARCH_BACKENDS = {
+    'whoosh': lambda directory: {
+        'ENGINE': 'haystack.backends.whoosh_backend.WhooshEngine',
+        'PATH': os.path.join(directory, 'whoosh'),
+    },
+    'sqlite': lambda directory: {
+        'ENGINE': 'offers.sqlite_search.SQLiteSearchEngine',
+        'PATH': os.path.join(directory, 'index.sqlite3'),
+    },
+}
+
+
+def get_search_queries(sample_size=20, random_seed=0):
+    """
+    The searches of the comparison, with words and prefixes sampled from the names of the offers. Every search is a
+    function that takes a ``SearchQuerySet`` and returns one the way the site would use it.
+
+    :return: The searches per kind
+    :rtype: dict
+    """
+    rng = random.Random(random_seed)
+    names = Offer.visible_offers.values_list('name', flat=True)[:sample_size * 20]
+    words = sorted(set(word.lower() for name in names for word in name.split() if len(word) >= 3)) or ['offer']
+    words = [rng.choice(words) for i in range(sample_size)]
+    offer_ids = list(Offer.visible_offers.values_list('pk', flat=True)[:sample_size * 5])
+
+    return {
+        "text": [lambda sqs, word=word: sqs.auto_query(word) for word in words],
+        "prefix": [lambda sqs, word=word: sqs.autocomplete(content_auto=word[:3]) for word in words],
+        "filtered": [
+            lambda sqs, word=word, ids=rng.sample(offer_ids, len(offer_ids) // 2): sqs.auto_query(word).filter(
+                django_id__in=ids
+            )
+            for word in words
+        ],
+    }
+
+
+def search_page(sqs):
+    """
+    Reads a page of results and the number of results, like the search page does
+    """
+    list(sqs[:8])
+    return sqs.count()
+
+
+def time_searches(alias, searches, requests):
+    timings = []
+    for i in range(requests):
+        sqs = searches[i % len(searches)](SearchQuerySet().using(alias).models(Offer))
+        start = time.time()
+        search_page(sqs)
+        timings.append((time.time() - start) * 1000)
+    return timings
+
+
+def get_size(path):
+    """
+    The size of a file or a directory in kilobytes
+    """
+    if os.path.isfile(path):
+        return os.path.getsize(path) // 1024
+    size = 0
+    for directory, dirnames, filenames in os.walk(path):
+        size += sum(os.path.getsize(os.path.join(directory, filename)) for filename in filenames)
+    return size // 1024
+
+
+def close_search_backend(alias):
+    """
+    Closes the connection of the current thread to the index, for the backends that keep one
+    """
+    backend = search_connections[alias].get_backend()
+    if hasattr(backend, 'close'):
+        backend.close()
+
+
+def run_search_backend(name, directory, queries, requests=50):
+    """
+    Indexes the visible offers into a new index of the backend and times the searches, also while the offers are
+    indexed again by another thread
+
+    :return: The indexing time in seconds, the size of the index and the latency percentiles per kind of search
+    :rtype: dict
+    """
+    alias = 'benchmark-' + name
+    search_connections.connections_info[alias] = SEARCH_BACKENDS[name](directory)
+    search_connections.reload(alias)
+    try:
+        offer_ids = list(Offer.visible_offers.values_list('pk', flat=True))
+        batches = [
+            offer_ids[start:start + settings.SEARCH_INDEX_BATCH_SIZE]
+            for start in range(0, len(offer_ids), settings.SEARCH_INDEX_BATCH_SIZE)
+        ]
+
+        start = time.time()
+        for batch in batches:
+            update_offers(batch, using=alias)
+        result = {
+            "documents": len(offer_ids),
+            "index_seconds": round(time.time() - start, 3),
+            "size": get_size(search_connections.connections_info[alias]['PATH']),
+        }
+
+        for kind in sorted(queries):
+            timings = time_searches(alias, queries[kind], requests)
+            result[kind] = {"p50": round(percentile(timings, 0.5), 3), "p95": round(percentile(timings, 0.95), 3)}
+
+        # Searches by another thread while the offers are indexed again, batch after batch. The searches do not
+        # touch the database, so they can run outside of the thread (and the test database) that indexes.
+        timings = []
+        errors = []
+
+        def search():
+            try:
+                timings.extend(time_searches(alias, queries["text"], requests))
+            except Exception as e:
+                errors.append(e)
+            finally:
+                close_search_backend(alias)
+
+        reader = threading.Thread(target=search)
+        reader.start()
+        while reader.is_alive():
+            for batch in batches:
+                update_offers(batch, using=alias)
+                if not reader.is_alive():
+                    break
+        reader.join()
+        if errors:
+            raise errors[0]
+        result["text_during_writes"] = {
+            "p50": round(percentile(timings, 0.5), 3), "p95": round(percentile(timings, 0.95), 3)
+        }
+        return result
+    finally:
+        close_search_backend(alias)
+        del search_connections.connections_info[alias]
+        search_connections._connections.pop(alias, None)
+
+
+def compare_search_backends(backends=None, requests=50):
+    """
+    Runs the same searches on a temporary index of every backend
+
+    :return: The results per backend
+    :rtype: dict
+    """
+    queries = get_search_queries()
+    results = {}
+    for name in backends or sorted(SEARCH_BACKENDS):
+        directory = tempfile.mkdtemp()
+        try:
+            results[name] = run_search_backend(name, directory, queries, requests)
+        finally:
+            shutil.rmtree(directory)
+    return results
+
+
+def save_results(results, path):
+    with open(path, 'w') as results_file:
+        json.dump(results, results_file, indent=2, sort_keys=True)
+
+
+def load_results(path):
+    with open(path) as results_file:
+        return json.load(results_file)
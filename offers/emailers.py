@@ -1,8 +1,7 @@
-from django.template.loader import render_to_string
-from django.core.mail import send_mail
-from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
+from offers.mail import mail_pool
+from offers.mail_templates import mail_renderer
 from offers.tasks import (
+    build_mail,
     send_comment_mail,
     send_new_comment_followers_mail,
     send_comment_like,
@@ -11,28 +10,10 @@ from offers.tasks import (
 
 
 def send_simple_mail(subject, message_template, message_plain_template, context, to):
+    message = mail_renderer.render(message_template, context)
+    message_plain = mail_renderer.render(message_plain_template, context)
 
-    if settings.SITE_URL.endswith('/'):
-        site_url = 'http://' + settings.SITE_URL[:-1]
-    else:
-        site_url = 'http://' + settings.SITE_URL
-
-    context.update({"site_url": site_url})
-
-    message = render_to_string(message_template, context)
-    message_plain = render_to_string(message_plain_template, context)
-
-    msg = EmailMultiAlternatives(
-        subject,
-        message_plain,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        to=[to]
-    )
-    msg.attach_alternative(
-        message,
-        "text/html"
-    )
-    msg.send()
+    mail_pool.send([build_mail(subject, message_plain, to, message)])
 
 
 def send_comment_reply(comment):
@@ -1,18 +1,60 @@
-from offers.models import Offer
+from offers.models import Offer, Provider
+from offers.page_cache import (
+    get_cached_response,
+    get_changed,
+    get_last_modified,
+    OFFERS_CHANGED_CACHE_KEY,
+    PROVIDERS_CHANGED_CACHE_KEY,
+)
 from django.contrib.syndication.views import Feed
+from django.core.exceptions import ObjectDoesNotExist
 from django.core.urlresolvers import reverse
 from django.conf import settings
+from django.http import Http404
 from django.utils.feedgenerator import Atom1Feed
 
 
 class OfferFeed(Feed):
+    """
+    The latest offers. Feed readers poll the feeds all the time, so the feed is only rendered again after an offer or
+    a provider changed (see ``offers.page_cache``), and answered with ``304 Not Modified`` when the reader has the
+    current version already.
+    """
     title = settings.SITE_NAME + ' offers'
     description = 'A recent list of offers on ' + settings.SITE_NAME
     description_template = 'offers/generic/offer_release.html'
     item_guid_is_permalink = True
 
-    def items(self):
-        return Offer.visible_offers.all()[:10]
+    def __call__(self, request, *args, **kwargs):
+        if not settings.PAGE_CACHE_ENABLED:
+            return super(OfferFeed, self).__call__(request, *args, **kwargs)
+
+        try:
+            obj = self.get_object(request, *args, **kwargs)
+        except ObjectDoesNotExist:
+            raise Http404('Feed object does not exist.')
+
+        # The links of the feed are absolute, so they differ per scheme
+        cache_key = 'feed-{0}-{1}-{2}'.format(
+            self.__class__.__name__, obj.pk if obj is not None else 'all', 'https' if request.is_secure() else 'http'
+        )
+        return get_cached_response(
+            request, cache_key, self.get_version(obj),
+            lambda: super(OfferFeed, self).__call__(request, *args, **kwargs)
+        )
+
+    def get_offers(self, obj):
+        return Offer.visible_offers.all()
+
+    def get_version(self, obj):
+        """
+        The version of the feed, the dates the offers (with their summaries) and the providers last changed
+        """
+        parts = get_changed(OFFERS_CHANGED_CACHE_KEY, PROVIDERS_CHANGED_CACHE_KEY)
+        return parts, get_last_modified(parts)
+
+    def items(self, obj):
+        return self.get_offers(obj).select_related('provider', 'summary')[:10]
 
     def link(self):
         return reverse('home')
@@ -27,3 +69,37 @@ class OfferFeed(Feed):
 class OfferAtomFeed(OfferFeed):
     feed_type = Atom1Feed
     subtitle = OfferFeed.description
+
+
+class ProviderOfferFeed(OfferFeed):
+    """
+    The latest offers of a provider
+    """
+    def get_object(self, request, provider_name):
+        return Provider.objects.get(name_slug=provider_name)
+
+    def get_offers(self, obj):
+        return Offer.visible_offers.for_provider(obj)
+
+    def get_version(self, obj):
+        """
+        The version of the feed, the update of the provider and the date the offers last changed
+        """
+        parts = [obj.updated_at] + get_changed(OFFERS_CHANGED_CACHE_KEY)
+        return parts, get_last_modified(parts)
+
+    def title(self, obj):
+        return u'{0} offers on {1}'.format(obj.name, settings.SITE_NAME)
+
+    def description(self, obj):
+        return u'A recent list of offers of {0} on {1}'.format(obj.name, settings.SITE_NAME)
+
+    def link(self, obj):
+        return obj.get_absolute_url()
+
+
+class ProviderOfferAtomFeed(ProviderOfferFeed):
+    feed_type = Atom1Feed
+
+    def subtitle(self, obj):
+        return self.description(obj)
@@ -7,6 +7,9 @@ from crispy_forms.helper import FormHelper
 from crispy_forms.layout import Submit, Layout, Div, Fieldset, HTML
 from crispy_forms.bootstrap import AppendedText, PrependedAppendedText, StrictButton, FieldWithButtons
 from haystack.forms import SearchForm
+from haystack.query import EmptySearchQuerySet
+from django_countries import countries as COUNTRIES
+from offers.plan_index import PlanQuery, get_offer_search
 
 
 class ProviderForm(forms.ModelForm):
@@ -199,13 +202,106 @@ class TestDownloadFormset(TestDownloadFormsetBase):
             form.fields["size"].label = 'Size (MB)'
 
 
+class OfferSearchResults(object):
+    """
+    The offers found by the offer search as a sequence of search results, only the documents of the sliced offers
+    (the page that is shown) are read from the index
+    """
+    def __init__(self, searchqueryset, offer_ids):
+        self.searchqueryset = searchqueryset
+        self.offer_ids = offer_ids
+        self._results = {}
+
+    def __len__(self):
+        return len(self.offer_ids)
+
+    def count(self):
+        return len(self.offer_ids)
+
+    def __getitem__(self, key):
+        if not isinstance(key, slice):
+            return self[key:key + 1 or None][0]
+
+        offer_ids = tuple(self.offer_ids[key])
+        if offer_ids not in self._results:
+            documents = {}
+            if offer_ids:
+                found = self.searchqueryset.filter(django_id__in=offer_ids)
+                documents = dict((int(result.pk), result) for result in found[:len(offer_ids)])
+            self._results[offer_ids] = [documents[pk] for pk in offer_ids if pk in documents]
+        return self._results[offer_ids]
+
+
 class OfferSearchForm(SearchForm):
+    """
+    The offer search. Besides the text it filters on the plans of the offers with the same parameters as the plan
+    finder, which are answered by the plan index, and it counts the found offers per country and server type.
+    """
+    # The plan finder parameters the form filters on
+    FILTER_FIELDS = ('cost__gte', 'cost__lte', 'memory__gte', 'memory__lte', 'locations__country', 'server_type')
+
+    cost__gte = forms.DecimalField(required=False, min_value=0)
+    cost__lte = forms.DecimalField(required=False, min_value=0)
+    memory__gte = forms.IntegerField(required=False, min_value=0)
+    memory__lte = forms.IntegerField(required=False, min_value=0)
+    locations__country = forms.ChoiceField(required=False, choices=[('', 'Any country')] + list(COUNTRIES))
+    server_type = forms.ChoiceField(required=False, choices=(('', 'Any server type'),) + Plan.SERVER_CHOICES)
+
     def __init__(self, *args, **kwargs):
         super(OfferSearchForm, self).__init__(*args, **kwargs)
+        self.facets = {}
+
+        self.fields["cost__gte"].widget.attrs["placeholder"] = 'Minimum cost'
+        self.fields["cost__lte"].widget.attrs["placeholder"] = 'Maximum cost'
+        self.fields["memory__gte"].widget.attrs["placeholder"] = 'Minimum memory (MB)'
+        self.fields["memory__lte"].widget.attrs["placeholder"] = 'Maximum memory (MB)'
 
         self.helper = FormHelper()
         self.helper.layout = Layout(
             FieldWithButtons('q', Submit("search", "Search!")),
+            Div(
+                Div('cost__gte', css_class='col-sm-2'),
+                Div('cost__lte', css_class='col-sm-2'),
+                Div('memory__gte', css_class='col-sm-2'),
+                Div('memory__lte', css_class='col-sm-2'),
+                Div('locations__country', css_class='col-sm-2'),
+                Div('server_type', css_class='col-sm-2'),
+                css_class='row'
+            ),
         )
         self.helper.form_method = "GET"
         self.helper.form_show_labels = False
+
+    def has_filters(self):
+        return self.is_valid() and any(
+            self.cleaned_data.get(field) not in (None, '') for field in self.FILTER_FIELDS
+        )
+
+    def get_plan_query(self):
+        """
+        The plan finder query of the filters, or None when the form is invalid
+
+        :rtype: PlanQuery
+        """
+        if not self.is_valid():
+            return None
+        params = dict(
+            (field, unicode(self.cleaned_data[field])) for field in self.FILTER_FIELDS
+            if self.cleaned_data.get(field) not in (None, '')
+        )
+        return PlanQuery.from_params(params)
+
+    def no_query_found(self):
+        # Filtering alone searches every offer
+        if self.has_filters():
+            return self.searchqueryset.all()
+        return super(OfferSearchForm, self).no_query_found()
+
+    def search(self):
+        sqs = super(OfferSearchForm, self).search()
+        query = self.get_plan_query()
+        if query is None or isinstance(sqs, EmptySearchQuerySet):
+            return sqs
+
+        offer_ids, self.facets = get_offer_search(query, self.cleaned_data.get('q'), sqs)
+        return OfferSearchResults(self.searchqueryset, offer_ids)
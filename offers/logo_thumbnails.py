@@ -0,0 +1,136 @@
+"""
+Pre-generated thumbnails of the provider logos.
+
+The pages show the logos in the sizes of PROVIDER_LOGO_SIZES. Instead of resizing a logo while a page renders, saving
+a provider with a new logo starts the ``generate_logo_thumbnails`` task. It crops the logo to every size, saves every
+thumbnail in the format of the logo and as WebP, and stores their urls and dimensions on the provider
+(``Provider.logo_thumbnails_data``), so the pages read them from the provider row. The ``generate_logo_thumbnails``
+command does the same for the existing logos with a pool of processes.
+"""
+from io import BytesIO
+import json
+import os
+from PIL import Image, ImageOps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+
+THUMBNAIL_DIRECTORY = os.path.join('provider_logos', 'thumbnails')
+
+
+def get_thumbnail_name(logo_name, width, height, extension):
+    name = os.path.splitext(os.path.basename(logo_name))[0]
+    return os.path.join(THUMBNAIL_DIRECTORY, u"{0}_{1}x{2}.{3}".format(name, width, height, extension))
+
+
+def save_image(image, name, image_format, **options):
+    """
+    Saves an image to the storage under the name, replacing the file that was there
+
+    :return: The name of the saved file
+    """
+    content = BytesIO()
+    image.save(content, image_format, **options)
+    if default_storage.exists(name):
+        default_storage.delete(name)
+    return default_storage.save(name, ContentFile(content.getvalue()))
+
+
+def make_thumbnails(logo_name):
+    """
+    Crops a logo to every size of PROVIDER_LOGO_SIZES and saves the thumbnails. Logos with transparency are saved as
+    PNG, the others as JPEG, and every thumbnail also as WebP. It doesn't use the database, so it can run in any
+    process.
+
+    :param logo_name: The name of the logo in the storage, an empty name has no thumbnails
+    :return: The thumbnails, in the format of ``Provider.logo_thumbnails_data``
+    :rtype: dict
+    """
+    thumbnails = {"source": logo_name, "sizes": {}, "files": []}
+    if not logo_name:
+        return thumbnails
+
+    logo = default_storage.open(logo_name)
+    try:
+        image = Image.open(logo)
+        image.load()
+    finally:
+        logo.close()
+
+    if image.mode in ('RGBA', 'LA') or 'transparency' in image.info:
+        image = image.convert('RGBA')
+        extension, image_format, options = 'png', 'PNG', {"optimize": True}
+    else:
+        image = image.convert('RGB')
+        extension, image_format, options = 'jpg', 'JPEG', {"quality": settings.PROVIDER_LOGO_QUALITY, "optimize": True}
+
+    for size, (width, height) in sorted(settings.PROVIDER_LOGO_SIZES.items()):
+        thumbnail = ImageOps.fit(image, (width, height), Image.ANTIALIAS)
+        name = save_image(thumbnail, get_thumbnail_name(logo_name, width, height, extension), image_format, **options)
+        webp_name = save_image(thumbnail, get_thumbnail_name(logo_name, width, height, 'webp'), 'WEBP',
+                               quality=settings.PROVIDER_LOGO_QUALITY)
+
+        thumbnails["files"].extend([name, webp_name])
+        thumbnails["sizes"][size] = {
+            "url": default_storage.url(name),
+            "width": thumbnail.size[0],
+            "height": thumbnail.size[1],
+            "webp_url": default_storage.url(webp_name),
+        }
+    return thumbnails
+
+
+def make_provider_thumbnails(provider):
+    """
+    ``make_thumbnails`` for the pool of the backfill: a broken logo is reported instead of stopping the pool
+
+    :param provider: The primary key and the logo name of a provider
+    :return: The primary key, the thumbnails and the error, one of them is None
+    :rtype: tuple
+    """
+    provider_pk, logo_name = provider
+    try:
+        return provider_pk, make_thumbnails(logo_name), None
+    except Exception as e:
+        return provider_pk, None, u"{0}: {1}".format(logo_name, e)
+
+
+def is_current(logo_name, thumbnails):
+    """
+    Whether the stored thumbnails were made from the logo, in the sizes that are configured now
+    """
+    sizes = dict((size, [width, height]) for size, (width, height) in settings.PROVIDER_LOGO_SIZES.items())
+    return thumbnails.get("source") == logo_name and dict(
+        (size, [thumbnail["width"], thumbnail["height"]]) for size, thumbnail in thumbnails.get("sizes", {}).items()
+    ) == sizes
+
+
+def store_thumbnails(provider_pk, thumbnails):
+    """
+    Stores the thumbnails on the provider, unless its logo changed since they were made, and deletes the thumbnails
+    of the previous logo. The provider counts as updated, so the pages and the search documents of its offers show
+    the new thumbnails.
+
+    :return: If the thumbnails were stored
+    :rtype: bool
+    """
+    from offers.models import Offer, Provider
+    from offers.page_cache import providers_changed
+    from offers.search_queue import enqueue
+    providers = Provider.objects.filter(pk=provider_pk, logo=thumbnails["source"])
+    old_data = list(providers.values_list('logo_thumbnails_data', flat=True))
+    if not old_data or not providers.update(logo_thumbnails_data=json.dumps(thumbnails), updated_at=timezone.now()):
+        # Made from a logo that was replaced meanwhile
+        delete_files(thumbnails["files"])
+        return False
+
+    delete_files(set(json.loads(old_data[0]).get("files", [])) - set(thumbnails["files"]))
+    providers_changed()
+    enqueue(Offer.objects.filter(provider=provider_pk).values_list('pk', flat=True))
+    return True
+
+
+def delete_files(names):
+    for name in names:
+        default_storage.delete(name)
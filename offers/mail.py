@@ -0,0 +1,148 @@
+"""
+Sending mail over pooled email backend connections.
+
+Opening a connection (for SMTP a TCP connection, a handshake and a login) costs more than sending a message over it,
+so every process keeps a few open connections and reuses them. A connection is closed after it sent
+MAIL_CONNECTION_MAX_MESSAGES messages or was idle for MAIL_CONNECTION_KEEPALIVE seconds, and a message that fails
+because the server dropped the connection is sent again over a new one.
+
+To try it against a real SMTP server locally, run ``python -m smtpd -n -c DebuggingServer localhost:1025`` and use
+the SMTP backend with EMAIL_HOST = 'localhost' and EMAIL_PORT = 1025.
+"""
+import logging
+import smtplib
+import socket
+import threading
+import time
+from django.conf import settings
+from django.core.mail import get_connection
+
+logger = logging.getLogger(__name__)
+
+# The errors that mean the connection is broken, not the message
+CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, socket.error)
+
+
+class PooledConnection(object):
+    def __init__(self, connection):
+        self.connection = connection
+        self.sent = 0
+        self.last_used = time.time()
+
+    def open(self):
+        self.connection.open()
+
+    def close(self):
+        try:
+            self.connection.close()
+        except Exception:
+            logger.exception("Could not close the mail connection")
+
+
+class ConnectionPool(object):
+    """
+    A pool of open email backend connections
+    """
+    def __init__(self, size=None, max_messages=None, keepalive=None):
+        self._size = size
+        self._max_messages = max_messages
+        self._keepalive = keepalive
+
+        self._idle = []
+        self._lock = threading.Lock()
+        self.opened = 0
+
+    @property
+    def size(self):
+        return self._size if self._size is not None else settings.MAIL_POOL_SIZE
+
+    @property
+    def max_messages(self):
+        return self._max_messages if self._max_messages is not None else settings.MAIL_CONNECTION_MAX_MESSAGES
+
+    @property
+    def keepalive(self):
+        return self._keepalive if self._keepalive is not None else settings.MAIL_CONNECTION_KEEPALIVE
+
+    def _new_connection(self):
+        connection = PooledConnection(get_connection())
+        connection.open()
+        with self._lock:
+            self.opened += 1
+        return connection
+
+    def acquire(self):
+        """
+        Takes an open connection from the pool, or opens a new one when there is none
+        """
+        expired = []
+        connection = None
+        with self._lock:
+            while self._idle:
+                idle = self._idle.pop()
+                if time.time() - idle.last_used > self.keepalive:
+                    expired.append(idle)
+                else:
+                    connection = idle
+                    break
+
+        for idle in expired:
+            idle.close()
+
+        return connection or self._new_connection()
+
+    def release(self, connection):
+        """
+        Returns a connection to the pool, or closes it when it sent enough messages or the pool is full
+        """
+        connection.last_used = time.time()
+        if connection.sent < self.max_messages:
+            with self._lock:
+                if len(self._idle) < self.size:
+                    self._idle.append(connection)
+                    return
+        connection.close()
+
+    def send(self, messages):
+        """
+        Sends the messages over one pooled connection. A message that fails because the connection broke is sent
+        again over a new connection once.
+
+        :return: The number of messages that were sent
+        :rtype: int
+        """
+        sent = 0
+        connection = self.acquire()
+        try:
+            for message in messages:
+                if connection.sent >= self.max_messages:
+                    connection.close()
+                    connection = self._new_connection()
+
+                try:
+                    sent += connection.connection.send_messages([message]) or 0
+                except CONNECTION_ERRORS:
+                    logger.warning("The mail connection broke, reconnecting")
+                    connection.close()
+                    connection = self._new_connection()
+                    sent += connection.connection.send_messages([message]) or 0
+                connection.sent += 1
+        except Exception:
+            connection.close()
+            raise
+
+        self.release(connection)
+        return sent
+
+    def close_all(self):
+        """
+        Closes all the idle connections
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+# The connection pool of this process
+mail_pool = ConnectionPool()
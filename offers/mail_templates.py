@@ -0,0 +1,110 @@
+"""
+Rendering of the mail templates.
+
+The templates are compiled once per process (so once per Celery worker) and kept in a cached loader, and the context
+every mail shares, like the url of the site, is built once. ``render_many`` renders one template for a list of
+recipients, so a mailing to many users parses nothing while it runs.
+"""
+import threading
+from django.conf import settings
+from django.template import Context, FilterExpression
+from django.template.loader_tags import ExtendsNode
+from django.template.loaders.cached import Loader as CachedLoader
+from django.test.signals import setting_changed
+
+
+def get_site_url():
+    if settings.SITE_URL.endswith('/'):
+        return 'http://' + settings.SITE_URL[:-1]
+    return 'http://' + settings.SITE_URL
+
+
+class CompiledParent(object):
+    """
+    Stands in for the template name of an ``{% extends %}`` tag, so the compiled parent is used instead of loading
+    it again for every render
+    """
+    def __init__(self, template):
+        self.template = template
+        self.filters = []
+        self.var = template.name
+
+    def resolve(self, context):
+        return self.template
+
+
+class MailRenderer(object):
+    """
+    Renders mail templates that are compiled only once
+    """
+    def __init__(self, loaders=None):
+        self._loaders = loaders
+        self._loader = None
+        self._base_context = None
+        self._lock = threading.Lock()
+
+    @property
+    def loader(self):
+        if self._loader is None:
+            with self._lock:
+                if self._loader is None:
+                    self._loader = CachedLoader(self._loaders or settings.TEMPLATE_LOADERS)
+        return self._loader
+
+    def get_base_context(self):
+        """
+        The context that is the same for every mail
+        """
+        if self._base_context is None:
+            self._base_context = {"site_url": get_site_url()}
+        return self._base_context
+
+    def get_template(self, template_name):
+        """
+        The compiled template, the template it extends is compiled and cached as well
+        """
+        template = self.loader.load_template(template_name)[0]
+        for node in template.nodelist:
+            if isinstance(node, ExtendsNode) and isinstance(node.parent_name, FilterExpression) \
+                    and isinstance(node.parent_name.var, basestring) and not node.parent_name.filters:
+                node.parent_name = CompiledParent(self.get_template(node.parent_name.var))
+        return template
+
+    def render_many(self, template_name, contexts):
+        """
+        Renders a template once for every context
+
+        :param contexts: A list of dicts
+        :return: The rendered templates in the order of the contexts
+        :rtype: list
+        """
+        template = self.get_template(template_name)
+        base_context = self.get_base_context()
+
+        rendered = []
+        for context in contexts:
+            # Every render gets its own context, so nothing leaks from one recipient to the next
+            rendered.append(template.render(Context(dict(base_context, **context))))
+        return rendered
+
+    def render(self, template_name, context):
+        return self.render_many(template_name, [context])[0]
+
+    def reset(self):
+        """
+        Forgets the compiled templates and the base context
+        """
+        with self._lock:
+            self._loader = None
+            self._base_context = None
+
+
+# The mail renderer of this process
+mail_renderer = MailRenderer()
+
+
+def reset_mail_renderer(sender, setting, **kwargs):
+    if setting in ('SITE_URL', 'TEMPLATE_LOADERS', 'TEMPLATE_DIRS'):
+        mail_renderer.reset()
+
+setting_changed.connect(reset_mail_renderer)
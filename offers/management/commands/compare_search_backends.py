@@ -0,0 +1,46 @@
+from optparse import make_option
+from django.core.management.base import BaseCommand, CommandError
+from offers.benchmarks import SEARCH_BACKENDS, compare_search_backends, save_results
+
+SEARCH_KINDS = ('text', 'prefix', 'filtered', 'text_during_writes')
+
+
+class Command(BaseCommand):
+    help = 'Indexes the offers into every search backend and compares the latency of the same searches'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--requests',
+                    dest='requests',
+                    type='int',
+                    default=50,
+                    help='The number of searches per kind of search'),
+        make_option('--backend',
+                    action='append',
+                    dest='backends',
+                    default=[],
+                    help='Only run this backend, can be given more than once'),
+        make_option('--save',
+                    dest='save',
+                    help='Store the results in this file'),
+    )
+
+    def handle(self, *args, **options):
+        unknown = set(options['backends']) - set(SEARCH_BACKENDS)
+        if unknown:
+            raise CommandError("Unknown backend: {0}".format(', '.join(sorted(unknown))))
+
+        results = compare_search_backends(options['backends'], max(options['requests'], 1))
+
+        self.stdout.write("{0:<8} {1:>9} {2:>9} {3:>9}".format('backend', 'documents', 'index s', 'size KB'))
+        for name in sorted(results):
+            self.stdout.write("{0:<8} {documents:>9} {index_seconds:>9.2f} {size:>9}".format(name, **results[name]))
+
+        self.stdout.write("")
+        self.stdout.write("{0:<20} {1:<8} {2:>9} {3:>9}".format('search', 'backend', 'p50 ms', 'p95 ms'))
+        for kind in SEARCH_KINDS:
+            for name in sorted(results):
+                self.stdout.write("{0:<20} {1:<8} {p50:>9.2f} {p95:>9.2f}".format(kind, name, **results[name][kind]))
+
+        if options['save']:
+            save_results(results, options['save'])
+            self.stdout.write("Stored the results in {0}.".format(options['save']))
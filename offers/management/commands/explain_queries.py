@@ -0,0 +1,96 @@
+from optparse import make_option
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from offers.models import Offer, Plan, Comment
+from offers.benchmark_data import seed
+
+
+def get_manager_queries():
+    """
+    The queries of the offer, plan and comment managers the way the views run them, for a provider, offer and user
+    that have data
+
+    :return: A list of names and querysets
+    :rtype: list
+    """
+    offer = Offer.active_offers.order_by('-published_at').first()
+    if offer is None:
+        raise CommandError("There are no active offers to query, create some with --seed.")
+    comment = Comment.visible.filter(offer=offer).first() or Comment.objects.first()
+
+    queries = [
+        ("visible offers", Offer.visible_offers.all()[:20]),
+        ("active offers", Offer.active_offers.all()[:20]),
+        ("active offers of a provider", Offer.active_offers.for_provider(offer.provider_id)[:20]),
+        ("requests of a provider", Offer.requests.for_provider(offer.provider_id).order_by('-created_at')),
+        ("publish queue", Offer.objects.filter(queue_rank__isnull=False).order_by('queue_rank')[:1]),
+        ("active plans", Plan.active_plans.all()[:20]),
+        ("active plans of an offer", Plan.active_plans.for_offer(offer).order_by('billing_time', 'cost')),
+        ("visible comments of an offer", Comment.visible.filter(offer=offer)),
+    ]
+    if comment is not None:
+        queries.append(("published comments of a user", Comment.objects.filter(
+            commenter_id=comment.commenter_id, status=Comment.PUBLISHED
+        ).order_by('-created_at')[:5]))
+    return queries
+
+
+def explain(queryset):
+    """
+    The query plan of the database for a queryset
+
+    :rtype: list
+    """
+    sql, params = queryset.query.sql_with_params()
+    prefix = 'EXPLAIN QUERY PLAN ' if connection.vendor == 'sqlite' else 'EXPLAIN '
+    cursor = connection.cursor()
+    cursor.execute(prefix + sql, params)
+    return [u' '.join(unicode(column) for column in row) for row in cursor.fetchall()]
+
+
+def time_query(queryset, repeat):
+    """
+    Runs a query a number of times
+
+    :return: The fastest and the average time in milliseconds
+    :rtype: tuple
+    """
+    timings = []
+    for i in range(repeat):
+        start = time.time()
+        # A clone, so every run goes to the database
+        list(queryset._clone())
+        timings.append((time.time() - start) * 1000)
+    return min(timings), sum(timings) / len(timings)
+
+
+class Command(BaseCommand):
+    help = 'Prints the query plan and the time of every offer, plan and comment manager query'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--seed',
+                    dest='seed',
+                    type='int',
+                    default=0,
+                    help='First create this many offers with their plans and comments (in the configured database!)'),
+        make_option('--repeat',
+                    dest='repeat',
+                    type='int',
+                    default=20,
+                    help='The number of times every query is run'),
+    )
+
+    def handle(self, *args, **options):
+        if options['seed']:
+            created = seed(offers=options['seed'])
+            self.stdout.write("Created " + ", ".join(
+                "{0} {1}".format(count, name) for name, count in sorted(created.items())
+            ) + ".")
+
+        repeat = max(options['repeat'], 1)
+        for name, queryset in get_manager_queries():
+            fastest, average = time_query(queryset, repeat)
+            self.stdout.write(u"== {0}: {1:.2f} ms fastest, {2:.2f} ms average".format(name, fastest, average))
+            for line in explain(queryset):
+                self.stdout.write(u"   " + line)
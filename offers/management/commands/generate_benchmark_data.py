@@ -0,0 +1,66 @@
+from optparse import make_option
+import time
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from offers.benchmark_data import SCALES, seed, build_derived_data
+
+# The numbers of a scale that can be changed on the command line
+SCALE_OPTIONS = ('providers', 'offers', 'plans_per_offer', 'comments_per_offer', 'likes_per_comment',
+                 'followers_per_offer', 'users', 'datacenters', 'locations_per_provider')
+
+
+class Command(BaseCommand):
+    help = 'Generates a synthetic dataset to benchmark against, in the configured database'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--scale',
+                    dest='scale',
+                    default='small',
+                    help='The size of the dataset: {0}'.format(', '.join(sorted(SCALES)))),
+        make_option('--random-seed',
+                    dest='random_seed',
+                    type='int',
+                    default=0,
+                    help='The seed of the random data, the same seed generates the same data'),
+        make_option('--skip-derived',
+                    action='store_true',
+                    dest='skip_derived',
+                    default=False,
+                    help="Don't build the summaries, rendered content and publish queue of the new offers"),
+        make_option('--index',
+                    action='store_true',
+                    dest='index',
+                    default=False,
+                    help='Update the search index afterwards'),
+    ) + tuple(
+        make_option('--' + name.replace('_', '-'),
+                    dest=name,
+                    type='int',
+                    help='Overrides the number of {0} of the scale'.format(name.replace('_', ' ')))
+        for name in SCALE_OPTIONS
+    )
+
+    def handle(self, *args, **options):
+        if options['scale'] not in SCALES:
+            raise CommandError("Unknown scale {0}, use one of: {1}".format(
+                options['scale'], ', '.join(sorted(SCALES))
+            ))
+
+        scale = dict(SCALES[options['scale']])
+        for name in SCALE_OPTIONS:
+            if options.get(name) is not None:
+                scale[name] = options[name]
+
+        start = time.time()
+        created = seed(random_seed=options['random_seed'], **scale)
+        self.stdout.write("Created " + ", ".join(
+            "{0} {1}".format(count, name) for name, count in sorted(created.items())
+        ) + " in {0:.1f}s.".format(time.time() - start))
+
+        if not options['skip_derived']:
+            start = time.time()
+            build_derived_data()
+            self.stdout.write("Built the derived data in {0:.1f}s.".format(time.time() - start))
+
+        if options['index']:
+            call_command('update_index', stdout=self.stdout)
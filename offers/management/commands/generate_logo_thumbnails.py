@@ -0,0 +1,55 @@
+from multiprocessing import Pool, cpu_count
+from optparse import make_option
+import json
+from django.core.management.base import BaseCommand
+from offers.logo_thumbnails import is_current, make_provider_thumbnails, store_thumbnails
+from offers.models import Provider
+
+
+class Command(BaseCommand):
+    help = 'Generates the thumbnails of the provider logos that have none in the configured sizes, in parallel'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--processes',
+                    dest='processes',
+                    type='int',
+                    default=None,
+                    help='The number of processes that resize the logos, the number of CPUs by default'),
+        make_option('--all',
+                    action='store_true',
+                    dest='all',
+                    default=False,
+                    help='Also generate the thumbnails that are current'),
+    )
+
+    def handle(self, *args, **options):
+        providers = [
+            (pk, logo)
+            for pk, logo, data in Provider.objects.exclude(logo='').order_by('pk').values_list(
+                'pk', 'logo', 'logo_thumbnails_data'
+            )
+            if options['all'] or not is_current(logo, json.loads(data))
+        ]
+        if not providers:
+            self.stdout.write("All logos have their thumbnails.")
+            return
+
+        # The workers only resize and save the images, the thumbnails are stored on the providers by this process
+        stored = 0
+        pool = Pool(max(options['processes'] or cpu_count(), 1))
+        try:
+            for provider_pk, thumbnails, error in pool.imap_unordered(make_provider_thumbnails, providers):
+                if error is not None:
+                    self.stderr.write(u"Provider #{0}: {1}".format(provider_pk, error))
+                elif store_thumbnails(provider_pk, thumbnails):
+                    stored += 1
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+        self.stdout.write("Generated the thumbnails of {0} logo{1}, {2} failed.".format(
+            stored, '' if stored == 1 else 's', len(providers) - stored
+        ))
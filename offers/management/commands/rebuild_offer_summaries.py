@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from offers.models import Offer, OfferSummary
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the denormalized summary row of every offer'
+
+    def handle(self, *args, **options):
+        total = 0
+        for offer in Offer.objects.all().iterator():
+            OfferSummary.update_for_offer(offer)
+            total += 1
+
+        self.stdout.write("Rebuilt the summaries of {0} offer{1}.".format(total, '' if total == 1 else 's'))
@@ -0,0 +1,40 @@
+from optparse import make_option
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from offers.search_queue import get_index_drift, update_offers
+
+
+class Command(BaseCommand):
+    help = 'Compares the offer search index with the database and only re-indexes the offers that drifted'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--using',
+                    dest='using',
+                    default='default',
+                    help='The search connection to compare'),
+        make_option('--dry-run',
+                    action='store_true',
+                    dest='dry_run',
+                    default=False,
+                    help='Only report the drift'),
+        make_option('--batch-size',
+                    dest='batch_size',
+                    type='int',
+                    default=None,
+                    help='The number of offers written with one commit, SEARCH_INDEX_BATCH_SIZE by default'),
+    )
+
+    def handle(self, *args, **options):
+        missing, stale, hidden = get_index_drift(options['using'])
+        self.stdout.write("{0} offer{1} missing, {2} stale and {3} no longer visible.".format(
+            len(missing), '' if len(missing) == 1 else 's', len(stale), len(hidden)
+        ))
+        if options['dry_run']:
+            return
+
+        drifted = missing + stale + hidden
+        batch_size = max(options['batch_size'] or settings.SEARCH_INDEX_BATCH_SIZE, 1)
+        for start in range(0, len(drifted), batch_size):
+            update_offers(drifted[start:start + batch_size], options['using'])
+        if drifted:
+            self.stdout.write("Fixed {0} offer{1}.".format(len(drifted), '' if len(drifted) == 1 else 's'))
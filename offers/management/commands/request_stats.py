@@ -0,0 +1,67 @@
+from optparse import make_option
+import json
+from django.core.management.base import BaseCommand
+from OfferListings.request_stats import get_process_summaries, merge_summaries, clear_process_summaries
+
+
+def format_value(value):
+    return '-' if value is None else '{0:.1f}'.format(value)
+
+
+class Command(BaseCommand):
+    help = 'Prints the request statistics the processes stored, per url name'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--json',
+                    action='store_true',
+                    dest='json',
+                    default=False,
+                    help='Print the statistics as JSON'),
+        make_option('--sort',
+                    dest='sort',
+                    default='wall_time',
+                    help='The field to sort on by its mean: wall_time, queries, sql_time, template_time, ...'),
+        make_option('--reset',
+                    action='store_true',
+                    dest='reset',
+                    default=False,
+                    help='Remove the stored statistics afterwards'),
+    )
+
+    def handle(self, *args, **options):
+        summaries = get_process_summaries()
+        views = merge_summaries(summaries)
+
+        if options['json']:
+            self.stdout.write(json.dumps({
+                "processes": [summary["process"] for summary in summaries],
+                "views": views,
+            }, indent=2, sort_keys=True))
+        else:
+            self.stdout.write("Statistics of {0} process{1}.".format(len(summaries), '' if len(summaries) == 1 else 'es'))
+            self.stdout.write("{0:<40} {1:>7} {2:>9} {3:>9} {4:>8} {5:>9} {6:>9} {7:>7}".format(
+                'view', 'count', 'p50 ms', 'p95 ms', 'queries', 'sql ms', 'tmpl ms', 'cache%'
+            ))
+
+            def sort_key(name):
+                field = views[name]["fields"].get(options['sort'], views[name]["fields"]["wall_time"])
+                return -(field["mean"] or 0)
+
+            for name in sorted(views, key=sort_key):
+                view = views[name]
+                fields = view["fields"]
+                lookups = (fields["cache_hits"]["mean"] or 0) + (fields["cache_misses"]["mean"] or 0)
+                self.stdout.write("{0:<40} {1:>7} {2:>9} {3:>9} {4:>8} {5:>9} {6:>9} {7:>7}{8}".format(
+                    name, view["count"],
+                    # The wall time percentiles are the upper bound of their histogram bucket
+                    format_value(fields["wall_time"]["p50"]), format_value(fields["wall_time"]["p95"]),
+                    format_value(fields["queries"]["mean"]), format_value(fields["sql_time"]["mean"]),
+                    format_value(fields["template_time"]["mean"]),
+                    format_value(100 * fields["cache_hits"]["mean"] / lookups) if lookups else '-',
+                    '  QUERIES GROW WITH RESULT' if view["query_growth"]["suspect"] else '',
+                ))
+
+        if options['reset']:
+            clear_process_summaries()
+            if not options['json']:
+                self.stdout.write("Removed the stored statistics.")
@@ -0,0 +1,49 @@
+from optparse import make_option
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from offers.models import Offer
+from offers.page_cache import offers_changed
+from template_helpers.converters import markdown_converter, RENDERER_VERSION
+
+
+class Command(BaseCommand):
+    help = 'Re-renders the stored html content of the offers that were rendered by an older renderer'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--all',
+                    action='store_true',
+                    dest='all',
+                    default=False,
+                    help='Re-render every offer, not only the stale ones'),
+        make_option('--batch-size',
+                    dest='batch_size',
+                    type='int',
+                    default=200,
+                    help='The number of offers updated per transaction'),
+    )
+
+    def handle(self, *args, **options):
+        offers = Offer.objects.all()
+        if not options['all']:
+            offers = offers.exclude(rendered_version=RENDERER_VERSION)
+
+        pks = list(offers.order_by('pk').values_list('pk', flat=True))
+        batch_size = max(options['batch_size'], 1)
+
+        for start in range(0, len(pks), batch_size):
+            batch = Offer.objects.filter(pk__in=pks[start:start + batch_size]).values_list('pk', 'content')
+
+            # A queryset update doesn't send the save signals or touch updated_at
+            with transaction.atomic():
+                for pk, content in batch:
+                    Offer.objects.filter(pk=pk).update(
+                        rendered_content=markdown_converter.convert(content),
+                        rendered_version=RENDERER_VERSION,
+                    )
+
+        if pks:
+            # The queryset updates don't send the signals that change the version of the cached lists
+            offers_changed()
+
+        total = len(pks)
+        self.stdout.write("Re-rendered {0} offer{1}.".format(total, '' if total == 1 else 's'))
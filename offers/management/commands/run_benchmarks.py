@@ -0,0 +1,78 @@
+from optparse import make_option
+from django.core.management.base import BaseCommand, CommandError
+from offers.benchmarks import get_scenarios, run_suite, compare, save_results, load_results
+
+
+class Command(BaseCommand):
+    help = 'Requests the main pages of the site and reports their latency, queries and memory'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--requests',
+                    dest='requests',
+                    type='int',
+                    default=50,
+                    help='The number of measured requests per scenario'),
+        make_option('--warmup',
+                    dest='warmup',
+                    type='int',
+                    default=2,
+                    help='The number of requests per scenario before measuring'),
+        make_option('--scenario',
+                    action='append',
+                    dest='scenarios',
+                    default=[],
+                    help='Only run this scenario, can be given more than once'),
+        make_option('--save-baseline',
+                    dest='save_baseline',
+                    help='Store the results in this file'),
+        make_option('--baseline',
+                    dest='baseline',
+                    help='Compare the results with the results stored in this file'),
+        make_option('--tolerance',
+                    dest='tolerance',
+                    type='float',
+                    default=0.2,
+                    help='The fraction a value may grow before it counts as a regression'),
+        make_option('--fail-on-regression',
+                    action='store_true',
+                    dest='fail_on_regression',
+                    default=False,
+                    help='Exit with an error when a value regressed'),
+    )
+
+    def handle(self, *args, **options):
+        scenarios = get_scenarios()
+        if options['scenarios']:
+            unknown = set(options['scenarios']) - set(scenario.name for scenario in scenarios)
+            if unknown:
+                raise CommandError("Unknown scenario: {0}".format(', '.join(sorted(unknown))))
+            scenarios = [scenario for scenario in scenarios if scenario.name in options['scenarios']]
+
+        results = run_suite(scenarios, max(options['requests'], 1), max(options['warmup'], 0))
+
+        self.stdout.write("{0:<18} {1:>7} {2:>9} {3:>9} {4:>9} {5:>9} {6:>12} {7:>7}".format(
+            'scenario', 'clients', 'p50 ms', 'p95 ms', 'queries', 'max q', 'memory KB', 'errors'
+        ))
+        for name in sorted(results):
+            result = results[name]
+            self.stdout.write("{0:<18} {concurrency:>7} {p50:>9.2f} {p95:>9.2f} {queries:>9.2f} {max_queries:>9} "
+                              "{memory:>12} {errors:>7}".format(name, **result))
+
+        if options['save_baseline']:
+            save_results(results, options['save_baseline'])
+            self.stdout.write("Stored the results in {0}.".format(options['save_baseline']))
+
+        if options['baseline']:
+            comparison = compare(results, load_results(options['baseline']), options['tolerance'])
+            regressions = [row for row in comparison if row["regressed"]]
+
+            self.stdout.write("")
+            for row in comparison:
+                self.stdout.write("{scenario:<18} {field:<8} {baseline:>9.2f} -> {value:>9.2f} {change:>+8.1%}{0}".format(
+                    '  REGRESSED' if row["regressed"] else '', **row
+                ))
+
+            if regressions and options['fail_on_regression']:
+                raise CommandError("{0} value{1} regressed.".format(
+                    len(regressions), '' if len(regressions) == 1 else 's'
+                ))
@@ -1,5 +1,6 @@
-from django.db import models
-from django.db.models.signals import pre_save, post_save
+from django.db import models, transaction, IntegrityError
+from django.db.models import F, Q
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete, m2m_changed
 from django.core.validators import URLValidator
 from django.core.urlresolvers import reverse
 from django.contrib.auth.models import User
@@ -14,8 +15,7 @@ import json
 import bbcode
 import html2text
 from decimal import Decimal
-from sorl.thumbnail import get_thumbnail
-from template_helpers.converters import markdown_converter
+from template_helpers.converters import markdown_converter, RENDERER_VERSION
 
 ############
 # Managers #
@@ -52,6 +52,21 @@ class OfferVisibleManager(models.Manager):
         """
         return self.get_query_set().filter(provider=provider)
 
+    def with_listing_data(self):
+        """
+        Returns the visible offers with everything an offer listing displays loaded up front. A page of offers is
+        loaded in a fixed number of queries, no matter how many offers the page has. The provider and summary are
+        joined in and the published comment count is selected as ``published_comment_count``. The cards show the plans
+        from the summary, so the plans are not loaded (an offer without a summary row yet queries its plans).
+        """
+        comment_table = Comment._meta.db_table
+        return self.get_query_set().select_related('provider', 'summary').extra(select={
+            "published_comment_count": "SELECT COUNT(*) FROM {0} WHERE {0}.offer_id = {1}.id AND {0}.status = %s".format(
+                comment_table,
+                Offer._meta.db_table,
+            ),
+        }, select_params=(Comment.PUBLISHED,))
+
 
 class OfferActiveManager(OfferVisibleManager):
     """
@@ -134,6 +149,8 @@ class Provider(models.Model):
     start_date = models.DateField()
     website = models.URLField(max_length=255)
     logo = models.ImageField(upload_to=get_file_path, blank=True, max_length=255)
+    # Made by the generate_logo_thumbnails task, see offers.logo_thumbnails
+    logo_thumbnails_data = models.TextField(default='{}', editable=False)
 
     tos = models.URLField(max_length=255, verbose_name='Terms of service')
     aup = models.URLField(max_length=255, verbose_name='Acceptable usage policy')
@@ -170,27 +187,39 @@ class Provider(models.Model):
         """
         return Plan.active_plans.for_provider(self).count()
 
-    def get_small_profile_image(self):
+    def get_logo_thumbnails(self):
+        """
+        The thumbnails of the current logo per size of PROVIDER_LOGO_SIZES. Each thumbnail is a dictionary with the
+        keys ``url``, ``width``, ``height`` and ``webp_url``. Empty until the thumbnails of the logo are generated.
+        """
+        thumbnails = json.loads(self.logo_thumbnails_data)
+        if not self.logo or thumbnails.get("source") != self.logo.name:
+            return {}
+        return thumbnails["sizes"]
+
+    def get_profile_image(self, size, placeholder):
+        width, height = settings.PROVIDER_LOGO_SIZES[size]
         if not self.logo:
-            image = settings.STATIC_URL + 'img/no_logo_small.png'
             return {
-                "url": image,
-                "width": 200,
-                "height": 200,
+                "url": settings.STATIC_URL + placeholder,
+                "width": width,
+                "height": height,
             }
-        image = get_thumbnail(self.logo, '200x200', crop='center')
-        return image
+        thumbnails = self.get_logo_thumbnails()
+        if size in thumbnails:
+            return thumbnails[size]
+        # The thumbnails of a new logo are still being generated, the browser scales the logo meanwhile
+        return {
+            "url": self.logo.url,
+            "width": width,
+            "height": height,
+        }
+
+    def get_small_profile_image(self):
+        return self.get_profile_image('small', 'img/no_logo_small.png')
 
     def get_large_profile_image(self):
-        if not self.logo:
-            image = settings.STATIC_URL + 'img/no_logo_large.png'
-            return {
-                "url": image,
-                "width": 400,
-                "height": 400,
-            }
-        image = get_thumbnail(self.logo, '400x400', crop='center')
-        return image
+        return self.get_profile_image('large', 'img/no_logo_large.png')
 
     def save(self, force_insert=False, force_update=False, using=None,
              update_fields=None):
@@ -198,6 +227,33 @@ class Provider(models.Model):
         super(Provider, self).save(force_insert, force_update, using, update_fields)
 
 
+def provider_remember_logo(sender, instance, raw, **kwargs):
+    instance._old_logo = None
+    if instance.pk is not None:
+        old_logo = Provider.objects.filter(pk=instance.pk).values_list('logo', 'logo_thumbnails_data')
+        if old_logo:
+            # The task may have stored the thumbnails after the instance was loaded
+            instance._old_logo, instance.logo_thumbnails_data = old_logo[0]
+
+
+def provider_update_logo_thumbnails(sender, instance, raw, **kwargs):
+    if raw or (instance.logo.name or '') == (getattr(instance, '_old_logo', None) or ''):
+        return
+    from offers.tasks import generate_logo_thumbnails
+    generate_logo_thumbnails.delay(instance.pk, instance.logo.name or '')
+
+
+def provider_change_pages(sender, **kwargs):
+    from offers.page_cache import providers_changed
+    providers_changed()
+
+
+pre_save.connect(provider_remember_logo, sender=Provider)
+post_save.connect(provider_update_logo_thumbnails, sender=Provider)
+post_save.connect(provider_change_pages, sender=Provider)
+post_delete.connect(provider_change_pages, sender=Provider)
+
+
 class Datacenter(models.Model):
     name = models.CharField(max_length=255)
     website = models.URLField(max_length=255, blank=True, null=True)
@@ -264,6 +320,8 @@ class Offer(models.Model):
 
     name = models.CharField(max_length=255)
     content = models.TextField()
+    rendered_content = models.TextField(blank=True, default='', editable=False)
+    rendered_version = models.CharField(max_length=32, blank=True, default='', editable=False)
     provider = models.ForeignKey(Provider)
     status = models.CharField(max_length=1, choices=STATUS_CHOICES, default=PUBLISHED)
     is_active = models.BooleanField(default=True)
@@ -282,6 +340,8 @@ class Offer(models.Model):
 
     is_ready = models.BooleanField(default=False)
     readied_at = models.DateTimeField(auto_now_add=True)
+    # The position of a ready request in the publish queue, maintained by the offer signals
+    queue_rank = models.PositiveIntegerField(null=True, blank=True, db_index=True, editable=False)
 
     creator = models.ForeignKey(User, null=True, blank=True)
     followers = models.ManyToManyField(User, blank=True, null=True, related_name="followed_offers")
@@ -303,6 +363,8 @@ class Offer(models.Model):
         return self.comment_set.filter(status=Comment.PUBLISHED).order_by('created_at')
 
     def comment_count(self):
+        if hasattr(self, 'published_comment_count'):
+            return self.published_comment_count
         return self.get_comments().count()
 
     def active_plan_count(self):
@@ -337,18 +399,77 @@ class Offer(models.Model):
             return True
         return False
 
+    def is_queued(self):
+        """
+        Returns if the offer is a ready request waiting to be published
+        """
+        return self.is_request and self.status == Offer.UNPUBLISHED and self.is_ready
+
     def queue_position(self):
-        if not self.is_request or self.status == Offer.PUBLISHED or not self.is_ready:
+        if not self.is_queued():
             return None
-        return Offer.requests.filter(
-            readied_at__lt=self.readied_at, is_ready=True,
-        ).count()+1
+        return self.queue_rank
     queue_position.short_description = "Queue position"
-    queue_position.admin_order_field = 'readied_at'
+    queue_position.admin_order_field = 'queue_rank'
+
+    @classmethod
+    def lock_queue(cls, *pks):
+        """
+        Locks the queued offers (and the given ones) until the end of the transaction, so two offers that enter or
+        leave the queue at the same time are numbered one after the other
+        """
+        list(cls.objects.filter(Q(queue_rank__isnull=False) | Q(pk__in=pks)).select_for_update().values_list(
+            'pk', flat=True
+        ))
+
+    def leave_queue(self, rank):
+        """
+        Removes the offer from the publish queue, the offers after it move up one position
+        """
+        with transaction.atomic():
+            Offer.lock_queue(self.pk)
+            Offer.objects.filter(queue_rank__gt=rank).update(queue_rank=F('queue_rank') - 1)
+            Offer.objects.filter(pk=self.pk).update(queue_rank=None)
+        self.queue_rank = None
+
+    def enter_queue(self):
+        """
+        Puts the offer in the publish queue by the time it was readied at, the offers after it move down one position.
+        A queue whose ranks were numbered wrong anyway (for example by changes without signals) is numbered again.
+        """
+        with transaction.atomic():
+            Offer.lock_queue(self.pk)
+            rank = Offer.objects.filter(queue_rank__isnull=False).exclude(pk=self.pk).filter(
+                Q(readied_at__lt=self.readied_at) | Q(readied_at=self.readied_at, pk__lt=self.pk)
+            ).count() + 1
+            Offer.objects.filter(queue_rank__gte=rank).exclude(pk=self.pk).update(queue_rank=F('queue_rank') + 1)
+            Offer.objects.filter(pk=self.pk).update(queue_rank=rank)
+
+            queue = Offer.objects.filter(queue_rank__isnull=False).aggregate(
+                count=models.Count('pk'), ranks=models.Count('queue_rank', distinct=True), last=models.Max('queue_rank')
+            )
+            if not queue["count"] == queue["ranks"] == queue["last"]:
+                Offer.rebuild_queue()
+                rank = Offer.objects.filter(pk=self.pk).values_list('queue_rank', flat=True)[0]
+        self.queue_rank = rank
+
+    @classmethod
+    def rebuild_queue(cls):
+        """
+        Numbers the whole publish queue again, for offers that were changed without their signals
+        """
+        with transaction.atomic():
+            cls.objects.exclude(queue_rank=None).update(queue_rank=None)
+            queued = cls.requests.filter(is_ready=True).order_by('readied_at', 'pk').values_list('pk', flat=True)
+            for rank, pk in enumerate(queued, 1):
+                cls.objects.filter(pk=pk).update(queue_rank=rank)
 
     def get_plan_locations(self):
+        """
+        Returns the distinct locations of all the plans of this offer, in the order they first appear.
+        """
         locations = []
-        for plan in self.plan_set.all():
+        for plan in self.plan_set.prefetch_related('locations__datacenter'):
             for location in plan.locations.all():
                 if location not in locations:
                     locations.append(location)
@@ -385,17 +506,62 @@ class Offer(models.Model):
             })
         return min_maxes
 
+    def get_summary(self):
+        """
+        Returns the denormalized card summary for this offer. If the summary row has not been built yet (for example
+        before the rebuild command has been run) an unsaved summary is calculated from the live data instead.
+        """
+        try:
+            return self.summary
+        except OfferSummary.DoesNotExist:
+            return OfferSummary.build_for_offer(self)
+
     def get_cache_key(self):
+        """
+        The cache key of the rendered content. The key is versioned by the last update of the offer, so saving an
+        offer invalidates the cached content in every cache tier and worker.
+        """
         if self.pk is None:
             return None
-        return "offer-{}-html-content".format(self.pk)
+        version = self.updated_at.strftime('%Y%m%d%H%M%S%f') if self.updated_at else ''
+        return "offer-{0}-html-content-{1}".format(self.pk, version)
+
+    def get_plans_version(self):
+        """
+        The version of the plans of the offer and their locations, for caching what is rendered from them. It changes
+        when a plan is saved, added or deleted, or one of their locations is saved.
+        """
+        values = self.plan_set.aggregate(
+            updated_at=models.Max('updated_at'), count=models.Count('pk'),
+            locations_updated_at=models.Max('locations__updated_at'), location_count=models.Count('locations'),
+        )
+        return u"-".join(unicode(values[key]) for key in sorted(values))
 
     def delete_html_cache(self):
         if self.pk is None:
             return
         cache.delete(self.get_cache_key())
 
+    def render_content(self):
+        """
+        Renders the markdown content and stores the result and the renderer version on the instance. The offer still
+        has to be saved.
+        """
+        self.rendered_content = markdown_converter.convert(self.content)
+        self.rendered_version = RENDERER_VERSION
+        return self.rendered_content
+
+    def has_rendered_content(self):
+        """
+        Whether the stored rendered content was rendered by the current renderer
+        """
+        return self.rendered_version == RENDERER_VERSION
+
     def html_content(self):
+        if self.has_rendered_content():
+            return self.rendered_content
+
+        # The stored content is missing or stale, until it is re-rendered fall back to the cache
         cache_key = self.get_cache_key()
         html_content = cache.get(cache_key)
         if html_content is None:
@@ -407,6 +573,15 @@ class Offer(models.Model):
 
     class Meta:
         ordering = ['-published_at']
+        index_together = (
+            # The publish queue
+            ('is_request', 'status', 'is_ready', 'readied_at'),
+            # visible_offers and active_offers, newest first
+            ('status', 'is_request', 'published_at'),
+            ('status', 'is_request', 'is_active', 'published_at'),
+            # The requests of a provider, newest first
+            ('provider', 'is_request', 'status', 'created_at'),
+        )
 
 
 def offer_update_published(sender, instance, raw, **kwargs):
@@ -426,13 +601,72 @@ def offer_update_published(sender, instance, raw, **kwargs):
                 instance.readied_at = timezone.now()
 
 
+def offer_remember_queue(sender, instance, raw, **kwargs):
+    instance._old_queue = None
+    if instance.pk is not None:
+        old_queue = Offer.objects.filter(pk=instance.pk).values_list('queue_rank', 'readied_at')
+        if old_queue:
+            # The queue may have moved since the instance was loaded, saving it mustn't write back an old rank
+            instance._old_queue = old_queue[0]
+            instance.queue_rank = instance._old_queue[0]
+
+
+def offer_update_queue(sender, instance, raw, **kwargs):
+    if raw:
+        return
+    old_rank, old_readied_at = getattr(instance, '_old_queue', None) or (None, None)
+    is_queued = instance.is_queued()
+
+    if old_rank is not None and is_queued and old_readied_at == instance.readied_at:
+        # Still at the same position
+        return
+    if old_rank is None and not is_queued:
+        return
+
+    with transaction.atomic():
+        if old_rank is not None:
+            instance.leave_queue(old_rank)
+        if is_queued:
+            instance.enter_queue()
+
+
+def offer_delete_queue(sender, instance, **kwargs):
+    # The rank of the loaded offer can be outdated
+    ranks = Offer.objects.filter(pk=instance.pk, queue_rank__isnull=False).values_list('queue_rank', flat=True)
+    if ranks:
+        instance.leave_queue(ranks[0])
+
+
+def offer_render_content(sender, instance, raw, **kwargs):
+    if raw:
+        return
+    instance.render_content()
+
+
 def offer_clear_cache(sender, instance, raw, **kwargs):
     instance.delete_html_cache()
-    instance.html_content()
+
+
+def offer_update_summary(sender, instance, raw, **kwargs):
+    if raw:
+        return
+    OfferSummary.update_for_offer(instance)
+
+
+def offer_change_pages(sender, **kwargs):
+    from offers.page_cache import offers_changed
+    offers_changed()
 
 
 pre_save.connect(offer_update_published, sender=Offer)
+pre_save.connect(offer_remember_queue, sender=Offer)
+post_save.connect(offer_update_queue, sender=Offer)
+pre_delete.connect(offer_delete_queue, sender=Offer)
+pre_save.connect(offer_render_content, sender=Offer)
 post_save.connect(offer_clear_cache, sender=Offer)
+post_save.connect(offer_update_summary, sender=Offer)
+post_save.connect(offer_change_pages, sender=Offer)
+post_delete.connect(offer_change_pages, sender=Offer)
 
 
 class Plan(models.Model):
@@ -500,6 +734,10 @@ class Plan(models.Model):
     objects = models.Manager()
     active_plans = ActivePlanManager()
 
+    class Meta:
+        # The active plans of an offer, by billing time and cost
+        index_together = (('offer', 'is_active', 'billing_time', 'cost'),)
+
     def data_format(self, value, format_type):
         """
         Format data such as MB or GB into better format. This means that:
@@ -618,6 +856,11 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ['created_at']
+        index_together = (
+            # The comments of an offer and of a user, in order
+            ('offer', 'status', 'created_at'),
+            ('commenter', 'status', 'created_at'),
+        )
 
     def is_reply(self):
         if self.reply_to is None:
@@ -635,6 +878,8 @@ class Comment(models.Model):
         })
 
     def like_count(self):
+        if hasattr(self, '_like_count'):
+            return self._like_count
         return self.like_set.count()
 
     def does_like(self, user):
@@ -647,6 +892,8 @@ class Comment(models.Model):
         :rtype: bool
         """
 
+        if hasattr(self, '_liked_user_pks'):
+            return user.pk in self._liked_user_pks
         return self.like_set.filter(user=user).exists()
 
     def liked_users(self):
@@ -655,7 +902,9 @@ class Comment(models.Model):
         :return: The comma separated list of users
         :rtype: str
         """
-        return ', '.join([like.user.username for like in self.like_set.all()])
+        if hasattr(self, '_liked_users'):
+            return ', '.join(self._liked_users)
+        return ', '.join([like.user.username for like in self.like_set.select_related('user')])
 
     def text_comment(self):
         """
@@ -687,3 +936,398 @@ class Like(models.Model):
 
     class Meta:
         unique_together = (('user', 'comment'),)
+
+
+class FollowerMailing(models.Model):
+    """
+    The progress of mailing the followers of an offer about a new comment. Followers are mailed in chunks in the order
+    of their primary key, so a mailing that was interrupted continues after the last chunk that was sent.
+
+    Every chunk task carries the ``chain_token`` of the mailing and the follower it continues after. A chunk is only
+    sent by the task that claims it, so a chunk task that is delivered twice, or the chain of a mailing that was
+    resumed meanwhile, never mails the same followers again.
+    """
+    comment = models.ForeignKey(Comment, related_name='follower_mailings')
+    exclude_user = models.ForeignKey(User, null=True, blank=True, related_name='+')
+
+    last_follower_pk = models.PositiveIntegerField(default=0)
+    sent_count = models.PositiveIntegerField(default=0)
+    is_done = models.BooleanField(default=False)
+    chain_token = models.CharField(max_length=32, blank=True, default='')
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __unicode__(self):
+        return u"Mailing of comment #{0}".format(self.comment_id)
+
+    def get_next_followers(self, chunk_size):
+        """
+        The primary keys, emails and names of the next followers to mail
+        """
+        followers = self.comment.offer.followers.filter(pk__gt=self.last_follower_pk).order_by('pk')
+        if self.exclude_user_id is not None:
+            followers = followers.exclude(pk=self.exclude_user_id)
+        return list(followers.values_list(
+            'pk', 'email', 'first_name', 'last_name', 'user_profile__notification_mode'
+        )[:chunk_size])
+
+
+class NotificationEvent(models.Model):
+    """
+    A notification for a user who gets their notifications in a digest. The events are collected here until the next
+    digest of the user is sent.
+    """
+    LIKE = 'l'
+    UNLIKE = 'u'
+    REPLY = 'r'
+    NEW_COMMENT = 'c'
+    KIND_CHOICES = (
+        (LIKE, 'Like'),
+        (UNLIKE, 'Unlike'),
+        (REPLY, 'Reply'),
+        (NEW_COMMENT, 'New comment'),
+    )
+
+    recipient = models.ForeignKey(User, related_name='notification_events')
+    kind = models.CharField(max_length=1, choices=KIND_CHOICES)
+    comment = models.ForeignKey(Comment, null=True, blank=True, on_delete=models.SET_NULL, related_name='+')
+    actor_name = models.CharField(max_length=30)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        index_together = (('sent_at', 'recipient'),)
+
+    def __unicode__(self):
+        return u"{0} by {1} for {2}".format(self.get_kind_display(), self.actor_name, self.recipient_id)
+
+    @classmethod
+    def coalesce(cls, events):
+        """
+        Collapses the events of one digest. A like and an unlike of the same comment by the same user cancel each
+        other out, so of all the likes and unlikes of a user on a comment only the net result is kept.
+
+        :param events: The events in the order they happened
+        :rtype: list
+        """
+        net_likes = {}
+        last_like = {}
+        for event in events:
+            if event.kind in (cls.LIKE, cls.UNLIKE):
+                key = (event.comment_id, event.actor_name)
+                net_likes[key] = net_likes.get(key, 0) + (1 if event.kind == cls.LIKE else -1)
+                last_like[key] = event
+
+        coalesced = []
+        for event in events:
+            if event.comment_id is None:
+                # The comment was deleted
+                continue
+            if event.kind in (cls.LIKE, cls.UNLIKE):
+                key = (event.comment_id, event.actor_name)
+                if last_like[key] is not event or net_likes[key] == 0:
+                    continue
+            coalesced.append(event)
+        return coalesced
+
+
+class SearchIndexQueue(models.Model):
+    """
+    The offers whose search index documents are out of date. An offer is queued once, queuing it again only moves its
+    ``queued_at``, so an update made while the offer is being indexed is not lost (see ``offers.search_queue``).
+    """
+    # Not a foreign key, deleted offers stay queued until they are removed from the index
+    offer_id = models.PositiveIntegerField(unique=True)
+    queued_at = models.DateTimeField(db_index=True)
+
+    # Kept below the number of parameters a query may have on SQLite
+    CHUNK_SIZE = 500
+
+    def __unicode__(self):
+        return u"Index update of offer #{0}".format(self.offer_id)
+
+    @classmethod
+    def enqueue(cls, offer_pks):
+        """
+        Queues the offers for indexing
+        """
+        offer_pks = sorted(set(offer_pks))
+        now = timezone.now()
+        for start in range(0, len(offer_pks), cls.CHUNK_SIZE):
+            chunk = offer_pks[start:start + cls.CHUNK_SIZE]
+            queued = set(cls.objects.filter(offer_id__in=chunk).values_list('offer_id', flat=True))
+            if queued:
+                cls.objects.filter(offer_id__in=queued).update(queued_at=now)
+
+            new = [pk for pk in chunk if pk not in queued]
+            if not new:
+                continue
+            try:
+                with transaction.atomic():
+                    cls.objects.bulk_create([cls(offer_id=pk, queued_at=now) for pk in new])
+            except IntegrityError:
+                # Another process queued some of them in the meantime
+                for pk in new:
+                    if not cls.objects.filter(offer_id=pk).update(queued_at=now):
+                        cls.objects.create(offer_id=pk, queued_at=now)
+
+
+class CommentThread(object):
+    """
+    A list of comments loaded with everything ``offers/comments.html`` displays. The commenter (with their profile
+    and provider), the offer and the comment being replied to are joined in, and the likes of all the comments are
+    loaded with a single query. The like helpers of each comment (``like_count``, ``liked_users`` and
+    ``does_like``) then answer from the loaded data.
+    """
+    def __init__(self, comments, user=None):
+        """
+        :param comments: The comments to load. Use ``CommentThread.prepare`` on a queryset before slicing or
+                         paginating it to join the related rows in.
+        :param user: The user viewing the comments
+        :type user: User
+        """
+        self.user = user
+        self.comments = list(comments)
+        self.load_likes()
+
+    @classmethod
+    def prepare(cls, comments):
+        """
+        Joins the rows displayed with each comment into a comment queryset.
+        """
+        return comments.select_related(
+            'commenter__user_profile__provider',
+            'offer',
+            'reply_to__commenter',
+            'reply_to__offer',
+        )
+
+    @classmethod
+    def for_offer(cls, offer, user=None):
+        """
+        Loads the published comments of an offer.
+        """
+        return cls(cls.prepare(offer.get_comments()), user)
+
+    @classmethod
+    def for_page(cls, page, user=None):
+        """
+        Replaces the comments of a paginator page with a loaded comment thread.
+        """
+        page.object_list = cls(page.object_list, user)
+        return page
+
+    def load_likes(self):
+        comments = dict((comment.pk, comment) for comment in self.comments)
+
+        for comment in self.comments:
+            comment._like_count = 0
+            comment._liked_users = []
+            comment._liked_user_pks = set()
+
+        if not comments:
+            return
+
+        likes = Like.objects.filter(comment__in=comments.keys()).order_by('pk').values_list(
+            'comment', 'user', 'user__username'
+        )
+        for comment_pk, user_pk, username in likes:
+            comment = comments[comment_pk]
+            comment._like_count += 1
+            comment._liked_users.append(username)
+            comment._liked_user_pks.add(user_pk)
+
+    def __iter__(self):
+        return iter(self.comments)
+
+    def __len__(self):
+        return len(self.comments)
+
+    def __getitem__(self, index):
+        return self.comments[index]
+
+
+class OfferSummary(models.Model):
+    """
+    A denormalized copy of everything the offer card (``offers/short_offer.html``) displays about the plans and
+    comments of an offer. It is kept up to date by the save and delete signals of offers, plans, locations and
+    comments, and can be rebuilt in bulk with the ``rebuild_offer_summaries`` management command.
+    """
+    offer = models.OneToOneField(Offer, related_name='summary')
+
+    plan_count = models.PositiveIntegerField(default=0)
+    active_plan_count = models.PositiveIntegerField(default=0)
+    comment_count = models.PositiveIntegerField(default=0)
+
+    min_max_cost_data = models.TextField(default='[]')
+    locations_data = models.TextField(default='[]')
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __unicode__(self):
+        return u"Summary of offer #{0}".format(self.offer_id)
+
+    def get_min_max_cost(self):
+        """
+        The per billing period minimum and maximum costs, in the same format as ``Offer.get_min_max_cost``.
+        """
+        return json.loads(self.min_max_cost_data)
+
+    def get_plan_locations(self):
+        """
+        The distinct locations of the plans of the offer. Each location is a dictionary with the keys ``city``,
+        ``country`` (the country code), ``country_name``, ``flag``, ``datacenter`` and ``name``.
+        """
+        return json.loads(self.locations_data)
+
+    def get_countries(self):
+        """
+        The distinct country codes of the plan locations, in the order they first appear.
+        """
+        countries = []
+        for location in self.get_plan_locations():
+            if location["country"] not in countries:
+                countries.append(location["country"])
+        return countries
+
+    @classmethod
+    def location_data(cls, location):
+        return {
+            "city": location.city,
+            "country": location.country.code,
+            "country_name": unicode(location.country.name),
+            "flag": location.country.flag,
+            "datacenter": location.datacenter.name,
+            "name": unicode(location),
+        }
+
+    @classmethod
+    def values_for_offer(cls, offer):
+        """
+        Calculates the summary values of an offer from the live plan and comment data.
+        """
+        return {
+            "plan_count": offer.plan_count(),
+            "active_plan_count": offer.active_plan_count(),
+            "comment_count": offer.comment_count(),
+            "min_max_cost_data": json.dumps(offer.get_min_max_cost()),
+            "locations_data": json.dumps([cls.location_data(location) for location in offer.get_plan_locations()]),
+        }
+
+    @classmethod
+    def build_for_offer(cls, offer):
+        """
+        Returns an unsaved summary for the offer.
+        """
+        return cls(offer=offer, **cls.values_for_offer(offer))
+
+    @classmethod
+    def update_for_offer(cls, offer, create=True):
+        """
+        Recalculates and stores the summary of an offer.
+
+        :param offer: The offer to summarize
+        :type offer: Offer
+        :param create: If the summary row should be created when it does not exist yet
+        :type create: bool
+        """
+        if offer.pk is None:
+            return
+        values = cls.values_for_offer(offer)
+        values["updated_at"] = timezone.now()
+
+        if not cls.objects.filter(offer=offer).update(**values) and create:
+            cls.objects.create(offer=offer, **values)
+        offer_change_pages(cls)
+
+    @classmethod
+    def update_for_offer_pk(cls, offer_pk, create=True):
+        try:
+            offer = Offer.objects.get(pk=offer_pk)
+        except Offer.DoesNotExist:
+            return
+        cls.update_for_offer(offer, create=create)
+
+
+def plan_update_summary(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    OfferSummary.update_for_offer_pk(instance.offer_id)
+
+
+def plan_delete_update_summary(sender, instance, **kwargs):
+    # The offer may be in the middle of being deleted itself, so never create a new summary row here
+    OfferSummary.update_for_offer_pk(instance.offer_id, create=False)
+
+
+def plan_locations_update_summary(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        OfferSummary.update_for_offer_pk(instance.offer_id)
+    elif pk_set:
+        for offer_pk in Plan.objects.filter(pk__in=pk_set).values_list('offer', flat=True).distinct():
+            OfferSummary.update_for_offer_pk(offer_pk)
+
+
+def location_update_summary(sender, instance, raw, **kwargs):
+    if raw or instance.pk is None:
+        return
+    for offer_pk in Plan.objects.filter(locations=instance).values_list('offer', flat=True).distinct():
+        OfferSummary.update_for_offer_pk(offer_pk)
+
+
+def comment_update_summary(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    OfferSummary.update_for_offer_pk(instance.offer_id)
+
+
+def comment_delete_update_summary(sender, instance, **kwargs):
+    OfferSummary.update_for_offer_pk(instance.offer_id, create=False)
+
+
+def update_plan_index(plan_ids):
+    from offers.plan_index import plan_index
+    plan_index.update_plans(plan_ids)
+
+
+def plan_update_plan_index(sender, instance, **kwargs):
+    update_plan_index([instance.pk])
+
+
+def plan_locations_update_plan_index(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        update_plan_index([instance.pk])
+    elif pk_set:
+        update_plan_index(pk_set)
+    else:
+        # The plans of a cleared location are not known anymore
+        from offers.plan_index import plan_index
+        plan_index.invalidate()
+
+
+def offer_update_plan_index(sender, instance, **kwargs):
+    update_plan_index(instance.plan_set.values_list('pk', flat=True))
+
+
+def location_update_plan_index(sender, instance, **kwargs):
+    update_plan_index(instance.plans.values_list('pk', flat=True))
+
+
+post_save.connect(plan_update_summary, sender=Plan)
+post_delete.connect(plan_delete_update_summary, sender=Plan)
+m2m_changed.connect(plan_locations_update_summary, sender=Plan.locations.through)
+post_save.connect(location_update_summary, sender=Location)
+post_save.connect(comment_update_summary, sender=Comment)
+post_delete.connect(comment_delete_update_summary, sender=Comment)
+
+post_save.connect(plan_update_plan_index, sender=Plan)
+post_delete.connect(plan_update_plan_index, sender=Plan)
+m2m_changed.connect(plan_locations_update_plan_index, sender=Plan.locations.through)
+post_save.connect(offer_update_plan_index, sender=Offer)
+post_save.connect(location_update_plan_index, sender=Location)
@@ -0,0 +1,219 @@
+"""
+Whole page caching for anonymous visitors.
+
+A cached page is keyed by the version of the content it shows. Saving anything a page shows changes its version, so
+pages never have to be invalidated. The version is also sent as the ``ETag`` of the page and the newest date as its
+``Last-Modified``, so a conditional request for an unchanged page is answered with ``304 Not Modified`` without
+rendering or reading the cache at all.
+
+The lists of offers and providers show too many rows to read their dates on every request, so their version is the
+date the offers (with their summaries) or the providers last changed, which the signals of the models store in the
+cache (see ``offers_changed`` and ``providers_changed``). The dates are read from the shared tier of the cache, as the
+local tier would serve a change of another process late. With the shared tier in the database, a change made in a
+transaction stores its date in the same transaction. The page of an offer reads the dates of its own rows instead.
+
+The pages show relative times ("released 3 hours ago"), which do not change the version, PAGE_CACHE_TIMEOUT limits
+how old those get.
+"""
+import calendar
+import hashlib
+from datetime import datetime, timedelta
+from functools import wraps
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.db.models import Max, Count
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils import timezone
+from django.utils.http import http_date, parse_http_date_safe, parse_etags, quote_etag
+from offers.models import Offer, Provider, Comment, Like, Location
+from template_helpers.converters import RENDERER_VERSION
+
+# Changing the templates of the pages doesn't change their version, bump this to drop the cached pages
+PAGE_CACHE_VERSION = 2
+
+OFFERS_CHANGED_CACHE_KEY = 'page-cache-offers-changed'
+PROVIDERS_CHANGED_CACHE_KEY = 'page-cache-providers-changed'
+
+
+def is_cacheable(request):
+    """
+    Whether the page of a request is the same for everyone who requests it
+    """
+    return (
+        settings.PAGE_CACHE_ENABLED and
+        request.method in ('GET', 'HEAD') and
+        not request.user.is_authenticated() and
+        # Pending messages are shown on the page, counting them doesn't mark them as seen
+        not len(get_messages(request))
+    )
+
+
+def get_etag(parts):
+    return hashlib.md5(repr((PAGE_CACHE_VERSION,) + tuple(parts))).hexdigest()
+
+
+def get_last_modified(parts):
+    dates = [part for part in parts if isinstance(part, datetime)]
+    return max(dates) if dates else None
+
+
+def is_not_modified(request, etag, last_modified):
+    """
+    Whether the copy the client has is still current. The ETag decides when the client sent one, otherwise the date.
+    """
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        return etag in parse_etags(if_none_match) or if_none_match.strip() == '*'
+
+    if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+    if if_modified_since is not None and last_modified is not None:
+        return calendar.timegm(last_modified.utctimetuple()) <= if_modified_since
+    return False
+
+
+def get_page_cache_key(request):
+    return "page-{0}".format(hashlib.md5(request.get_full_path().encode('utf-8')).hexdigest())
+
+
+def get_cached_response(request, cache_key, version, render):
+    """
+    Answers a request with a cached copy of a response. The copy is rendered and stored when there is none for the
+    version yet, and when the client already has the version it gets a ``304 Not Modified`` instead.
+
+    :param cache_key: The cache key of the response, the version is added to it
+    :param version: A list of the values the response depends on and the date it last changed
+    :param render: A function that returns the response, only a ``200 OK`` response is stored
+    :rtype: django.http.HttpResponse
+    """
+    parts, last_modified = version
+    etag = get_etag(parts)
+
+    if is_not_modified(request, etag, last_modified):
+        response = HttpResponseNotModified()
+    else:
+        cache_key = "{0}-{1}".format(cache_key, etag)
+        cached = cache.get(cache_key)
+        if cached is None:
+            response = render()
+            if response.status_code != 200 or response.streaming:
+                return response
+            # The headers the view set (like Vary) are stored with the content, cookies are not
+            cache.set(cache_key, (response.content, response.items()), settings.PAGE_CACHE_TIMEOUT)
+        else:
+            content, headers = cached
+            response = HttpResponse(content)
+            for header, value in headers:
+                response[header] = value
+
+    response['ETag'] = quote_etag(etag)
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(calendar.timegm(last_modified.utctimetuple()))
+    return response
+
+
+def cache_anonymous_page(get_version):
+    """
+    Caches the page of a view for anonymous visitors and answers their conditional requests.
+
+    :param get_version: A function that takes the arguments of the view and returns a list of the values the page
+                        depends on and the date it last changed, or None when the view should just run (like when
+                        the page doesn't exist)
+    """
+    def decorator(view):
+        @wraps(view)
+        def cached_view(request, *args, **kwargs):
+            if not is_cacheable(request):
+                return view(request, *args, **kwargs)
+
+            version = get_version(*args, **kwargs)
+            if version is None:
+                return view(request, *args, **kwargs)
+            return get_cached_response(
+                request, get_page_cache_key(request), version, lambda: view(request, *args, **kwargs)
+            )
+        return cached_view
+    return decorator
+
+
+def get_changed_cache():
+    # A tiered cache keeps local copies for a while, the dates of the changes have to be seen by every process at once
+    return getattr(cache, 'shared', cache)
+
+
+def set_changed(key):
+    get_changed_cache().set(key, timezone.now(), None)
+
+
+def offers_changed():
+    """
+    Changes the version of the pages that list offers, called when an offer or its summary changes
+    """
+    set_changed(OFFERS_CHANGED_CACHE_KEY)
+
+
+def providers_changed():
+    """
+    Changes the version of the pages that list providers, called when a provider changes
+    """
+    set_changed(PROVIDERS_CHANGED_CACHE_KEY)
+
+
+def get_changed(*keys):
+    """
+    The dates the content of the keys last changed. A date that isn't in the cache (yet) is set to now, so the pages
+    that depend on it count as changed.
+
+    :rtype: list
+    """
+    changed_cache = get_changed_cache()
+    dates = changed_cache.get_many(keys)
+    for key in keys:
+        if dates.get(key) is None:
+            changed_cache.add(key, timezone.now(), None)
+            dates[key] = changed_cache.get(key)
+    return [dates[key] for key in keys]
+
+
+def list_offers_version(page_number=1):
+    # The page counts down to the next publish, which only moves when the schedule runs
+    next_offer = timezone.now() + timedelta(seconds=settings.PUBLISH_SCHEDULE.is_due(timezone.now())[1])
+    parts = get_changed(OFFERS_CHANGED_CACHE_KEY, PROVIDERS_CHANGED_CACHE_KEY)
+    return parts + [next_offer.strftime('%Y%m%d%H%M')], get_last_modified(parts)
+
+
+def view_offer_version(offer_pk, slug=None):
+    offer = Offer.visible_offers.filter(pk=offer_pk).values(
+        'updated_at', 'rendered_version', 'summary__updated_at', 'provider__updated_at'
+    ).first()
+    if offer is None:
+        return None
+
+    comments = Comment.objects.filter(offer=offer_pk).aggregate(updated_at=Max('updated_at'), count=Count('pk'))
+    likes = Like.objects.filter(comment__offer=offer_pk).aggregate(updated_at=Max('updated_at'), count=Count('pk'))
+    # The page lists the test addresses and downloads of the plan locations
+    locations = Location.objects.filter(plans__offer=offer_pk).aggregate(
+        test_ips_updated_at=Max('test_ips__updated_at'), test_ip_count=Count('test_ips', distinct=True),
+        test_downloads_updated_at=Max('test_downloads__updated_at'),
+        test_download_count=Count('test_downloads', distinct=True),
+    )
+    # Re-rendering the content of the offer doesn't change its dates
+    parts = [
+        offer["updated_at"], offer["rendered_version"], RENDERER_VERSION, offer["summary__updated_at"],
+        offer["provider__updated_at"], comments["updated_at"], comments["count"], likes["updated_at"], likes["count"],
+    ] + [locations[key] for key in sorted(locations)]
+    return parts, get_last_modified(parts)
+
+
+def provider_list_version():
+    parts = get_changed(PROVIDERS_CHANGED_CACHE_KEY, OFFERS_CHANGED_CACHE_KEY)
+    return parts, get_last_modified(parts)
+
+
+def provider_profile_version(provider_name):
+    provider = Provider.objects.filter(name_slug=provider_name).values('pk', 'updated_at').first()
+    if provider is None:
+        return None
+
+    parts = [provider["updated_at"]] + get_changed(OFFERS_CHANGED_CACHE_KEY)
+    return parts, get_last_modified(parts)
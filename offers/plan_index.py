@@ -0,0 +1,639 @@
+"""
+An in memory, columnar index of the active plans for the plan finder.
+
+Every active plan is a row. The numeric fields are kept in array columns and every value of the categorical fields
+(billing time, server type, provider, country and datacenter) has a bitset of the rows that have it, stored as a
+Python integer. A search ANDs the bitsets of the filters together, so it never touches the database. A range of a
+numeric field is turned into a bitset from the rows sorted by that field.
+
+Every operation on a bitset copies the whole integer, so the bitsets are never built or read one row at a time: they
+are built from a byte array of the rows and read by converting them into one (``rows_to_mask`` and
+``mask_to_bytes``), which keeps every search linear in the number of plans.
+
+The index of a process is updated incrementally by the Plan, Offer and Location signals. Other processes notice the
+change through a version stamp in the shared tier of the cache and rebuild their index on their next search, so every
+change costs every other process a full rebuild (one query over the active plans). A process that was already behind
+when it changes plans rebuilds as well, instead of applying only its own changes.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from decimal import Decimal, InvalidOperation
+import binascii
+import calendar
+import hashlib
+import threading
+import uuid
+from django.core.cache import cache
+from django_countries import countries as COUNTRIES
+from offers.models import Offer, Plan, Provider, Datacenter
+
+VERSION_CACHE_KEY = 'plan-index-version'
+
+# How long the facets and offer searches are cached, they are also invalidated by every change of the index
+FACETS_CACHE_TIMEOUT = 60 * 10
+
+NUMERIC_FIELDS = ('memory', 'disk_space', 'bandwidth', 'ipv4_space', 'ipv6_space', 'cpu_cores', 'cost')
+ORDERING_FIELDS = NUMERIC_FIELDS + ('created_at', 'pk')
+
+# The categorical filters of the plan api and the bitsets they filter on
+SET_FIELDS = {
+    'billing_time': 'billing_time',
+    'server_type': 'server_type',
+    'offer__provider__id': 'provider',
+    'locations__country': 'country',
+    'locations__datacenter__id': 'datacenter',
+}
+INTEGER_SET_FIELDS = ('provider', 'datacenter')
+
+# The positions of the set bits of every byte value
+BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+
+def get_version_cache():
+    # A tiered cache keeps local copies for a while, a change of the version has to be seen by every process at once
+    return getattr(cache, 'shared', cache)
+
+
+def rows_to_mask(rows, size):
+    """
+    The bitset of the rows, of an index with the given number of rows
+    """
+    data = bytearray((size + 7) // 8)
+    for row in rows:
+        data[row >> 3] |= 1 << (row & 7)
+    if not data:
+        return 0
+    data.reverse()
+    return int(binascii.hexlify(data), 16)
+
+
+def mask_to_bytes(mask):
+    """
+    The bitset as a byte array, the bit of a row is bit ``row & 7`` of byte ``row >> 3`` (see ``has_row``)
+    """
+    digits = '{0:x}'.format(mask)
+    data = bytearray(binascii.unhexlify(digits if len(digits) % 2 == 0 else '0' + digits))
+    data.reverse()
+    return data
+
+
+def has_row(data, row):
+    index = row >> 3
+    return index < len(data) and data[index] >> (row & 7) & 1
+
+
+def mask_rows(mask):
+    """
+    The rows of the bitset, in order
+    """
+    for index, value in enumerate(mask_to_bytes(mask)):
+        if value:
+            for bit in BYTE_BITS[value]:
+                yield index << 3 | bit
+
+
+class PlanQuery(object):
+    """
+    A normalized plan finder search. It takes the same parameters as the plan api: ``<field>__gte``, ``<field>__lte``
+    and ``<field>`` for the numeric fields, ``<field>__in`` (comma separated) and ``<field>`` for the categorical
+    fields, and ``order_by``, ``offset`` and ``limit``. Other parameters are ignored.
+    """
+    def __init__(self, ranges=None, sets=None, order_by='pk', offset=0, limit=20):
+        self.ranges = ranges or {}
+        self.sets = sets or {}
+        self.order_by = order_by
+        self.offset = offset
+        self.limit = limit
+
+    @staticmethod
+    def parse_number(value):
+        try:
+            return float(Decimal(value))
+        except (InvalidOperation, TypeError):
+            raise ValueError("Invalid number '{0}'".format(value))
+
+    @staticmethod
+    def parse_set(field, values):
+        values = [value.strip() for value in values if value.strip()]
+        if field in INTEGER_SET_FIELDS:
+            try:
+                return frozenset(int(value) for value in values)
+            except ValueError:
+                raise ValueError("Invalid {0} '{1}'".format(field, ','.join(values)))
+        return frozenset(values)
+
+    @classmethod
+    def from_params(cls, params, default_limit=20, max_limit=100):
+        """
+        Parses the query parameters of a search.
+
+        :raises ValueError: When a parameter is invalid
+        """
+        ranges = {}
+        sets = {}
+
+        for key in params.keys():
+            value = params.get(key)
+            name, separator, lookup = key.rpartition('__')
+            if not separator:
+                name, lookup = key, 'exact'
+
+            if name in NUMERIC_FIELDS and lookup in ('gte', 'lte', 'exact'):
+                minimum, maximum = ranges.get(name, (None, None))
+                number = cls.parse_number(value)
+                if lookup in ('gte', 'exact'):
+                    minimum = number if minimum is None else max(minimum, number)
+                if lookup in ('lte', 'exact'):
+                    maximum = number if maximum is None else min(maximum, number)
+                ranges[name] = (minimum, maximum)
+            elif name in SET_FIELDS and lookup in ('in', 'exact'):
+                field = SET_FIELDS[name]
+                values = cls.parse_set(field, value.split(',') if lookup == 'in' else [value])
+                sets[field] = sets[field] & values if field in sets else values
+            elif key in SET_FIELDS:
+                sets[SET_FIELDS[key]] = cls.parse_set(SET_FIELDS[key], [value])
+
+        order_by = params.get('order_by') or 'pk'
+        if order_by.lstrip('-') not in ORDERING_FIELDS:
+            raise ValueError("Can't order by '{0}'".format(order_by))
+
+        try:
+            offset = int(params.get('offset', 0))
+            limit = int(params.get('limit', default_limit))
+        except ValueError:
+            raise ValueError("Invalid offset or limit")
+        if offset < 0 or limit < 0:
+            raise ValueError("Invalid offset or limit")
+
+        return cls(ranges, sets, order_by, offset, min(limit or max_limit, max_limit))
+
+    def filter_key(self):
+        """
+        A key that is the same for every query with the same filters, in any order
+        """
+        ranges = sorted((field, minimum, maximum) for field, (minimum, maximum) in self.ranges.items())
+        sets = sorted((field, sorted(values)) for field, values in self.sets.items())
+        return repr((ranges, sets))
+
+
+class PlanIndex(object):
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.version = None
+        self._clear()
+
+    def _clear(self):
+        self.plan_ids = array('l')
+        self.offer_ids = array('l')
+        self.rows = {}
+        self.free_rows = []
+        self.alive = 0
+
+        self.columns = dict((field, array('d')) for field in NUMERIC_FIELDS + ('created_at',))
+        self.bitsets = dict((field, {}) for field in SET_FIELDS.values())
+        self.row_values = []
+
+        self._sorted = {}
+
+    # Loading
+
+    @staticmethod
+    def _timestamp(value):
+        return calendar.timegm(value.utctimetuple()) + value.microsecond / 1000000.0
+
+    @classmethod
+    def _load(cls, plan_ids=None):
+        """
+        Loads the index records of the active plans (or only of the given plans) in two queries
+
+        :rtype: dict
+        """
+        plans = Plan.active_plans.all()
+        if plan_ids is not None:
+            plans = plans.filter(pk__in=plan_ids)
+
+        records = {}
+        fields = NUMERIC_FIELDS + ('created_at', 'billing_time', 'server_type', 'offer_id', 'offer__provider_id')
+        for values in plans.values_list('pk', *fields):
+            record = dict(zip(fields, values[1:]))
+            record['created_at'] = cls._timestamp(record['created_at'])
+            records[values[0]] = {
+                'offer': record['offer_id'],
+                'numbers': [float(record[field]) for field in NUMERIC_FIELDS + ('created_at',)],
+                'sets': {
+                    'billing_time': set([record['billing_time']]),
+                    'server_type': set([record['server_type']]),
+                    'provider': set([record['offer__provider_id']]),
+                    'country': set(),
+                    'datacenter': set(),
+                },
+            }
+
+        if records:
+            locations = Plan.locations.through.objects.filter(plan__in=plans.values('pk')).values_list(
+                'plan_id', 'location__country', 'location__datacenter_id'
+            )
+            for plan_id, country, datacenter_id in locations:
+                if plan_id in records:
+                    records[plan_id]['sets']['country'].add(country)
+                    records[plan_id]['sets']['datacenter'].add(datacenter_id)
+        return records
+
+    def _set_row(self, plan_id, record):
+        row = self.rows.get(plan_id)
+        if row is None:
+            if self.free_rows:
+                row = self.free_rows.pop()
+                self.plan_ids[row] = plan_id
+            else:
+                row = len(self.plan_ids)
+                self.plan_ids.append(plan_id)
+                self.offer_ids.append(0)
+                for column in self.columns.values():
+                    column.append(0)
+                self.row_values.append({})
+            self.rows[plan_id] = row
+        else:
+            self._clear_bits(row)
+
+        bit = 1 << row
+        self.offer_ids[row] = record['offer']
+        for field, value in zip(NUMERIC_FIELDS + ('created_at',), record['numbers']):
+            self.columns[field][row] = value
+        for field, values in record['sets'].items():
+            bitsets = self.bitsets[field]
+            for value in values:
+                bitsets[value] = bitsets.get(value, 0) | bit
+        self.row_values[row] = record['sets']
+        self.alive |= bit
+
+    def _clear_bits(self, row):
+        bit = 1 << row
+        for field, values in self.row_values[row].items():
+            bitsets = self.bitsets[field]
+            for value in values:
+                bitsets[value] &= ~bit
+                if not bitsets[value]:
+                    del bitsets[value]
+        self.row_values[row] = {}
+        self.alive &= ~bit
+
+    def _remove_row(self, plan_id):
+        row = self.rows.pop(plan_id, None)
+        if row is not None:
+            self._clear_bits(row)
+            self.plan_ids[row] = 0
+            self.offer_ids[row] = 0
+            self.free_rows.append(row)
+
+    def build(self):
+        """
+        Rebuilds the whole index from the database. The rows of every value are collected first, so every bitset is
+        built once.
+        """
+        records = self._load()
+        with self._lock:
+            self._clear()
+            value_rows = dict((field, {}) for field in self.bitsets)
+            for row, plan_id in enumerate(sorted(records)):
+                record = records[plan_id]
+                self.rows[plan_id] = row
+                self.plan_ids.append(plan_id)
+                self.offer_ids.append(record['offer'])
+                for field, value in zip(NUMERIC_FIELDS + ('created_at',), record['numbers']):
+                    self.columns[field].append(value)
+                for field, values in record['sets'].items():
+                    for value in values:
+                        value_rows[field].setdefault(value, []).append(row)
+                self.row_values.append(record['sets'])
+
+            size = len(self.plan_ids)
+            for field, values in value_rows.items():
+                self.bitsets[field] = dict((value, rows_to_mask(rows, size)) for value, rows in values.items())
+            self.alive = (1 << size) - 1
+
+    def ensure_current(self):
+        """
+        Rebuilds the index when it hasn't been built yet or another process changed it
+        """
+        version = get_version_cache().get(VERSION_CACHE_KEY)
+        if version is None:
+            version = uuid.uuid4().hex
+            get_version_cache().set(VERSION_CACHE_KEY, version, None)
+
+        if version != self.version:
+            self.build()
+            self.version = version
+
+    def update_plans(self, plan_ids):
+        """
+        Updates the rows of the plans, plans that are not active anymore are removed from the index
+        """
+        plan_ids = set(plan_ids)
+        if not plan_ids:
+            return
+
+        if get_version_cache().get(VERSION_CACHE_KEY) != self.version:
+            # Another process changed the index since this one was built, applying only these plans would leave
+            # those changes out, so it is rebuilt on the next search instead
+            self.version = None
+
+        version = uuid.uuid4().hex
+        get_version_cache().set(VERSION_CACHE_KEY, version, None)
+
+        if self.version is None:
+            # Not built yet, it is built on the first search
+            return
+
+        records = self._load(plan_ids)
+        with self._lock:
+            for plan_id in plan_ids:
+                if plan_id in records:
+                    self._set_row(plan_id, records[plan_id])
+                else:
+                    self._remove_row(plan_id)
+            self._sorted = {}
+            self.version = version
+
+    def invalidate(self):
+        """
+        Makes every process rebuild its index on its next search
+        """
+        get_version_cache().set(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+        self.version = None
+
+    # Searching
+
+    def _get_sort_key(self, field):
+        column = self.plan_ids if field == 'pk' else self.columns[field]
+        plan_ids = self.plan_ids
+        return lambda row: (column[row], plan_ids[row])
+
+    def _get_sorted(self, field):
+        """
+        The rows sorted by a column and their values
+        """
+        data = self._sorted.get(field)
+        if data is None:
+            column = self.plan_ids if field == 'pk' else self.columns[field]
+            rows = sorted(self.rows.values(), key=self._get_sort_key(field))
+            data = (rows, [column[row] for row in rows])
+            self._sorted[field] = data
+        return data
+
+    def _range_mask(self, field, minimum, maximum):
+        rows, values = self._get_sorted(field)
+        start = 0 if minimum is None else bisect_left(values, minimum)
+        end = len(values) if maximum is None else bisect_right(values, maximum)
+        if start >= end:
+            return 0
+        size = len(self.plan_ids)
+        if end - start <= len(rows) // 2:
+            return rows_to_mask(rows[start:end], size)
+        # Most rows are in the range, the rows outside it are fewer to set
+        return self.alive & ~rows_to_mask(rows[:start] + rows[end:], size)
+
+    def _set_mask(self, field, values):
+        bitsets = self.bitsets[field]
+        mask = 0
+        for value in values:
+            mask |= bitsets.get(value, 0)
+        return mask
+
+    def get_mask(self, query, exclude=None):
+        """
+        The bitset of the rows that match the filters of the query
+
+        :param exclude: The name of a filter to ignore
+        """
+        mask = self.alive
+        for field, values in query.sets.items():
+            if field != exclude and mask:
+                mask &= self._set_mask(field, values)
+        for field, (minimum, maximum) in query.ranges.items():
+            if field != exclude and mask:
+                mask &= self._range_mask(field, minimum, maximum)
+        return mask
+
+    def search(self, query):
+        """
+        Searches the plans
+
+        :type query: PlanQuery
+        :return: The number of matching plans and the ids of the plans on the requested page
+        :rtype: tuple
+        """
+        self.ensure_current()
+        with self._lock:
+            mask = self.get_mask(query)
+            total = bin(mask).count('1')
+
+            field = query.order_by.lstrip('-')
+            descending = query.order_by.startswith('-')
+            plan_ids = []
+            if query.offset < total and total * 8 < len(self.rows):
+                # Few matches, sorting them is cheaper than walking the sorted column
+                rows = sorted(mask_rows(mask), key=self._get_sort_key(field), reverse=descending)
+                plan_ids = [self.plan_ids[row] for row in rows[query.offset:query.offset + query.limit]]
+            elif query.offset < total:
+                rows = self._get_sorted(field)[0]
+                data = mask_to_bytes(mask)
+                skip = query.offset
+                for row in reversed(rows) if descending else rows:
+                    if has_row(data, row):
+                        if skip:
+                            skip -= 1
+                            continue
+                        plan_ids.append(self.plan_ids[row])
+                        if len(plan_ids) >= query.limit:
+                            break
+
+        return total, plan_ids
+
+    def _column_range(self, field, mask):
+        """
+        The minimum and maximum value of a column in the rows of the bitset
+        """
+        if not mask:
+            return None, None
+        data = mask_to_bytes(mask)
+        rows, values = self._get_sorted(field)
+        minimum = next(values[index] for index, row in enumerate(rows) if has_row(data, row))
+        maximum = next(values[index] for index in xrange(len(rows) - 1, -1, -1) if has_row(data, rows[index]))
+        return minimum, maximum
+
+    def facets(self, query):
+        """
+        Counts the matching plans for every value of the categorical fields and finds the range of every numeric field.
+        The filter of a field itself is ignored for its own counts and range, so they show what changing it would find.
+
+        :type query: PlanQuery
+        :rtype: dict
+        """
+        self.ensure_current()
+        with self._lock:
+            mask = self.get_mask(query)
+            facets = {
+                "total_count": bin(mask).count('1'),
+                "counts": {},
+                "ranges": {},
+            }
+
+            for field, bitsets in self.bitsets.items():
+                field_mask = mask if field not in query.sets else self.get_mask(query, exclude=field)
+                facets["counts"][field] = dict(
+                    (value, bin(field_mask & bitset).count('1')) for value, bitset in bitsets.items()
+                )
+
+            for field in NUMERIC_FIELDS:
+                field_mask = mask if field not in query.ranges else self.get_mask(query, exclude=field)
+                minimum, maximum = self._column_range(field, field_mask)
+                facets["ranges"][field] = {"min": minimum, "max": maximum}
+
+        return facets
+
+    def _mask_offers(self, mask):
+        """
+        The distinct offers of the rows in the bitset
+        """
+        offer_column = self.offer_ids
+        return set(offer_column[row] for row in mask_rows(mask))
+
+    def search_offers(self, query):
+        """
+        The offers that have at least one plan that matches the filters of the query, for the offer search
+
+        :type query: PlanQuery
+        :rtype: set
+        """
+        self.ensure_current()
+        with self._lock:
+            return self._mask_offers(self.get_mask(query))
+
+    def offer_facets(self, query, offer_ids, fields=('country', 'server_type')):
+        """
+        Counts the offers (of the given offers) that have a matching plan for every value of the categorical fields.
+        Like ``facets`` the filter of a field is ignored for its own counts.
+
+        :type query: PlanQuery
+        :rtype: dict
+        """
+        self.ensure_current()
+        offer_ids = set(offer_ids)
+        with self._lock:
+            counts = {}
+            for field in fields:
+                field_mask = self.get_mask(query, exclude=field)
+                counts[field] = {}
+                for value, bitset in self.bitsets[field].items():
+                    count = len(self._mask_offers(field_mask & bitset) & offer_ids)
+                    if count:
+                        counts[field][value] = count
+        return counts
+
+plan_index = PlanIndex()
+
+
+def get_facet_names(counts):
+    """
+    The display names of the values of the categorical fields
+    """
+    server_types = {}
+    for key, name in Plan.SERVER_CHOICES:
+        if isinstance(name, tuple):
+            server_types.update(name)
+        else:
+            server_types[key] = name
+
+    return {
+        "billing_time": dict(Plan.BILLING_CHOICES),
+        "server_type": server_types,
+        "country": dict(COUNTRIES),
+        "provider": dict(
+            Provider.objects.filter(pk__in=counts.get("provider", {}).keys()).values_list('pk', 'name')
+        ),
+        "datacenter": dict(
+            Datacenter.objects.filter(pk__in=counts.get("datacenter", {}).keys()).values_list('pk', 'name')
+        ),
+    }
+
+
+def get_facets(query):
+    """
+    The facets of the plan finder for the filters of the query, with the display name of every value. Facets are
+    cached per filter and index version.
+
+    :type query: PlanQuery
+    :rtype: dict
+    """
+    plan_index.ensure_current()
+    cache_key = 'plan-facets-{0}'.format(
+        hashlib.md5('{0}-{1}'.format(plan_index.version, query.filter_key())).hexdigest()
+    )
+    facets = cache.get(cache_key)
+    if facets is not None:
+        return facets
+
+    index_facets = plan_index.facets(query)
+    facets = {
+        "total_count": index_facets["total_count"],
+        "ranges": index_facets["ranges"],
+        "facets": get_named_counts(index_facets["counts"]),
+    }
+
+    cache.set(cache_key, facets, FACETS_CACHE_TIMEOUT)
+    return facets
+
+
+def get_named_counts(counts):
+    """
+    The counts of every value of the categorical fields as lists of ``value``, ``name`` and ``count`` dictionaries,
+    sorted by name
+    """
+    names = get_facet_names(counts)
+    named_counts = {}
+    for field, field_counts in counts.items():
+        values = [{
+            "value": value,
+            "name": unicode(names[field].get(value, value)),
+            "count": count,
+        } for value, count in field_counts.items()]
+        named_counts[field] = sorted(values, key=lambda value: value["name"].lower())
+    return named_counts
+
+
+def get_offer_search(query, text, searchqueryset):
+    """
+    The offers the offer search finds that have a plan matching the filters of the query, in the order of the text
+    search, and the country and server type facets of the found offers: how many of them have a matching plan for
+    every country and server type. Both are cached per text, filter and version of the plan and search indexes, so
+    paging through the results reads the hits of the text search once.
+
+    :type query: PlanQuery
+    :param text: The searched text, without text every visible offer is searched by its plans
+    :param searchqueryset: The text search
+    :return: The primary keys of the found offers and the facets
+    :rtype: tuple
+    """
+    from offers.search_queue import get_search_version
+    plan_index.ensure_current()
+    cache_key = 'offer-search-{0}'.format(hashlib.md5(u'{0}-{1}-{2}-{3}'.format(
+        plan_index.version, get_search_version(), query.filter_key(), text
+    ).encode('utf-8')).hexdigest())
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    if text:
+        # Whoosh can't facet, the plan index counts the offers the text search found
+        offer_ids = [int(pk) for pk in searchqueryset.values_list('pk', flat=True)[:searchqueryset.count()]]
+    else:
+        offer_ids = list(Offer.visible_offers.order_by('pk').values_list('pk', flat=True))
+    facets = get_named_counts(plan_index.offer_facets(query, offer_ids))
+
+    if query.ranges or query.sets:
+        matching = plan_index.search_offers(query)
+        offer_ids = [offer_id for offer_id in offer_ids if offer_id in matching]
+
+    cache.set(cache_key, (offer_ids, facets), FACETS_CACHE_TIMEOUT)
+    return offer_ids, facets
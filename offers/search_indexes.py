@@ -1,19 +1,105 @@
+from HTMLParser import HTMLParser
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
 from haystack import indexes
 from offers.models import Offer
+from offers.search_queue import get_index_version
+
+# The number of words of the content stored for the search results
+SNIPPET_WORDS = 60
 
 
 class OfferIndex(indexes.SearchIndex, indexes.Indexable):
+    """
+    Besides the searched text every search document stores everything a search result displays, so the results are
+    rendered from the index without loading the offers.
+    """
     text = indexes.CharField(document=True, use_template=True)
     provider = indexes.CharField(model_attr='provider')
 
     status = indexes.CharField(model_attr='status')
 
     published_at = indexes.DateTimeField(model_attr='published_at')
+    # Compared with the database by the reconcile_search_index command
+    updated_at = indexes.DateTimeField()
     content_auto = indexes.EdgeNgramField(use_template=True, template_name='search/indexes/offers/offer_text.txt')
+    # The provider suggestions of the autocomplete
+    provider_auto = indexes.EdgeNgramField(model_attr='provider__name')
+
+    # Displayed by the search results
+    name = indexes.CharField(model_attr='name', indexed=False)
+    url = indexes.CharField(indexed=False)
+    is_active = indexes.BooleanField(indexed=False)
+    snippet = indexes.CharField(indexed=False)
+    provider_name = indexes.CharField(indexed=False)
+    provider_slug = indexes.CharField(indexed=False)
+    provider_url = indexes.CharField(indexed=False)
+    provider_logo = indexes.CharField(indexed=False)
+    plan_count = indexes.IntegerField(indexed=False)
+    active_plan_count = indexes.IntegerField(indexed=False)
+    comment_count = indexes.IntegerField(indexed=False)
+    costs = indexes.MultiValueField(indexed=False)
+    countries = indexes.MultiValueField()
+    flags = indexes.MultiValueField(indexed=False)
 
     def get_model(self):
         return Offer
 
+    def prepare_updated_at(self, obj):
+        return get_index_version(obj)
+
+    def prepare_url(self, obj):
+        return obj.get_absolute_url()
+
+    def prepare_is_active(self, obj):
+        return obj.offer_active()
+
+    def prepare_snippet(self, obj):
+        # Stored as text, the template escapes it
+        return Truncator(HTMLParser().unescape(strip_tags(obj.html_content()))).words(SNIPPET_WORDS)
+
+    def prepare_provider_name(self, obj):
+        return obj.provider.name
+
+    def prepare_provider_slug(self, obj):
+        return obj.provider.name_slug
+
+    def prepare_provider_url(self, obj):
+        return obj.provider.get_absolute_url()
+
+    def prepare_provider_logo(self, obj):
+        return obj.provider.get_small_profile_image()["url"]
+
+    def prepare_plan_count(self, obj):
+        return obj.get_summary().plan_count
+
+    def prepare_active_plan_count(self, obj):
+        return obj.get_summary().active_plan_count
+
+    def prepare_comment_count(self, obj):
+        return obj.get_summary().comment_count
+
+    def prepare_costs(self, obj):
+        """
+        The cost range of every billing period, the way the offer card displays it
+        """
+        costs = []
+        for min_max in obj.get_summary().get_min_max_cost():
+            if min_max["same"]:
+                costs.append(u"${0} ({1})".format(min_max["min_cost"], min_max["name"]))
+            else:
+                costs.append(u"${0} - ${1} ({2})".format(min_max["min_cost"], min_max["max_cost"], min_max["name"]))
+        return costs
+
+    def prepare_flags(self, obj):
+        flags = []
+        for location in obj.get_summary().get_plan_locations():
+            flags.append(location["flag"])
+        return flags
+
+    def prepare_countries(self, obj):
+        return obj.get_summary().get_countries()
+
     def index_queryset(self, using=None):
         """Used when the entire index for model is updated."""
-        return self.get_model().visible_offers.all()
\ No newline at end of file
+        return self.get_model().visible_offers.all()
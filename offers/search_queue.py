@@ -0,0 +1,206 @@
+"""
+Incremental updates of the offer search index.
+
+``QueuedSignalProcessor`` (the HAYSTACK_SIGNAL_PROCESSOR) queues the offers that change when an offer, one of its
+plans, comments or locations or its provider is saved or deleted. The queue is a table (``SearchIndexQueue``), so it
+survives restarts, and the ``update_search_index`` task drains it in batches of SEARCH_INDEX_BATCH_SIZE offers. Every
+batch is written to the index with a single commit. The ``reconcile_search_index`` command compares the index with the
+database and fixes the offers that drifted, for example while the workers were down.
+
+Every write to the index changes the version in the shared tier of the cache (``get_search_version``), which the
+cached searches are keyed by.
+"""
+import uuid
+from django.core.cache import cache
+from django.db.models import signals
+from django.utils import timezone
+from haystack import connections, connection_router
+from haystack.query import SearchQuerySet
+from haystack.signals import BaseSignalProcessor
+
+VERSION_CACHE_KEY = 'search-index-version'
+
+
+def get_version_cache():
+    # A tiered cache keeps local copies for a while, a change of the version has to be seen by every process at once
+    return getattr(cache, 'shared', cache)
+
+
+class QueuedSignalProcessor(BaseSignalProcessor):
+    """
+    Queues the offers whose search documents change instead of indexing them while the request waits
+    """
+    def get_handlers(self):
+        from offers.models import Offer, Plan, Provider, Comment, Location
+        return [
+            (signals.post_save, Offer, self.handle_offer),
+            (signals.post_delete, Offer, self.handle_offer),
+            (signals.post_save, Plan, self.handle_plan),
+            (signals.post_delete, Plan, self.handle_plan),
+            (signals.m2m_changed, Plan.locations.through, self.handle_plan_locations),
+            # Deleting a provider deletes its offers, which queues them
+            (signals.post_save, Provider, self.handle_provider),
+            # The documents count the published comments and show the flags and countries of the locations
+            (signals.post_save, Comment, self.handle_comment),
+            (signals.post_delete, Comment, self.handle_comment),
+            (signals.post_save, Location, self.handle_location),
+            # The plans of a deleted location are only known before it is deleted
+            (signals.pre_delete, Location, self.handle_location),
+        ]
+
+    def setup(self):
+        for signal, sender, handler in self.get_handlers():
+            signal.connect(handler, sender=sender)
+
+    def teardown(self):
+        for signal, sender, handler in self.get_handlers():
+            signal.disconnect(handler, sender=sender)
+
+    def handle_offer(self, sender, instance, raw=False, **kwargs):
+        if not raw:
+            enqueue([instance.pk])
+
+    def handle_plan(self, sender, instance, raw=False, **kwargs):
+        if not raw:
+            enqueue([instance.offer_id])
+
+    def handle_plan_locations(self, sender, instance, action, reverse, pk_set, **kwargs):
+        if action not in ('post_add', 'post_remove', 'post_clear'):
+            return
+        from offers.models import Plan
+        if not reverse:
+            enqueue([instance.offer_id])
+        elif pk_set:
+            enqueue(Plan.objects.filter(pk__in=pk_set).values_list('offer', flat=True).distinct())
+
+    def handle_provider(self, sender, instance, raw=False, **kwargs):
+        if not raw:
+            enqueue(instance.offer_set.values_list('pk', flat=True))
+
+    def handle_comment(self, sender, instance, raw=False, **kwargs):
+        if not raw:
+            enqueue([instance.offer_id])
+
+    def handle_location(self, sender, instance, raw=False, **kwargs):
+        if not raw and instance.pk is not None:
+            from offers.models import Plan
+            enqueue(Plan.objects.filter(locations=instance).values_list('offer', flat=True).distinct())
+
+
+def enqueue(offer_pks):
+    from offers.models import SearchIndexQueue
+    SearchIndexQueue.enqueue(offer_pks)
+
+
+def get_identifier(offer_pk):
+    from offers.models import Offer
+    return u"{0}.{1}.{2}".format(Offer._meta.app_label, Offer._meta.module_name, offer_pk)
+
+
+def update_offers(offer_pks, using=None):
+    """
+    Brings the search documents of the offers up to date in the given or every index. The visible offers are written
+    with a single commit, the others are removed.
+
+    :return: The number of updated and removed documents
+    :rtype: tuple
+    """
+    from offers.models import Offer
+    offer_pks = set(offer_pks)
+    updated = removed = 0
+    for alias in [using] if using else connection_router.for_write():
+        index = connections[alias].get_unified_index().get_index(Offer)
+        backend = connections[alias].get_backend()
+
+        offers = list(index.index_queryset(using=alias).filter(pk__in=offer_pks).select_related('provider', 'summary'))
+        if offers:
+            backend.update(index, offers)
+        hidden = offer_pks - set(offer.pk for offer in offers)
+        for offer_pk in sorted(hidden):
+            backend.remove(get_identifier(offer_pk))
+        updated, removed = len(offers), len(hidden)
+    if offer_pks:
+        get_version_cache().set(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+    return updated, removed
+
+
+def get_search_version():
+    """
+    The version of the search index, which changes whenever documents are written
+    """
+    version_cache = get_version_cache()
+    version = version_cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        version_cache.add(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+        version = version_cache.get(VERSION_CACHE_KEY)
+    return version
+
+
+def process_queue(batch_size, queued_before=None):
+    """
+    Indexes the next batch of queued offers and takes them off the queue, unless they were queued again meanwhile
+
+    :param queued_before: Only take the offers queued before this moment
+    :return: The number of offers taken from the queue
+    :rtype: int
+    """
+    from offers.models import SearchIndexQueue
+    started_at = timezone.now()
+    entries = SearchIndexQueue.objects.order_by('queued_at', 'pk')
+    if queued_before is not None:
+        entries = entries.filter(queued_at__lte=queued_before)
+    entries = list(entries.values_list('pk', 'offer_id')[:batch_size])
+    if not entries:
+        return 0
+
+    update_offers([offer_pk for pk, offer_pk in entries])
+    SearchIndexQueue.objects.filter(pk__in=[pk for pk, offer_pk in entries], queued_at__lte=started_at).delete()
+    return len(entries)
+
+
+def get_index_version(offer):
+    """
+    The moment the search document of an offer last changed: the newest update of the offer, its provider and its
+    summary (which changes with the plans and their locations)
+    """
+    dates = [offer.updated_at, offer.provider.updated_at, offer.get_summary().updated_at]
+    return max(date for date in dates if date is not None)
+
+
+def to_index_precision(value):
+    """
+    A date the way the index returns it, naive in UTC and without microseconds
+    """
+    if value is None:
+        return None
+    if timezone.is_aware(value):
+        value = timezone.make_naive(value, timezone.utc)
+    return value.replace(microsecond=0)
+
+
+def get_index_drift(using='default'):
+    """
+    Compares the search documents of the offers with the database
+
+    :return: The primary keys of the visible offers that are not indexed, those whose document is older than the
+             offer, and those that are indexed but no longer visible
+    :rtype: tuple
+    """
+    from offers.models import Offer
+    index = connections[using].get_unified_index().get_index(Offer)
+    offers = index.index_queryset(using=using).values_list(
+        'pk', 'updated_at', 'provider__updated_at', 'summary__updated_at'
+    )
+    versions = dict(
+        (pk, to_index_precision(max(date for date in dates if date is not None)))
+        for pk, dates in ((values[0], values[1:]) for values in offers.iterator())
+    )
+
+    indexed = {}
+    for result in SearchQuerySet().using(using).models(Offer):
+        indexed[int(result.pk)] = to_index_precision(getattr(result, 'updated_at', None))
+
+    missing = sorted(set(versions) - set(indexed))
+    stale = sorted(pk for pk in set(versions) & set(indexed) if indexed[pk] != versions[pk])
+    hidden = sorted(set(indexed) - set(versions))
+    return missing, stale, hidden
@@ -0,0 +1,563 @@
+"""
+A haystack search backend on SQLite FTS5, an embedded alternative to Whoosh that needs no search server.
+
+Every document is a row in a regular table, with its stored fields as JSON, and a row with its text fields in an FTS5
+table. The text filters (``contains`` and ``startswith``, ``auto_query`` and ``autocomplete``) are matched by FTS5 and
+ranked with bm25. The n-gram fields are matched as prefixes of their words, so they don't have to be split into
+n-grams. The other filters (``exact``, ``in``, ``gt``, ``gte``, ``lt``, ``lte`` and ``range``) compare the JSON values,
+and multi valued fields match when any of their values does.
+
+The database is in WAL mode, so searches read the last committed state while a batch of documents is written. Every
+thread has its own SQLite connection.
+
+To use it::
+
+    HAYSTACK_CONNECTIONS = {
+        'default': {
+            'ENGINE': 'offers.sqlite_search.SQLiteSearchEngine',
+            'PATH': os.path.join(BASE_PATH, 'offers_index.sqlite3'),
+        },
+    }
+
+The SQLite library Python is linked against needs the FTS5 and JSON1 extensions, which not every build has
+(``get_missing_features``).
+
+Changing the text fields of the indexes recreates the FTS5 table, the documents have to be indexed again afterwards.
+Faceting, highlighting, spelling suggestions and more like this are not supported, like with Whoosh.
+"""
+from datetime import date, datetime
+from decimal import Decimal
+import json
+import logging
+import os
+import sqlite3
+import threading
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models.loading import get_model
+from django.utils import timezone
+from django.utils.encoding import force_text
+from haystack.backends import BaseEngine, BaseSearchBackend, BaseSearchQuery, log_query
+from haystack.constants import ID, DJANGO_CT, DJANGO_ID
+from haystack.inputs import AutoQuery, Exact, Not, Raw
+from haystack.models import SearchResult
+from haystack.utils import get_identifier
+
+DOCUMENT_TABLE = 'haystack_document'
+TEXT_TABLE = 'haystack_text'
+
+# The fields that are matched as text, the others are compared as values
+TEXT_FIELD_TYPES = ('string', 'ngram', 'edge_ngram')
+PREFIX_FIELD_TYPES = ('ngram', 'edge_ngram')
+TEXT_FILTERS = ('contains', 'startswith')
+
+# The columns of the document table that can be filtered on directly
+DOCUMENT_COLUMNS = {
+    ID: 'd.id',
+    DJANGO_CT: 'd.django_ct',
+    DJANGO_ID: 'd.django_id',
+}
+
+
+def quote_sql(value):
+    """
+    A Python value as an SQL literal
+    """
+    if value is None:
+        return 'NULL'
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, (int, long, float)):
+        return repr(value)
+    return u"'{0}'".format(force_text(value).replace(u"'", u"''"))
+
+
+def quote_fts(term, prefix=False):
+    """
+    A term as an FTS5 string, which matches the words of the term as a phrase
+    """
+    return u'"{0}"{1}'.format(force_text(term).replace(u'"', u'""'), u'*' if prefix else u'')
+
+
+def json_path(fieldname):
+    return quote_sql(u'$."{0}"'.format(fieldname))
+
+
+def get_missing_features():
+    """
+    The extensions the backend needs that the SQLite library of Python lacks, probed on an in memory database
+
+    :rtype: list
+    """
+    missing = []
+    connection = sqlite3.connect(':memory:')
+    try:
+        for feature, statement in [
+            ('FTS5', 'CREATE VIRTUAL TABLE probe USING fts5(text)'),
+            ('JSON1', "SELECT value FROM json_each('[1]')"),
+        ]:
+            try:
+                connection.execute(statement)
+            except sqlite3.OperationalError:
+                missing.append(feature)
+    finally:
+        connection.close()
+    return missing
+
+
+class SQLiteSearchBackend(BaseSearchBackend):
+    def __init__(self, connection_alias, **connection_options):
+        super(SQLiteSearchBackend, self).__init__(connection_alias, **connection_options)
+        if not connection_options.get('PATH'):
+            raise ImproperlyConfigured(
+                "You must specify a 'PATH' in your settings for connection '{0}'.".format(connection_alias)
+            )
+        self.path = connection_options['PATH']
+        # How long a write waits for another write to finish, in seconds
+        self.busy_timeout = connection_options.get('BUSY_TIMEOUT', 30)
+
+        self.setup_complete = False
+        self.content_field_name = None
+        self.text_columns = []
+        self.prefix_columns = set()
+        self._local = threading.local()
+        self._setup_lock = threading.Lock()
+        self.log = logging.getLogger('haystack')
+
+    # Connection and schema
+
+    def get_connection(self):
+        """
+        The SQLite connection of the current thread. It runs in autocommit mode, writes open their own transaction.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def close(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def build_schema(self, fields):
+        """
+        Splits the fields of the indexes into the text columns of the FTS5 table and the values stored as JSON
+        """
+        text_columns = set()
+        prefix_columns = set()
+        content_field_name = None
+
+        for field_name, field in fields.items():
+            fieldname = field.index_fieldname
+            if field.document:
+                content_field_name = fieldname
+            if field.indexed and field.field_type in TEXT_FIELD_TYPES:
+                text_columns.add(fieldname)
+                if field.field_type in PREFIX_FIELD_TYPES:
+                    prefix_columns.add(fieldname)
+
+        return content_field_name, sorted(text_columns), prefix_columns
+
+    def setup(self):
+        from haystack import connections
+        with self._setup_lock:
+            if self.setup_complete:
+                return
+            missing = get_missing_features()
+            if missing:
+                raise ImproperlyConfigured(
+                    "The search connection '{0}' needs the {1} extension{2} of SQLite, which SQLite {3} of this Python "
+                    "lacks.".format(self.connection_alias, ' and '.join(missing), 's' if len(missing) > 1 else '',
+                                    sqlite3.sqlite_version)
+                )
+
+            self.content_field_name, self.text_columns, self.prefix_columns = self.build_schema(
+                connections[self.connection_alias].get_unified_index().all_searchfields()
+            )
+
+            connection = self.get_connection()
+            existing = [row[1] for row in connection.execute('PRAGMA table_info({0})'.format(TEXT_TABLE))]
+            if existing and existing != self.text_columns:
+                self.log.warning("The text fields of the search indexes changed, the documents of '%s' are removed.",
+                                 self.connection_alias)
+                connection.execute('DROP TABLE {0}'.format(TEXT_TABLE))
+                connection.execute('DROP TABLE IF EXISTS {0}'.format(DOCUMENT_TABLE))
+
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS {0} ('
+                'rowid INTEGER PRIMARY KEY, id TEXT NOT NULL UNIQUE, django_ct TEXT NOT NULL, '
+                'django_id TEXT NOT NULL, data TEXT NOT NULL)'.format(DOCUMENT_TABLE)
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS {0}_django_ct ON {0} (django_ct)'.format(DOCUMENT_TABLE))
+            connection.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS {0} USING fts5({1}, tokenize='unicode61 remove_diacritics 1', "
+                "prefix='2 3')".format(TEXT_TABLE, ', '.join(self.text_columns))
+            )
+            self.setup_complete = True
+
+    def _from_python(self, value):
+        """
+        A Python value as a JSON value. Dates are stored as ISO strings (in UTC), so they compare in order.
+        """
+        if isinstance(value, datetime):
+            if timezone.is_aware(value):
+                value = timezone.make_naive(value, timezone.utc)
+            return value.isoformat()
+        if isinstance(value, date):
+            return value.isoformat()
+        if isinstance(value, Decimal):
+            return float(value)
+        if isinstance(value, (list, tuple, set)):
+            return [self._from_python(item) for item in value]
+        if value is None or isinstance(value, (bool, int, long, float)):
+            return value
+        return force_text(value)
+
+    def _to_text(self, value):
+        if value is None:
+            return u''
+        if isinstance(value, (list, tuple, set)):
+            return u' '.join(force_text(item) for item in value)
+        return force_text(value)
+
+    # Writing
+
+    def _remove_rows(self, connection, where, params):
+        rowids = [row[0] for row in connection.execute(
+            'SELECT rowid FROM {0} WHERE {1}'.format(DOCUMENT_TABLE, where), params
+        )]
+        for start in range(0, len(rowids), 500):
+            chunk = rowids[start:start + 500]
+            placeholders = ', '.join('?' * len(chunk))
+            connection.execute('DELETE FROM {0} WHERE rowid IN ({1})'.format(TEXT_TABLE, placeholders), chunk)
+            connection.execute('DELETE FROM {0} WHERE rowid IN ({1})'.format(DOCUMENT_TABLE, placeholders), chunk)
+        return len(rowids)
+
+    def _write(self, write):
+        """
+        Runs a write in a transaction. Searches keep reading the last committed state until it commits.
+        """
+        if not self.setup_complete:
+            self.setup()
+
+        connection = self.get_connection()
+        try:
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                result = write(connection)
+            except Exception:
+                connection.execute('ROLLBACK')
+                raise
+            connection.execute('COMMIT')
+            return result
+        except Exception as e:
+            if not self.silently_fail:
+                raise
+            self.log.error("Failed to write to the search index of '%s': %s", self.connection_alias, e,
+                           exc_info=True)
+
+    def update(self, index, iterable, commit=True):
+        """
+        Adds or replaces the documents of the objects, all of them in one transaction
+        """
+        if not self.setup_complete:
+            self.setup()
+
+        text_columns = self.text_columns
+        big_fields = set([self.content_field_name]) | self.prefix_columns
+        insert_text = 'INSERT INTO {0} (rowid, {1}) VALUES (?, {2})'.format(
+            TEXT_TABLE, ', '.join(text_columns), ', '.join('?' * len(text_columns))
+        )
+
+        def write(connection):
+            count = 0
+            for obj in iterable:
+                document = index.full_prepare(obj)
+                self._remove_rows(connection, 'id = ?', [document[ID]])
+
+                # The big text fields are only stored in the FTS5 table
+                data = dict(
+                    (key, self._from_python(value)) for key, value in document.items()
+                    if key not in (ID, DJANGO_CT, DJANGO_ID) and key not in big_fields
+                )
+                cursor = connection.execute(
+                    'INSERT INTO {0} (id, django_ct, django_id, data) VALUES (?, ?, ?, ?)'.format(DOCUMENT_TABLE),
+                    [document[ID], document[DJANGO_CT], force_text(document[DJANGO_ID]), json.dumps(data)]
+                )
+                connection.execute(
+                    insert_text, [cursor.lastrowid] + [self._to_text(document.get(column)) for column in text_columns]
+                )
+                count += 1
+
+            if count and commit:
+                # Merges some of the segments the writes add, so searches don't read more and more of them
+                connection.execute("INSERT INTO {0} ({0}, rank) VALUES ('merge', 16)".format(TEXT_TABLE))
+            return count
+
+        self._write(write)
+
+    def remove(self, obj_or_string, commit=True):
+        identifier = get_identifier(obj_or_string)
+        self._write(lambda connection: self._remove_rows(connection, 'id = ?', [identifier]))
+
+    def clear(self, models=[], commit=True):
+        if not models:
+            self._write(lambda connection: self._remove_rows(connection, '1', []))
+        else:
+            content_types = [u"{0}.{1}".format(model._meta.app_label, model._meta.module_name) for model in models]
+            self._write(lambda connection: self._remove_rows(
+                connection, 'django_ct IN ({0})'.format(', '.join('?' * len(content_types))), content_types
+            ))
+
+    # Searching
+
+    @log_query
+    def search(self, query_string, sort_by=None, start_offset=0, end_offset=None, fields='', highlight=False,
+               facets=None, date_facets=None, query_facets=None, narrow_queries=None, spelling_query=None,
+               within=None, dwithin=None, distance_point=None, models=None, limit_to_registered_models=None,
+               result_class=None, rank_query=None, **kwargs):
+        """
+        Searches the documents. The query is an SQL condition built by ``SQLiteSearchQuery``, the rank query an FTS5
+        expression of its text filters that orders the results by relevance.
+        """
+        if not self.setup_complete:
+            self.setup()
+
+        if len(query_string) == 0:
+            return {'results': [], 'hits': 0}
+
+        from haystack import connections
+        unified_index = connections[self.connection_alias].get_unified_index()
+
+        conditions = [u'({0})'.format(query_string)]
+        for narrow_query in narrow_queries or []:
+            conditions.append(u'({0})'.format(narrow_query))
+
+        if limit_to_registered_models is None:
+            limit_to_registered_models = True
+        if models:
+            model_choices = models
+        elif limit_to_registered_models:
+            model_choices = unified_index.get_indexed_models()
+        else:
+            model_choices = []
+        if model_choices:
+            conditions.append(u'd.django_ct IN ({0})'.format(', '.join(
+                quote_sql(u"{0}.{1}".format(model._meta.app_label, model._meta.module_name))
+                for model in model_choices
+            )))
+        where = u' AND '.join(conditions)
+
+        connection = self.get_connection()
+        try:
+            count = u'SELECT COUNT(*) FROM {0} d WHERE {1}'.format(DOCUMENT_TABLE, where)
+            hits = connection.execute(count).fetchone()[0]
+
+            # Only the requested text columns are read, they can be big
+            requested = set(fields) if fields else None
+            text_columns = [
+                column for column in self.text_columns if requested is None or column in requested
+            ]
+            select = [u'd.django_ct', u'd.django_id', u'd.data'] + [u't.{0}'.format(column) for column in text_columns]
+            joins = u''
+            if text_columns:
+                joins += u' JOIN {0} t ON t.rowid = d.rowid'.format(TEXT_TABLE)
+
+            order_by = []
+            params = []
+            if rank_query:
+                select.append(u'r.rank')
+                joins += u' LEFT JOIN (SELECT rowid, bm25({0}) AS rank FROM {0} WHERE {0} MATCH ?) r ' \
+                         u'ON r.rowid = d.rowid'.format(TEXT_TABLE)
+                params.append(rank_query)
+            else:
+                select.append(u'NULL')
+
+            for field in sort_by or []:
+                descending = field.startswith('-')
+                fieldname = unified_index.get_index_fieldname(field.lstrip('-'))
+                column = DOCUMENT_COLUMNS.get(fieldname, u'json_extract(d.data, {0})'.format(json_path(fieldname)))
+                order_by.append(u'{0} {1}'.format(column, 'DESC' if descending else 'ASC'))
+            if rank_query:
+                order_by.append(u'r.rank IS NULL, r.rank')
+            order_by.append(u'd.rowid')
+
+            sql = u'SELECT {0} FROM {1} d{2} WHERE {3} ORDER BY {4} LIMIT ? OFFSET ?'.format(
+                u', '.join(select), DOCUMENT_TABLE, joins, where, u', '.join(order_by)
+            )
+            limit = -1 if end_offset is None else max(end_offset - start_offset, 0)
+            rows = connection.execute(sql, params + [limit, start_offset]).fetchall()
+        except sqlite3.Error as e:
+            if not self.silently_fail:
+                raise
+            self.log.error("Failed to query the search index of '%s' with '%s': %s", self.connection_alias,
+                           query_string, e, exc_info=True)
+            return {'results': [], 'hits': 0}
+
+        return {
+            'results': self._process_results(rows, text_columns, result_class),
+            'hits': hits,
+            'facets': {},
+            'spelling_suggestion': None,
+        }
+
+    def _process_results(self, rows, text_columns, result_class=None):
+        from haystack import connections
+        unified_index = connections[self.connection_alias].get_unified_index()
+        indexed_models = unified_index.get_indexed_models()
+        result_class = result_class or SearchResult
+
+        results = []
+        for row in rows:
+            django_ct, django_id, data = row[:3]
+            app_label, model_name = django_ct.split('.')
+            model = get_model(app_label, model_name)
+            if not model or model not in indexed_models:
+                continue
+
+            index = unified_index.get_index(model)
+            values = json.loads(data)
+            # The stored value of a field that is also a text column keeps its type, like the values of a list
+            for column, value in zip(text_columns, row[3:3 + len(text_columns)]):
+                values.setdefault(column, value)
+
+            additional_fields = {}
+            for key, value in values.items():
+                key = str(key)
+                field = index.fields.get(key)
+                if field is not None and value is not None and hasattr(field, 'convert'):
+                    value = field.convert(value)
+                additional_fields[key] = value
+
+            rank = row[-1]
+            score = -rank if rank is not None else 0
+            results.append(result_class(app_label, model_name, django_id, score, **additional_fields))
+        return results
+
+
+class SQLiteSearchQuery(BaseSearchQuery):
+    """
+    Builds the query as an SQL condition on the documents (``d``). The text filters become FTS5 matches, which are
+    also collected into the rank query.
+    """
+    def __init__(self, using='default'):
+        super(SQLiteSearchQuery, self).__init__(using=using)
+        self.rank_terms = []
+
+    def clean(self, query_fragment):
+        # The terms are quoted as FTS5 strings, nothing has to be escaped
+        return query_fragment
+
+    def matching_all_fragment(self):
+        return u'1'
+
+    def build_query(self):
+        self.rank_terms = []
+        return super(SQLiteSearchQuery, self).build_query()
+
+    def build_params(self, spelling_query=None):
+        kwargs = super(SQLiteSearchQuery, self).build_params(spelling_query=spelling_query)
+        if self.rank_terms:
+            kwargs['rank_query'] = u' OR '.join(u'({0})'.format(term) for term in self.rank_terms)
+        return kwargs
+
+    def _match(self, expression):
+        return u'd.rowid IN (SELECT rowid FROM {0} WHERE {0} MATCH {1})'.format(TEXT_TABLE, quote_sql(expression))
+
+    def build_text_fragment(self, fieldname, value, prefix):
+        """
+        An FTS5 match of the words of the value in a text column
+        """
+        column = u'{{{0}}} : '.format(fieldname)
+        positive = []
+        negative = []
+
+        if isinstance(value, Raw):
+            positive.append(force_text(value.query_string))
+        elif isinstance(value, Exact):
+            positive.append(quote_fts(value.query_string))
+        elif isinstance(value, Not):
+            negative.append(quote_fts(value.query_string, prefix))
+        elif isinstance(value, AutoQuery):
+            query_string = value.query_string
+            for phrase in AutoQuery.exact_match_re.findall(query_string):
+                if phrase.strip():
+                    positive.append(quote_fts(phrase))
+            for word in AutoQuery.exact_match_re.sub(u' ', query_string).split():
+                if word.startswith('-') and len(word) > 1:
+                    negative.append(quote_fts(word[1:], prefix))
+                else:
+                    positive.append(quote_fts(word, prefix))
+        else:
+            if hasattr(value, 'input_type_name'):
+                value = value.query_string
+            positive.extend(quote_fts(word, prefix) for word in force_text(value).split())
+
+        if positive:
+            expression = u'{0}({1})'.format(column, u' AND '.join(positive))
+            self.rank_terms.append(expression)
+            if negative:
+                expression = u'({0}) NOT ({1}({2}))'.format(expression, column, u' OR '.join(negative))
+            return self._match(expression)
+        if negative:
+            return u'NOT {0}'.format(self._match(u'{0}({1})'.format(column, u' OR '.join(negative))))
+        return self.matching_all_fragment()
+
+    def build_value_fragment(self, fieldname, filter_type, value):
+        """
+        A comparison of a stored value, a multi valued field matches when any of its values does
+        """
+        if hasattr(value, 'input_type_name'):
+            value = value.query_string
+        if hasattr(value, 'values_list'):
+            value = list(value)
+
+        if fieldname in DOCUMENT_COLUMNS:
+            column = DOCUMENT_COLUMNS[fieldname]
+            convert = lambda item: quote_sql(force_text(item))
+        else:
+            column = u'value'
+            convert = lambda item: quote_sql(self.backend._from_python(item))
+
+        if filter_type == 'in':
+            values = list(value)
+            if not values:
+                return u'0'
+            condition = u'{0} IN ({1})'.format(column, u', '.join(convert(item) for item in values))
+        elif filter_type == 'range':
+            condition = u'{0} BETWEEN {1} AND {2}'.format(column, convert(value[0]), convert(value[1]))
+        else:
+            operator = {'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<='}.get(filter_type, '=')
+            condition = u'{0} {1} {2}'.format(column, operator, convert(value))
+
+        if fieldname in DOCUMENT_COLUMNS:
+            return condition
+        return u'EXISTS (SELECT 1 FROM json_each(d.data, {0}) WHERE {1})'.format(json_path(fieldname), condition)
+
+    def build_query_fragment(self, field, filter_type, value):
+        from haystack import connections
+        backend = self.backend
+        if not backend.setup_complete:
+            backend.setup()
+
+        if field == 'content':
+            fieldname = backend.content_field_name
+        else:
+            fieldname = connections[self._using].get_unified_index().get_index_fieldname(field)
+
+        if fieldname in backend.text_columns and filter_type in TEXT_FILTERS:
+            prefix = filter_type == 'startswith' or fieldname in backend.prefix_columns
+            return self.build_text_fragment(fieldname, value, prefix)
+        return self.build_value_fragment(fieldname, filter_type, value)
+
+
+class SQLiteSearchEngine(BaseEngine):
+    backend = SQLiteSearchBackend
+    query = SQLiteSearchQuery
@@ -3,7 +3,7 @@
   var PlanFinder;
 
   PlanFinder = (function() {
-    var currentRequest, filterPlans, getAndRender, makePagination, min_max_fields, multi_fields, ordering, paginationNavigate, setupInputTriggers;
+    var currentRequest, filterPlans, getAndRender, makePagination, min_max_fields, multi_fields, ordering, paginationNavigate, setupInputTriggers, updateFacets;
 
     function PlanFinder() {}
 
@@ -12,19 +12,24 @@
     multi_fields = [
       {
         selector: $("#countrySelect"),
-        api: "locations__country"
+        api: "locations__country",
+        facet: "country"
       }, {
         selector: $("#providerSelect"),
-        api: "offer__provider__id"
+        api: "offer__provider__id",
+        facet: "provider"
       }, {
         selector: $("#billingSelect"),
-        api: "billing_time"
+        api: "billing_time",
+        facet: "billing_time"
       }, {
         selector: $("#datacenterSelect"),
-        api: "locations__datacenter__id"
+        api: "locations__datacenter__id",
+        facet: "datacenter"
       }, {
         selector: $("#serverTypeSelect"),
-        api: "server_type"
+        api: "server_type",
+        facet: "server_type"
       }
     ];
 
@@ -106,6 +111,31 @@
       });
     };
 
+    updateFacets = function(urlParameters) {
+      $.get('/find/facets/?' + urlParameters, function(data) {
+        var counts, facet, select_field, _i, _j, _len, _len1, _ref;
+        for (_i = 0, _len = multi_fields.length; _i < _len; _i++) {
+          select_field = multi_fields[_i];
+          counts = {};
+          _ref = data.facets[select_field.facet];
+          for (_j = 0, _len1 = _ref.length; _j < _len1; _j++) {
+            facet = _ref[_j];
+            counts[facet.value] = facet.count;
+          }
+          select_field.selector.find('option').each(function() {
+            var count, option, _ref1;
+            option = $(this);
+            if (option.data('name') == null) {
+              option.data('name', option.text());
+            }
+            count = (_ref1 = counts[option.val()]) != null ? _ref1 : 0;
+            option.text("" + (option.data('name')) + " (" + count + ")");
+          });
+          select_field.selector.trigger('chosen:updated');
+        }
+      });
+    };
+
     paginationNavigate = function(url) {
       if (url.length > 0) {
         return getAndRender(url);
@@ -164,7 +194,8 @@
         urlOptions["order_by"] = ordering.val();
       }
       urlParameters = $.param(urlOptions);
-      getAndRender('/find/data/main/plan/?' + urlParameters);
+      getAndRender('/find/plans/?' + urlParameters);
+      updateFacets(urlParameters);
     };
 
     $(document).ready(function() {
@@ -18,6 +18,10 @@ class MarkdownHTMLConverter {
   var _refreshSubscription;
   bool _renderMarkdownText;
   
+  // The last document rendered by the server and its hash
+  String _renderedMarkdown;
+  String _renderedHash;
+  
   MarkdownHTMLConverter(String textAreaClass, String divOutputClass){
     _textInput = querySelectorAll(textAreaClass)[0];
     _htmlOutputMaster = querySelectorAll(divOutputClass)[0];
@@ -84,29 +88,75 @@ class MarkdownHTMLConverter {
   }
 
   void _refreshButtonClick(Event e){
-    refreshMarkdownContent();
+    refreshMarkdownContent(fullDocument: true);
   }
   
-  void refreshMarkdownContent(){
+  void refreshMarkdownContent({bool fullDocument: false}){
     if (!_renderMarkdownText) return;
+    
+    String markdown = getMarkdownContent();
+    if (!fullDocument && markdown == _renderedMarkdown) return;
         
     _refreshButton.classes.add("disabled");
     var url = "/helper/markdown/";
     
     FormData requestData = new FormData();
-    requestData.append("markdown", getMarkdownContent());
+    if (fullDocument || _renderedHash == null){
+      requestData.append("markdown", markdown);
+    } else {
+      // Only send the changed part of the document
+      requestData.append("base_hash", _renderedHash);
+      requestData.append("changes", JSON.encode(_getChanges(_renderedMarkdown, markdown)));
+    }
     requestData.append("csrfmiddlewaretoken", _csrfToken);
     
     var request = HttpRequest.request(
         url,
         method: "POST",
         sendData: requestData
-    ).then(_htmlContentReceived);
+    ).then((HttpRequest request) => _htmlContentReceived(request, markdown));
+  }
+  
+  Map _getChanges(String oldText, String newText){
+    int start = 0;
+    while (start < oldText.length && start < newText.length && oldText[start] == newText[start]){
+      start++;
+    }
+    // The offsets count UTF-16 code units, never split the surrogate pair of a character like an emoji
+    if (start > 0 && (newText.codeUnitAt(start - 1) & 0xFC00) == 0xD800){
+      start--;
+    }
+    
+    int oldEnd = oldText.length;
+    int newEnd = newText.length;
+    while (oldEnd > start && newEnd > start && oldText[oldEnd - 1] == newText[newEnd - 1]){
+      oldEnd--;
+      newEnd--;
+    }
+    if (oldEnd < oldText.length && (oldText.codeUnitAt(oldEnd) & 0xFC00) == 0xDC00){
+      oldEnd++;
+      newEnd++;
+    }
+    
+    return {"start": start, "end": oldEnd, "text": newText.substring(start, newEnd)};
   }
 
-  void _htmlContentReceived(HttpRequest request) {
+  void _htmlContentReceived(HttpRequest request, String markdown) {
     var responseData = JSON.decode(request.responseText);
     
+    if (responseData["missing"] == true){
+      // The server doesn't know the last document anymore
+      _renderedHash = null;
+      refreshMarkdownContent(fullDocument: true);
+      return;
+    }
+    
+    _refreshButton.classes.remove("disabled");
+    if (responseData["html"] == null) return;
+    
+    _renderedMarkdown = markdown;
+    _renderedHash = responseData["hash"];
+    
     NodeValidatorBuilder _htmlValidator = new NodeValidatorBuilder();
     _htmlValidator..allowHtml5()
                   ..allowImages()
@@ -116,7 +166,6 @@ class MarkdownHTMLConverter {
                   ..allowElement('img', attributes: ['src']);
     
     _renderedField.setInnerHtml(responseData["html"], validator: _htmlValidator);
-    _refreshButton.classes.remove("disabled");
   }
   
   void _toggleButtonClick(Event e){
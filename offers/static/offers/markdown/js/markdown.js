@@ -7310,7 +7310,7 @@ main: function() {
   T.MarkdownHTMLConverter$(".markdowntextfield", ".markdown-render").refreshMarkdownContent$0();
 },
 
-MarkdownHTMLConverter: {"": "Object;_textInput,_htmlOutputMaster,_renderedField,_refreshButton,_togglePaneButton,_csrfToken,_refreshSubscription,_renderMarkdownText",
+MarkdownHTMLConverter: {"": "Object;_textInput,_htmlOutputMaster,_renderedField,_refreshButton,_togglePaneButton,_csrfToken,_refreshSubscription,_renderMarkdownText,_renderedMarkdown,_renderedHash",
   _textInputKeyDown$1: function(e) {
     this._cancelMarkdownStream$0();
   },
@@ -7332,25 +7332,71 @@ MarkdownHTMLConverter: {"": "Object;_textInput,_htmlOutputMaster,_renderedField,
     }
   },
   _refreshButtonClick$1: function(e) {
-    this.refreshMarkdownContent$0();
+    this.refreshMarkdownContent$1$fullDocument(true);
   },
   get$_refreshButtonClick: function() {
     return new H.BoundClosure$1(this, T.MarkdownHTMLConverter.prototype._refreshButtonClick$1, null, "_refreshButtonClick$1");
   },
-  refreshMarkdownContent$0: function() {
-    var t1, requestData;
+  refreshMarkdownContent$1$fullDocument: function(fullDocument) {
+    var markdown, t1, requestData;
     if (this._renderMarkdownText !== true)
       return;
+    markdown = J.get$value$x(this._textInput);
+    if (fullDocument !== true && J.$eq(markdown, this._renderedMarkdown))
+      return;
     t1 = J.get$classes$x(this._refreshButton);
     t1.add$1(t1, "disabled");
     requestData = W.FormData_FormData(null);
-    requestData.append("markdown", J.get$value$x(this._textInput));
+    if (fullDocument === true || this._renderedHash == null)
+      requestData.append("markdown", markdown);
+    else {
+      requestData.append("base_hash", this._renderedHash);
+      requestData.append("changes", JSON.stringify(this._getChanges$2(this._renderedMarkdown, markdown)));
+    }
     requestData.append("csrfmiddlewaretoken", this._csrfToken);
-    W.HttpRequest_request("/helper/markdown/", "POST", null, null, null, null, requestData, null).then$1(this.get$_htmlContentReceived());
+    W.HttpRequest_request("/helper/markdown/", "POST", null, null, null, null, requestData, null).then$1(new T.MarkdownHTMLConverter_refreshMarkdownContent_closure(this, markdown));
+  },
+  refreshMarkdownContent$0: function() {
+    return this.refreshMarkdownContent$1$fullDocument(false);
+  },
+  _getChanges$2: function(oldText, newText) {
+    var start, oldEnd, newEnd;
+    start = 0;
+    while (true) {
+      if (!(start < oldText.length && start < newText.length && oldText.charCodeAt(start) === newText.charCodeAt(start)))
+        break;
+      ++start;
+    }
+    if (start > 0 && (newText.charCodeAt(start - 1) & 64512) === 55296)
+      --start;
+    oldEnd = oldText.length;
+    newEnd = newText.length;
+    while (true) {
+      if (!(oldEnd > start && newEnd > start && oldText.charCodeAt(oldEnd - 1) === newText.charCodeAt(newEnd - 1)))
+        break;
+      --oldEnd;
+      --newEnd;
+    }
+    if (oldEnd < oldText.length && (oldText.charCodeAt(oldEnd) & 64512) === 56320) {
+      ++oldEnd;
+      ++newEnd;
+    }
+    return {start: start, end: oldEnd, text: newText.substring(start, newEnd)};
   },
-  _htmlContentReceived$1: function(request) {
+  _htmlContentReceived$2: function(request, markdown) {
     var responseData, t1, _htmlValidator;
     responseData = C.C_JsonCodec.decode$1(J.get$responseText$x(request));
+    if (J.$eq(J.$index$asx(responseData, "missing"), true)) {
+      this._renderedHash = null;
+      this.refreshMarkdownContent$1$fullDocument(true);
+      return;
+    }
+    t1 = J.get$classes$x(this._refreshButton);
+    t1.remove$1(t1, "disabled");
+    if (J.$index$asx(responseData, "html") == null)
+      return;
+    this._renderedMarkdown = markdown;
+    this._renderedHash = J.$index$asx(responseData, "hash");
     t1 = [];
     H.setRuntimeTypeInfo(t1, [W.NodeValidator]);
     _htmlValidator = new W.NodeValidatorBuilder(t1);
@@ -7362,11 +7408,6 @@ MarkdownHTMLConverter: {"": "Object;_textInput,_htmlOutputMaster,_renderedField,
     _htmlValidator.allowCustomElement$4$attributes$uriAttributes$uriPolicy("a", ["href", "rev", "rel"], null, null);
     _htmlValidator.allowCustomElement$4$attributes$uriAttributes$uriPolicy("img", ["src"], null, null);
     J.setInnerHtml$2$validator$x(this._renderedField, J.$index$asx(responseData, "html"), _htmlValidator);
-    t1 = J.get$classes$x(this._refreshButton);
-    t1.remove$1(t1, "disabled");
-  },
-  get$_htmlContentReceived: function() {
-    return new H.BoundClosure$1(this, T.MarkdownHTMLConverter.prototype._htmlContentReceived$1, null, "_htmlContentReceived$1");
   },
   _toggleButtonClick$1: function(e) {
     if (this._renderMarkdownText === true)
@@ -7464,7 +7505,7 @@ MarkdownHTMLConverter: {"": "Object;_textInput,_htmlOutputMaster,_renderedField,
   },
   static: {
 MarkdownHTMLConverter$: function(textAreaClass, divOutputClass) {
-  var t1 = new T.MarkdownHTMLConverter(null, null, null, null, null, null, null, null);
+  var t1 = new T.MarkdownHTMLConverter(null, null, null, null, null, null, null, null, null, null);
   t1.MarkdownHTMLConverter$2(textAreaClass, divOutputClass);
   return t1;
 }}
@@ -7476,6 +7517,13 @@ MarkdownHTMLConverter__textInputKeyUp_closure: {"": "Closure;this_0",
     return this.this_0.refreshMarkdownContent$0();
   },
   $is_args1: true
+},
+
+MarkdownHTMLConverter_refreshMarkdownContent_closure: {"": "Closure;this_0,markdown_1",
+  call$1: function(request) {
+    return this.this_0._htmlContentReceived$2(request, this.markdown_1);
+  },
+  $is_args1: true
 }},
 1],
 ]);
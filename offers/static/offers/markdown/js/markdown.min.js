@@ -10,5 +10,5 @@
 .get$globalThis().setTimeout==null||$globalState.isWorker===!0:r=!1;if(r)this._handle=1,r=$globalState.topEventLoop,i=$globalState.currentContext,r.events._add$1(new a._IsolateEvent(i,new a.TimerImpl_internalCallback(this,n),"timer")),this._inEventLoop=!0;else{if(e.get$globalThis().setTimeout==null)throw a.wrapException(v.UnsupportedError$("Timer greater than 0."));r=$globalState.topEventLoop,r.activeTimerCount=r.activeTimerCount+1,this._handle=e.get$globalThis().setTimeout(a.convertDartClosureToJS(new a.TimerImpl_internalCallback0(this,n),0),t)}},"static":{TimerImpl$:function(e,t){var n=new a.TimerImpl(!0,!1,null);return n.TimerImpl$2(e,t),n}}},TimerImpl_internalCallback:{"":"Closure;this_0,callback_1",call$0:function(){this.this_0._handle=null,this.callback_1.call$0()}},TimerImpl_internalCallback0:{"":"Closure;this_2,callback_3",call$0:function(){this.this_2._handle=null;var e=$globalState.topEventLoop;e.activeTimerCount=e.activeTimerCount-1,this.callback_3.call$0()}}}],["_js_helper","dart:_js_helper",,a,{isJsIndexable:function(e,t){var n,r;if(t!=null){n=t.x;if(n!=null)return n}return r=f.getInterceptor(e),typeof e=="object"&&e!==null&&!!r.$isJavaScriptIndexingBehavior},S:function(e){var t;if(typeof e=="string")return e;if(typeof e=="number"){if(e!==0)return""+e}else{if(!0===e)return"true";if(!1===e)return"false";if(e==null)return"null"}t=f.toString$0(e);if(typeof t!="string")throw a.wrapException(v.ArgumentError$(e));return t},Primitives_initializeStatics:function(t){e.Primitives_mirrorFunctionCacheName=e.Primitives_mirrorFunctionCacheName+("_"+a.S(t)),e.Primitives_mirrorInvokeCacheName=e.Primitives_mirrorInvokeCacheName+("_"+a.S(t))},Primitives_objectHashCode:function(e){var t=e.$identityHash;return t==null&&(t=Math.random()*1073741823|0,e.$identityHash=t),t},Primitives_objectTypeName:function(e){var t,n;return t=r.JS_CONST_86y(f.getInterceptor(e)),t==="Object"&&(n=String(e.constructor).match(/^\s*function\s*(\S*)\s*\(/)[1],typeof n=="string"&&(t=n)),f.getInterceptor$s(t).codeUnitAt$1(t,0)===36&&(t=r.JSString_methods.substring$1(t,1)),t+a.joinArguments(a.getRuntimeTypeInfo(e),0,null)},Primitives_objectToString:function(e){return"Instance of '"+a.Primitives_objectTypeName(e)+"'"},Primitives_newFixedList:function(e){var t=new Array(e);return t.fixed$length=!0,t},Primitives__fromCharCodeApply:function(e){var t,n,r,i,s,o;t=e.length;for(n=t<=500,r="",i=0;i<t;i+=500)n?s=e:(o=i+500,o=o<t?o:t,s=e.slice(i,o)),r+=String.fromCharCode.apply(null,s);return r},Primitives_stringFromCodePoints:function(e){var t,n,i;t=[],t.$builtinTypeInfo=[f.JSInt];for(n=new a.ListIterator(e,e.length,0,null);n.moveNext$0();){i=n._dev$_current;if(typeof i!="number"||Math.floor(i)!==i)throw a.wrapException(v.ArgumentError$(i));if(i<=65535)t.push(i);else{if(!(i<=1114111))throw a.wrapException(v.ArgumentError$(i));t.push(55296+(r.JSInt_methods.$shr(i-65536,10)&1023)),t.push(56320+(i&1023))}}return a.Primitives__fromCharCodeApply(t)},Primitives_stringFromCharCodes:function(e){var t,n;for(t=new a.ListIterator(e,e.length,0,null);t.moveNext$0();){n=t._dev$_current;if(typeof n!="number"||Math.floor(n)!==n)throw a.wrapException(v.ArgumentError$(n));if(n<0)throw a.wrapException(v.ArgumentError$(n));if(n>65535)return a.Primitives_stringFromCodePoints(e)}return a.Primitives__fromCharCodeApply(e)},Primitives_getProperty:function(e,t){if(e==null||typeof e=="boolean"||typeof e=="number"||typeof e=="string")throw a.wrapException(new v.ArgumentError(e));return e[t]},Primitives_setProperty:function(e,t,n){if(e==null||typeof e=="boolean"||typeof e=="number"||typeof e=="string")throw a.wrapException(new v.ArgumentError(e));e[t]=n},iae:function(e){throw a.wrapException(v.ArgumentError$(e))},ioore:function(e,t){throw e==null&&f.get$length$asx(e),(typeof t!="number"||Math.floor(t)!==t)&&a.iae(t),a.wrapException(v.RangeError$value(t))},wrapException:function(e){var t;return e==null&&(e=new v.NullThrownError),t=new Error,t.dartException=e,"defineProperty"in Object?(Object.defineProperty(t,"message",{get:a.toStringWrapper$closure.call$0}),t.name=""):t.toString=a.toStringWrapper$closure.call$0,t},toStringWrapper:function(){return f.toString$0(this.dartException)},throwExpression:function(e){throw a.wrapException(e)},unwrapException:function(t){var n,i,s,o,u,f,l,c,h,p,d,m,g,y;n=new a.unwrapException_saveStackTrace(t);if(t==null)return;if(typeof t!="object")return t;if("dartException"in t)return n.call$1(t.dartException);if("message"in t){i=t.message;if("number"in t&&typeof t.number=="number"){s=t.number,o=s&65535;if((r.JSInt_methods.$shr(s,16)&8191)===10)switch(o){case 438:return n.call$1(a.JsNoSuchMethodError$(a.S(i)+" (Error "+o+")",null));case 445:case 5007:return u=a.S(i)+" (Error "+o+")",n.call$1(new a.NullError(u,null));default:}}if(t instanceof TypeError)return u=e.get$TypeErrorDecoder_noSuchMethodPattern(),f=e.get$TypeErrorDecoder_notClosurePattern(),l=e.get$TypeErrorDecoder_nullCallPattern(),c=e.get$TypeErrorDecoder_nullLiteralCallPattern(),h=e.get$TypeErrorDecoder_undefinedCallPattern(),p=e.get$TypeErrorDecoder_undefinedLiteralCallPattern(),d=e.get$TypeErrorDecoder_nullPropertyPattern(),e.get$TypeErrorDecoder_nullLiteralPropertyPattern(),m=e.get$TypeErrorDecoder_undefinedPropertyPattern(),g=e.get$TypeErrorDecoder_undefinedLiteralPropertyPattern(),y=u.matchTypeError$1(i),y!=null?n.call$1(a.JsNoSuchMethodError$(i,y)):(y=f.matchTypeError$1(i),y!=null?(y.method="call",n.call$1(a.JsNoSuchMethodError$(i,y))):(y=l.matchTypeError$1(i),y==null?(y=c.matchTypeError$1(i),y==null?(y=h.matchTypeError$1(i),y==null?(y=p.matchTypeError$1(i),y==null?(y=d.matchTypeError$1(i),y==null?(y=c.matchTypeError$1(i),y==null?(y=m.matchTypeError$1(i),y==null?(y=g.matchTypeError$1(i),u=y!=null):u=!0):u=!0):u=!0):u=!0):u=!0):u=!0):u=!0,u?(u=y==null?null:y.method,n.call$1(new a.NullError(i,u))):(u=typeof i=="string"?i:"",n.call$1(new a.UnknownJsTypeError(u)))));return t instanceof RangeError?typeof i=="string"&&i.indexOf("call stack")!==-1?new v.StackOverflowError:n.call$1(new v.ArgumentError(null)):typeof InternalError=="function"&&t instanceof InternalError&&typeof i=="string"&&i==="too much recursion"?new v.StackOverflowError:t}return t},objectHashCode:function(e){return e==null||typeof e!="object"?f.get$hashCode$(e):a.Primitives_objectHashCode(e)},fillLiteralMap:function(e,t){var n,r,i,s;n=e.length;for(r=0;r<n;r=s)i=r+1,s=i+1,t.$indexSet(t,e[r],e[i]);return t},invokeClosure:function(e,t,n,r,i,s,o){var u=f.getInterceptor(n);if(u.$eq(n,0))return a._callInIsolate(t,new a.invokeClosure_closure(e));if(u.$eq(n,1))return a._callInIsolate(t,new a.invokeClosure_closure0(e,r));if(u.$eq(n,2))return a._callInIsolate(t,new a.invokeClosure_closure1(e,r,i));if(u.$eq(n,3))return a._callInIsolate(t,new a.invokeClosure_closure2(e,r,i,s));if(u.$eq(n,4))return a._callInIsolate(t,new a.invokeClosure_closure3(e,r,i,s,o));throw a.wrapException(v.Exception_Exception("Unsupported number of arguments for wrapped closure"))},convertDartClosureToJS:function(e,t){var n;if(e==null)return;return n=e.$identity,n?n:(n=function(e,t,n,r){return function(i,s,o,u){return r(e,n,t,i,s,o,u)}}(e,t,$globalState.currentContext,a.invokeClosure$closure.call$7),e.$identity=n,n)},throwCyclicInit:function(e){throw a.wrapException(v.CyclicInitializationError$("Cyclic initialization for static "+a.S(e)))},setRuntimeTypeInfo:function(e,t){return e!=null&&(e.$builtinTypeInfo=t),e},getRuntimeTypeInfo:function(e){if(e==null)return;return e.$builtinTypeInfo},getRuntimeTypeArguments:function(e,t){return a.substitute(e["$as"+a.S(t)],a.getRuntimeTypeInfo(e))},getRuntimeTypeArgument:function(e,t,n){var r=a.getRuntimeTypeArguments(e,t);return r==null?null:r[n]},getRuntimeTypeAsString:function(e,t){return e[0].builtin$cls+a.joinArguments(e,1,t)},runtimeTypeToString:function(e,t){if(e==null)return"dynamic";if(typeof e=="object"&&e!==null&&e.constructor===Array)return a.getRuntimeTypeAsString(e,t);if(typeof e=="function")return e.builtin$cls;if(typeof e=="number"&&Math.floor(e)===e)return r.JSInt_methods.toString$0(e);return},joinArguments:function(e,t,n){var r,i,s,o,u,f;if(e==null)return"";r=v.StringBuffer$("");for(i=t,s=!0,o=!0;i<e.length;++i)s?s=!1:r._contents=r._contents+", ",u=e[i],u!=null&&(o=!1),f=a.runtimeTypeToString(u,n),f=typeof f=="string"?f:a.S(f),r._contents=r._contents+f;return o?"":"<"+a.S(r)+">"},substitute:function(e,t){return typeof e=="object"&&e!==null&&e.constructor===Array?t=e:typeof e=="function"&&(e=a.invokeOn(e,null,t),typeof e=="object"&&e!==null&&e.constructor===Array?t=e:typeof e=="function"&&(t=a.invokeOn(e,null,t))),t},computeSignature:function(e,t,n){return a.invokeOn(e,t,a.getRuntimeTypeArguments(t,n))},invokeOn:function(e,t,n){return e.apply(t,n)},toStringForNativeObject:function(t){var n=e.getTagFunction;return"Instance of "+(n==null?"<Unknown>":n.call$1(t))},hashCodeForNativeObject:function(e){return a.Primitives_objectHashCode(e)},defineProperty:function(e,t,n){Object.defineProperty(e,t,{value:n,enumerable:!1,writable:!0,configurable:!0})},lookupAndCacheInterceptor:function(t){var n,r,i,s,o,u;n=e.getTagFunction.call$1(t),r=e.dispatchRecordsForInstanceTags[n];if(r!=null)return Object.defineProperty(t,A.dispatchPropertyName,{value:r,enumerable:!1,writable:!0,configurable:!0}),r.i;i=e.interceptorsForUncacheableTags[n];if(i!=null)return i;s=A.interceptorsByTag[n];if(s==null){n=e.alternateTagFunction.call$2(t,n);if(n!=null){r=e.dispatchRecordsForInstanceTags[n];if(r!=null)return Object.defineProperty(t,A.dispatchPropertyName,{value:r,enumerable:!1,writable:!0,configurable:!0}),r.i;i=e.interceptorsForUncacheableTags[n];if(i!=null)return i;s=A.interceptorsByTag[n]}}if(s==null)return;i=s.prototype,o=n[0];if(o==="!")return r=a.makeLeafDispatchRecord(i),e.dispatchRecordsForInstanceTags[n]=r,Object.defineProperty(t,A.dispatchPropertyName,{value:r,enumerable:!1,writable:!0,configurable:!0}),r.i;if(o==="~")return e.interceptorsForUncacheableTags[n]=i,i;if(o==="-")return u=a.makeLeafDispatchRecord(i),Object.defineProperty(Object.getPrototypeOf(t),A.dispatchPropertyName,{value:u,enumerable:!1,writable:!0,configurable:!0}),u.i;if(o==="+")return a.patchInteriorProto(t,i);if(o==="*")throw a.wrapException(v.UnimplementedError$(n));return A.leafTags[n]===!0?(u=a.makeLeafDispatchRecord(i),Object.defineProperty(Object.getPrototypeOf(t),A.dispatchPropertyName,{value:u,enumerable:!1,writable:!0,configurable:!0}),u.i):a.patchInteriorProto(t,i)},patchInteriorProto:function(e,t){var n,r;return n=Object.getPrototypeOf(e),r=f.makeDispatchRecord(t,n,null,null),Object.defineProperty(n,A.dispatchPropertyName,{value:r,enumerable:!1,writable:!0,configurable:!0}),t},makeLeafDispatchRecord:function(e){return f.makeDispatchRecord(e,!1,null,!!e.$isJavaScriptIndexingBehavior)},makeDefaultDispatchRecord:function(e,t,n){var r=t.prototype;return A.leafTags[e]===!0?f.makeDispatchRecord(r,!1,null,!!r.$isJavaScriptIndexingBehavior):f.makeDispatchRecord(r,n,null,null)},initNativeDispatch:function(){if(!0===e.initNativeDispatchFlag)return;e.initNativeDispatchFlag=!0,a.initNativeDispatchContinue()},initNativeDispatchContinue:function(){var t,n,r,i,s,o,u;e.dispatchRecordsForInstanceTags=Object.create(null),e.interceptorsForUncacheableTags=Object.create(null),a.initHooks(),t=A.interceptorsByTag,n=Object.getOwnPropertyNames(t);if(typeof window!="undefined"){window;for(r=0;r<n.length;++r)i=n[r],s=e.prototypeForTagFunction.call$1(i),s!=null&&(o=a.makeDefaultDispatchRecord(i,t[i],s),o!=null&&Object.defineProperty(s,A.dispatchPropertyName,{value:o,enumerable:!1,writable:!0,configurable:!0}))}for(r=0;r<n.length;++r)i=n[r],/^[A-Za-z_]/.test(i)&&(u=t[i],t["!"+i]=u,t["~"+i]=u,t["-"+i]=u,t["+"+i]=u,t["*"+i]=u)},initHooks:function(){var t,n,i,s,o,u,f;t=r.JS_CONST_TtD(),t=a.applyHooksTransformer(r.JS_CONST_0,a.applyHooksTransformer(r.JS_CONST_Fs4,a.applyHooksTransformer(r.JS_CONST_Fs4,a.applyHooksTransformer(r.JS_CONST_rD3,a.applyHooksTransformer(r.JS_CONST_6qb,a.applyHooksTransformer(r.JS_CONST_Cbr(r.JS_CONST_86y),t))))));if(typeof dartNativeDispatchHooksTransformer!="undefined"){n=dartNativeDispatchHooksTransformer,typeof n=="function"&&(n=[n]);if(n.constructor==Array)for(i=0;i<n.length;++i)s=n[i],typeof s=="function"&&(t=s(t)||t)}o=t.getTag,u=t.getUnknownTag,f=t.prototypeForTag,e.getTagFunction=new a.initHooks_closure(o),e.alternateTagFunction=new a.initHooks_closure0(u),e.prototypeForTagFunction=new a.initHooks_closure1(f)},applyHooksTransformer:function(e,t){return e(t)||t},TypeErrorDecoder:{"":"Object;_pattern,_arguments,_argumentsExpr,_expr,_method,_receiver",matchTypeError$1:function(e){var t,n,r;t=(new RegExp(this._pattern)).exec(e);if(t==null)return;return n={},r=this._arguments,r!==-1&&(n.arguments=t[r+1]),r=this._argumentsExpr,r!==-1&&(n.argumentsExpr=t[r+1]),r=this._expr,r!==-1&&(n.expr=t[r+1]),r=this._method,r!==-1&&(n.method=t[r+1]),r=this._receiver,r!==-1&&(n.receiver=t[r+1]),n},"static":{"":"TypeErrorDecoder_noSuchMethodPattern,TypeErrorDecoder_notClosurePattern,TypeErrorDecoder_nullCallPattern,TypeErrorDecoder_nullLiteralCallPattern,TypeErrorDecoder_undefinedCallPattern,TypeErrorDecoder_undefinedLiteralCallPattern,TypeErrorDecoder_nullPropertyPattern,TypeErrorDecoder_nullLiteralPropertyPattern,TypeErrorDecoder_undefinedPropertyPattern,TypeErrorDecoder_undefinedLiteralPropertyPattern",TypeErrorDecoder_extractPattern:function(e){var t,n,r,i,s,o;return e=e.replace(String({}),"$receiver$").replace(new RegExp("[[\\]{}()*+?.\\\\^$|]","g"),"\\$&"),t=e.match(/\\\$[a-zA-Z]+\\\$/g),t==null&&(t=[]),n=t.indexOf("\\$arguments\\$"),r=t.indexOf("\\$argumentsExpr\\$"),i=t.indexOf("\\$expr\\$"),s=t.indexOf("\\$method\\$"),o=t.indexOf("\\$receiver\\$"),new a.TypeErrorDecoder(e.replace("\\$arguments\\$","((?:x|[^x])*)").replace("\\$argumentsExpr\\$","((?:x|[^x])*)").replace("\\$expr\\$","((?:x|[^x])*)").replace("\\$method\\$","((?:x|[^x])*)").replace("\\$receiver\\$","((?:x|[^x])*)"),n,r,i,s,o)},TypeErrorDecoder_provokeCallErrorOn:function(e){return function(e){var t="$arguments$";try{e.$method$(t)}catch(n){return n.message}}(e)},TypeErrorDecoder_provokeCallErrorOnNull:function(){return function(){var e="$arguments$";try{null.$method$(e)}catch(t){return t.message}}()},TypeErrorDecoder_provokeCallErrorOnUndefined:function(){return function(){var e="$arguments$";try{(void 0).$method$(e)}catch(t){return t.message}}()},TypeErrorDecoder_provokePropertyErrorOn:function(e){return function(e){try{e.$method$}catch(t){return t.message}}(e)},TypeErrorDecoder_provokePropertyErrorOnNull:function(){return function(){try{null.$method$}catch(e){return e.message}}()},TypeErrorDecoder_provokePropertyErrorOnUndefined:function(){return function(){try{(void 0).$method$}catch(e){return e.message}}()}}},NullError:{"":"Error;_message,_method",toString$0:function(e){var t=this._method;return t==null?"NullError: "+a.S(this._message):'NullError: Cannot call "'+a.S(t)+'" on null'},$isError:!0},JsNoSuchMethodError:{"":"Error;_message,_method,_receiver",toString$0:function(e){var t,n;return t=this._method,t==null?"NoSuchMethodError: "+a.S(this._message):(n=this._receiver,n==null?'NoSuchMethodError: Cannot call "'+t+'" ('+a.S(this._message)+")":'NoSuchMethodError: Cannot call "'+t+'" on "'+n+'" ('+a.S(this._message)+")")},$isError:!0,"static":{JsNoSuchMethodError$:function(e,t){var n,r;return n=t==null,r=n?null:t.method,n=n?null:t.receiver,new a.JsNoSuchMethodError(e,r,n)}}},UnknownJsTypeError:{"":"Error;_message",toString$0:function(e){var t=this._message;return r.JSString_methods.get$isEmpty(t)?"Error":"Error: "+t}},unwrapException_saveStackTrace:{"":"Closure;ex_0",call$1:function(e){var t=f.getInterceptor(e);return typeof e=="object"&&e!==null&&!!t.$isError&&e.$thrownJsError==null&&(e.$thrownJsError=this.ex_0),e},$is_args1:!0},_StackTrace:{"":"Object;_exception,_trace",toString$0:function(e){var t,n;return t=this._trace,t!=null?t:(t=this._exception,n=typeof t=="object"?t.stack:null,t=n==null?"":n,this._trace=t,t)}},invokeClosure_closure:{"":"Closure;closure_0",call$0:function(){return this.closure_0.call$0()}},invokeClosure_closure0:{"":"Closure;closure_1,arg1_2",call$0:function(){return this.closure_1.call$1(this.arg1_2)}},invokeClosure_closure1:{"":"Closure;closure_3,arg1_4,arg2_5",call$0:function(){return this.closure_3.call$2(this.arg1_4,this.arg2_5)}},invokeClosure_closure2:{"":"Closure;closure_6,arg1_7,arg2_8,arg3_9",call$0:function(){return this.closure_6.call$3(this.arg1_7,this.arg2_8,this.arg3_9)}},invokeClosure_closure3:{"":"Closure;closure_10,arg1_11,arg2_12,arg3_13,arg4_14",call$0:function(){return this.closure_10.call$4(this.arg1_11,this.arg2_12,this.arg3_13,this.arg4_14)}},Closure:{"":"Object;",toString$0:function(e){return"Closure"}},BoundClosure:{"":"Closure;_self,_target,_receiver,__js_helper$_name",$eq:function(e,t){var n;return t==null?!1:this===t?!0:(n=f.getInterceptor(t),typeof t!="object"||t===null||!n.$isBoundClosure?!1:this._self===t._self&&this._target===t._target&&this._receiver===t._receiver)},get$hashCode:function(e){var t,n;return t=this._receiver,t==null?n=a.Primitives_objectHashCode(this._self):n=typeof t!="object"?f.get$hashCode$(t):a.Primitives_objectHashCode(t),(n^a.Primitives_objectHashCode(this._target))>>>0},$isBoundClosure:!0},initHooks_closure:{"":"Closure;getTag_0",call$1:function(e){return this.getTag_0(e)},$is_args1:!0},initHooks_closure0:{"":"Closure;getUnknownTag_1",call$2:function(e,t){return this.getUnknownTag_1(e,t)},$is_args2:!0},initHooks_closure1:{"":"Closure;prototypeForTag_2",call$1:function(e){return this.prototypeForTag_2(e)},$is_args1:!0}}],["dart._collection.dev","dart:_collection-dev",,a,{Arrays_copy:function(e,t,n,i,s){var o,u,f;if(t<i)for(o=t+s-1,u=i+s-1;o>=t;--o,--u){if(o<0||o>=e.length)throw a.ioore(e,o);r.JSArray_methods.$indexSet(n,u,e[o])}else for(f=t+s,u=i,o=t;o<f;++o,++u){if(o<0||o>=e.length)throw a.ioore(e,o);r.JSArray_methods.$indexSet(n,u,e[o])}},IterableMixinWorkaround_forEach:function(e,t){var n;for(n=new a.ListIterator(e,e.length,0,null);n.moveNext$0();)t.call$1(n._dev$_current)},IterableMixinWorkaround_any:function(e,t){var n;for(n=new a.ListIterator(e,e.length,0,null);n.moveNext$0();)if(t.call$1(n._dev$_current)===!0)return!0;return!1},IterableMixinWorkaround_toStringIterable:function(t,n,r){var i,s,o;for(s=0;s<e.get$IterableMixinWorkaround__toStringList().length;++s){o=e.get$IterableMixinWorkaround__toStringList();if(s>=o.length)throw a.ioore(o,s);if(o[s]===t)return a.S(n)+"..."+a.S(r)}i=v.StringBuffer$("");try{e.get$IterableMixinWorkaround__toStringList().push(t),i.write$1(n),i.writeAll$2(t,", "),i.write$1(r)}finally{o=e.get$IterableMixinWorkaround__toStringList();if(0>=o.length)throw a.ioore(o,0);o.pop()}return i.get$_contents()},IterableMixinWorkaround__rangeCheck:function(e,t,n){if(t<0||t>e.length)throw a.wrapException(v.RangeError$range(t,0,e.length));if(n<t||n>e.length)throw a.wrapException(v.RangeError$range(n,t,e.length))},IterableMixinWorkaround_setRangeList:function(e,t,n,r,i){var s;a.IterableMixinWorkaround__rangeCheck(e,t,n),s=n-t;if(s===0)return;if(i<0)throw a.wrapException(new v.ArgumentError(i));if(i+s>r.length)throw a.wrapException(v.StateError$("Not enough elements"));a.Arrays_copy(r,i,e,t,s)},printToConsole:function(e){if(typeof dartPrint=="function"){dartPrint(e);return}if(typeof console=="object"&&typeof console.log=="function"){console.log(e);return}if(typeof window=="object")return;if(typeof print=="function"){print(e);return}throw"Unable to print message: "+String(e)},Symbol_getName:function(e){return e.get$_name()},ListIterable:{"":"IterableBase;",get$iterator:function(e){return new a.ListIterator(this,this.get$length(this),0,null)},forEach$1:function(e,t){var n,r;n=this.get$length(this);for(r=0;r<n;++r){t.call$1(this.elementAt$1(this,r));if(n!==this.get$length(this))throw a.wrapException(v.ConcurrentModificationError$(this))}},$asIterableBase:null,$isEfficientLength:!0},ListIterator:{"":"Object;_iterable,_dev$_length,_index,_dev$_current",get$current:function(){return this._dev$_current},moveNext$0:function(){var e,t,n,r;e=this._iterable,t=f.getInterceptor$asx(e),n=t.get$length(e);if(this._dev$_length!==n)throw a.wrapException(v.ConcurrentModificationError$(e));return r=this._index,r>=n?(this._dev$_current=null,!1):(this._dev$_current=t.elementAt$1(e,r),this._index=this._index+1,!0)}},MappedIterable:{"":"IterableBase;_iterable,_f",get$iterator:function(e){var t=this._iterable;return t=t.get$iterator(t),t=new a.MappedIterator(null,t,this._f),a.setRuntimeTypeInfo(t,[a.getRuntimeTypeArgument(this,"MappedIterable",0),a.getRuntimeTypeArgument(this,"MappedIterable",1)]),t},get$length:function(e){var t=this._iterable;return t.get$length(t)},$asIterableBase:function(e,t){return[t]},"static":{MappedIterable_MappedIterable:function(e,t,n,r){var i;return e.$isEfficientLength?(i=new a.EfficientLengthMappedIterable(e,t),a.setRuntimeTypeInfo(i,[n,r]),i):(i=new a.MappedIterable(e,t),a.setRuntimeTypeInfo(i,[n,r]),i)}}},EfficientLengthMappedIterable:{"":"MappedIterable;_iterable,_f",$asMappedIterable:null,$isEfficientLength:!0},MappedIterator:{"":"Iterator;_dev$_current,_iterator,_f",_f$1:function(e){return this._f.call$1(e)},moveNext$0:function(){var e=this._iterator;return e.moveNext$0()?(this._dev$_current=this._f$1(e.get$current()),!0):(this._dev$_current=null,!1)},get$current:function(){return this._dev$_current},$asIterator:function(e,t){return[t]}},MappedListIterable:{"":"ListIterable;_source,_f",_f$1:function(e){return this._f.call$1(e)},get$length:function(e){return f.get$length$asx(this._source)},elementAt$1:function(e,t){return this._f$1(f.elementAt$1$ax(this._source,t))},$asListIterable:function(e,t){return[t]},$isEfficientLength:!0},WhereIterable:{"":"IterableBase;_iterable,_f",get$iterator:function(e){var t=f.get$iterator$ax(this._iterable);return t=new a.WhereIterator(t,this._f),a.setRuntimeTypeInfo(t,[a.getRuntimeTypeArgument(this,"WhereIterable",0)]),t},$asIterableBase:null},WhereIterator:{"":"Iterator;_iterator,_f",_f$1:function(e){return this._f.call$1(e)},moveNext$0:function(){for(var e=this._iterator;e.moveNext$0();)if(this._f$1(e.get$current())===!0)return!0;return!1},get$current:function(){return this._iterator.get$current()},$asIterator:null},FixedLengthListMixin:{"":"Object;",set$length:function(e,t){throw a.wrapException(v.UnsupportedError$("Cannot change the length of a fixed-length list"))},add$1:function(e,t){throw a.wrapException(v.UnsupportedError$("Cannot add to a fixed-length list"))},addAll$1:function(e,t){throw a.wrapException(v.UnsupportedError$("Cannot add to a fixed-length list"))}}}],["dart.async","dart:async",,v,{_invokeErrorHandler:function(e,t,n){var r=f.getInterceptor(e);return r.$is_args2?e.call$2(t,n):e.call$1(t)},_registerErrorHandler:function(e,t){var n=f.getInterceptor(e);return t.toString,n.$is_args2?e:e},Future_Future$delayed:function(e,t,n){var r,i;return r=null,i=new v._SyncCompleter(v._Future$(r)),a.setRuntimeTypeInfo(i,[r]),v.Timer_Timer(e,new v.Future_Future$delayed_closure(i)),i.future},Future_wait:function(t){var n,i,s,o,u,l,c,h,p;n={},n.completer_0=null,n.values_1=null,i=new v.Future_wait_handleError(n),n.remaining_2=0;for(s=new a.ListIterator(t,t.length,0,null);s.moveNext$0();)o=s._dev$_current,u=n.remaining_2,n.remaining_2=u+1,l=o.catchError$1(i),c=e.Zone__current,c.toString,h=new v._Future(0,c,null,null,new v.Future_wait_closure(n,u),null,v._registerErrorHandler(null,c),null),h.$builtinTypeInfo=[null],l._addListener$1(h);return i=n.remaining_2,i===0?v._Future$immediate(r.List_empty,null):(n.values_1=v.List_List(i,null),i=f.JSArray,p=new v._AsyncCompleter(v._Future$(i)),a.setRuntimeTypeInfo(p,[i]),n.completer_0=p,n.completer_0.future)},_asyncRunCallback:function(){var t,n,i,s;for(;n=e.get$_asyncCallbacks(),n._head!==n._tail;){t=e.get$_asyncCallbacks().removeFirst$0();try{t.call$0()}catch(i){throw a.unwrapException(i),s=r.JSNumber_methods.$tdiv(r.Duration_0._duration,1e3),a.TimerImpl$(s<0?0:s,v._asyncRunCallback$closure),i}}e._callbacksAreEnqueued=!1},_scheduleAsyncCallback:function(t){e.get$_asyncCallbacks()._add$1(t),e._callbacksAreEnqueued||(v._createTimer(r.Duration_0,v._asyncRunCallback$closure),e._callbacksAreEnqueued=!0)},scheduleMicrotask:function(t){var n=e.Zone__current;if(n===r.C__RootZone){n.toString,v._scheduleAsyncCallback(t);return}v._scheduleAsyncCallback(n.bindCallback$2$runGuarded(t,!0))},Stream_Stream$fromFuture:function(e,t){var n,r;return n=v.StreamController_StreamController(null,null,null,null,!0,t),e.then$2$onError(new v.Stream_Stream$fromFuture_closure(n),new v.Stream_Stream$fromFuture_closure0(n)),r=new v._ControllerStream(n),a.setRuntimeTypeInfo(r,[null]),r},StreamController_StreamController:function(e,t,n,r,i,s){var o;return e==null?i?new v._NoCallbackSyncStreamController(null,0,null):new v._NoCallbackAsyncStreamController(null,0,null):(i?(o=new v._SyncStreamController(t,n,r,e,null,0,null),a.setRuntimeTypeInfo(o,[s])):(o=new v._AsyncStreamController(t,n,r,e,null,0,null),a.setRuntimeTypeInfo(o,[s])),o)},_runGuarded:function(t){var n,r,i,s,o,u;if(t==null)return;try{n=t.call$0(),s=n,o=f.getInterceptor(s);if(typeof s!="object"||s===null||!o.$isFuture)return;return n}catch(u){s=a.unwrapException(u),r=s,i=new a._StackTrace(u,null),s=e.Zone__current,s.toString,v._rootHandleUncaughtError(s,null,s,r,i)}},_nullDataHandler:function(e){},_nullErrorHandler:function(t,n){var r=e.Zone__current;r.toString,v._rootHandleUncaughtError(r,null,r,t,n)},_nullDoneHandler:function(){},_runUserCode:function(e,t,n){var r,i,s,o;try{t.call$1(e.call$0())}catch(s){o=a.unwrapException(s),r=o,i=new a._StackTrace(s,null),n.call$2(r,i)}},_cancelAndError:function(e,t,n,r){var i,s;i=e.cancel$0(),s=f.getInterceptor(i),typeof i!="object"||i===null||!s.$isFuture?t._completeError$2(n,r):i.whenComplete$1(new v._cancelAndError_closure(t,n,r))},_cancelAndErrorClosure:function(e,t){return new v._cancelAndErrorClosure_closure(e,t)},Timer_Timer:function(t,n){var i=e.Zone__current;return i===r.C__RootZone?(i.toString,v._createTimer(t,n)):v._createTimer(t,i.bindCallback$2$runGuarded(n,!0))},_createTimer:function(e,t){var n=r.JSNumber_methods.$tdiv(e._duration,1e3);return a.TimerImpl$(n<0?0:n,t)},_rootHandleUncaughtError:function(e,t,n,r,i){v._rootRun(e,null,e,new v._rootHandleUncaughtError_closure(r,i))},_rootRun:function(t,n,r,i){var s,o,u;o=e.Zone__current,u=r;if(o==null?u==null:o===u)return i.call$0();s=o;try{return e.Zone__current=r,o=i.call$0(),o}finally{e.Zone__current=s}},_rootRunUnary:function(t,n,r,i,s){var o,u,a;u=e.Zone__current,a=r;if(u==null?a==null:u===a)return i.call$1(s);o=u;try{return e.Zone__current=r,u=i.call$1(s),u}finally{e.Zone__current=o}},_rootRunBinary:function(t,n,r,i,s,o){var u,a,f;a=e.Zone__current,f=r;if(a==null?f==null:a===f)return i.call$2(s,o);u=a;try{return e.Zone__current=r,a=i.call$2(s,o),a}finally{e.Zone__current=u}},_AsyncError:{"":"Object;error>,stackTrace<",$isError:!0},Future:{"":"Object;",$isFuture:!0},Future_Future$delayed_closure0:{"":"Closure;computation_0",call$1:function(e){return this.computation_0.call$0()},$is_args1:!0},Future_Future$delayed_closure:{"":"Closure;completer_1",call$0:function(){var e=this.completer_1.future;e._state!==0&&a.throwExpression(v.StateError$("Future already completed")),e._complete$1(null)}},Future_wait_handleError:{"":"Closure;box_0",call$1:function(e){var t=this.box_0;t.values_1!=null&&(t.values_1=null,t.completer_0.completeError$1(e));return},$is_args1:!0},Future_wait_closure:{"":"Closure;box_0,pos_1",call$1:function(e){var t,n,r;t=this.box_0,n=t.values_1;if(n==null)return;r=this.pos_1;if(r<0||r>=n.length)throw a.ioore(n,r);n[r]=e,t.remaining_2=t.remaining_2-1,t.remaining_2===0&&(n=t.completer_0,t=t.values_1,n=n.future,n._state!==0&&a.throwExpression(new v.StateError("Future already completed")),n._asyncComplete$1(t))},$is_args1:!0},_Completer:{"":"Object;"},_AsyncCompleter:{"":"_Completer;future",completeError$2:function(e,t){var n;if(e==null)throw a.wrapException(new v.ArgumentError("Error must not be null"));n=this.future;if(n._state!==0)throw a.wrapException(v.StateError$("Future already completed"));n._asyncCompleteError$2(e,t)},completeError$1:function(e){return this.completeError$2(e,null)},get$completeError:function(){return new v.BoundClosure$2(this,v._AsyncCompleter.prototype.completeError$2,null,"completeError$2")},$as_Completer:null},_SyncCompleter:{"":"_Completer;future",$as_Completer:null},_Future:{"":"Object;_state,_zone<,_resultOrListeners,_nextListener<,_onValueCallback,_errorTestCallback,_onErrorCallback,_whenCompleteActionCallback",get$_isComplete:function(){return this._state>=4},get$_hasError:function(){return this._state===8},set$_isChained:function(e){e?this._state=2:this._state=0},get$_onValue:function(){return this._state===2?null:this._onValueCallback},_onValue$1:function(e){return this.get$_onValue().call$1(e)},get$_whenCompleteAction:function(){return this._state===2?null:this._whenCompleteActionCallback},_whenCompleteAction$0:function(){return this.get$_whenCompleteAction().call$0()},then$2$onError:function(e,t){var n=v._Future$_then(e,t,null);return this._addListener$1(n),n},then$1:function(e){return this.then$2$onError(e,null)},catchError$2$test:function(e,t){var n=v._Future$_catchError(e,t,null);return this._addListener$1(n),n},catchError$1:function(e){return this.catchError$2$test(e,null)},whenComplete$1:function(e){var t=v._Future$_whenComplete(e,a.getRuntimeTypeArgument(this,"_Future",0));return this._addListener$1(t),t},get$_async$_value:function(){return this._resultOrListeners},get$_error:function(){return this._resultOrListeners},_setValue$1:function(e){this._state=4,this._resultOrListeners=e},_setError$2:function(e,t){this._state=8,this._resultOrListeners=new v._AsyncError(e,t)},_addListener$1:function(e){this._state>=4?(this._zone.toString,v._scheduleAsyncCallback(new v._Future__addListener_closure(this,e))):(e._nextListener=this._resultOrListeners,this._resultOrListeners=e)},_removeListeners$0:function(){var e,t,n;e=this._resultOrListeners,this._resultOrListeners=null;for(t=null;e!=null;t=e,e=n)n=e.get$_nextListener(),e._nextListener=t;return t},_complete$1:function(e){var t,n;t=f.getInterceptor(e);if(typeof e=="object"&&e!==null&&!!t.$isFuture){v._Future__chainFutures(e,this);return}n=this._removeListeners$0(),this._setValue$1(e),v._Future__propagateToListeners(this,n)},_completeError$2:function(e,t){var n=this._removeListeners$0();this._setError$2(e,t),v._Future__propagateToListeners(this,n)},get$_completeError:function(){return new v.BoundClosure$2(this,v._Future.prototype._completeError$2,null,"_completeError$2")},_asyncComplete$1:function(e){this._state!==0&&a.throwExpression(v.StateError$("Future already completed")),this._state=1,this._zone.toString,v._scheduleAsyncCallback(new v._Future__asyncComplete_closure(this,e))},_asyncCompleteError$2:function(e,t){this._state!==0&&a.throwExpression(v.StateError$("Future already completed")),this._state=1,this._zone.toString,v._scheduleAsyncCallback(new v._Future__asyncCompleteError_closure(this,e,t))},_async$_Future$immediate$1:function(e,t){this._asyncComplete$1(e)},$is_Future:!0,$isFuture:!0,"static":{"":"_Future__INCOMPLETE,_Future__PENDING_COMPLETE,_Future__CHAINED,_Future__VALUE,_Future__ERROR",_Future$:function(t){var n=new v._Future(0,e.Zone__current,null,null,null,null,null,null);return a.setRuntimeTypeInfo(n,[t]),n},_Future$immediate:function(t,n){var r=new v._Future(0,e.Zone__current,null,null,null,null,null,null);return a.setRuntimeTypeInfo(r,[n]),r._async$_Future$immediate$1(t,n),r},_Future$_then:function(t,n,r){var i=e.Zone__current;return i.toString,i=new v._Future(0,i,null,null,t,null,v._registerErrorHandler(n,i),null),a.setRuntimeTypeInfo(i,[r]),i},_Future$_catchError:function(t,n,r){var i,s;return i=e.Zone__current,s=v._registerErrorHandler(t,i),i.toString,s=new v._Future(0,i,null,null,null,n,s,null),a.setRuntimeTypeInfo(s,[r]),s},_Future$_whenComplete:function(t,n){var r=e.Zone__current;return r.toString,r=new v._Future(0,r,null,null,null,null,null,t),a.setRuntimeTypeInfo(r,[n]),r},_Future__chainFutures:function(e,t){var n;t._state=2,n=f.getInterceptor(e),typeof e!="object"||e===null||!n.$is_Future?e.then$2$onError(new v._Future__chainFutures_closure(t),new v._Future__chainFutures_closure0(t)):e._state>=4?v._Future__propagateToListeners(e,t):e._addListener$1(t)},_Future__propagateMultipleListeners:function(e,t){var n;do{n=t.get$_nextListener(),t._nextListener=null,v._Future__propagateToListeners(e,t);if(n!=null){t=n;continue}break}while(!0)},_Future__propagateToListeners:function(t,n){var r,i,s,o,u,a,l,c,h;r={},r.source_4=t;for(;!0;){i={};if(!r.source_4.get$_isComplete())return;s=r.source_4.get$_hasError();if(s&&n==null){i=r.source_4,o=i.get$_error(),i=i._zone,u=f.get$error$x(o),a=o.get$stackTrace(),i.toString,v._rootHandleUncaughtError
 (i,null,i,u,a);return}if(n==null)return;if(n._nextListener!=null){v._Future__propagateMultipleListeners(r.source_4,n);return}s?(u=r.source_4.get$_zone(),a=n._zone,u.toString,a.toString,u=a==null?u!=null:a!==u):u=!1;if(u){i=r.source_4,o=i.get$_error(),i=i._zone,u=f.get$error$x(o),a=o.get$stackTrace(),i.toString,v._rootHandleUncaughtError(i,null,i,u,a);return}u=e.Zone__current,a=n._zone;if(u==null?a!=null:u!==a){a.toString,v._rootRun(a,null,a,new v._Future__propagateToListeners_closure(r,n));return}i.listenerHasValue_1=null,i.listenerValueOrError_2=null,i.isPropagationAborted_3=!1,a.toString,v._rootRun(a,null,a,new v._Future__propagateToListeners_closure0(r,i,s,n));if(i.isPropagationAborted_3)return;u=i.listenerHasValue_1===!0,u?(a=i.listenerValueOrError_2,l=f.getInterceptor(a),l=typeof a=="object"&&a!==null&&!!l.$isFuture,a=l):a=!1;if(a){c=i.listenerValueOrError_2,i=f.getInterceptor(c);if(typeof c=="object"&&c!==null&&!!i.$is_Future&&c._state>=4){n._state=2,r.source_4=c;continue}v._Future__chainFutures(c,n);return}u?(h=n._removeListeners$0(),i=i.listenerValueOrError_2,n._state=4,n._resultOrListeners=i):(h=n._removeListeners$0(),o=i.listenerValueOrError_2,i=f.get$error$x(o),u=o.get$stackTrace(),n._state=8,n._resultOrListeners=new v._AsyncError(i,u)),r.source_4=n,n=h}}}},_Future__addListener_closure:{"":"Closure;this_0,listener_1",call$0:function(){v._Future__propagateToListeners(this.this_0,this.listener_1)}},_Future__chainFutures_closure:{"":"Closure;target_0",call$1:function(e){this.target_0._complete$1(e)},$is_args1:!0},_Future__chainFutures_closure0:{"":"Closure;target_1",call$2:function(e,t){this.target_1._completeError$2(e,t)},call$1:function(e){return this.call$2(e,null)},$is_args2:!0,$is_args1:!0},_Future__asyncComplete_closure:{"":"Closure;this_0,value_1",call$0:function(){this.this_0._complete$1(this.value_1)}},_Future__asyncCompleteError_closure:{"":"Closure;this_0,error_1,stackTrace_2",call$0:function(){this.this_0._completeError$2(this.error_1,this.stackTrace_2)}},_Future__propagateToListeners_closure:{"":"Closure;box_2,listener_3",call$0:function(){v._Future__propagateToListeners(this.box_2.source_4,this.listener_3)}},_Future__propagateToListeners_closure0:{"":"Closure;box_2,box_1,hasError_4,listener_5",call$0:function(){var e,t,n,r,i,s,o,u,l,c,h,p;e={};try{l=this.box_2,this.hasError_4?(n=l.source_4.get$_error(),l=this.listener_5,r=l._state===2?null:l._errorTestCallback,i=!0,r!=null&&(i=r.call$1(f.get$error$x(n))),i===!0?c=(l._state===2?null:l._onErrorCallback)!=null:c=!1,c?(s=l._state===2?null:l._onErrorCallback,l=this.box_1,l.listenerValueOrError_2=v._invokeErrorHandler(s,f.get$error$x(n),n.get$stackTrace()),l.listenerHasValue_1=!0):(l=this.box_1,l.listenerValueOrError_2=n,l.listenerHasValue_1=!1)):(t=l.source_4.get$_async$_value(),l=this.listener_5,c=l._state===2?null:l._onValueCallback,h=this.box_1,c!=null?(h.listenerValueOrError_2=l._onValue$1(t),h.listenerHasValue_1=!0):(h.listenerValueOrError_2=t,h.listenerHasValue_1=!0)),l=this.listener_5,(l._state===2?null:l._whenCompleteActionCallback)!=null&&(e.completeResult_0=l._whenCompleteAction$0(),c=e.completeResult_0,h=f.getInterceptor(c),typeof c=="object"&&c!==null&&!!h.$isFuture&&(l.set$_isChained(!0),e.completeResult_0.then$2$onError(new v._Future__propagateToListeners__closure(this.box_2,l),new v._Future__propagateToListeners__closure0(e,l)),this.box_1.isPropagationAborted_3=!0))}catch(p){e=a.unwrapException(p),o=e,u=new a._StackTrace(p,null),this.hasError_4?(e=f.get$error$x(this.box_2.source_4.get$_error()),l=o,l=e==null?l==null:e===l,e=l):e=!1,l=this.box_1,e?l.listenerValueOrError_2=this.box_2.source_4.get$_error():l.listenerValueOrError_2=new v._AsyncError(o,u),this.box_1.listenerHasValue_1=!1}}},_Future__propagateToListeners__closure:{"":"Closure;box_2,listener_6",call$1:function(e){v._Future__propagateToListeners(this.box_2.source_4,this.listener_6)},$is_args1:!0},_Future__propagateToListeners__closure0:{"":"Closure;box_0,listener_7",call$2:function(e,t){var n,r,i;n=this.box_0,r=n.completeResult_0,i=f.getInterceptor(r);if(typeof r!="object"||r===null||!i.$is_Future)n.completeResult_0=v._Future$(null),n.completeResult_0._setError$2(e,t);v._Future__propagateToListeners(n.completeResult_0,this.listener_7)},call$1:function(e){return this.call$2(e,null)},$is_args2:!0,$is_args1:!0},Stream:{"":"Object;",forEach$1:function(e,t){var n,r;return n={},r=v._Future$(null),n.subscription_0=null,n.subscription_0=this.listen$4$cancelOnError$onDone$onError(new v.Stream_forEach_closure(n,this,t,r),!0,new v.Stream_forEach_closure0(r),r.get$_completeError()),r},get$length:function(e){var t,n;return t={},n=v._Future$(f.JSInt),t.count_0=0,this.listen$4$cancelOnError$onDone$onError(new v.Stream_length_closure(t),!0,new v.Stream_length_closure0(t,n),n.get$_completeError()),n}},Stream_Stream$fromFuture_closure:{"":"Closure;controller_0",call$1:function(e){var t=this.controller_0;t._state>=4&&a.throwExpression(t._badEventState$0()),t._async$_add$1(e),t.close$0(t)},$is_args1:!0},Stream_Stream$fromFuture_closure0:{"":"Closure;controller_1",call$2:function(e,t){var n=this.controller_1;n._state>=4&&a.throwExpression(n._badEventState$0()),n._addError$2(e,t),n.close$0(n)},$is_args2:!0},Stream_forEach_closure:{"":"Closure;box_0,this_1,action_2,future_3",call$1:function(e){v._runUserCode(new v.Stream_forEach__closure(this.action_2,e),new v.Stream_forEach__closure0,v._cancelAndErrorClosure(this.box_0.subscription_0,this.future_3))},$is_args1:!0},Stream_forEach__closure:{"":"Closure;action_4,element_5",call$0:function(){return this.action_4.call$1(this.element_5)}},Stream_forEach__closure0:{"":"Closure;",call$1:function(e){},$is_args1:!0},Stream_forEach_closure0:{"":"Closure;future_6",call$0:function(){this.future_6._complete$1(null)}},Stream_length_closure:{"":"Closure;box_0",call$1:function(e){var t=this.box_0;t.count_0=t.count_0+1},$is_args1:!0},Stream_length_closure0:{"":"Closure;box_0,future_1",call$0:function(){this.future_1._complete$1(this.box_0.count_0)}},StreamSubscription:{"":"Object;"},_StreamController:{"":"Object;",get$_pendingEvents:function(){return(this._state&8)===0?this._varData:this._varData.get$varData()},_ensurePendingEvents$0:function(){if((this._state&8)===0)return this._varData==null&&(this._varData=new v._StreamImplEvents(null,null,0)),this._varData;var e=this._varData.get$varData();return e},get$_subscription:function(){return(this._state&8)!==0?this._varData.get$varData():this._varData},_badEventState$0:function(){return(this._state&4)!==0?new v.StateError("Cannot add event after closing"):new v.StateError("Cannot add event while adding a stream")},_ensureDoneFuture$0:function(){return this._doneFuture==null&&(this._doneFuture=v._Future$(null),(this._state&2)!==0&&this._doneFuture._complete$1(null)),this._doneFuture},add$1:function(e,t){if(this._state>=4)throw a.wrapException(this._badEventState$0());this._async$_add$1(t)},close$0:function(e){var t=this._state;if((t&4)!==0)return this._doneFuture;if(t>=4)throw a.wrapException(this._badEventState$0());return this._state=(t|4)>>>0,this._ensureDoneFuture$0(),t=this._state,(t&1)!==0?this._sendDone$0():(t&3)===0&&(t=this._ensurePendingEvents$0(),t.add$1(t,r.C__DelayedDone)),this._doneFuture},_async$_add$1:function(e){var t=this._state;(t&1)!==0?this._sendData$1(e):(t&3)===0&&(t=this._ensurePendingEvents$0(),t.add$1(t,new v._DelayedData(e,null)))},_addError$2:function(e,t){var n=this._state;(n&1)!==0?this._sendError$2(e,t):(n&3)===0&&(n=this._ensurePendingEvents$0(),n.add$1(n,new v._DelayedError(e,t,null)))},_subscribe$1:function(t){var n,r,i,s,o;if((this._state&3)!==0)throw a.wrapException(v.StateError$("Stream has already been listened to."));return n=e.Zone__current,r=t?1:0,i=new v._ControllerSubscription(this,null,null,null,n,r,null,null),a.setRuntimeTypeInfo(i,[null]),s=this.get$_pendingEvents(),this._state=(this._state|1)>>>0,(this._state&8)!==0?(o=this._varData,o.set$varData(i),o.resume$0()):this._varData=i,i._setPendingEvents$1(s),i._guardCallback$1(new v._StreamController__subscribe_closure(this)),i},_recordCancel$1:function(e){var t,n;return(this._state&8)!==0&&this._varData.cancel$0(),this._varData=null,this._state=(this._state&4294967286|2)>>>0,t=new v._StreamController__recordCancel_complete(this),n=v._runGuarded(this.get$_onCancel()),n!=null?n=n.whenComplete$1(t):t.call$0(),n},_recordPause$1:function(e){var t;(this._state&8)!==0&&(t=this._varData,t.pause$0(t)),v._runGuarded(this.get$_onPause())},_recordResume$1:function(e){(this._state&8)!==0&&this._varData.resume$0(),v._runGuarded(this.get$_onResume())}},_StreamController__subscribe_closure:{"":"Closure;this_0",call$0:function(){v._runGuarded(this.this_0.get$_onListen())}},_StreamController__recordCancel_complete:{"":"Closure;this_0",call$0:function(){var e=this.this_0._doneFuture;e!=null&&e._state===0&&e._asyncComplete$1(null)}},_SyncStreamControllerDispatch:{"":"Object;",_sendData$1:function(e){this.get$_subscription()._async$_add$1(e)},_sendError$2:function(e,t){this.get$_subscription()._addError$2(e,t)},_sendDone$0:function(){this.get$_subscription()._close$0()}},_AsyncStreamControllerDispatch:{"":"Object;",_sendData$1:function(e){this.get$_subscription()._addPending$1(new v._DelayedData(e,null))},_sendError$2:function(e,t){this.get$_subscription()._addPending$1(new v._DelayedError(e,t,null))},_sendDone$0:function(){this.get$_subscription()._addPending$1(r.C__DelayedDone)}},_AsyncStreamController:{"":"_StreamController__AsyncStreamControllerDispatch;_onListen<,_onPause<,_onResume<,_onCancel<,_varData,_state,_doneFuture"},_StreamController__AsyncStreamControllerDispatch:{"":"_StreamController+_AsyncStreamControllerDispatch;"},_SyncStreamController:{"":"_StreamController__SyncStreamControllerDispatch;_onListen<,_onPause<,_onResume<,_onCancel<,_varData,_state,_doneFuture"},_StreamController__SyncStreamControllerDispatch:{"":"_StreamController+_SyncStreamControllerDispatch;"},_NoCallbacks:{"":"Object;",get$_onListen:function(){return},get$_onPause:function(){return},get$_onResume:function(){return},get$_onCancel:function(){return}},_NoCallbackAsyncStreamController:{"":"_StreamController__AsyncStreamControllerDispatch0+_NoCallbacks;_varData,_state,_doneFuture"},_StreamController__AsyncStreamControllerDispatch0:{"":"_StreamController+_AsyncStreamControllerDispatch;"},_NoCallbackSyncStreamController:{"":"_StreamController__SyncStreamControllerDispatch0+_NoCallbacks;_varData,_state,_doneFuture"},_StreamController__SyncStreamControllerDispatch0:{"":"_StreamController+_SyncStreamControllerDispatch;"},_ControllerStream:{"":"_StreamImpl;_controller",_createSubscription$1:function(e){return this._controller._subscribe$1(e)},get$hashCode:function(e){return(a.Primitives_objectHashCode(this._controller)^892482866)>>>0},$eq:function(e,t){var n;return t==null?!1:this===t?!0:(n=f.getInterceptor(t),typeof t!="object"||t===null||!n.$is_ControllerStream?!1:t._controller===this._controller)},$is_ControllerStream:!0,$as_StreamImpl:null},_ControllerSubscription:{"":"_BufferingStreamSubscription;_controller<,_async$_onData,_onError,_onDone,_zone,_state,_cancelFuture,_pending",_onCancel$0:function(){return this.get$_controller()._recordCancel$1(this)},_onPause$0:function(){this.get$_controller()._recordPause$1(this)},get$_onPause:function(){return new v.BoundClosure$0(this,v._ControllerSubscription.prototype._onPause$0,null,"_onPause$0")},_onResume$0:function(){this.get$_controller()._recordResume$1(this)},get$_onResume:function(){return new v.BoundClosure$0(this,v._ControllerSubscription.prototype._onResume$0,null,"_onResume$0")},$as_BufferingStreamSubscription:null},_EventSink:{"":"Object;"},_BufferingStreamSubscription:{"":"Object;_async$_onData,_onError,_onDone,_zone<,_state,_cancelFuture,_pending",_setPendingEvents$1:function(e){if(e==null)return;this._pending=e,e.get$isEmpty(e)||(this._state=(this._state|64)>>>0,this._pending.schedule$1(this))},onData$1:function(t){e.Zone__current.toString,this._async$_onData=t},onError$1:function(t,n){n==null&&(n=v._nullErrorHandler$closure),this._onError=v._registerErrorHandler(n,e.Zone__current)},onDone$1:function(t){t==null&&(t=v._nullDoneHandler$closure),e.Zone__current.toString,this._onDone=t},pause$1:function(e,t){var n=this._state;if((n&8)!==0)return;this._state=(n+128|4)>>>0,n<128&&this._pending!=null&&this._pending.cancelSchedule$0(),(n&4)===0&&(this._state&32)===0&&this._guardCallback$1(this.get$_onPause())},pause$0:function(e){return this.pause$1(e,null)},resume$0:function(){var e,t;e=this._state;if((e&8)!==0)return;e>=128&&(this._state=e-128,e=this._state,e<128&&((e&64)!==0?(t=this._pending,t=!t.get$isEmpty(t)):t=!1,t?this._pending.schedule$1(this):(this._state=(e&4294967291)>>>0,(this._state&32)===0&&this._guardCallback$1(this.get$_onResume()))))},cancel$0:function(){return this._state=(this._state&4294967279)>>>0,(this._state&8)!==0?this._cancelFuture:(this._cancel$0(),this._cancelFuture)},get$_mayResumeInput:function(){if(this._state<128){var e=this._pending;e=e==null||e.get$isEmpty(e)}else e=!1;return e},_cancel$0:function(){this._state=(this._state|8)>>>0,(this._state&64)!==0&&this._pending.cancelSchedule$0(),(this._state&32)===0&&(this._pending=null),this._cancelFuture=this._onCancel$0()},_async$_add$1:function(e){var t=this._state;if((t&8)!==0)return;t<32?this._sendData$1(e):this._addPending$1(new v._DelayedData(e,null))},_addError$2:function(e,t){var n=this._state;if((n&8)!==0)return;n<32?this._sendError$2(e,t):this._addPending$1(new v._DelayedError(e,t,null))},_close$0:function(){var e=this._state;if((e&8)!==0)return;this._state=(e|2)>>>0,this._state<32?this._sendDone$0():this._addPending$1(r.C__DelayedDone)},_onPause$0:function(){},get$_onPause:function(){return new v.BoundClosure$0(this,v._BufferingStreamSubscription.prototype._onPause$0,null,"_onPause$0")},_onResume$0:function(){},get$_onResume:function(){return new v.BoundClosure$0(this,v._BufferingStreamSubscription.prototype._onResume$0,null,"_onResume$0")},_onCancel$0:function(){},_addPending$1:function(e){var t,n;t=this._pending,t==null&&(t=new v._StreamImplEvents(null,null,0),this._pending=t),t.add$1(t,e),n=this._state,(n&64)===0&&(this._state=(n|64)>>>0,this._state<128&&this._pending.schedule$1(this))},_sendData$1:function(e){var t=this._state;this._state=(t|32)>>>0,this._zone.runUnaryGuarded$2(this._async$_onData,e),this._state=(this._state&4294967263)>>>0,this._checkState$1((t&4)!==0)},_sendError$2:function(e,t){var n,r,i;n=this._state,r=new v._BufferingStreamSubscription__sendError_sendError(this,e,t),(n&1)!==0?(this._state=(n|16)>>>0,this._cancel$0(),n=this._cancelFuture,i=f.getInterceptor(n),typeof n!="object"||n===null||!i.$isFuture?r.call$0():n.whenComplete$1(r)):(r.call$0(),this._checkState$1((n&4)!==0))},_sendDone$0:function(){var e,t,n;e=new v._BufferingStreamSubscription__sendDone_sendDone(this),this._cancel$0(),this._state=(this._state|16)>>>0,t=this._cancelFuture,n=f.getInterceptor(t),typeof t!="object"||t===null||!n.$isFuture?e.call$0():t.whenComplete$1(e)},_guardCallback$1:function(e){var t=this._state;this._state=(t|32)>>>0,e.call$0(),this._state=(this._state&4294967263)>>>0,this._checkState$1((t&4)!==0)},_checkState$1:function(e){var t,n,r;t=this._state,(t&64)!==0?(n=this._pending,n=n.get$isEmpty(n)):n=!1,n&&(this._state=(t&4294967231)>>>0,(this._state&4)!==0&&this.get$_mayResumeInput()&&(this._state=(this._state&4294967291)>>>0));for(;!0;e=r){t=this._state;if((t&8)!==0){this._pending=null;return}r=(t&4)!==0;if(e===r)break;this._state=(t^32)>>>0,r?this._onPause$0():this._onResume$0(),this._state=(this._state&4294967263)>>>0}t=this._state,(t&64)!==0&&t<128&&this._pending.schedule$1(this)},"static":{"":"_BufferingStreamSubscription__STATE_CANCEL_ON_ERROR,_BufferingStreamSubscription__STATE_CLOSED,_BufferingStreamSubscription__STATE_INPUT_PAUSED,_BufferingStreamSubscription__STATE_CANCELED,_BufferingStreamSubscription__STATE_WAIT_FOR_CANCEL,_BufferingStreamSubscription__STATE_IN_CALLBACK,_BufferingStreamSubscription__STATE_HAS_PENDING,_BufferingStreamSubscription__STATE_PAUSE_COUNT,_BufferingStreamSubscription__STATE_PAUSE_COUNT_SHIFT"}},_BufferingStreamSubscription__sendError_sendError:{"":"Closure;this_0,error_1,stackTrace_2",call$0:function(){var t,n,r,i,s;t=this.this_0,n=t._state;if((n&8)!==0&&(n&16)===0)return;t._state=(n|32)>>>0,n=t._zone,r=e.Zone__current,n.toString,r.toString,(r==null?n!=null:r!==n)?v._rootHandleUncaughtError(r,null,r,this.error_1,this.stackTrace_2):(r=t._onError,i=f.getInterceptor(r),s=this.error_1,i.$is_args2?n.runBinaryGuarded$3(r,s,this.stackTrace_2):n.runUnaryGuarded$2(r,s)),t._state=(t._state&4294967263)>>>0}},_BufferingStreamSubscription__sendDone_sendDone:{"":"Closure;this_0",call$0:function(){var e,t;e=this.this_0,t=e._state;if((t&16)===0)return;e._state=(t|42)>>>0,e._zone.runGuarded$1(e._onDone),e._state=(e._state&4294967263)>>>0}},_StreamImpl:{"":"Stream;",listen$4$cancelOnError$onDone$onError:function(e,t,n,r){var i=this._createSubscription$1(!0===t);return i.onData$1(e),i.onError$1(i,r),i.onDone$1(n),i},listen$1:function(e){return this.listen$4$cancelOnError$onDone$onError(e,null,null,null)},_createSubscription$1:function(t){var n,r,i;return n=a.getRuntimeTypeArgument(this,"_StreamImpl",0),r=e.Zone__current,i=t?1:0,i=new v._BufferingStreamSubscription(null,null,null,r,i,null,null),a.setRuntimeTypeInfo(i,[n]),i},$asStream:null},_DelayedEvent:{"":"Object;next@"},_DelayedData:{"":"_DelayedEvent;value,next",perform$1:function(e){e._sendData$1(this.value)}},_DelayedError:{"":"_DelayedEvent;error>,stackTrace<,next",perform$1:function(e){e._sendError$2(this.error,this.stackTrace)}},_DelayedDone:{"":"Object;",perform$1:function(e){e._sendDone$0()},get$next:function(){return},set$next:function(e){throw a.wrapException(new v.StateError("No events after a done."))}},_PendingEvents:{"":"Object;",schedule$1:function(e){var t=this._state;if(t===1)return;if(t>=1){this._state=1;return}v.scheduleMicrotask(new v._PendingEvents_schedule_closure(this,e)),this._state=1},cancelSchedule$0:function(){this._state===1&&(this._state=3)}},_PendingEvents_schedule_closure:{"":"Closure;this_0,dispatch_1",call$0:function(){var e,t;e=this.this_0,t=e._state,e._state=0;if(t===3)return;e.handleNext$1(this.dispatch_1)}},_StreamImplEvents:{"":"_PendingEvents;firstPendingEvent,lastPendingEvent,_state",get$isEmpty:function(e){return this.lastPendingEvent==null},add$1:function(e,t){var n=this.lastPendingEvent;n==null?(this.lastPendingEvent=t,this.firstPendingEvent=t):(n.set$next(t),this.lastPendingEvent=t)},handleNext$1:function(e){var t=this.firstPendingEvent;this.firstPendingEvent=t.get$next(),this.firstPendingEvent==null&&(this.lastPendingEvent=null),t.perform$1(e)}},_cancelAndError_closure:{"":"Closure;future_0,error_1,stackTrace_2",call$0:function(){return this.future_0._completeError$2(this.error_1,this.stackTrace_2)}},_cancelAndErrorClosure_closure:{"":"Closure;subscription_0,future_1",call$2:function(e,t){return v._cancelAndError(this.subscription_0,this.future_1,e,t)},$is_args2:!0},_BaseZone:{"":"Object;",runGuarded$1:function(e){var t,n,r,i;try{return r=this.run$1(e),r}catch(i){return r=a.unwrapException(i),t=r,n=new a._StackTrace(i,null),this.handleUncaughtError$2(t,n)}},runUnaryGuarded$2:function(e,t){var n,r,i,s;try{return i=this.runUnary$2(e,t),i}catch(s){return i=a.unwrapException(s),n=i,r=new a._StackTrace(s,null),this.handleUncaughtError$2(n,r)}},runBinaryGuarded$3:function(e,t,n){var r,i,s,o;try{return s=this.runBinary$3(e,t,n),s}catch(o){return s=a.unwrapException(o),r=s,i=new a._StackTrace(o,null),this.handleUncaughtError$2(r,i)}},bindCallback$2$runGuarded:function(e,t){var n=this.registerCallback$1(e);return t?new v._BaseZone_bindCallback_closure(this,n):new v._BaseZone_bindCallback_closure0(this,n)},bindUnaryCallback$2$runGuarded:function(e,t){var n=this.registerUnaryCallback$1(e);return t?new v._BaseZone_bindUnaryCallback_closure(this,n):new v._BaseZone_bindUnaryCallback_closure0(this,n)}},_BaseZone_bindCallback_closure:{"":"Closure;this_0,registered_1",call$0:function(){return this.this_0.runGuarded$1(this.registered_1)}},_BaseZone_bindCallback_closure0:{"":"Closure;this_2,registered_3",call$0:function(){return this.this_2.run$1(this.registered_3)}},_BaseZone_bindUnaryCallback_closure:{"":"Closure;this_0,registered_1",call$1:function(e){return this.this_0.runUnaryGuarded$2(this.registered_1,e)},$is_args1:!0},_BaseZone_bindUnaryCallback_closure0:{"":"Closure;this_2,registered_3",call$1:function(e){return this.this_2.runUnary$2(this.registered_3,e)},$is_args1:!0},_rootHandleUncaughtError_closure:{"":"Closure;error_0,stackTrace_1",call$0:function(){v._scheduleAsyncCallback(new v._rootHandleUncaughtError__closure(this.error_0,this.stackTrace_1))}},_rootHandleUncaughtError__closure:{"":"Closure;error_2,stackTrace_3",call$0:function(){var e,t,n;throw e=this.error_2,v.print("Uncaught Error: "+a.S(e)),t=this.stackTrace_3,t==null?(n=f.getInterceptor(e),n=typeof e=="object"&&e!==null&&!!n.$isError):n=!1,n&&(t=e.get$stackTrace()),t!=null&&v.print("Stack Trace: \n"+a.S(t)+"\n"),a.wrapException(e)}},_RootZone:{"":"_BaseZone;",$index:function(e,t){return},handleUncaughtError$2:function(e,t){return v._rootHandleUncaughtError(this,null,this,e,t)},run$1:function(e){return v._rootRun(this,null,this,e)},runUnary$2:function(e,t){return v._rootRunUnary(this,null,this,e,t)},runBinary$3:function(e,t,n){return v._rootRunBinary(this,null,this,e,t,n)},registerCallback$1:function(e){return e},registerUnaryCallback$1:function(e){return e}}}],["dart.collection","dart:collection",,v,{_defaultEquals:function(e,t){return f.$eq(e,t)},_defaultHashCode:function(e){return f.get$hashCode$(e)},HashMap_HashMap:function(e,t,n,r,i){var s=new v._HashMap(0,null,null,null,null);return a.setRuntimeTypeInfo(s,[r,i]),s},HashSet_HashSet$identity:function(e){var t=new v._IdentityHashSet(0,null,null,null,null);return a.setRuntimeTypeInfo(t,[e]),t},_iterableToString:function(t){var n,r;r=e.get$_toStringVisiting();if(r.contains$1(r,t))return"(...)";r=e.get$_toStringVisiting(),r.add$1(r,t),n=[];try{v._iterablePartsToStrings(t,n)}finally{r=e.get$_toStringVisiting(),r.remove$1(r,t)}return r=v.StringBuffer$("("),r.writeAll$2(n,", "),r.write$1(")"),r._contents},_iterablePartsToStrings:function(e,t){var n,r,i,s,o,u,f,l,c,h;n=e.get$iterator(e),r=0,i=0;for(;;){if(!(r<80||i<3))break;if(!n.moveNext$0())return;s=a.S(n.get$current()),t.push(s),r+=s.length+2,++i}if(!n.moveNext$0()){if(i<=5)return;if(0>=t.length)throw a.ioore(t,0);o=t.pop();if(0>=t.length)throw a.ioore(t,0);u=t.pop()}else{f=n.get$current(),++i;if(!n.moveNext$0()){if(i<=4){t.push(a.S(f));return}o=a.S(f);if(0>=t.length)throw a.ioore(t,0);u=t.pop(),r+=o.length+2}else{l=n.get$current(),++i;for(;n.moveNext$0();f=l,l=c){c=n.get$current(),++i;if(i>100){for(;;){if(!(r>75&&i>3))break;if(0>=t.length)throw a.ioore(t,0);r-=t.pop().length+2,--i}t.push("...");return}}u=a.S(f),o=a.S(l),r+=o.length+u.length+4}}i>t.length+2?(r+=5,h="..."):h=null;for(;;){if(!(r>80&&t.length>3))break;if(0>=t.length)throw a.ioore(t,0);r-=t.pop().length+2,h==null&&(r+=5,h="...")}h!=null&&t.push(h),t.push(u),t.push(o)},LinkedHashMap_LinkedHashMap:function(e,t,n,r,i){var s=new v._LinkedHashMap(0,null,null,null,null,null,0);return a.setRuntimeTypeInfo(s,[r,i]),s},LinkedHashSet_LinkedHashSet:function(e,t,n,r){var i=new v._LinkedHashSet(0,null,null,null,null,null,0);return a.setRuntimeTypeInfo(i,[r]),i},Maps_mapToString:function(t){var n,r,i,s;n={};for(i=0;i<e.get$Maps__toStringList().length;++i){s=e.get$Maps__toStringList();if(i>=s.length)throw a.ioore(s,i);if(s[i]===t)return"{...}"}r=v.StringBuffer$("");try{e.get$Maps__toStringList().push(t),r.write$1("{"),n.first_0=!0,f.forEach$1$ax(t,new v.Maps_mapToString_closure(n,r)),r.write$1("}")}finally{n=e.get$Maps__toStringList();if(0>=n.length)throw a.ioore(n,0);n.pop()}return r.get$_contents()},_HashMap:{"":"Object;_collection$_length,_strings,_nums,_rest,_keys",get$length:function(e){return this._collection$_length},get$keys:function(){var e=new v.HashMapKeyIterable(this);return a.setRuntimeTypeInfo(e,[a.getRuntimeTypeArgument(this,"_HashMap",0)]),e},get$values:function(e){var t=new v.HashMapKeyIterable(this);return a.setRuntimeTypeInfo(t,[a.getRuntimeTypeArgument(this,"_HashMap",0)]),a.MappedIterable_MappedIterable(t,new v._HashMap_values_closure(this),a.getRuntimeTypeArgument(t,"IterableBase",0),null)},addAll$1:function(e,t){a.IterableMixinWorkaround_forEach(t,new v._HashMap_addAll_closure(this))},$index:function(e,t){var n,r,i,s,o,u,a;if(typeof t=="string"&&t!=="__proto__")return n=this._strings,n==null?r=null:(i=n[t],r=i===n?null:i),r;if(typeof t=="number"&&(t&67108863)===t)return s=this._nums,s==null?r=null:(i=s[t],r=i===s?null:i),r;o=this._rest;if(o==null)return;return u=o[this._computeHashCode$1(t)],a=this._findBucketIndex$2(u,t),a<0?null:u[a+1]},$indexSet:function(e,t,n){var r,i,s,o,u,a;typeof t=="string"&&t!=="__proto__"?(r=this._strings,r==null&&(r=v._HashMap__newHashTable(),this._strings=r),this._addHashTableEntry$3(r,t,n)):typeof t=="number"&&(t&67108863)===t?(i=this._nums,i==null&&(i=v._HashMap__newHashTable(),this._nums=i),this._addHashTableEntry$3(i,t,n)):(s=this._rest,s==null&&(s=v._HashMap__newHashTable(),this._rest=s),o=this._computeHashCode$1(t),u=s[o],u==null?(v._HashMap__setTableEntry(s,o,[t,n]),this._collection$_length=this._collection$_length+1,this._keys=null):(a=this._findBucketIndex$2(u,t),a>=0?u[a+1]=n:(u.push(t,n),this._collection$_length=this._collection$_length+1,this._keys=null)))},forEach$1:function(e,t){var n,r,i,s;n=this._computeKeys$0();for(r=n.length,i=0;i<r;++i){s=n[i],t.call$2(s,this.$index(this,s));if(n!==this._keys)throw a.wrapException(v.ConcurrentModificationError$(this))}},_computeKeys$0:function(){var e,t,n,r,i,s,o,u,a,f,l,c;e=this._keys;if(e!=null)return e;t=v.List_List(this._collection$_length,null),n=this._strings;if(n!=null){r=Object.getOwnPropertyNames(n),i=r.length;for(s=0,o=0;o<i;++o)t[s]=r[o],++s}else s=0;u=this._nums;if(u!=null){r=Object.getOwnPropertyNames(u),i=r.length;for(o=0;o<i;++o)t[s]=+r[o],++s}a=this._rest;if(a!=null){r=Object.getOwnPropertyNames(a),i=r.length;for(o=0;o<i;++o){f=a[r[o]],l=f.length;for(c=0;c<l;c+=2)t[s]=f[c],++s}}return this._keys=t,t},_addHashTableEntry$3:function(e,t,n){e[t]==null&&(this._collection$_length=this._collection$_length+1,this._keys=null),v._HashMap__setTableEntry(e,t,n)},_computeHashCode$1:function(e){return f.get$hashCode$(e)&67108863},_findBucketIndex$2:function(e,t){var n,r;if(e==null)return-1;n=e.length;for(r=0;r<n;r+=2)if(f.$eq(e[r],t))return r;return-1},$isMap:!0,"static":{_HashMap__setTableEntry:function(e,t,n){n==null?e[t]=e:e[t]=n},_HashMap__newHashTable:function(){var e=Object.create(null);return v._HashMap__setTableEntry(e,"<non-identifier-key>",e),delete e["<non-identifier-key>"],e}}},_HashMap_values_closure:{"":"Closure;this_0",call$1:function(e){var t=this.this_0;return t.$index(t,e)},$is_args1:!0},_HashMap_addAll_closure:{"":"Closure;this_0",call$2:function(e,t){var n=this.this_0;n.$indexSet(n,e,t)},$is_args2:!0},HashMapKeyIterable:{"":"IterableBase;_map",get$length:function(e){return this._map._collection$_length},get$iterator:function(e){var t=this._map;return new v.HashMapKeyIterator(t,t._computeKeys$0(),0,null)},forEach$1:function(e,t){var n,r,i,s;n=this._map,r=n._computeKeys$0();for(i=r.length,s=0;s<i;++s){t.call$1(r[s]);if(r!==n._keys)throw a.wrapException(v.ConcurrentModificationError$(n))}},$asIterableBase:null,$isEfficientLength:!0},HashMapKeyIterator:{"":"Object;_map,_keys,_offset,_collection$_current",get$current:function(){return this._collection$_current},moveNext$0:function(){var e,t,n;e=this._keys,t=this._offset,n=this._map;if(e!==n._keys)throw a.wrapException(v.ConcurrentModificationError$(n));return t>=e.length?(this._collection$_current=null,!1):(this._collection$_current=e[t],this._offset=t+1,!0)}},_LinkedHashMap:{"":"Object;_collection$_length,_strings,_nums,_rest,_first,_last,_modifications",get$length:function(e){return this._collection$_length},get$isEmpty:function(e){return this._collection$_length===0},get$keys:function(){var e=new v.LinkedHashMapKeyIterable(this);return a.setRuntimeTypeInfo(e,[a.getRuntimeTypeArgument(this,"_LinkedHashMap",0)]),e},get$values:function(e){var t=new v.LinkedHashMapKeyIterable(this);return a.setRuntimeTypeInfo(t,[a.getRuntimeTypeArgument(this,"_LinkedHashMap",0)]),a.MappedIterable_MappedIterable(t,new v._LinkedHashMap_values_closure(this),a.getRuntimeTypeArgument(t,"IterableBase",0),null)},containsKey$1:function(e){var t,n,r;return typeof e=="string"&&e!=="__proto__"?(t=this._strings,t==null?!1:t[e]!=null):typeof e=="number"&&(e&67108863)===e?(n=this._nums,n==null?!1:n[e]!=null):(r=this._rest,r==null?!1:this._findBucketIndex$2(r[this._computeHashCode$1(e)],e)>=0)},addAll$1:function(e,t){a.IterableMixinWorkaround_forEach(t,new v._LinkedHashMap_addAll_closure(this))},$index:function(e,t){var n,r,i,s,o,u;if(typeof t=="string"&&t!=="__proto__"){n=this._strings;if(n==null)return;return r=n[t],r==null?null:r.get$_value()}if(typeof t=="number"&&(t&67108863)===t){i=this._nums;if(i==null)return;return r=i[t],r==null?null:r.get$_value()}s=this._rest;if(s==null)return;o=s[this._computeHashCode$1(t)],u=this._findBucketIndex$2(o,t);if(u<0)return;return o[u].get$_value()},$indexSet:function(e,t,n){var r,i,s,o,u,a;typeof t=="string"&&t!=="__proto__"?(r=this._strings,r==null&&(r=v._LinkedHashMap__newHashTable(),this._strings=r),this._addHashTableEntry$3(r,t,n)):typeof t=="number"&&(t&67108863)===t?(i=this._nums,i==null&&(i=v._LinkedHashMap__newHashTable(),this._nums=i),this._addHashTableEntry$3(i,t,n)):(s=this._rest,s==null&&(s=v._LinkedHashMap__newHashTable(),this._rest=s),o=this._computeHashCode$1(t),u=s[o],u==null?s[o]=[this._newLinkedCell$2(t,n)]:(a=this._findBucketIndex$2(u,t),a>=0?u[a].set$_value(n):u.push(this._newLinkedCell$2(t,n))))},remove$1:function(e,t){var n,r,i,s;if(typeof t=="string"&&t!=="__proto__")return this._removeHashTableEntry$2(this._strings,t);if(typeof t=="number"&&(t&67108863)===t)return this._removeHashTableEntry$2(this._nums,t);n=this._rest;if(n==null)return;r=n[this._computeHashCode$1(t)],i=this._findBucketIndex$2(r,t);if(i<0)return;return s=r.splice(i,1)[0],this._unlinkCell$1(s),s.get$_value()},forEach$1:function(e,t){var n,r;n=this._first,r=this._modifications;for(;n!=null;){t.call$2(n.get$_key(),n._value);if(r!==this._modifications)throw a.wrapException(v.ConcurrentModificationError$(this));n=n._next}},_addHashTableEntry$3:function(e,t,n){var r=e[t];r==null?e[t]=this._newLinkedCell$2(t,n):r.set$_value(n)},_removeHashTableEntry$2:function(e,t){var n;if(e==null)return;n=e[t];if(n==null)return;return this._unlinkCell$1(n),delete e[t],n.get$_value()},_newLinkedCell$2:function(e,t){var n,r;return n=new v.LinkedHashMapCell(e,t,null,null),this._first==null?(this._last=n,this._first=n):(r=this._last,n._previous=r,r.set$_next(n),this._last=n),this._collection$_length=this._collection$_length+1,this._modifications=this._modifications+1&67108863,n},_unlinkCell$1:function(e){var t,n;t=e.get$_previous(),n=e.get$_next(),t==null?this._first=n:t.set$_next(n),n==null?this._last=t:n.set$_previous(t),this._collection$_length=this._collection$_length-1,this._modifications=this._modifications+1&67108863},_computeHashCode$1:function(e){return f.get$hashCode$(e)&67108863},_findBucketIndex$2:function(e,t){var n,r;if(e==null)return-1;n=e.length;for(r=0;r<n;++r)if(f.$eq(e[r].get$_key(),t))return r;return-1},toString$0:function(e){return v.Maps_mapToString(this)},$isMap:!0,"static":{_LinkedHashMap__newHashTable:function(){var e=Object.create(null);return e["<non-identifier-key>"]=e,delete e["<non-identifier-key>"],e}}},_LinkedHashMap_values_closure:{"":"Closure;this_0",call$1:function(e){var t=this.this_0;return t.$index(t,e)},$is_args1:!0},_LinkedHashMap_addAll_closure:{"":"Closure;this_0",call$2:function(e,t){var n=this.this_0;n.$indexSet(n,e,t)},$is_args2:!0},LinkedHashMapCell:{"":"Object;_key<,_value@,_next@,_previous@"},LinkedHashMapKeyIterable:{"":"IterableBase;_map",get$length:function(e){return this._map._collection$_length},get$iterator:function(e){var t=this._map;return t=new v.LinkedHashMapKeyIterator(t,t._modifications,null,null),t._cell=t._map._first,t},forEach$1:function(e,t){var n,r,i;n=this._map,r=n._first,i=n._modifications;for(;r!=null;){t.call$1(r.get$_key());if(i!==n._modifications)throw a.wrapException(v.ConcurrentModificationError$(n));r=r._next}},$asIterableBase:null,$isEfficientLength:!0},LinkedHashMapKeyIterator:{"":"Object;_map,_modifications,_cell,_collection$_current",get$current:function(){return this._collection$_current},moveNext$0:function(){var e=this._map;if(this._modifications!==e._modifications)throw a.wrapException(v.ConcurrentModificationError$
 (e));return e=this._cell,e==null?(this._collection$_current=null,!1):(this._collection$_current=e.get$_key(),this._cell=this._cell.get$_next(),!0)}},_HashSet:{"":"_HashSetBase;",get$iterator:function(e){return new v.HashSetIterator(this,this._computeElements$0(),0,null)},get$length:function(e){return this._collection$_length},contains$1:function(e,t){var n,r,i;return typeof t=="string"&&t!=="__proto__"?(n=this._strings,n==null?!1:n[t]!=null):typeof t=="number"&&(t&67108863)===t?(r=this._nums,r==null?!1:r[t]!=null):(i=this._rest,i==null?!1:this._findBucketIndex$2(i[this._computeHashCode$1(t)],t)>=0)},lookup$1:function(e){var t,n,r,i;typeof e!="string"||e==="__proto__"?t=typeof e=="number"&&(e&67108863)===e:t=!0;if(t)return this.contains$1(this,e)?e:null;n=this._rest;if(n==null)return;r=n[this._computeHashCode$1(e)],i=this._findBucketIndex$2(r,e);if(i<0)return;return f.$index$asx(r,i)},add$1:function(e,t){var n,r,i,s,o,u;if(typeof t=="string"&&t!=="__proto__")return n=this._strings,n==null&&(r=Object.create(null),r["<non-identifier-key>"]=r,delete r["<non-identifier-key>"],this._strings=r,n=r),this._addHashTableEntry$2(n,t);if(typeof t=="number"&&(t&67108863)===t)return i=this._nums,i==null&&(r=Object.create(null),r["<non-identifier-key>"]=r,delete r["<non-identifier-key>"],this._nums=r,i=r),this._addHashTableEntry$2(i,t);s=this._rest,s==null&&(r=Object.create(null),r["<non-identifier-key>"]=r,delete r["<non-identifier-key>"],this._rest=r,s=r),o=this._computeHashCode$1(t),u=s[o];if(u==null)s[o]=[t];else{if(this._findBucketIndex$2(u,t)>=0)return!1;u.push(t)}return this._collection$_length=this._collection$_length+1,this._elements=null,!0},addAll$1:function(e,t){var n;for(n=new a.ListIterator(t,t.length,0,null);n.moveNext$0();)this.add$1(this,n._dev$_current)},remove$1:function(e,t){var n,r,i;return n=this._rest,n==null?!1:(r=n[this._computeHashCode$1(t)],i=this._findBucketIndex$2(r,t),i<0?!1:(this._collection$_length=this._collection$_length-1,this._elements=null,r.splice(i,1),!0))},_computeElements$0:function(){var e,t,n,r,i,s,o,u,a,f,l,c;e=this._elements;if(e!=null)return e;t=v.List_List(this._collection$_length,null),n=this._strings;if(n!=null){r=Object.getOwnPropertyNames(n),i=r.length;for(s=0,o=0;o<i;++o)t[s]=r[o],++s}else s=0;u=this._nums;if(u!=null){r=Object.getOwnPropertyNames(u),i=r.length;for(o=0;o<i;++o)t[s]=+r[o],++s}a=this._rest;if(a!=null){r=Object.getOwnPropertyNames(a),i=r.length;for(o=0;o<i;++o){f=a[r[o]],l=f.length;for(c=0;c<l;++c)t[s]=f[c],++s}}return this._elements=t,t},_addHashTableEntry$2:function(e,t){return e[t]!=null?!1:(e[t]=0,this._collection$_length=this._collection$_length+1,this._elements=null,!0)},_computeHashCode$1:function(e){return f.get$hashCode$(e)&67108863},_findBucketIndex$2:function(e,t){var n,r;if(e==null)return-1;n=e.length;for(r=0;r<n;++r)if(f.$eq(e[r],t))return r;return-1},$as_HashSetBase:null,$isEfficientLength:!0},_IdentityHashSet:{"":"_HashSet;_collection$_length,_strings,_nums,_rest,_elements",_computeHashCode$1:function(e){return a.objectHashCode(e)&67108863},_findBucketIndex$2:function(e,t){var n,r,i;if(e==null)return-1;n=e.length;for(r=0;r<n;++r){i=e[r];if(i==null?t==null:i===t)return r}return-1},$as_HashSet:null},HashSetIterator:{"":"Object;_set,_elements,_offset,_collection$_current",get$current:function(){return this._collection$_current},moveNext$0:function(){var e,t,n;e=this._elements,t=this._offset,n=this._set;if(e!==n._elements)throw a.wrapException(v.ConcurrentModificationError$(n));return t>=e.length?(this._collection$_current=null,!1):(this._collection$_current=e[t],this._offset=t+1,!0)}},_LinkedHashSet:{"":"_HashSetBase;_collection$_length,_strings,_nums,_rest,_first,_last,_modifications",get$iterator:function(e){var t=new v.LinkedHashSetIterator(this,this._modifications,null,null);return t._cell=t._set._first,t},get$length:function(e){return this._collection$_length},contains$1:function(e,t){var n,r,i;return typeof t=="string"&&t!=="__proto__"?(n=this._strings,n==null?!1:n[t]!=null):typeof t=="number"&&(t&67108863)===t?(r=this._nums,r==null?!1:r[t]!=null):(i=this._rest,i==null?!1:this._findBucketIndex$2(i[this._computeHashCode$1(t)],t)>=0)},lookup$1:function(e){var t,n,r,i;typeof e!="string"||e==="__proto__"?t=typeof e=="number"&&(e&67108863)===e:t=!0;if(t)return this.contains$1(this,e)?e:null;n=this._rest;if(n==null)return;r=n[this._computeHashCode$1(e)],i=this._findBucketIndex$2(r,e);if(i<0)return;return f.$index$asx(r,i).get$_collection$_element()},forEach$1:function(e,t){var n,r;n=this._first,r=this._modifications;for(;n!=null;){t.call$1(n.get$_collection$_element());if(r!==this._modifications)throw a.wrapException(v.ConcurrentModificationError$(this));n=n._next}},add$1:function(e,t){var n,r,i,s,o,u;if(typeof t=="string"&&t!=="__proto__")return n=this._strings,n==null&&(r=Object.create(null),r["<non-identifier-key>"]=r,delete r["<non-identifier-key>"],this._strings=r,n=r),this._addHashTableEntry$2(n,t);if(typeof t=="number"&&(t&67108863)===t)return i=this._nums,i==null&&(r=Object.create(null),r["<non-identifier-key>"]=r,delete r["<non-identifier-key>"],this._nums=r,i=r),this._addHashTableEntry$2(i,t);s=this._rest,s==null&&(r=Object.create(null),r["<non-identifier-key>"]=r,delete r["<non-identifier-key>"],this._rest=r,s=r),o=this._computeHashCode$1(t),u=s[o];if(u==null)s[o]=[this._newLinkedCell$1(t)];else{if(this._findBucketIndex$2(u,t)>=0)return!1;u.push(this._newLinkedCell$1(t))}return!0},addAll$1:function(e,t){var n;for(n=f.get$iterator$ax(t);n.moveNext$0();)this.add$1(this,n.get$current())},remove$1:function(e,t){var n,r,i;return t!=="__proto__"?this._removeHashTableEntry$2(this._strings,t):(n=this._rest,n==null?!1:(r=n[this._computeHashCode$1(t)],i=this._findBucketIndex$2(r,t),i<0?!1:(this._unlinkCell$1(r.splice(i,1)[0]),!0)))},_addHashTableEntry$2:function(e,t){return e[t]!=null?!1:(e[t]=this._newLinkedCell$1(t),!0)},_removeHashTableEntry$2:function(e,t){var n;return e==null?!1:(n=e[t],n==null?!1:(this._unlinkCell$1(n),delete e[t],!0))},_newLinkedCell$1:function(e){var t,n;return t=new v.LinkedHashSetCell(e,null,null),this._first==null?(this._last=t,this._first=t):(n=this._last,t._previous=n,n.set$_next(t),this._last=t),this._collection$_length=this._collection$_length+1,this._modifications=this._modifications+1&67108863,t},_unlinkCell$1:function(e){var t,n;t=e.get$_previous(),n=e.get$_next(),t==null?this._first=n:t.set$_next(n),n==null?this._last=t:n.set$_previous(t),this._collection$_length=this._collection$_length-1,this._modifications=this._modifications+1&67108863},_computeHashCode$1:function(e){return f.get$hashCode$(e)&67108863},_findBucketIndex$2:function(e,t){var n,r;if(e==null)return-1;n=e.length;for(r=0;r<n;++r)if(f.$eq(e[r].get$_collection$_element(),t))return r;return-1},$as_HashSetBase:null,$isEfficientLength:!0},LinkedHashSetCell:{"":"Object;_collection$_element<,_next@,_previous@"},LinkedHashSetIterator:{"":"Object;_set,_modifications,_cell,_collection$_current",get$current:function(){return this._collection$_current},moveNext$0:function(){var e=this._set;if(this._modifications!==e._modifications)throw a.wrapException(v.ConcurrentModificationError$(e));return e=this._cell,e==null?(this._collection$_current=null,!1):(this._collection$_current=e.get$_collection$_element(),this._cell=this._cell.get$_next(),!0)}},_HashSetBase:{"":"IterableBase;",toString$0:function(e){return a.IterableMixinWorkaround_toStringIterable(this,"{","}")},$asIterableBase:null,$isEfficientLength:!0},IterableBase:{"":"Object;",forEach$1:function(e,t){var n;for(n=this.get$iterator(this);n.moveNext$0();)t.call$1(n.get$current())},join$1:function(e,t){var n,r,i;n=this.get$iterator(this);if(!n.moveNext$0())return"";r=v.StringBuffer$("");if(t===""){do i=a.S(n.get$current()),r._contents=r._contents+i;while(n.moveNext$0())}else{r.write$1(a.S(n.get$current()));for(;n.moveNext$0();)r._contents=r._contents+t,i=a.S(n.get$current()),r._contents=r._contents+i}return r._contents},toList$1$growable:function(e,t){return v.List_List$from(this,t,a.getRuntimeTypeArgument(this,"IterableBase",0))},toList$0:function(e){return this.toList$1$growable(e,!0)},get$length:function(e){var t,n;t=this.get$iterator(this);for(n=0;t.moveNext$0();)++n;return n},get$single:function(e){var t,n;t=this.get$iterator(this);if(!t.moveNext$0())throw a.wrapException(v.StateError$("No elements"));n=t.get$current();if(t.moveNext$0())throw a.wrapException(v.StateError$("More than one element"));return n},elementAt$1:function(e,t){var n,r,i;if(t<0)throw a.wrapException(v.RangeError$value(t));for(n=this.get$iterator(this),r=t;n.moveNext$0();){i=n.get$current();if(r===0)return i;--r}throw a.wrapException(v.RangeError$value(t))},toString$0:function(e){return v._iterableToString(this)}},ListBase:{"":"Object+ListMixin;",$isList:!0,$asList:null,$isEfficientLength:!0},ListMixin:{"":"Object;",get$iterator:function(e){return new a.ListIterator(e,this.get$length(e),0,null)},elementAt$1:function(e,t){return this.$index(e,t)},forEach$1:function(e,t){var n,r;n=this.get$length(e);for(r=0;r<n;++r){t.call$1(this.$index(e,r));if(n!==this.get$length(e))throw a.wrapException(v.ConcurrentModificationError$(e))}},where$1:function(e,t){var n=new a.WhereIterable(e,t);return a.setRuntimeTypeInfo(n,[a.getRuntimeTypeArgument(e,"ListMixin",0)]),n},add$1:function(e,t){var n=this.get$length(e);this.set$length(e,n+1),this.$indexSet(e,n,t)},addAll$1:function(e,t){var n,r,i;for(n=new a.ListIterator(t,t.length,0,null);n.moveNext$0();)r=n._dev$_current,i=this.get$length(e),this.set$length(e,i+1),this.$indexSet(e,i,r)},toString$0:function(t){var n,r;r=e.get$_toStringVisiting();if(r.contains$1(r,t))return"[...]";n=v.StringBuffer$("");try{r=e.get$_toStringVisiting(),r.add$1(r,t),n.write$1("["),n.writeAll$2(t,", "),n.write$1("]")}finally{r=e.get$_toStringVisiting(),r.remove$1(r,t)}return n.get$_contents()},$isList:!0,$asList:null,$isEfficientLength:!0},Maps_mapToString_closure:{"":"Closure;box_0,result_1",call$2:function(e,t){var n=this.box_0;n.first_0||this.result_1.write$1(", "),n.first_0=!1,n=this.result_1,n.write$1(e),n.write$1(": "),n.write$1(t)},$is_args2:!0},ListQueue:{"":"IterableBase;_table,_head,_tail,_modificationCount",get$iterator:function(e){return v._ListQueueIterator$(this)},forEach$1:function(e,t){var n,r,i;n=this._modificationCount;for(r=this._head;r!==this._tail;r=(r+1&this._table.length-1)>>>0){i=this._table;if(r<0||r>=i.length)throw a.ioore(i,r);t.call$1(i[r]),n!==this._modificationCount&&a.throwExpression(v.ConcurrentModificationError$(this))}},get$length:function(e){return(this._tail-this._head&this._table.length-1)>>>0},add$1:function(e,t){this._add$1(t)},addAll$1:function(e,t){var n,r,i,s,o,u,f;n=t.length,r=this.get$length(this),i=r+n,s=this._table,o=s.length,i>=o?(this._preGrow$1(i),s=this._table,a.IterableMixinWorkaround_setRangeList(s,r,i,t,0),this._tail=this._tail+n):(i=this._tail,u=o-i,n<u?(a.IterableMixinWorkaround_setRangeList(s,i,i+n,t,0),this._tail=this._tail+n):(f=n-u,a.IterableMixinWorkaround_setRangeList(s,i,i+u,t,0),i=this._table,a.IterableMixinWorkaround_setRangeList(i,0,f,t,u),this._tail=f)),this._modificationCount=this._modificationCount+1},toString$0:function(e){return a.IterableMixinWorkaround_toStringIterable(this,"{","}")},removeFirst$0:function(){var e,t,n,r;if(this._head===this._tail)throw a.wrapException(v.StateError$("No elements"));this._modificationCount=this._modificationCount+1,e=this._table,t=this._head,n=e.length;if(t<0||t>=n)throw a.ioore(e,t);return r=e[t],this._head=(t+1&n-1)>>>0,r},_add$1:function(e){var t,n,r;t=this._table,n=this._tail,r=t.length;if(n<0||n>=r)throw a.ioore(t,n);t[n]=e,this._tail=(n+1&r-1)>>>0,this._head===this._tail&&this._grow$0(),this._modificationCount=this._modificationCount+1},_grow$0:function(){var e,t,n,r;e=v.List_List(this._table.length*2,a.getRuntimeTypeArgument(this,"ListQueue",0)),a.setRuntimeTypeInfo(e,[a.getRuntimeTypeArgument(this,"ListQueue",0)]),t=this._table,n=this._head,r=t.length-n,a.IterableMixinWorkaround_setRangeList(e,0,r,t,n),t=this._head,n=this._table,a.IterableMixinWorkaround_setRangeList(e,r,r+t,n,0),this._head=0,this._tail=this._table.length,this._table=e},_writeToList$1:function(e){var t,n,r,i,s;return t=this._head,n=this._tail,r=this._table,t<=n?(i=n-t,a.IterableMixinWorkaround_setRangeList(e,0,i,r,t),i):(s=r.length-t,a.IterableMixinWorkaround_setRangeList(e,0,s,r,t),t=this._tail,n=this._table,a.IterableMixinWorkaround_setRangeList(e,s,s+t,n,0),this._tail+s)},_preGrow$1:function(e){var t=v.List_List(v.ListQueue__nextPowerOf2(e),a.getRuntimeTypeArgument(this,"ListQueue",0));a.setRuntimeTypeInfo(t,[a.getRuntimeTypeArgument(this,"ListQueue",0)]),this._tail=this._writeToList$1(t),this._table=t,this._head=0},ListQueue$1:function(e,t){var n=v.List_List(8,t);a.setRuntimeTypeInfo(n,[t]),this._table=n},$asIterableBase:null,$isEfficientLength:!0,"static":{"":"ListQueue__INITIAL_CAPACITY",ListQueue$:function(e,t){var n=new v.ListQueue(null,0,0,0);return a.setRuntimeTypeInfo(n,[t]),n.ListQueue$1(e,t),n},ListQueue__nextPowerOf2:function(e){var t;if(typeof e!="number")throw e.$shl();e=(e<<2>>>0)-1;for(;!0;e=t){t=(e&e-1)>>>0;if(t===0)return e}}}},_ListQueueIterator:{"":"Object;_queue,_end,_modificationCount,_collection$_position,_collection$_current",get$current:function(){return this._collection$_current},moveNext$0:function(){var e,t,n;e=this._queue,this._modificationCount!==e._modificationCount&&a.throwExpression(v.ConcurrentModificationError$(e)),t=this._collection$_position;if(t===this._end)return this._collection$_current=null,!1;n=e._table;if(t<0||t>=n.length)throw a.ioore(n,t);return this._collection$_current=n[t],this._collection$_position=(this._collection$_position+1&e._table.length-1)>>>0,!0},"static":{_ListQueueIterator$:function(e){return new v._ListQueueIterator(e,e._tail,e._modificationCount,e._head,null)}}}}],["dart.convert","dart:convert",,v,{_convertJsonToDart:function(e,t){var n=new v._convertJsonToDart_closure;return n.call$2(null,(new v._convertJsonToDart_walk(n)).call$1(e))},_parseJson:function(e,t){var n,r,i,s;i=e;if(typeof i!="string")throw a.wrapException(new v.ArgumentError(e));n=null;try{n=JSON.parse(e)}catch(s){throw i=a.unwrapException(s),r=i,a.wrapException(v.FormatException$(String(r)))}return v._convertJsonToDart(n,t)},_convertJsonToDart_closure:{"":"Closure;",call$2:function(e,t){return t},$is_args2:!0},_convertJsonToDart_walk:{"":"Closure;revive_0",call$1:function(e){var t,n,r,i,s,o,u;if(e==null||typeof e!="object")return e;if(Object.getPrototypeOf(e)===Array.prototype){t=e;for(n=this.revive_0,r=0;r<t.length;++r)t[r]=n.call$2(r,this.call$1(t[r]));return t}i=Object.keys(e),s=a.fillLiteralMap([],v.LinkedHashMap_LinkedHashMap(null,null,null,null,null));for(n=this.revive_0,r=0;r<i.length;++r)o=i[r],s.$indexSet(s,o,n.call$2(o,this.call$1(e[o])));return u=e.__proto__,typeof u!="undefined"&&u!==Object.prototype&&s.$indexSet(s,"__proto__",n.call$2("__proto__",this.call$1(u))),s},$is_args1:!0},Codec:{"":"Object;"},Converter:{"":"Object;"},JsonCodec:{"":"Codec;",decode$2$reviver:function(e,t){return v._parseJson(e,r.JsonDecoder_null._reviver)},decode$1:function(e){return this.decode$2$reviver(e,null)}},JsonDecoder:{"":"Converter;_reviver"}}],["dart.core","dart:core",,v,{_symbolToString:function(e){return a.Symbol_getName(e)},Error_safeToString:function(e){var t,n,i,s,o,u;if(typeof e=="number"||typeof e=="boolean"||null==e)return f.toString$0(e);if(typeof e=="string"){t=new v.StringBuffer(""),t._contents='"';for(n=e.length,i=0;i<n;++i)s=r.JSString_methods.codeUnitAt$1(e,i),s<=31?s===10?t._contents=t._contents+"\\n":s===13?t._contents=t._contents+"\\r":s===9?t._contents=t._contents+"\\t":(t._contents=t._contents+"\\x",s<16?t._contents=t._contents+"0":(t._contents=t._contents+"1",s-=16),o=s<10?48+s:87+s,u=v.List_List$filled(1,o,f.JSInt),u.$builtinTypeInfo=[f.JSInt],o=a.Primitives_stringFromCharCodes(u),t._contents=t._contents+o):s===92?t._contents=t._contents+"\\\\":s===34?t._contents=t._contents+'\\"':(u=v.List_List$filled(1,s,f.JSInt),u.$builtinTypeInfo=[f.JSInt],o=a.Primitives_stringFromCharCodes(u),t._contents=t._contents+o);return t._contents=t._contents+'"',t._contents}return"Instance of '"+a.Primitives_objectTypeName(e)+"'"},Exception_Exception:function(e){return new v._ExceptionImplementation(e)},identical:function(e,t){return e==null?t==null:e===t},identityHashCode:function(e){return a.objectHashCode(e)},List_List:function(e,t){if(e==null)return new Array(0);if(typeof e!="number"||Math.floor(e)!==e||e<0)throw a.wrapException(v.ArgumentError$("Length must be a positive integer: "+a.S(e)+"."));return a.Primitives_newFixedList(e)},List_List$filled:function(e,t,n){var r,i,s;if(e<0)throw a.wrapException(v.ArgumentError$("Length must be a positive integer: "+e+"."));r=a.Primitives_newFixedList(e);if(e!==0&&!0)for(i=r.length,s=0;s<i;++s)r[s]=t;return r},List_List$from:function(e,t,n){var r,i,s,o,u;r=v.List_List(null,n),a.setRuntimeTypeInfo(r,[n]);for(i=f.get$iterator$ax(e);i.moveNext$0();)r.push(i.get$current());if(t)return r;s=r.length,o=v.List_List(s,n),a.setRuntimeTypeInfo(o,[n]);for(i=r.length,u=0;u<s;++u){if(u>=i)throw a.ioore(r,u);o[u]=r[u]}return o},print:function(e){var t=f.toString$0(e);a.printToConsole(t)},NoSuchMethodError_toString_closure:{"":"Closure;box_0",call$2:function(e,t){var n=this.box_0;n.i_1>0&&n.sb_0.write$1(", "),n.sb_0.write$1(v._symbolToString(e))},$is_args2:!0},Duration:{"":"Object;_duration",$lt:function(e,t){return r.JSNumber_methods.$lt(this._duration,t.get$_duration())},$gt:function(e,t){return r.JSNumber_methods.$gt(this._duration,t.get$_duration())},$ge:function(e,t){return r.JSNumber_methods.$ge(this._duration,t.get$_duration())},$eq:function(e,t){var n;return t==null?!1:(n=f.getInterceptor(t),typeof t!="object"||t===null||!n.$isDuration?!1:this._duration===t._duration)},get$hashCode:function(e){return this._duration&536870911},toString$0:function(e){var t,n,i,s,o;return t=new v.Duration_toString_twoDigits,n=this._duration,n<0?"-"+a.S(v.Duration$(0,0,-n,0,0,0)):(i=t.call$1(r.JSNumber_methods.remainder$1(r.JSNumber_methods.$tdiv(n,6e7),60)),s=t.call$1(r.JSNumber_methods.remainder$1(r.JSNumber_methods.$tdiv(n,1e6),60)),o=(new v.Duration_toString_sixDigits).call$1(r.JSNumber_methods.remainder$1(n,1e6)),a.S(r.JSNumber_methods.$tdiv(n,36e8))+":"+a.S(i)+":"+a.S(s)+"."+a.S(o))},$isDuration:!0,"static":{"":"Duration_MICROSECONDS_PER_MILLISECOND,Duration_MILLISECONDS_PER_SECOND,Duration_SECONDS_PER_MINUTE,Duration_MINUTES_PER_HOUR,Duration_HOURS_PER_DAY,Duration_MICROSECONDS_PER_SECOND,Duration_MICROSECONDS_PER_MINUTE,Duration_MICROSECONDS_PER_HOUR,Duration_MICROSECONDS_PER_DAY,Duration_MILLISECONDS_PER_MINUTE,Duration_MILLISECONDS_PER_HOUR,Duration_MILLISECONDS_PER_DAY,Duration_SECONDS_PER_HOUR,Duration_SECONDS_PER_DAY,Duration_MINUTES_PER_DAY,Duration_ZERO",Duration$:function(e,t,n,r,i,s){return new v.Duration(e*864e8+t*36e8+i*6e7+s*1e6+r*1e3+n)}}},Duration_toString_sixDigits:{"":"Closure;",call$1:function(e){var t=f.getInterceptor$n(e);return t.$ge(e,1e5)?a.S(e):t.$ge(e,1e4)?"0"+a.S(e):t.$ge(e,1e3)?"00"+a.S(e):t.$ge(e,100)?"000"+a.S(e):t.$gt(e,10)?"0000"+a.S(e):"00000"+a.S(e)},$is_args1:!0},Duration_toString_twoDigits:{"":"Closure;",call$1:function(e){return f.$ge$n(e,10)?a.S(e):"0"+a.S(e)},$is_args1:!0},Error:{"":"Object;",get$stackTrace:function(){return new a._StackTrace(this.$thrownJsError,null)},$isError:!0},NullThrownError:{"":"Error;",toString$0:function(e){return"Throw of null."}},ArgumentError:{"":"Error;message",toString$0:function(e){var t=this.message;return t!=null?"Illegal argument(s): "+a.S(t):"Illegal argument(s)"},"static":{ArgumentError$:function(e){return new v.ArgumentError(e)}}},RangeError:{"":"ArgumentError;message",toString$0:function(e){return"RangeError: "+a.S(this.message)},"static":{RangeError$value:function(e){return new v.RangeError("value "+a.S(e))},RangeError$range:function(e,t,n){return new v.RangeError("value "+a.S(e)+" not in range "+t+".."+a.S(n))}}},UnsupportedError:{"":"Error;message",toString$0:function(e){return"Unsupported operation: "+this.message},"static":{UnsupportedError$:function(e){return new v.UnsupportedError(e)}}},UnimplementedError:{"":"Error;message",toString$0:function(e){var t=this.message;return t!=null?"UnimplementedError: "+a.S(t):"UnimplementedError"},$isError:!0,"static":{UnimplementedError$:function(e){return new v.UnimplementedError(e)}}},StateError:{"":"Error;message",toString$0:function(e){return"Bad state: "+this.message},"static":{StateError$:function(e){return new v.StateError(e)}}},ConcurrentModificationError:{"":"Error;modifiedObject",toString$0:function(e){var t=this.modifiedObject;return t==null?"Concurrent modification during iteration.":"Concurrent modification during iteration: "+a.S(v.Error_safeToString(t))+"."},"static":{ConcurrentModificationError$:function(e){return new v.ConcurrentModificationError(e)}}},StackOverflowError:{"":"Object;",toString$0:function(e){return"Stack Overflow"},get$stackTrace:function(){return},$isError:!0},CyclicInitializationError:{"":"Error;variableName",toString$0:function(e){return"Reading static variable '"+this.variableName+"' during its initialization"},"static":{CyclicInitializationError$:function(e){return new v.CyclicInitializationError(e)}}},_ExceptionImplementation:{"":"Object;message",toString$0:function(e){var t=this.message;return t==null?"Exception":"Exception: "+a.S(t)}},FormatException:{"":"Object;message",toString$0:function(e){return"FormatException: "+this.message},"static":{FormatException$:function(e){return new v.FormatException(e)}}},Expando:{"":"Object;name",toString$0:function(e){return"Expando:"+a.S(this.name)},$index:function(e,t){var n=a.Primitives_getProperty(t,"expando$values");return n==null?null:a.Primitives_getProperty(n,this._getKey$0())},$indexSet:function(e,t,n){var r=a.Primitives_getProperty(t,"expando$values");r==null&&(r=new v.Object,a.Primitives_setProperty(t,"expando$values",r)),a.Primitives_setProperty(r,this._getKey$0(),n)},_getKey$0:function(){var t,n;return t=a.Primitives_getProperty(this,"expando$key"),t==null&&(n=e.Expando__keyCount,e.Expando__keyCount=n+1,t="expando$key$"+n,a.Primitives_setProperty(this,"expando$key",t)),t},"static":{"":"Expando__KEY_PROPERTY_NAME,Expando__EXPANDO_PROPERTY_NAME,Expando__keyCount"}},Function:{"":"Object;"},Iterator:{"":"Object;"},Null:{"":"Object;",toString$0:function(e){return"null"}},Object:{"":";",$eq:function(e,t){return this===t},get$hashCode:function(e){return a.Primitives_objectHashCode(this)},toString$0:function(e){return a.Primitives_objectToString(this)}},StackTrace:{"":"Object;"},StringBuffer:{"":"Object;_contents<",get$length:function(e){return this._contents.length},write$1:function(e){var t=typeof e=="string"?e:a.S(e);this._contents=this._contents+t},writeAll$2:function(e,t){var n,r;n=f.get$iterator$ax(e);if(!n.moveNext$0())return;if(t.length===0){do r=n.get$current(),r=typeof r=="string"?r:a.S(r),this._contents=this._contents+r;while(n.moveNext$0())}else{this.write$1(n.get$current());for(;n.moveNext$0();)this._contents=this._contents+t,r=n.get$current(),r=typeof r=="string"?r:a.S(r),this._contents=this._contents+r}},toString$0:function(e){return this._contents},StringBuffer$1:function(e){this._contents=e},"static":{StringBuffer$:function(e){var t=new v.StringBuffer("");return t.StringBuffer$1(e),t}}},Symbol:{"":"Object;"}}],["dart.dom.html","dart:html",,S,{AnchorElement_AnchorElement:function(e){var t=document.createElement("a",null);return t},Element_Element$html:function(e,t,n){var r,i;return r=f.createFragment$3$treeSanitizer$validator$x(document.body,e,t,n),r.toString,i=new S._ChildNodeListLazy(r),i=i.where$1(i,new S.Element_Element$html_closure),i.get$single(i)},FormData_FormData:function(e){return new FormData},HttpRequest_request:function(e,t,n,i,s,o,u,f){var l,c,h,p;return l=S.HttpRequest,c=new v._AsyncCompleter(v._Future$(l)),a.setRuntimeTypeInfo(c,[l]),h=new XMLHttpRequest,r.HttpRequest_methods.open$3$async(h,t,e,!0),l=new S._EventStream(h,r.EventStreamProvider_load._eventType,!1),a.setRuntimeTypeInfo(l,[null]),p=new S._EventStreamSubscription(0,l._html$_target,l._eventType,S._wrapZone(new S.HttpRequest_request_closure(c,h)),l._useCapture),a.setRuntimeTypeInfo(p,[a.getRuntimeTypeArgument(l,"_EventStream",0)]),p._tryResume$0(),p=new S._EventStream(h,r.EventStreamProvider_error._eventType,!1),a.setRuntimeTypeInfo(p,[null]),l=c.get$completeError(),l=new S._EventStreamSubscription(0,p._html$_target,p._eventType,S._wrapZone(l),p._useCapture),a.setRuntimeTypeInfo(l,[a.getRuntimeTypeArgument(p,"_EventStream",0)]),l._tryResume$0(),h.send(u),c.future},Window__isDartLocation:function(e){var t,n,r;try{return t=e,n=f.getInterceptor(t),typeof t=="object"&&t!==null&&!!n.$isLocation}catch(r){return a.unwrapException(r),!1}},_wrapZone:function(t){var n=e.Zone__current;return n===r.C__RootZone?t:n.bindUnaryCallback$2$runGuarded(t,!0)},HtmlElement:{"":"Element;","%":"HTMLAppletElement|HTMLBRElement|HTMLBaseFontElement|HTMLCanvasElement|HTMLContentElement|HTMLDListElement|HTMLDataListElement|HTMLDetailsElement|HTMLDialogElement|HTMLDirectoryElement|HTMLDivElement|HTMLFontElement|HTMLFrameElement|HTMLFrameSetElement|HTMLHRElement|HTMLHeadElement|HTMLHeadingElement|HTMLHtmlElement|HTMLImageElement|HTMLLabelElement|HTMLLegendElement|HTMLMarqueeElement|HTMLMenuElement|HTMLModElement|HTMLOptGroupElement|HTMLParagraphElement|HTMLPreElement|HTMLQuoteElement|HTMLShadowElement|HTMLSpanElement|HTMLTableCaptionElement|HTMLTableCellElement|HTMLTableColElement|HTMLTableDataCellElement|HTMLTableHeaderCellElement|HTMLTitleElement|HTMLTrackElement|HTMLUListElement|HTMLUnknownElement;HTMLElement"},AnchorElement:{"":"HtmlElement;hostname=,href},port=,protocol=,type}",toString$0:function(e){return e.toString()},"%":"HTMLAnchorElement"},AreaElement:{"":"HtmlElement;hostname=,href},port=,protocol=","%":"HTMLAreaElement"},BaseElement:{"":"HtmlElement;href}","%":"HTMLBaseElement"},BodyElement:{"":"HtmlElement;",$isBodyElement:!0,"%":"HTMLBodyElement"},ButtonElement:{"":"HtmlElement;name=,type},value=","%":"HTMLButtonElement"},CharacterData:{"":"Node;length=","%":"CDATASection|CharacterData|Comment|ProcessingInstruction|Text"},Document:{"":"Node;",get$onKeyDown:function(e){var t=new S._EventStream(e,r.EventStreamProvider_keydown._eventType,!1);return a.setRuntimeTypeInfo(t,[null]),t},get$onKeyUp:function(e){var t=new S._EventStream(e,r.EventStreamProvider_keyup._eventType,!1);return a.setRuntimeTypeInfo(t,[null]),t},"%":"Document|HTMLDocument|SVGDocument"},DocumentFragment:{"":"Node;",appendHtml$1:function(e,t){e.appendChild(f.createFragment$3$treeSanitizer$validator$x(document.body,t,null,null))},"%":"DocumentFragment|ShadowRoot"},DomException:{"":"Interceptor;",toString$0:function(e){return e.toString()},"%":"DOMException"},Element:{"":"Node;className%",get$attributes:function(e){return new S._ElementAttributeMap(e)},get$classes:function(e){return new S._ElementCssClassSet(e)},appendHtml$1:function(e,t){this.insertAdjacentHtml$2(e,"beforeend",t)},toString$0:function(e){return e.localName},insertAdjacentHtml$2:function(e,t,n){e.insertAdjacentHTML?e.insertAdjacentHTML(t,n):this._insertAdjacentNode$2(e,t,f.createFragment$3$treeSanitizer$validator$x(document.body,n,null,null))},_insertAdjacentNode$2:function(e,t,n){var r,i;switch(t.toLowerCase()){case"beforebegin":e.parentNode.insertBefore(n,e);break;case"afterbegin":if((new S._ChildNodeListLazy(e))._this.childNodes.length>0){r=(new S._ChildNodeListLazy(e))._this.childNodes;if(0>=r.length)throw a.ioore(r,0);i=r[0]}else i=null;e.insertBefore(n,i);break;case"beforeend":e.appendChild(n);break;case"afterend":e.parentNode.insertBefore(n,e.nextSibling);break;default:throw a.wrapException(new v.ArgumentError("Invalid position "+t))}},createFragment$3$treeSanitizer$validator:function(t,n,r,i){var s,o,u,l,c;if(r==null)i==null&&(e.Element__defaultValidator==null&&(s=[],a.setRuntimeTypeInfo(s,[S.NodeValidator]),s=new S.NodeValidatorBuilder(s),o=s._validators,o.push(S._Html5NodeValidator$(null)),o.push(S._TemplatingNodeValidator$()),e.Element__defaultValidator=s),i=e.Element__defaultValidator),s=e.Element__defaultSanitizer,s==null?e.Element__defaultSanitizer=new S._ValidatingTreeSanitizer(i):s.validator=i,r=e.Element__defaultSanitizer;else if(i!=null)throw a.wrapException(v.ArgumentError$("validator can only be passed if treeSanitizer is null"));e.Element__parseDocument==null&&(e.Element__parseDocument=document.implementation.createHTMLDocument(""),e.Element__parseRange=e.Element__parseDocument.createRange(),u=e.Element__parseDocument.createElement("base",null),f.set$href$x(u,document.baseURI),e.Element__parseDocument.head.appendChild(u)),s=e.Element__parseDocument,this.$isBodyElement?l=s.body:(l=s.createElement(t.tagName,null),e.Element__parseDocument.body.appendChild(l));if("createContextualFragment"in window.Range.prototype)e.Element__parseRange.selectNodeContents(l),c=e.Element__parseRange.createContextualFragment(n);else{l.innerHTML=n,c=e.Element__parseDocument.createDocumentFragment();for(;s=l.firstChild,s!=null;)c.appendChild(s)}return s=e.Element__parseDocument.body,(l==null?s!=null:l!==s)&&f.remove$0$ax(l),r.sanitizeTree$1(c),document.adoptNode(c),c},createFragment$2$treeSanitizer:function(e,t,n){return this.createFragment$3$treeSanitizer$validator(e,t,n,null)},setInnerHtml$3$treeSanitizer$validator:function(e,t,n,r){e.textContent=null,e.appendChild(this.createFragment$3$treeSanitizer$validator(e,t,n,r))},setInnerHtml$2$validator:function(e,t,n){return this.setInnerHtml$3$treeSanitizer$validator(e,t,null,n)},get$onKeyDown:function(e){var t=new S._ElementEventStreamImpl(e,r.EventStreamProvider_keydown._eventType,!1);return a.setRuntimeTypeInfo(t,[null]),t},get$onKeyUp:function(e){var t=new S._ElementEventStreamImpl(e,r.EventStreamProvider_keyup._eventType,!1);return a.setRuntimeTypeInfo(t,[null]),t},$isElement:!0,"%":";Element"},EmbedElement:{"":"HtmlElement;name=,type}","%":"HTMLEmbedElement"},ErrorEvent:{"":"Event;error=","%":"ErrorEvent"},Event:{"":"Interceptor;","%":"AudioProcessingEvent|AutocompleteErrorEvent|BeforeLoadEvent|BeforeUnloadEvent|CSSFontFaceLoadEvent|CloseEvent|CustomEvent|DeviceMotionEvent|DeviceOrientationEvent|HashChangeEvent|IDBVersionChangeEvent|MIDIConnectionEvent|MIDIMessageEvent|MediaKeyEvent|MediaKeyMessageEvent|MediaKeyNeededEvent|MediaStreamEvent|MediaStreamTrackEvent|MessageEvent|MutationEvent|OfflineAudioCompletionEvent|OverflowEvent|PageTransitionEvent|PopStateEvent|RTCDTMFToneChangeEvent|RTCDataChannelEvent|RTCIceCandidateEvent|SecurityPolicyViolationEvent|SpeechInputEvent|SpeechRecognitionEvent|SpeechSynthesisEvent|StorageEvent|TrackEvent|TransitionEvent|WebGLContextEvent|WebKitAnimationEvent|WebKitTransitionEvent;Event"},EventTarget:{"":"Interceptor;",addEventListener$3:function(e,t,n,r){return e.addEventListener(t,a.convertDartClosureToJS(n,1),r)},removeEventListener$3:function(e,t,n,r){return e.removeEventListener(t,a.convertDartClosureToJS(n,1),r)},"%":"MediaStream;EventTarget"},FieldSetElement:{"":"HtmlElement;name=","%":"HTMLFieldSetElement"},FormElement:{"":"HtmlElement;length=,name=","%":"HTMLFormElement"},HttpRequest:{"":"HttpRequestEventTarget;responseText=",open$5$async$password$user:function(e,t,n,r,i,s){return e.open(t,n,r,s,i)},open$3$async:function(e,t,n,r){return e.open(t,n,r)},send$1:function(e,t){return e.send(t)},"%":"XMLHttpRequest"},HttpRequestEventTarget:{"":"EventTarget;","%":";XMLHttpRequestEventTarget"},IFrameElement:{"":"HtmlElement;name=","%":"HTMLIFrameElement"},InputElement:{"":"HtmlElement;name=,type},value=",$isElement:!0,"%":"HTMLInputElement"},KeyboardEvent:{"":"UIEvent;","%":"KeyboardEvent"},KeygenElement:{"":"HtmlElement;name=","%":"HTMLKeygenElement"},LIElement:{"":"HtmlElement;value=","%":"HTMLLIElement"},LinkElement:{"":"HtmlElement;href},type}","%":"HTMLLinkElement"},Location:{"":"Interceptor;hostname=,port=,protocol=",toString$0:function(e){return e.toString()},$isLocation:!0,"%":"Location"},MapElement:{"":"HtmlElement;name=","%":"HTMLMapElement"},MediaElement:{"":"HtmlElement;error=","%":"HTMLAudioElement|HTMLMediaElement|HTMLVideoElement"},MetaElement:{"":"HtmlElement;name=","%":"HTMLMetaElement"},MeterElement:{"":"HtmlElement;value=","%":"HTMLMeterElement"},MidiOutput:{"":"MidiPort;",send$2:function(e,t,n){return e.send(t,n)},send$1:function(e,t){return e.send(t)},"%":"MIDIOutput"},MidiPort:{"":"EventTarget;","%":"MIDIInput;MIDIPort"},MouseEvent:{"":"UIEvent;","%":"DragEvent|MSPointerEvent|MouseEvent|MouseScrollEvent|MouseWheelEvent|PointerEvent|WheelEvent"},Node:{"":"EventTarget;lastChild=,nodeType=",get$nodes:function(e){return new S._ChildNodeListLazy(e)},remove$0:function(e){var t=e.parentNode;t!=null&&t.removeChild(e)},toString$0:function(
-e){var t=e.nodeValue;return t==null?f.Interceptor.prototype.toString$0.call(this,e):t},"%":"DocumentType|Entity|Notation;Node"},NodeList:{"":"Interceptor_ListMixin_ImmutableListMixin;",get$length:function(e){return e.length},$index:function(e,t){var n=e.length;if(t>>>0!==t||t>=n)throw a.wrapException(v.RangeError$range(t,0,n));return e[t]},$indexSet:function(e,t,n){throw a.wrapException(v.UnsupportedError$("Cannot assign element of immutable List."))},set$length:function(e,t){throw a.wrapException(v.UnsupportedError$("Cannot resize immutable List."))},elementAt$1:function(e,t){if(t<0||t>=e.length)throw a.ioore(e,t);return e[t]},$asList:function(){return[S.Node]},$isList:!0,$isEfficientLength:!0,$isJavaScriptIndexingBehavior:!0,"%":"NodeList|RadioNodeList"},OListElement:{"":"HtmlElement;type}","%":"HTMLOListElement"},ObjectElement:{"":"HtmlElement;name=,type}","%":"HTMLObjectElement"},OptionElement:{"":"HtmlElement;value=","%":"HTMLOptionElement"},OutputElement:{"":"HtmlElement;name=,value=","%":"HTMLOutputElement"},ParamElement:{"":"HtmlElement;name=,value=","%":"HTMLParamElement"},ProgressElement:{"":"HtmlElement;value=","%":"HTMLProgressElement"},ProgressEvent:{"":"Event;","%":"ProgressEvent|ResourceProgressEvent|XMLHttpRequestProgressEvent"},Range:{"":"Interceptor;",toString$0:function(e){return e.toString()},"%":"Range"},ScriptElement0:{"":"HtmlElement;type}","%":"HTMLScriptElement"},SelectElement:{"":"HtmlElement;length=,name=,value=","%":"HTMLSelectElement"},SourceElement:{"":"HtmlElement;type}","%":"HTMLSourceElement"},SpeechRecognitionError:{"":"Event;error=","%":"SpeechRecognitionError"},StyleElement:{"":"HtmlElement;type}","%":"HTMLStyleElement"},TableElement:{"":"HtmlElement;",createFragment$3$treeSanitizer$validator:function(e,t,n,r){var i,s,o;return"createContextualFragment"in window.Range.prototype?S.Element.prototype.createFragment$3$treeSanitizer$validator.call(this,e,t,n,r):(i=S.Element_Element$html("<table>"+a.S(t)+"</table>",n,r),s=document.createDocumentFragment(),s.toString,o=new S._ChildNodeListLazy(s),o.addAll$1(o,f.get$nodes$x(i)),s)},"%":"HTMLTableElement"},TableRowElement:{"":"HtmlElement;",createFragment$3$treeSanitizer$validator:function(e,t,n,r){var i,s,o,u;return"createContextualFragment"in window.Range.prototype?S.Element.prototype.createFragment$3$treeSanitizer$validator.call(this,e,t,n,r):(i=document.createDocumentFragment(),s=f.createFragment$3$treeSanitizer$validator$x(document.createElement("table",null),t,n,r),s.toString,s=new S._ChildNodeListLazy(s),o=s.get$single(s),o.toString,s=new S._ChildNodeListLazy(o),u=s.get$single(s),i.toString,s=new S._ChildNodeListLazy(i),u.toString,s.addAll$1(s,new S._ChildNodeListLazy(u)),i)},"%":"HTMLTableRowElement"},TableSectionElement:{"":"HtmlElement;",createFragment$3$treeSanitizer$validator:function(e,t,n,r){var i,s,o;return"createContextualFragment"in window.Range.prototype?S.Element.prototype.createFragment$3$treeSanitizer$validator.call(this,e,t,n,r):(i=document.createDocumentFragment(),s=f.createFragment$3$treeSanitizer$validator$x(document.createElement("table",null),t,n,r),s.toString,s=new S._ChildNodeListLazy(s),o=s.get$single(s),i.toString,s=new S._ChildNodeListLazy(i),o.toString,s.addAll$1(s,new S._ChildNodeListLazy(o)),i)},"%":"HTMLTableSectionElement"},TemplateElement:{"":"HtmlElement;",setInnerHtml$3$treeSanitizer$validator:function(e,t,n,r){var i;e.textContent=null,i=this.createFragment$3$treeSanitizer$validator(e,t,n,r),e.content.appendChild(i)},setInnerHtml$2$validator:function(e,t,n){return this.setInnerHtml$3$treeSanitizer$validator(e,t,null,n)},$isTemplateElement:!0,"%":"HTMLTemplateElement"},TextAreaElement:{"":"HtmlElement;name=,value=","%":"HTMLTextAreaElement"},UIEvent:{"":"Event;","%":"CompositionEvent|FocusEvent|SVGZoomEvent|TextEvent|TouchEvent;UIEvent"},Window:{"":"EventTarget;",get$location:function(e){var t=e.location;return S.Window__isDartLocation(t)===!0?t:(null==e._location_wrapper&&(e._location_wrapper=new S._LocationWrapper(t)),e._location_wrapper)},toString$0:function(e){return e.toString()},"%":"DOMWindow|Window"},_Attr:{"":"Node;name=,value=","%":"Attr"},_NamedNodeMap:{"":"Interceptor_ListMixin_ImmutableListMixin0;",get$length:function(e){return e.length},$index:function(e,t){var n=e.length;if(t>>>0!==t||t>=n)throw a.wrapException(v.RangeError$range(t,0,n));return e[t]},$indexSet:function(e,t,n){throw a.wrapException(v.UnsupportedError$("Cannot assign element of immutable List."))},set$length:function(e,t){throw a.wrapException(v.UnsupportedError$("Cannot resize immutable List."))},elementAt$1:function(e,t){if(t<0||t>=e.length)throw a.ioore(e,t);return e[t]},$asList:function(){return[S.Node]},$isList:!0,$isEfficientLength:!0,$isJavaScriptIndexingBehavior:!0,"%":"MozNamedAttrMap|NamedNodeMap"},Console:{"":"Object;",error$1:function(e,t){return typeof console!="undefined"?console.error(t):null},get$error:function(e){return new S.BoundClosure$i1(this,S.Console.prototype.error$1,e,"error$1")},"static":{"":"Console__safeConsole"}},_FrozenElementList:{"":"ListBase;_nodeList,_elementList",get$length:function(e){return this._nodeList.length},$index:function(e,t){var n=this._nodeList;if(t>>>0!==t||t>=n.length)throw a.ioore(n,t);return n[t]},$indexSet:function(e,t,n){throw a.wrapException(v.UnsupportedError$("Cannot modify list"))},set$length:function(e,t){throw a.wrapException(v.UnsupportedError$("Cannot modify list"))},_html$_FrozenElementList$_wrap$1:function(e,t){var n=r.NodeList_methods.where$1(this._nodeList,new S._FrozenElementList$_wrap_closure);this._elementList=v.List_List$from(n,!0,a.getRuntimeTypeArgument(n,"IterableBase",0))},$asListBase:null,$asList:null,$isList:!0,$isEfficientLength:!0,"static":{_FrozenElementList$_wrap:function(e,t){var n=new S._FrozenElementList(e,null);return a.setRuntimeTypeInfo(n,[t]),n._html$_FrozenElementList$_wrap$1(e,t),n}}},_FrozenElementList$_wrap_closure:{"":"Closure;",call$1:function(e){var t=f.getInterceptor(e);return typeof e=="object"&&e!==null&&!!t.$isElement},$is_args1:!0},Element_Element$html_closure:{"":"Closure;",call$1:function(e){var t=f.getInterceptor(e);return typeof e=="object"&&e!==null&&!!t.$isElement},$is_args1:!0},HttpRequest_request_closure0:{"":"Closure;xhr_0",call$2:function(e,t){this.xhr_0.setRequestHeader(e,t)},$is_args2:!0},HttpRequest_request_closure:{"":"Closure;completer_1,xhr_2",call$1:function(e){var t,n,r;t=this.xhr_2,n=t.status;if(typeof n!="number")throw n.$ge();n=n>=200&&n<300||n===0||n===304,r=this.completer_1,n?(n=r.future,n._state!==0&&a.throwExpression(v.StateError$("Future already completed")),n._asyncComplete$1(t)):r.completeError$1(e)},$is_args1:!0},_ChildNodeListLazy:{"":"ListBase;_this",get$single:function(e){var t,n;t=this._this,n=t.childNodes.length;if(n===0)throw a.wrapException(v.StateError$("No elements"));if(n>1)throw a.wrapException(v.StateError$("More than one element"));return t.firstChild},add$1:function(e,t){this._this.appendChild(t)},addAll$1:function(e,t){var n,r,i,s;n=f.getInterceptor$ax(t);if(!!n.$is_ChildNodeListLazy){n=t._this,r=this._this;if(n!==r)for(i=n.childNodes.length,s=0;s<i;++s)r.appendChild(n.firstChild);return}for(n=n.get$iterator(t),r=this._this;n.moveNext$0();)r.appendChild(n.get$current())},$indexSet:function(e,t,n){var r,i;r=this._this,i=r.childNodes;if(t>>>0!==t||t>=i.length)throw a.ioore(i,t);r.replaceChild(n,i[t])},get$iterator:function(e){return r.NodeList_methods.get$iterator(this._this.childNodes)},get$length:function(e){return this._this.childNodes.length},set$length:function(e,t){throw a.wrapException(v.UnsupportedError$("Cannot set length on immutable List."))},$index:function(e,t){var n=this._this.childNodes;if(t>>>0!==t||t>=n.length)throw a.ioore(n,t);return n[t]},$is_ChildNodeListLazy:!0,$asList:function(){return[S.Node]}},Interceptor_ListMixin:{"":"Interceptor+ListMixin;",$isList:!0,$asList:null,$isEfficientLength:!0},Interceptor_ListMixin_ImmutableListMixin:{"":"Interceptor_ListMixin+ImmutableListMixin;",$asList:null,$isList:!0,$isEfficientLength:!0},Interceptor_ListMixin0:{"":"Interceptor+ListMixin;",$isList:!0,$asList:null,$isEfficientLength:!0},Interceptor_ListMixin_ImmutableListMixin0:{"":"Interceptor_ListMixin0+ImmutableListMixin;",$asList:null,$isList:!0,$isEfficientLength:!0},_AttributeMap:{"":"Object;",forEach$1:function(e,t){var n,r;for(n=this.get$keys(),n=new a.ListIterator(n,n.length,0,null);n.moveNext$0();)r=n._dev$_current,t.call$2(r,this.$index(this,r))},get$keys:function(){var e,t,n,r,i;e=this._element.attributes,t=v.List_List(null,f.JSString),a.setRuntimeTypeInfo(t,[f.JSString]);for(n=e.length,r=0;r<n;++r){if(r>=e.length)throw a.ioore(e,r);i=e[r],this._matches$1(i)&&t.push(f.get$name$x(i))}return t},get$values:function(e){var t,n,r,i,s;t=this._element.attributes,n=v.List_List(null,f.JSString),a.setRuntimeTypeInfo(n,[f.JSString]);for(r=t.length,i=0;i<r;++i){if(i>=t.length)throw a.ioore(t,i);s=t[i],this._matches$1(s)&&n.push(f.get$value$x(s))}return n},$isMap:!0,$asMap:function(){return[f.JSString,f.JSString]}},_ElementAttributeMap:{"":"_AttributeMap;_element",$index:function(e,t){return this._element.getAttribute(t)},$indexSet:function(e,t,n){this._element.setAttribute(t,n)},get$length:function(e){return this.get$keys().length},_matches$1:function(e){return e.namespaceURI==null}},_ElementCssClassSet:{"":"CssClassSetImpl;_element",readClasses$0:function(){var e,t,n;e=v.LinkedHashSet_LinkedHashSet(null,null,null,f.JSString);for(t=f.get$className$x(this._element).split(" "),t=new a.ListIterator(t,t.length,0,null);t.moveNext$0();)n=f.trim$0$s(t._dev$_current),n.length!==0&&e.add$1(e,n);return e},writeClasses$1:function(e){v.List_List$from(e,!0,null),f.set$className$x(this._element,e.join$1(e," "))}},EventStreamProvider:{"":"Object;_eventType"},_EventStream:{"":"Stream;_html$_target,_eventType,_useCapture",listen$4$cancelOnError$onDone$onError:function(e,t,n,r){var i=new S._EventStreamSubscription(0,this._html$_target,this._eventType,S._wrapZone(e),this._useCapture);return a.setRuntimeTypeInfo(i,[a.getRuntimeTypeArgument(this,"_EventStream",0)]),i._tryResume$0(),i},$asStream:null},_ElementEventStreamImpl:{"":"_EventStream;_html$_target,_eventType,_useCapture",$as_EventStream:null},_EventStreamSubscription:{"":"StreamSubscription;_pauseCount,_html$_target,_eventType,_onData,_useCapture",cancel$0:function(){if(this._html$_target==null)return;this._unlisten$0(),this._html$_target=null,this._onData=null},_tryResume$0:function(){var e=this._onData;e!=null&&this._pauseCount<=0&&f.addEventListener$3$x(this._html$_target,this._eventType,e,this._useCapture)},_unlisten$0:function(){var e=this._onData;e!=null&&f.removeEventListener$3$x(this._html$_target,this._eventType,e,this._useCapture)},$asStreamSubscription:null},_Html5NodeValidator:{"":"Object;uriPolicy<",allowsElement$1:function(t){var n=e.get$_Html5NodeValidator__allowedElements();return n.contains$1(n,t.tagName)},allowsAttribute$3:function(t,n,r){var i,s,o;return i=t.tagName,s=e.get$_Html5NodeValidator__attributeValidators(),o=s.$index(s,i+"::"+n),o==null&&(s=e.get$_Html5NodeValidator__attributeValidators(),o=s.$index(s,"*::"+n)),o==null?!1:o.call$4(t,n,r,this)},_Html5NodeValidator$1$uriPolicy:function(t){var n,i,s;n=e.get$_Html5NodeValidator__attributeValidators();if(n.get$isEmpty(n)){for(n=new a.ListIterator(r.List_1GN,261,0,null);n.moveNext$0();)i=n._dev$_current,s=e.get$_Html5NodeValidator__attributeValidators(),s.$indexSet(s,i,S._Html5NodeValidator__standardAttributeValidator$closure);for(n=new a.ListIterator(r.List_yrN,12,0,null);n.moveNext$0();)i=n._dev$_current,s=e.get$_Html5NodeValidator__attributeValidators(),s.$indexSet(s,i,S._Html5NodeValidator__uriAttributeValidator$closure)}},"static":{"":"_Html5NodeValidator__allowedElements,_Html5NodeValidator__standardAttributes,_Html5NodeValidator__uriAttributes,_Html5NodeValidator__attributeValidators",_Html5NodeValidator$:function(e){var t=new S._SameOriginUriPolicy(S.AnchorElement_AnchorElement(null),r.Window_methods.get$location(window));return t=new S._Html5NodeValidator(t),t._Html5NodeValidator$1$uriPolicy(e),t},_Html5NodeValidator__standardAttributeValidator:function(e,t,n,r){return!0},_Html5NodeValidator__uriAttributeValidator:function(e,t,n,r){return r.get$uriPolicy().allowsUri$1(n)}}},ImmutableListMixin:{"":"Object;",get$iterator:function(e){return S.FixedSizeListIterator$(e)},add$1:function(e,t){throw a.wrapException(v.UnsupportedError$("Cannot add to immutable List."))},addAll$1:function(e,t){throw a.wrapException(v.UnsupportedError$("Cannot add to immutable List."))},$isList:!0,$asList:null,$isEfficientLength:!0},NodeValidatorBuilder:{"":"Object;_validators",allowImages$1:function(e){this._validators.push(S._SimpleNodeValidator__SimpleNodeValidator$allowImages(new S._SameOriginUriPolicy(S.AnchorElement_AnchorElement(null),r.Window_methods.get$location(window))))},allowImages$0:function(){return this.allowImages$1(null)},allowInlineStyles$1$tagName:function(e){this._validators.push(S._SimpleNodeValidator$(null,["*::style"],null,null))},allowInlineStyles$0:function(){return this.allowInlineStyles$1$tagName(null)},allowCustomElement$4$attributes$uriAttributes$uriPolicy:function(e,t,n,i){var s,o;s=e.toUpperCase(),o=new a.MappedListIterable(t,new S.NodeValidatorBuilder_allowCustomElement_closure(s)),a.setRuntimeTypeInfo(o,[null,null]),i=new S._SameOriginUriPolicy(S.AnchorElement_AnchorElement(null),r.Window_methods.get$location(window)),this._validators.push(S._CustomElementNodeValidator$(i,[s],o,null,!1,!0))},add$1:function(e,t){this._validators.push(t)},allowsElement$1:function(e){return a.IterableMixinWorkaround_any(this._validators,new S.NodeValidatorBuilder_allowsElement_closure(e))},allowsAttribute$3:function(e,t,n){return a.IterableMixinWorkaround_any(this._validators,new S.NodeValidatorBuilder_allowsAttribute_closure(e,t,n))}},NodeValidatorBuilder_allowCustomElement_closure:{"":"Closure;tagNameUpper_0",call$1:function(e){return this.tagNameUpper_0+"::"+f.toLowerCase$0$s(e)},$is_args1:!0},NodeValidatorBuilder_allowCustomElement_closure0:{"":"Closure;tagNameUpper_1",call$1:function(e){return this.tagNameUpper_1+"::"+f.toLowerCase$0$s(e)},$is_args1:!0},NodeValidatorBuilder_allowsElement_closure:{"":"Closure;element_0",call$1:function(e){return e.allowsElement$1(this.element_0)},$is_args1:!0},NodeValidatorBuilder_allowsAttribute_closure:{"":"Closure;element_0,attributeName_1,value_2",call$1:function(e){return e.allowsAttribute$3(this.element_0,this.attributeName_1,this.value_2)},$is_args1:!0},_SimpleNodeValidator:{"":"Object;allowedElements,allowedAttributes,allowedUriAttributes,uriPolicy<",allowsElement$1:function(e){var t=this.allowedElements;return t.contains$1(t,e.tagName)},allowsAttribute$3:function(e,t,n){var r,i;return r=e.tagName,i=this.allowedUriAttributes,i.contains$1(i,r+"::"+t)?this.uriPolicy.allowsUri$1(n):i.contains$1(i,"*::"+t)?this.uriPolicy.allowsUri$1(n):(i=this.allowedAttributes,i.contains$1(i,r+"::"+t)?!0:i.contains$1(i,"*::"+t)?!0:i.contains$1(i,r+"::*")?!0:i.contains$1(i,"*::*")?!0:!1)},"static":{_SimpleNodeValidator__SimpleNodeValidator$allowImages:function(e){return S._SimpleNodeValidator$(e,["IMG::align","IMG::alt","IMG::border","IMG::height","IMG::hspace","IMG::ismap","IMG::name","IMG::usemap","IMG::vspace","IMG::width"],["IMG"],["IMG::src"])},_SimpleNodeValidator$:function(e,t,n,r){var i,s,o;return n!=null?(i=v.LinkedHashSet_LinkedHashSet(null,null,null,null),i.addAll$1(i,n)):i=v.LinkedHashSet_LinkedHashSet(null,null,null,null),t!=null?(s=v.LinkedHashSet_LinkedHashSet(null,null,null,null),s.addAll$1(s,t)):s=v.LinkedHashSet_LinkedHashSet(null,null,null,null),r!=null?(o=v.LinkedHashSet_LinkedHashSet(null,null,null,null),o.addAll$1(o,r)):o=v.LinkedHashSet_LinkedHashSet(null,null,null,null),new S._SimpleNodeValidator(i,s,o,e)}}},_CustomElementNodeValidator:{"":"_SimpleNodeValidator;allowTypeExtension,allowCustomTag,allowedElements,allowedAttributes,allowedUriAttributes,uriPolicy",allowsElement$1:function(e){var t,n;if(this.allowTypeExtension){t=(new S._ElementAttributeMap(e))._element.getAttribute("is");if(t!=null)return n=this.allowedElements,t.toString,n.contains$1(n,t.toUpperCase())&&n.contains$1(n,e.tagName)}return this.allowCustomTag?(n=this.allowedElements,n=n.contains$1(n,e.tagName)):n=!1,n},allowsAttribute$3:function(e,t,n){var r;return this.allowsElement$1(e)?(this.allowTypeExtension?t==="is"?(r=this.allowedElements,n.toString,r=r.contains$1(r,n.toUpperCase())):r=!1:r=!1,r?!0:S._SimpleNodeValidator.prototype.allowsAttribute$3.call(this,e,t,n)):!1},"static":{_CustomElementNodeValidator$:function(e,t,n,r,i,s){var o,u,a;return o=v.LinkedHashSet_LinkedHashSet(null,null,null,null),o.addAll$1(o,t),n!=null?(u=v.LinkedHashSet_LinkedHashSet(null,null,null,null),u.addAll$1(u,n)):u=v.LinkedHashSet_LinkedHashSet(null,null,null,null),a=v.LinkedHashSet_LinkedHashSet(null,null,null,null),new S._CustomElementNodeValidator(i,s,o,u,a,e)}}},_TemplatingNodeValidator:{"":"_SimpleNodeValidator;_templateAttrs,allowedElements,allowedAttributes,allowedUriAttributes,uriPolicy",allowsAttribute$3:function(e,t,n){var r;return S._SimpleNodeValidator.prototype.allowsAttribute$3.call(this,e,t,n)?!0:t==="template"&&n===""?!0:(new S._ElementAttributeMap(e))._element.getAttribute("template")===""?(r=this._templateAttrs,r.contains$1(r,t)):!1},"static":{"":"_TemplatingNodeValidator__TEMPLATE_ATTRS",_TemplatingNodeValidator$:function(){var e,t,n,i;return e=new a.MappedListIterable(r.List_wSV,new S._TemplatingNodeValidator_closure),a.setRuntimeTypeInfo(e,[null,null]),t=v.LinkedHashSet_LinkedHashSet(null,null,null,null),t.addAll$1(t,["TEMPLATE"]),n=v.LinkedHashSet_LinkedHashSet(null,null,null,null),n.addAll$1(n,e),e=n,n=v.LinkedHashSet_LinkedHashSet(null,null,null,null),i=v.LinkedHashSet_LinkedHashSet(null,null,null,f.JSString),i.addAll$1(i,r.List_wSV),new S._TemplatingNodeValidator(i,t,e,n,null)}}},_TemplatingNodeValidator_closure:{"":"Closure;",call$1:function(e){return"TEMPLATE::"+a.S(e)},$is_args1:!0},_SvgNodeValidator:{"":"Object;",allowsElement$1:function(e){var t=f.getInterceptor(e);return t.$isScriptElement?!1:t.$isSvgElement?!0:!1},allowsAttribute$3:function(e,t,n){return t==="is"||r.JSString_methods.startsWith$1(t,"on")?!1:this.allowsElement$1(e)}},FixedSizeListIterator:{"":"Object;_array,_length,_position,_current",moveNext$0:function(){var e,t;return e=this._position+1,t=this._length,e<t?(this._current=f.$index$asx(this._array,e),this._position=e,!0):(this._current=null,this._position=t,!1)},get$current:function(){return this._current},"static":{FixedSizeListIterator$:function(e){return new S.FixedSizeListIterator(e,f.get$length$asx(e),-1,null)}}},_LocationWrapper:{"":"Object;_ptr",get$hostname:function(e){return this._ptr.hostname},get$port:function(e){return this._ptr.port},get$protocol:function(e){return this._ptr.protocol},toString$0:function(e){return this._ptr.toString()},$isLocation:!0},NodeValidator:{"":"Object;"},_SameOriginUriPolicy:{"":"Object;_hiddenAnchor,_loc",allowsUri$1:function(e){var t,n,r,i,s,o;return t=this._hiddenAnchor,n=f.getInterceptor$x(t),n.set$href(t,e),r=n.get$hostname(t),i=this._loc,s=f.getInterceptor$x(i),o=s.get$hostname(i),(r==null?o==null:r===o)?(r=n.get$port(t),o=s.get$port(i),(r==null?o==null:r===o)?(r=n.get$protocol(t),i=s.get$protocol(i),i=r==null?i==null:r===i,r=i):r=!1):r=!1,r?t=!0:t=n.get$hostname(t)===""&&n.get$port(t)===""&&n.get$protocol(t)===":",t}},_ValidatingTreeSanitizer:{"":"Object;validator",sanitizeTree$1:function(e){(new S._ValidatingTreeSanitizer_sanitizeTree_walk(this)).call$1(e)},sanitizeNode$1:function(t){var n,r,i,s,o,u,l,c,h;n=f.getInterceptor$x(t);switch(n.get$nodeType(t)){case 1:r=n.get$attributes(t);if(!this.validator.allowsElement$1(t)){window,i=e.get$Console__safeConsole(),s="Removing disallowed element <"+t.tagName+">",i.toString,typeof console!="undefined"&&console.warn(s),n.remove$0(t);break}i=r._element,o=i.getAttribute("is");if(o!=null&&!this.validator.allowsAttribute$3(t,"is",o)){window,i=e.get$Console__safeConsole(),s="Removing disallowed type extension <"+t.tagName+' is="'+o+'">',i.toString,typeof console!="undefined"&&console.warn(s),n.remove$0(t);break}s=r.get$keys(),u=v.List_List$from(s,!0,a.getRuntimeTypeArgument(s,"JSArray",0));for(l=r.get$keys().length-1;l>=0;--l){if(l>=u.length)throw a.ioore(u,l);c=u[l],this.validator.allowsAttribute$3(t,f.toLowerCase$0$s(c),i.getAttribute(c))||(window,s=e.get$Console__safeConsole(),h="Removing disallowed attribute <"+t.tagName+" "+c+'="'+i.getAttribute(c)+'">',s.toString,typeof console!="undefined"&&console.warn(h),i.getAttribute(c),i.removeAttribute(c))}typeof t=="object"&&t!==null&&!!n.$isTemplateElement&&this.sanitizeTree$1(t.content);break;case 8:case 11:case 3:case 4:break;default:n.remove$0(t)}}},_ValidatingTreeSanitizer_sanitizeTree_walk:{"":"Closure;this_0",call$1:function(e){var t,n;this.this_0.sanitizeNode$1(e),t=f.get$lastChild$x(e);for(;t!=null;t=n)n=t.previousSibling,this.call$1(t)},$is_args1:!0}}],["dart.dom.svg","dart:svg",,v,{ScriptElement:{"":"SvgElement;type}",$isScriptElement:!0,"%":"SVGScriptElement"},StyleElement0:{"":"SvgElement;type}","%":"SVGStyleElement"},SvgElement:{"":"Element;",get$classes:function(e){return e._cssClassSet==null&&(e._cssClassSet=new v._AttributeClassSet(e)),e._cssClassSet},createFragment$3$treeSanitizer$validator:function(e,t,n,r){var i,s,o,u,l;n=new S._ValidatingTreeSanitizer(r),i='<svg version="1.1">'+a.S(t)+"</svg>",s=f.createFragment$2$treeSanitizer$x(document.body,i,n),o=document.createDocumentFragment(),s.toString,u=new S._ChildNodeListLazy(s),l=u.get$single(u);for(;u=l.firstChild,u!=null;)o.appendChild(u);return o},insertAdjacentHtml$2:function(e,t,n){throw a.wrapException(v.UnsupportedError$("Cannot invoke insertAdjacentHtml on SVG."))},$isSvgElement:!0,"%":"SVGAElement|SVGAltGlyphDefElement|SVGAltGlyphElement|SVGAltGlyphItemElement|SVGAnimateColorElement|SVGAnimateElement|SVGAnimateMotionElement|SVGAnimateTransformElement|SVGAnimationElement|SVGCircleElement|SVGClipPathElement|SVGComponentTransferFunctionElement|SVGCursorElement|SVGDefsElement|SVGDescElement|SVGEllipseElement|SVGFEBlendElement|SVGFEColorMatrixElement|SVGFEComponentTransferElement|SVGFECompositeElement|SVGFEConvolveMatrixElement|SVGFEDiffuseLightingElement|SVGFEDisplacementMapElement|SVGFEDistantLightElement|SVGFEDropShadowElement|SVGFEFloodElement|SVGFEFuncAElement|SVGFEFuncBElement|SVGFEFuncGElement|SVGFEFuncRElement|SVGFEGaussianBlurElement|SVGFEImageElement|SVGFEMergeElement|SVGFEMergeNodeElement|SVGFEMorphologyElement|SVGFEOffsetElement|SVGFEPointLightElement|SVGFESpecularLightingElement|SVGFESpotLightElement|SVGFETileElement|SVGFETurbulenceElement|SVGFilterElement|SVGFontElement|SVGFontFaceElement|SVGFontFaceFormatElement|SVGFontFaceNameElement|SVGFontFaceSrcElement|SVGFontFaceUriElement|SVGForeignObjectElement|SVGGElement|SVGGlyphElement|SVGGlyphRefElement|SVGGradientElement|SVGGraphicsElement|SVGHKernElement|SVGImageElement|SVGLineElement|SVGLinearGradientElement|SVGMPathElement|SVGMarkerElement|SVGMaskElement|SVGMetadataElement|SVGMissingGlyphElement|SVGPathElement|SVGPatternElement|SVGPolygonElement|SVGPolylineElement|SVGRadialGradientElement|SVGRectElement|SVGSVGElement|SVGSetElement|SVGStopElement|SVGSwitchElement|SVGSymbolElement|SVGTSpanElement|SVGTextContentElement|SVGTextElement|SVGTextPathElement|SVGTextPositioningElement|SVGTitleElement|SVGUseElement|SVGVKernElement|SVGViewElement;SVGElement"},_AttributeClassSet:{"":"CssClassSetImpl;_svg$_element",readClasses$0:function(){var e,t,n,r;e=(new S._ElementAttributeMap(this._svg$_element))._element.getAttribute("class"),t=v.LinkedHashSet_LinkedHashSet(null,null,null,f.JSString);if(e==null)return t;for(n=e.split(" "),n=new a.ListIterator(n,n.length,0,null);n.moveNext$0();)r=f.trim$0$s(n._dev$_current),r.length!==0&&t.add$1(t,r);return t},writeClasses$1:function(e){(new S._ElementAttributeMap(this._svg$_element))._element.setAttribute("class",e.join$1(e," "))}}}],["dart.isolate","dart:isolate",,v,{ReceivePort:{"":"Object;"}}],["dart.typed_data","dart:typed_data",,v,{TypedData:{"":"Interceptor;",_invalidIndex$2:function(e,t,n){var r=f.getInterceptor$n(t);throw r.$lt(t,0)||r.$ge(t,n)?a.wrapException(v.RangeError$range(t,0,n)):a.wrapException(new v.ArgumentError("Invalid list index "+a.S(t)))},"%":";ArrayBufferView;TypedData_ListMixin|TypedData_ListMixin_FixedLengthListMixin"},Uint8List:{"":"TypedData_ListMixin_FixedLengthListMixin;",get$length:function(e){return r.JS_CONST_ZYJ(e)},$index:function(e,t){var n,i;n=r.JS_CONST_ZYJ(e);if(t>>>0==t){if(typeof t!="number")throw t.$ge();i=t>=n}else i=!0;return i&&this._invalidIndex$2(e,t,n),e[t]},$indexSet:function(e,t,n){var i=r.JS_CONST_ZYJ(e);(t>>>0!=t||f.$ge$n(t,i))&&this._invalidIndex$2(e,t,i),e[t]=n},$asList:function(){return[f.JSInt]},$isList:!0,$isEfficientLength:!0,$isJavaScriptIndexingBehavior:!0,"%":";Uint8Array"},TypedData_ListMixin:{"":"TypedData+ListMixin;",$isList:!0,$asList:null,$isEfficientLength:!0},TypedData_ListMixin_FixedLengthListMixin:{"":"TypedData_ListMixin+FixedLengthListMixin;",$asList:null}}],["html_common","dart:html_common",,v,{CssClassSetImpl:{"":"Object;",toString$0:function(e){var t=this.readClasses$0();return t.join$1(t," ")},get$iterator:function(e){var t=this.readClasses$0();return t=new v.LinkedHashSetIterator(t,t._modifications,null,null),t._cell=t._set._first,t},forEach$1:function(e,t){var n=this.readClasses$0();n.forEach$1(n,t)},get$length:function(e){return this.readClasses$0()._collection$_length},lookup$1:function(e){var t=this.readClasses$0();return t.contains$1(t,e)?e:null},add$1:function(e,t){return this.modify$1(new v.CssClassSetImpl_add_closure(t))},remove$1:function(e,t){var n,r;return n=this.readClasses$0(),r=n.remove$1(n,t),this.writeClasses$1(n),r},addAll$1:function(e,t){this.modify$1(new v.CssClassSetImpl_addAll_closure(t))},modify$1:function(e){var t,n;return t=this.readClasses$0(),n=e.call$1(t),this.writeClasses$1(t),n},$isEfficientLength:!0},CssClassSetImpl_add_closure:{"":"Closure;value_0",call$1:function(e){return f.add$1$ax(e,this.value_0)},$is_args1:!0},CssClassSetImpl_addAll_closure:{"":"Closure;iterable_0",call$1:function(e){return f.addAll$1$ax(e,this.iterable_0)},$is_args1:!0}}],["","markdown.dart",,b,{main:function(){b.MarkdownHTMLConverter$(".markdowntextfield",".markdown-render").refreshMarkdownContent$0()},MarkdownHTMLConverter:{"":"Object;_textInput,_htmlOutputMaster,_renderedField,_refreshButton,_togglePaneButton,_csrfToken,_refreshSubscription,_renderMarkdownText",_textInputKeyDown$1:function(e){this._cancelMarkdownStream$0()},get$_textInputKeyDown:function(){return new a.BoundClosure$1(this,b.MarkdownHTMLConverter.prototype._textInputKeyDown$1,null,"_textInputKeyDown$1")},_textInputKeyUp$1:function(e){this._cancelMarkdownStream$0(),this._refreshSubscription=v.Stream_Stream$fromFuture(v.Future_Future$delayed(r.Duration_300000,null,null),null).listen$1(new b.MarkdownHTMLConverter__textInputKeyUp_closure(this))},get$_textInputKeyUp:function(){return new a.BoundClosure$1(this,b.MarkdownHTMLConverter.prototype._textInputKeyUp$1,null,"_textInputKeyUp$1")},_cancelMarkdownStream$0:function(){var e=this._refreshSubscription;e!=null&&(e.cancel$0(),this._refreshSubscription=null)},_refreshButtonClick$1:function(e){this.refreshMarkdownContent$0()},get$_refreshButtonClick:function(){return new a.BoundClosure$1(this,b.MarkdownHTMLConverter.prototype._refreshButtonClick$1,null,"_refreshButtonClick$1")},refreshMarkdownContent$0:function(){var e,t;if(this._renderMarkdownText!==!0)return;e=f.get$classes$x(this._refreshButton),e.add$1(e,"disabled"),t=S.FormData_FormData(null),t.append("markdown",f.get$value$x(this._textInput)),t.append("csrfmiddlewaretoken",this._csrfToken),S.HttpRequest_request("/helper/markdown/","POST",null,null,null,null,t,null).then$1(this.get$_htmlContentReceived())},_htmlContentReceived$1:function(e){var t,n,i;t=r.C_JsonCodec.decode$1(f.get$responseText$x(e)),n=[],a.setRuntimeTypeInfo(n,[S.NodeValidator]),i=new S.NodeValidatorBuilder(n),n=i._validators,n.push(S._Html5NodeValidator$(null)),i.allowImages$0(),i.allowInlineStyles$0(),n.push(new S._SvgNodeValidator),i.allowCustomElement$4$attributes$uriAttributes$uriPolicy("a",["href","rev","rel"],null,null),i.allowCustomElement$4$attributes$uriAttributes$uriPolicy("img",["src"],null,null),f.setInnerHtml$2$validator$x(this._renderedField,f.$index$asx(t,"html"),i),n=f.get$classes$x(this._refreshButton),n.remove$1(n,"disabled")},get$_htmlContentReceived:function(){return new a.BoundClosure$1(this,b.MarkdownHTMLConverter.prototype._htmlContentReceived$1,null,"_htmlContentReceived$1")},_toggleButtonClick$1:function(e){this._renderMarkdownText===!0?this.hidePreview$0():this.showPreview$0()},get$_toggleButtonClick:function(){return new a.BoundClosure$1(this,b.MarkdownHTMLConverter.prototype._toggleButtonClick$1,null,"_toggleButtonClick$1")},hidePreview$0:function(){this._renderMarkdownText=!1;var e=f.get$classes$x(this._refreshButton);e.add$1(e,"disabled"),this._renderedField.hidden=!0,this._togglePaneButton.textContent="Show preview",e=f.get$classes$x(this._togglePaneButton),e.remove$1(e,"btn-info"),e=f.get$classes$x(this._togglePaneButton),e.add$1(e,"btn-primary")},showPreview$0:function(){this._renderMarkdownText=!0,this.refreshMarkdownContent$0(),this._renderedField.hidden=!1,this._togglePaneButton.textContent="Hide preview";var e=f.get$classes$x(this._togglePaneButton);e.remove$1(e,"btn-primary"),e=f.get$classes$x(this._togglePaneButton),e.add$1(e,"btn-info")},MarkdownHTMLConverter$2:function(e,t){var n,i,s,o;n=S._FrozenElementList$_wrap(document.querySelectorAll(e),null)._nodeList;if(0>=n.length)throw a.ioore(n,0);this._textInput=n[0],n=S._FrozenElementList$_wrap(document.querySelectorAll(t),null)._nodeList;if(0>=n.length)throw a.ioore(n,0);this._htmlOutputMaster=n[0],f.appendHtml$1$x(this._htmlOutputMaster,'<span class="title-text">Preview</span>'),this._refreshButton=document.createElement("button",null),n=f.get$classes$x(this._refreshButton),n.addAll$1(n,["btn","btn-success","btn-xs"]),this._refreshButton.textContent="Refresh",f.set$type$x(this._refreshButton,"button"),n=this._refreshButton,n.toString,i=r.EventStreamProvider_click._eventType,n=new S._ElementEventStreamImpl(n,i,!1),a.setRuntimeTypeInfo(n,[null]),s=this.get$_refreshButtonClick(),s=new S._EventStreamSubscription(0,n._html$_target,n._eventType,S._wrapZone(s),n._useCapture),a.setRuntimeTypeInfo(s,[a.getRuntimeTypeArgument(n,"_EventStream",0)]),s._tryResume$0(),this._togglePaneButton=document.createElement("button",null),s=f.get$classes$x(this._togglePaneButton),s.addAll$1(s,["btn","btn-primary","btn-xs"]),this._togglePaneButton.textContent="Show preview",f.set$type$x(this._togglePaneButton,"button"),s=this._togglePaneButton,s.toString,i=new S._ElementEventStreamImpl(s,i,!1),a.setRuntimeTypeInfo(i,[null]),s=this.get$_toggleButtonClick(),s=new S._EventStreamSubscription(0,i._html$_target,i._eventType,S._wrapZone(s),i._useCapture),a.setRuntimeTypeInfo(s,[a.getRuntimeTypeArgument(i,"_EventStream",0)]),s._tryResume$0(),o=document.createElement("div",null),o.appendChild(this._refreshButton),o.appendChild(this._togglePaneButton),s=f.get$classes$x(o),s.add$1(s,"pull-right"),this._htmlOutputMaster.appendChild(o),this._renderedField=document.createElement("div",null),s=f.get$classes$x(this._renderedField),s.add$1(s,"render-field"),this._htmlOutputMaster.appendChild(this._renderedField),this.hidePreview$0(),s=S._FrozenElementList$_wrap(document.querySelectorAll("[name=csrfmiddlewaretoken]"),null)._nodeList;if(0>=s.length)throw a.ioore(s,0);this._csrfToken=f.get$value$x(s[0]),s=f.get$onKeyDown$x(this._textInput),i=this.get$_textInputKeyDown(),i=new S._EventStreamSubscription(0,s._html$_target,s._eventType,S._wrapZone(i),s._useCapture),a.setRuntimeTypeInfo(i,[a.getRuntimeTypeArgument(s,"_EventStream",0)]),i._tryResume$0(),i=f.get$onKeyUp$x(this._textInput),s=this.get$_textInputKeyUp(),s=new S._EventStreamSubscription(0,i._html$_target,i._eventType,S._wrapZone(s),i._useCapture),a.setRuntimeTypeInfo(s,[a.getRuntimeTypeArgument(i,"_EventStream",0)]),s._tryResume$0()},"static":{MarkdownHTMLConverter$:function(e,t){var n=new b.MarkdownHTMLConverter(null,null,null,null,null,null,null,null);return n.MarkdownHTMLConverter$2(e,t),n}}},MarkdownHTMLConverter__textInputKeyUp_closure:{"":"Closure;this_0",call$1:function(e){return this.this_0.refreshMarkdownContent$0()},$is_args1:!0}},1]]),C.$finishClasses(k,e,null),k=null,A.globalFunctions.IsolateNatives__processWorkerMessage$closure=a.IsolateNatives__processWorkerMessage$closure=new a.Closure$2(a.IsolateNatives__processWorkerMessage,"IsolateNatives__processWorkerMessage$closure"),A.globalFunctions.toStringWrapper$closure=a.toStringWrapper$closure=new 
+e){var t=e.nodeValue;return t==null?f.Interceptor.prototype.toString$0.call(this,e):t},"%":"DocumentType|Entity|Notation;Node"},NodeList:{"":"Interceptor_ListMixin_ImmutableListMixin;",get$length:function(e){return e.length},$index:function(e,t){var n=e.length;if(t>>>0!==t||t>=n)throw a.wrapException(v.RangeError$range(t,0,n));return e[t]},$indexSet:function(e,t,n){throw a.wrapException(v.UnsupportedError$("Cannot assign element of immutable List."))},set$length:function(e,t){throw a.wrapException(v.UnsupportedError$("Cannot resize immutable List."))},elementAt$1:function(e,t){if(t<0||t>=e.length)throw a.ioore(e,t);return e[t]},$asList:function(){return[S.Node]},$isList:!0,$isEfficientLength:!0,$isJavaScriptIndexingBehavior:!0,"%":"NodeList|RadioNodeList"},OListElement:{"":"HtmlElement;type}","%":"HTMLOListElement"},ObjectElement:{"":"HtmlElement;name=,type}","%":"HTMLObjectElement"},OptionElement:{"":"HtmlElement;value=","%":"HTMLOptionElement"},OutputElement:{"":"HtmlElement;name=,value=","%":"HTMLOutputElement"},ParamElement:{"":"HtmlElement;name=,value=","%":"HTMLParamElement"},ProgressElement:{"":"HtmlElement;value=","%":"HTMLProgressElement"},ProgressEvent:{"":"Event;","%":"ProgressEvent|ResourceProgressEvent|XMLHttpRequestProgressEvent"},Range:{"":"Interceptor;",toString$0:function(e){return e.toString()},"%":"Range"},ScriptElement0:{"":"HtmlElement;type}","%":"HTMLScriptElement"},SelectElement:{"":"HtmlElement;length=,name=,value=","%":"HTMLSelectElement"},SourceElement:{"":"HtmlElement;type}","%":"HTMLSourceElement"},SpeechRecognitionError:{"":"Event;error=","%":"SpeechRecognitionError"},StyleElement:{"":"HtmlElement;type}","%":"HTMLStyleElement"},TableElement:{"":"HtmlElement;",createFragment$3$treeSanitizer$validator:function(e,t,n,r){var i,s,o;return"createContextualFragment"in window.Range.prototype?S.Element.prototype.createFragment$3$treeSanitizer$validator.call(this,e,t,n,r):(i=S.Element_Element$html("<table>"+a.S(t)+"</table>",n,r),s=document.createDocumentFragment(),s.toString,o=new S._ChildNodeListLazy(s),o.addAll$1(o,f.get$nodes$x(i)),s)},"%":"HTMLTableElement"},TableRowElement:{"":"HtmlElement;",createFragment$3$treeSanitizer$validator:function(e,t,n,r){var i,s,o,u;return"createContextualFragment"in window.Range.prototype?S.Element.prototype.createFragment$3$treeSanitizer$validator.call(this,e,t,n,r):(i=document.createDocumentFragment(),s=f.createFragment$3$treeSanitizer$validator$x(document.createElement("table",null),t,n,r),s.toString,s=new S._ChildNodeListLazy(s),o=s.get$single(s),o.toString,s=new S._ChildNodeListLazy(o),u=s.get$single(s),i.toString,s=new S._ChildNodeListLazy(i),u.toString,s.addAll$1(s,new S._ChildNodeListLazy(u)),i)},"%":"HTMLTableRowElement"},TableSectionElement:{"":"HtmlElement;",createFragment$3$treeSanitizer$validator:function(e,t,n,r){var i,s,o;return"createContextualFragment"in window.Range.prototype?S.Element.prototype.createFragment$3$treeSanitizer$validator.call(this,e,t,n,r):(i=document.createDocumentFragment(),s=f.createFragment$3$treeSanitizer$validator$x(document.createElement("table",null),t,n,r),s.toString,s=new S._ChildNodeListLazy(s),o=s.get$single(s),i.toString,s=new S._ChildNodeListLazy(i),o.toString,s.addAll$1(s,new S._ChildNodeListLazy(o)),i)},"%":"HTMLTableSectionElement"},TemplateElement:{"":"HtmlElement;",setInnerHtml$3$treeSanitizer$validator:function(e,t,n,r){var i;e.textContent=null,i=this.createFragment$3$treeSanitizer$validator(e,t,n,r),e.content.appendChild(i)},setInnerHtml$2$validator:function(e,t,n){return this.setInnerHtml$3$treeSanitizer$validator(e,t,null,n)},$isTemplateElement:!0,"%":"HTMLTemplateElement"},TextAreaElement:{"":"HtmlElement;name=,value=","%":"HTMLTextAreaElement"},UIEvent:{"":"Event;","%":"CompositionEvent|FocusEvent|SVGZoomEvent|TextEvent|TouchEvent;UIEvent"},Window:{"":"EventTarget;",get$location:function(e){var t=e.location;return S.Window__isDartLocation(t)===!0?t:(null==e._location_wrapper&&(e._location_wrapper=new S._LocationWrapper(t)),e._location_wrapper)},toString$0:function(e){return e.toString()},"%":"DOMWindow|Window"},_Attr:{"":"Node;name=,value=","%":"Attr"},_NamedNodeMap:{"":"Interceptor_ListMixin_ImmutableListMixin0;",get$length:function(e){return e.length},$index:function(e,t){var n=e.length;if(t>>>0!==t||t>=n)throw a.wrapException(v.RangeError$range(t,0,n));return e[t]},$indexSet:function(e,t,n){throw a.wrapException(v.UnsupportedError$("Cannot assign element of immutable List."))},set$length:function(e,t){throw a.wrapException(v.UnsupportedError$("Cannot resize immutable List."))},elementAt$1:function(e,t){if(t<0||t>=e.length)throw a.ioore(e,t);return e[t]},$asList:function(){return[S.Node]},$isList:!0,$isEfficientLength:!0,$isJavaScriptIndexingBehavior:!0,"%":"MozNamedAttrMap|NamedNodeMap"},Console:{"":"Object;",error$1:function(e,t){return typeof console!="undefined"?console.error(t):null},get$error:function(e){return new S.BoundClosure$i1(this,S.Console.prototype.error$1,e,"error$1")},"static":{"":"Console__safeConsole"}},_FrozenElementList:{"":"ListBase;_nodeList,_elementList",get$length:function(e){return this._nodeList.length},$index:function(e,t){var n=this._nodeList;if(t>>>0!==t||t>=n.length)throw a.ioore(n,t);return n[t]},$indexSet:function(e,t,n){throw a.wrapException(v.UnsupportedError$("Cannot modify list"))},set$length:function(e,t){throw a.wrapException(v.UnsupportedError$("Cannot modify list"))},_html$_FrozenElementList$_wrap$1:function(e,t){var n=r.NodeList_methods.where$1(this._nodeList,new S._FrozenElementList$_wrap_closure);this._elementList=v.List_List$from(n,!0,a.getRuntimeTypeArgument(n,"IterableBase",0))},$asListBase:null,$asList:null,$isList:!0,$isEfficientLength:!0,"static":{_FrozenElementList$_wrap:function(e,t){var n=new S._FrozenElementList(e,null);return a.setRuntimeTypeInfo(n,[t]),n._html$_FrozenElementList$_wrap$1(e,t),n}}},_FrozenElementList$_wrap_closure:{"":"Closure;",call$1:function(e){var t=f.getInterceptor(e);return typeof e=="object"&&e!==null&&!!t.$isElement},$is_args1:!0},Element_Element$html_closure:{"":"Closure;",call$1:function(e){var t=f.getInterceptor(e);return typeof e=="object"&&e!==null&&!!t.$isElement},$is_args1:!0},HttpRequest_request_closure0:{"":"Closure;xhr_0",call$2:function(e,t){this.xhr_0.setRequestHeader(e,t)},$is_args2:!0},HttpRequest_request_closure:{"":"Closure;completer_1,xhr_2",call$1:function(e){var t,n,r;t=this.xhr_2,n=t.status;if(typeof n!="number")throw n.$ge();n=n>=200&&n<300||n===0||n===304,r=this.completer_1,n?(n=r.future,n._state!==0&&a.throwExpression(v.StateError$("Future already completed")),n._asyncComplete$1(t)):r.completeError$1(e)},$is_args1:!0},_ChildNodeListLazy:{"":"ListBase;_this",get$single:function(e){var t,n;t=this._this,n=t.childNodes.length;if(n===0)throw a.wrapException(v.StateError$("No elements"));if(n>1)throw a.wrapException(v.StateError$("More than one element"));return t.firstChild},add$1:function(e,t){this._this.appendChild(t)},addAll$1:function(e,t){var n,r,i,s;n=f.getInterceptor$ax(t);if(!!n.$is_ChildNodeListLazy){n=t._this,r=this._this;if(n!==r)for(i=n.childNodes.length,s=0;s<i;++s)r.appendChild(n.firstChild);return}for(n=n.get$iterator(t),r=this._this;n.moveNext$0();)r.appendChild(n.get$current())},$indexSet:function(e,t,n){var r,i;r=this._this,i=r.childNodes;if(t>>>0!==t||t>=i.length)throw a.ioore(i,t);r.replaceChild(n,i[t])},get$iterator:function(e){return r.NodeList_methods.get$iterator(this._this.childNodes)},get$length:function(e){return this._this.childNodes.length},set$length:function(e,t){throw a.wrapException(v.UnsupportedError$("Cannot set length on immutable List."))},$index:function(e,t){var n=this._this.childNodes;if(t>>>0!==t||t>=n.length)throw a.ioore(n,t);return n[t]},$is_ChildNodeListLazy:!0,$asList:function(){return[S.Node]}},Interceptor_ListMixin:{"":"Interceptor+ListMixin;",$isList:!0,$asList:null,$isEfficientLength:!0},Interceptor_ListMixin_ImmutableListMixin:{"":"Interceptor_ListMixin+ImmutableListMixin;",$asList:null,$isList:!0,$isEfficientLength:!0},Interceptor_ListMixin0:{"":"Interceptor+ListMixin;",$isList:!0,$asList:null,$isEfficientLength:!0},Interceptor_ListMixin_ImmutableListMixin0:{"":"Interceptor_ListMixin0+ImmutableListMixin;",$asList:null,$isList:!0,$isEfficientLength:!0},_AttributeMap:{"":"Object;",forEach$1:function(e,t){var n,r;for(n=this.get$keys(),n=new a.ListIterator(n,n.length,0,null);n.moveNext$0();)r=n._dev$_current,t.call$2(r,this.$index(this,r))},get$keys:function(){var e,t,n,r,i;e=this._element.attributes,t=v.List_List(null,f.JSString),a.setRuntimeTypeInfo(t,[f.JSString]);for(n=e.length,r=0;r<n;++r){if(r>=e.length)throw a.ioore(e,r);i=e[r],this._matches$1(i)&&t.push(f.get$name$x(i))}return t},get$values:function(e){var t,n,r,i,s;t=this._element.attributes,n=v.List_List(null,f.JSString),a.setRuntimeTypeInfo(n,[f.JSString]);for(r=t.length,i=0;i<r;++i){if(i>=t.length)throw a.ioore(t,i);s=t[i],this._matches$1(s)&&n.push(f.get$value$x(s))}return n},$isMap:!0,$asMap:function(){return[f.JSString,f.JSString]}},_ElementAttributeMap:{"":"_AttributeMap;_element",$index:function(e,t){return this._element.getAttribute(t)},$indexSet:function(e,t,n){this._element.setAttribute(t,n)},get$length:function(e){return this.get$keys().length},_matches$1:function(e){return e.namespaceURI==null}},_ElementCssClassSet:{"":"CssClassSetImpl;_element",readClasses$0:function(){var e,t,n;e=v.LinkedHashSet_LinkedHashSet(null,null,null,f.JSString);for(t=f.get$className$x(this._element).split(" "),t=new a.ListIterator(t,t.length,0,null);t.moveNext$0();)n=f.trim$0$s(t._dev$_current),n.length!==0&&e.add$1(e,n);return e},writeClasses$1:function(e){v.List_List$from(e,!0,null),f.set$className$x(this._element,e.join$1(e," "))}},EventStreamProvider:{"":"Object;_eventType"},_EventStream:{"":"Stream;_html$_target,_eventType,_useCapture",listen$4$cancelOnError$onDone$onError:function(e,t,n,r){var i=new S._EventStreamSubscription(0,this._html$_target,this._eventType,S._wrapZone(e),this._useCapture);return a.setRuntimeTypeInfo(i,[a.getRuntimeTypeArgument(this,"_EventStream",0)]),i._tryResume$0(),i},$asStream:null},_ElementEventStreamImpl:{"":"_EventStream;_html$_target,_eventType,_useCapture",$as_EventStream:null},_EventStreamSubscription:{"":"StreamSubscription;_pauseCount,_html$_target,_eventType,_onData,_useCapture",cancel$0:function(){if(this._html$_target==null)return;this._unlisten$0(),this._html$_target=null,this._onData=null},_tryResume$0:function(){var e=this._onData;e!=null&&this._pauseCount<=0&&f.addEventListener$3$x(this._html$_target,this._eventType,e,this._useCapture)},_unlisten$0:function(){var e=this._onData;e!=null&&f.removeEventListener$3$x(this._html$_target,this._eventType,e,this._useCapture)},$asStreamSubscription:null},_Html5NodeValidator:{"":"Object;uriPolicy<",allowsElement$1:function(t){var n=e.get$_Html5NodeValidator__allowedElements();return n.contains$1(n,t.tagName)},allowsAttribute$3:function(t,n,r){var i,s,o;return i=t.tagName,s=e.get$_Html5NodeValidator__attributeValidators(),o=s.$index(s,i+"::"+n),o==null&&(s=e.get$_Html5NodeValidator__attributeValidators(),o=s.$index(s,"*::"+n)),o==null?!1:o.call$4(t,n,r,this)},_Html5NodeValidator$1$uriPolicy:function(t){var n,i,s;n=e.get$_Html5NodeValidator__attributeValidators();if(n.get$isEmpty(n)){for(n=new a.ListIterator(r.List_1GN,261,0,null);n.moveNext$0();)i=n._dev$_current,s=e.get$_Html5NodeValidator__attributeValidators(),s.$indexSet(s,i,S._Html5NodeValidator__standardAttributeValidator$closure);for(n=new a.ListIterator(r.List_yrN,12,0,null);n.moveNext$0();)i=n._dev$_current,s=e.get$_Html5NodeValidator__attributeValidators(),s.$indexSet(s,i,S._Html5NodeValidator__uriAttributeValidator$closure)}},"static":{"":"_Html5NodeValidator__allowedElements,_Html5NodeValidator__standardAttributes,_Html5NodeValidator__uriAttributes,_Html5NodeValidator__attributeValidators",_Html5NodeValidator$:function(e){var t=new S._SameOriginUriPolicy(S.AnchorElement_AnchorElement(null),r.Window_methods.get$location(window));return t=new S._Html5NodeValidator(t),t._Html5NodeValidator$1$uriPolicy(e),t},_Html5NodeValidator__standardAttributeValidator:function(e,t,n,r){return!0},_Html5NodeValidator__uriAttributeValidator:function(e,t,n,r){return r.get$uriPolicy().allowsUri$1(n)}}},ImmutableListMixin:{"":"Object;",get$iterator:function(e){return S.FixedSizeListIterator$(e)},add$1:function(e,t){throw a.wrapException(v.UnsupportedError$("Cannot add to immutable List."))},addAll$1:function(e,t){throw a.wrapException(v.UnsupportedError$("Cannot add to immutable List."))},$isList:!0,$asList:null,$isEfficientLength:!0},NodeValidatorBuilder:{"":"Object;_validators",allowImages$1:function(e){this._validators.push(S._SimpleNodeValidator__SimpleNodeValidator$allowImages(new S._SameOriginUriPolicy(S.AnchorElement_AnchorElement(null),r.Window_methods.get$location(window))))},allowImages$0:function(){return this.allowImages$1(null)},allowInlineStyles$1$tagName:function(e){this._validators.push(S._SimpleNodeValidator$(null,["*::style"],null,null))},allowInlineStyles$0:function(){return this.allowInlineStyles$1$tagName(null)},allowCustomElement$4$attributes$uriAttributes$uriPolicy:function(e,t,n,i){var s,o;s=e.toUpperCase(),o=new a.MappedListIterable(t,new S.NodeValidatorBuilder_allowCustomElement_closure(s)),a.setRuntimeTypeInfo(o,[null,null]),i=new S._SameOriginUriPolicy(S.AnchorElement_AnchorElement(null),r.Window_methods.get$location(window)),this._validators.push(S._CustomElementNodeValidator$(i,[s],o,null,!1,!0))},add$1:function(e,t){this._validators.push(t)},allowsElement$1:function(e){return a.IterableMixinWorkaround_any(this._validators,new S.NodeValidatorBuilder_allowsElement_closure(e))},allowsAttribute$3:function(e,t,n){return a.IterableMixinWorkaround_any(this._validators,new S.NodeValidatorBuilder_allowsAttribute_closure(e,t,n))}},NodeValidatorBuilder_allowCustomElement_closure:{"":"Closure;tagNameUpper_0",call$1:function(e){return this.tagNameUpper_0+"::"+f.toLowerCase$0$s(e)},$is_args1:!0},NodeValidatorBuilder_allowCustomElement_closure0:{"":"Closure;tagNameUpper_1",call$1:function(e){return this.tagNameUpper_1+"::"+f.toLowerCase$0$s(e)},$is_args1:!0},NodeValidatorBuilder_allowsElement_closure:{"":"Closure;element_0",call$1:function(e){return e.allowsElement$1(this.element_0)},$is_args1:!0},NodeValidatorBuilder_allowsAttribute_closure:{"":"Closure;element_0,attributeName_1,value_2",call$1:function(e){return e.allowsAttribute$3(this.element_0,this.attributeName_1,this.value_2)},$is_args1:!0},_SimpleNodeValidator:{"":"Object;allowedElements,allowedAttributes,allowedUriAttributes,uriPolicy<",allowsElement$1:function(e){var t=this.allowedElements;return t.contains$1(t,e.tagName)},allowsAttribute$3:function(e,t,n){var r,i;return r=e.tagName,i=this.allowedUriAttributes,i.contains$1(i,r+"::"+t)?this.uriPolicy.allowsUri$1(n):i.contains$1(i,"*::"+t)?this.uriPolicy.allowsUri$1(n):(i=this.allowedAttributes,i.contains$1(i,r+"::"+t)?!0:i.contains$1(i,"*::"+t)?!0:i.contains$1(i,r+"::*")?!0:i.contains$1(i,"*::*")?!0:!1)},"static":{_SimpleNodeValidator__SimpleNodeValidator$allowImages:function(e){return S._SimpleNodeValidator$(e,["IMG::align","IMG::alt","IMG::border","IMG::height","IMG::hspace","IMG::ismap","IMG::name","IMG::usemap","IMG::vspace","IMG::width"],["IMG"],["IMG::src"])},_SimpleNodeValidator$:function(e,t,n,r){var i,s,o;return n!=null?(i=v.LinkedHashSet_LinkedHashSet(null,null,null,null),i.addAll$1(i,n)):i=v.LinkedHashSet_LinkedHashSet(null,null,null,null),t!=null?(s=v.LinkedHashSet_LinkedHashSet(null,null,null,null),s.addAll$1(s,t)):s=v.LinkedHashSet_LinkedHashSet(null,null,null,null),r!=null?(o=v.LinkedHashSet_LinkedHashSet(null,null,null,null),o.addAll$1(o,r)):o=v.LinkedHashSet_LinkedHashSet(null,null,null,null),new S._SimpleNodeValidator(i,s,o,e)}}},_CustomElementNodeValidator:{"":"_SimpleNodeValidator;allowTypeExtension,allowCustomTag,allowedElements,allowedAttributes,allowedUriAttributes,uriPolicy",allowsElement$1:function(e){var t,n;if(this.allowTypeExtension){t=(new S._ElementAttributeMap(e))._element.getAttribute("is");if(t!=null)return n=this.allowedElements,t.toString,n.contains$1(n,t.toUpperCase())&&n.contains$1(n,e.tagName)}return this.allowCustomTag?(n=this.allowedElements,n=n.contains$1(n,e.tagName)):n=!1,n},allowsAttribute$3:function(e,t,n){var r;return this.allowsElement$1(e)?(this.allowTypeExtension?t==="is"?(r=this.allowedElements,n.toString,r=r.contains$1(r,n.toUpperCase())):r=!1:r=!1,r?!0:S._SimpleNodeValidator.prototype.allowsAttribute$3.call(this,e,t,n)):!1},"static":{_CustomElementNodeValidator$:function(e,t,n,r,i,s){var o,u,a;return o=v.LinkedHashSet_LinkedHashSet(null,null,null,null),o.addAll$1(o,t),n!=null?(u=v.LinkedHashSet_LinkedHashSet(null,null,null,null),u.addAll$1(u,n)):u=v.LinkedHashSet_LinkedHashSet(null,null,null,null),a=v.LinkedHashSet_LinkedHashSet(null,null,null,null),new S._CustomElementNodeValidator(i,s,o,u,a,e)}}},_TemplatingNodeValidator:{"":"_SimpleNodeValidator;_templateAttrs,allowedElements,allowedAttributes,allowedUriAttributes,uriPolicy",allowsAttribute$3:function(e,t,n){var r;return S._SimpleNodeValidator.prototype.allowsAttribute$3.call(this,e,t,n)?!0:t==="template"&&n===""?!0:(new S._ElementAttributeMap(e))._element.getAttribute("template")===""?(r=this._templateAttrs,r.contains$1(r,t)):!1},"static":{"":"_TemplatingNodeValidator__TEMPLATE_ATTRS",_TemplatingNodeValidator$:function(){var e,t,n,i;return e=new a.MappedListIterable(r.List_wSV,new S._TemplatingNodeValidator_closure),a.setRuntimeTypeInfo(e,[null,null]),t=v.LinkedHashSet_LinkedHashSet(null,null,null,null),t.addAll$1(t,["TEMPLATE"]),n=v.LinkedHashSet_LinkedHashSet(null,null,null,null),n.addAll$1(n,e),e=n,n=v.LinkedHashSet_LinkedHashSet(null,null,null,null),i=v.LinkedHashSet_LinkedHashSet(null,null,null,f.JSString),i.addAll$1(i,r.List_wSV),new S._TemplatingNodeValidator(i,t,e,n,null)}}},_TemplatingNodeValidator_closure:{"":"Closure;",call$1:function(e){return"TEMPLATE::"+a.S(e)},$is_args1:!0},_SvgNodeValidator:{"":"Object;",allowsElement$1:function(e){var t=f.getInterceptor(e);return t.$isScriptElement?!1:t.$isSvgElement?!0:!1},allowsAttribute$3:function(e,t,n){return t==="is"||r.JSString_methods.startsWith$1(t,"on")?!1:this.allowsElement$1(e)}},FixedSizeListIterator:{"":"Object;_array,_length,_position,_current",moveNext$0:function(){var e,t;return e=this._position+1,t=this._length,e<t?(this._current=f.$index$asx(this._array,e),this._position=e,!0):(this._current=null,this._position=t,!1)},get$current:function(){return this._current},"static":{FixedSizeListIterator$:function(e){return new S.FixedSizeListIterator(e,f.get$length$asx(e),-1,null)}}},_LocationWrapper:{"":"Object;_ptr",get$hostname:function(e){return this._ptr.hostname},get$port:function(e){return this._ptr.port},get$protocol:function(e){return this._ptr.protocol},toString$0:function(e){return this._ptr.toString()},$isLocation:!0},NodeValidator:{"":"Object;"},_SameOriginUriPolicy:{"":"Object;_hiddenAnchor,_loc",allowsUri$1:function(e){var t,n,r,i,s,o;return t=this._hiddenAnchor,n=f.getInterceptor$x(t),n.set$href(t,e),r=n.get$hostname(t),i=this._loc,s=f.getInterceptor$x(i),o=s.get$hostname(i),(r==null?o==null:r===o)?(r=n.get$port(t),o=s.get$port(i),(r==null?o==null:r===o)?(r=n.get$protocol(t),i=s.get$protocol(i),i=r==null?i==null:r===i,r=i):r=!1):r=!1,r?t=!0:t=n.get$hostname(t)===""&&n.get$port(t)===""&&n.get$protocol(t)===":",t}},_ValidatingTreeSanitizer:{"":"Object;validator",sanitizeTree$1:function(e){(new S._ValidatingTreeSanitizer_sanitizeTree_walk(this)).call$1(e)},sanitizeNode$1:function(t){var n,r,i,s,o,u,l,c,h;n=f.getInterceptor$x(t);switch(n.get$nodeType(t)){case 1:r=n.get$attributes(t);if(!this.validator.allowsElement$1(t)){window,i=e.get$Console__safeConsole(),s="Removing disallowed element <"+t.tagName+">",i.toString,typeof console!="undefined"&&console.warn(s),n.remove$0(t);break}i=r._element,o=i.getAttribute("is");if(o!=null&&!this.validator.allowsAttribute$3(t,"is",o)){window,i=e.get$Console__safeConsole(),s="Removing disallowed type extension <"+t.tagName+' is="'+o+'">',i.toString,typeof console!="undefined"&&console.warn(s),n.remove$0(t);break}s=r.get$keys(),u=v.List_List$from(s,!0,a.getRuntimeTypeArgument(s,"JSArray",0));for(l=r.get$keys().length-1;l>=0;--l){if(l>=u.length)throw a.ioore(u,l);c=u[l],this.validator.allowsAttribute$3(t,f.toLowerCase$0$s(c),i.getAttribute(c))||(window,s=e.get$Console__safeConsole(),h="Removing disallowed attribute <"+t.tagName+" "+c+'="'+i.getAttribute(c)+'">',s.toString,typeof console!="undefined"&&console.warn(h),i.getAttribute(c),i.removeAttribute(c))}typeof t=="object"&&t!==null&&!!n.$isTemplateElement&&this.sanitizeTree$1(t.content);break;case 8:case 11:case 3:case 4:break;default:n.remove$0(t)}}},_ValidatingTreeSanitizer_sanitizeTree_walk:{"":"Closure;this_0",call$1:function(e){var t,n;this.this_0.sanitizeNode$1(e),t=f.get$lastChild$x(e);for(;t!=null;t=n)n=t.previousSibling,this.call$1(t)},$is_args1:!0}}],["dart.dom.svg","dart:svg",,v,{ScriptElement:{"":"SvgElement;type}",$isScriptElement:!0,"%":"SVGScriptElement"},StyleElement0:{"":"SvgElement;type}","%":"SVGStyleElement"},SvgElement:{"":"Element;",get$classes:function(e){return e._cssClassSet==null&&(e._cssClassSet=new v._AttributeClassSet(e)),e._cssClassSet},createFragment$3$treeSanitizer$validator:function(e,t,n,r){var i,s,o,u,l;n=new S._ValidatingTreeSanitizer(r),i='<svg version="1.1">'+a.S(t)+"</svg>",s=f.createFragment$2$treeSanitizer$x(document.body,i,n),o=document.createDocumentFragment(),s.toString,u=new S._ChildNodeListLazy(s),l=u.get$single(u);for(;u=l.firstChild,u!=null;)o.appendChild(u);return o},insertAdjacentHtml$2:function(e,t,n){throw a.wrapException(v.UnsupportedError$("Cannot invoke insertAdjacentHtml on SVG."))},$isSvgElement:!0,"%":"SVGAElement|SVGAltGlyphDefElement|SVGAltGlyphElement|SVGAltGlyphItemElement|SVGAnimateColorElement|SVGAnimateElement|SVGAnimateMotionElement|SVGAnimateTransformElement|SVGAnimationElement|SVGCircleElement|SVGClipPathElement|SVGComponentTransferFunctionElement|SVGCursorElement|SVGDefsElement|SVGDescElement|SVGEllipseElement|SVGFEBlendElement|SVGFEColorMatrixElement|SVGFEComponentTransferElement|SVGFECompositeElement|SVGFEConvolveMatrixElement|SVGFEDiffuseLightingElement|SVGFEDisplacementMapElement|SVGFEDistantLightElement|SVGFEDropShadowElement|SVGFEFloodElement|SVGFEFuncAElement|SVGFEFuncBElement|SVGFEFuncGElement|SVGFEFuncRElement|SVGFEGaussianBlurElement|SVGFEImageElement|SVGFEMergeElement|SVGFEMergeNodeElement|SVGFEMorphologyElement|SVGFEOffsetElement|SVGFEPointLightElement|SVGFESpecularLightingElement|SVGFESpotLightElement|SVGFETileElement|SVGFETurbulenceElement|SVGFilterElement|SVGFontElement|SVGFontFaceElement|SVGFontFaceFormatElement|SVGFontFaceNameElement|SVGFontFaceSrcElement|SVGFontFaceUriElement|SVGForeignObjectElement|SVGGElement|SVGGlyphElement|SVGGlyphRefElement|SVGGradientElement|SVGGraphicsElement|SVGHKernElement|SVGImageElement|SVGLineElement|SVGLinearGradientElement|SVGMPathElement|SVGMarkerElement|SVGMaskElement|SVGMetadataElement|SVGMissingGlyphElement|SVGPathElement|SVGPatternElement|SVGPolygonElement|SVGPolylineElement|SVGRadialGradientElement|SVGRectElement|SVGSVGElement|SVGSetElement|SVGStopElement|SVGSwitchElement|SVGSymbolElement|SVGTSpanElement|SVGTextContentElement|SVGTextElement|SVGTextPathElement|SVGTextPositioningElement|SVGTitleElement|SVGUseElement|SVGVKernElement|SVGViewElement;SVGElement"},_AttributeClassSet:{"":"CssClassSetImpl;_svg$_element",readClasses$0:function(){var e,t,n,r;e=(new S._ElementAttributeMap(this._svg$_element))._element.getAttribute("class"),t=v.LinkedHashSet_LinkedHashSet(null,null,null,f.JSString);if(e==null)return t;for(n=e.split(" "),n=new a.ListIterator(n,n.length,0,null);n.moveNext$0();)r=f.trim$0$s(n._dev$_current),r.length!==0&&t.add$1(t,r);return t},writeClasses$1:function(e){(new S._ElementAttributeMap(this._svg$_element))._element.setAttribute("class",e.join$1(e," "))}}}],["dart.isolate","dart:isolate",,v,{ReceivePort:{"":"Object;"}}],["dart.typed_data","dart:typed_data",,v,{TypedData:{"":"Interceptor;",_invalidIndex$2:function(e,t,n){var r=f.getInterceptor$n(t);throw r.$lt(t,0)||r.$ge(t,n)?a.wrapException(v.RangeError$range(t,0,n)):a.wrapException(new v.ArgumentError("Invalid list index "+a.S(t)))},"%":";ArrayBufferView;TypedData_ListMixin|TypedData_ListMixin_FixedLengthListMixin"},Uint8List:{"":"TypedData_ListMixin_FixedLengthListMixin;",get$length:function(e){return r.JS_CONST_ZYJ(e)},$index:function(e,t){var n,i;n=r.JS_CONST_ZYJ(e);if(t>>>0==t){if(typeof t!="number")throw t.$ge();i=t>=n}else i=!0;return i&&this._invalidIndex$2(e,t,n),e[t]},$indexSet:function(e,t,n){var i=r.JS_CONST_ZYJ(e);(t>>>0!=t||f.$ge$n(t,i))&&this._invalidIndex$2(e,t,i),e[t]=n},$asList:function(){return[f.JSInt]},$isList:!0,$isEfficientLength:!0,$isJavaScriptIndexingBehavior:!0,"%":";Uint8Array"},TypedData_ListMixin:{"":"TypedData+ListMixin;",$isList:!0,$asList:null,$isEfficientLength:!0},TypedData_ListMixin_FixedLengthListMixin:{"":"TypedData_ListMixin+FixedLengthListMixin;",$asList:null}}],["html_common","dart:html_common",,v,{CssClassSetImpl:{"":"Object;",toString$0:function(e){var t=this.readClasses$0();return t.join$1(t," ")},get$iterator:function(e){var t=this.readClasses$0();return t=new v.LinkedHashSetIterator(t,t._modifications,null,null),t._cell=t._set._first,t},forEach$1:function(e,t){var n=this.readClasses$0();n.forEach$1(n,t)},get$length:function(e){return this.readClasses$0()._collection$_length},lookup$1:function(e){var t=this.readClasses$0();return t.contains$1(t,e)?e:null},add$1:function(e,t){return this.modify$1(new v.CssClassSetImpl_add_closure(t))},remove$1:function(e,t){var n,r;return n=this.readClasses$0(),r=n.remove$1(n,t),this.writeClasses$1(n),r},addAll$1:function(e,t){this.modify$1(new v.CssClassSetImpl_addAll_closure(t))},modify$1:function(e){var t,n;return t=this.readClasses$0(),n=e.call$1(t),this.writeClasses$1(t),n},$isEfficientLength:!0},CssClassSetImpl_add_closure:{"":"Closure;value_0",call$1:function(e){return f.add$1$ax(e,this.value_0)},$is_args1:!0},CssClassSetImpl_addAll_closure:{"":"Closure;iterable_0",call$1:function(e){return f.addAll$1$ax(e,this.iterable_0)},$is_args1:!0}}],["","markdown.dart",,b,{main:function(){b.MarkdownHTMLConverter$(".markdowntextfield",".markdown-render").refreshMarkdownContent$0()},MarkdownHTMLConverter:{"":"Object;_textInput,_htmlOutputMaster,_renderedField,_refreshButton,_togglePaneButton,_csrfToken,_refreshSubscription,_renderMarkdownText,_renderedMarkdown,_renderedHash",_textInputKeyDown$1:function(e){this._cancelMarkdownStream$0()},get$_textInputKeyDown:function(){return new a.BoundClosure$1(this,b.MarkdownHTMLConverter.prototype._textInputKeyDown$1,null,"_textInputKeyDown$1")},_textInputKeyUp$1:function(e){this._cancelMarkdownStream$0(),this._refreshSubscription=v.Stream_Stream$fromFuture(v.Future_Future$delayed(r.Duration_300000,null,null),null).listen$1(new b.MarkdownHTMLConverter__textInputKeyUp_closure(this))},get$_textInputKeyUp:function(){return new a.BoundClosure$1(this,b.MarkdownHTMLConverter.prototype._textInputKeyUp$1,null,"_textInputKeyUp$1")},_cancelMarkdownStream$0:function(){var e=this._refreshSubscription;e!=null&&(e.cancel$0(),this._refreshSubscription=null)},_refreshButtonClick$1:function(e){this.refreshMarkdownContent$1$fullDocument(!0)},get$_refreshButtonClick:function(){return new a.BoundClosure$1(this,b.MarkdownHTMLConverter.prototype._refreshButtonClick$1,null,"_refreshButtonClick$1")},refreshMarkdownContent$1$fullDocument:function(e){var t,n,i;if(this._renderMarkdownText!==!0)return;t=f.get$value$x(this._textInput);if(e!==!0&&f.$eq(t,this._renderedMarkdown))return;n=f.get$classes$x(this._refreshButton),n.add$1(n,"disabled"),i=S.FormData_FormData(null),e===!0||this._renderedHash==null?i.append("markdown",t):(i.append("base_hash",this._renderedHash),i.append("changes",JSON.stringify(this._getChanges$2(this._renderedMarkdown,t)))),i.append("csrfmiddlewaretoken",this._csrfToken),S.HttpRequest_request("/helper/markdown/","POST",null,null,null,null,i,null).then$1(new b.MarkdownHTMLConverter_refreshMarkdownContent_closure(this,t))},refreshMarkdownContent$0:function(){return this.refreshMarkdownContent$1$fullDocument(!1)},_getChanges$2:function(e,t){var n,i,s;for(n=0;n<e.length&&n<t.length&&e.charCodeAt(n)===t.charCodeAt(n);)++n;n>0&&(t.charCodeAt(n-1)&64512)===55296&&--n;for(i=e.length,s=t.length;i>n&&s>n&&e.charCodeAt(i-1)===t.charCodeAt(s-1);)--i,--s;return i<e.length&&(e.charCodeAt(i)&64512)===56320&&(++i,++s),{start:n,end:i,text:t.substring(n,s)}},_htmlContentReceived$2:function(e,o){var t,n,i;t=r.C_JsonCodec.decode$1(f.get$responseText$x(e));if(f.$eq(f.$index$asx(t,"missing"),!0)){this._renderedHash=null,this.refreshMarkdownContent$1$fullDocument(!0);return}n=f.get$classes$x(this._refreshButton),n.remove$1(n,"disabled");if(f.$index$asx(t,"html")==null)return;this._renderedMarkdown=o,this._renderedHash=f.$index$asx(t,"hash"),n=[],a.setRuntimeTypeInfo(n,[S.NodeValidator]),i=new S.NodeValidatorBuilder(n),n=i._validators,n.push(S._Html5NodeValidator$(null)),i.allowImages$0(),i.allowInlineStyles$0(),n.push(new S._SvgNodeValidator),i.allowCustomElement$4$attributes$uriAttributes$uriPolicy("a",["href","rev","rel"],null,null),i.allowCustomElement$4$attributes$uriAttributes$uriPolicy("img",["src"],null,null),f.setInnerHtml$2$validator$x(this._renderedField,f.$index$asx(t,"html"),i)},_toggleButtonClick$1:function(e){this._renderMarkdownText===!0?this.hidePreview$0():this.showPreview$0()},get$_toggleButtonClick:function(){return new a.BoundClosure$1(this,b.MarkdownHTMLConverter.prototype._toggleButtonClick$1,null,"_toggleButtonClick$1")},hidePreview$0:function(){this._renderMarkdownText=!1;var e=f.get$classes$x(this._refreshButton);e.add$1(e,"disabled"),this._renderedField.hidden=!0,this._togglePaneButton.textContent="Show preview",e=f.get$classes$x(this._togglePaneButton),e.remove$1(e,"btn-info"),e=f.get$classes$x(this._togglePaneButton),e.add$1(e,"btn-primary")},showPreview$0:function(){this._renderMarkdownText=!0,this.refreshMarkdownContent$0(),this._renderedField.hidden=!1,this._togglePaneButton.textContent="Hide preview";var e=f.get$classes$x(this._togglePaneButton);e.remove$1(e,"btn-primary"),e=f.get$classes$x(this._togglePaneButton),e.add$1(e,"btn-info")},MarkdownHTMLConverter$2:function(e,t){var n,i,s,o;n=S._FrozenElementList$_wrap(document.querySelectorAll(e),null)._nodeList;if(0>=n.length)throw a.ioore(n,0);this._textInput=n[0],n=S._FrozenElementList$_wrap(document.querySelectorAll(t),null)._nodeList;if(0>=n.length)throw a.ioore(n,0);this._htmlOutputMaster=n[0],f.appendHtml$1$x(this._htmlOutputMaster,'<span class="title-text">Preview</span>'),this._refreshButton=document.createElement("button",null),n=f.get$classes$x(this._refreshButton),n.addAll$1(n,["btn","btn-success","btn-xs"]),this._refreshButton.textContent="Refresh",f.set$type$x(this._refreshButton,"button"),n=this._refreshButton,n.toString,i=r.EventStreamProvider_click._eventType,n=new S._ElementEventStreamImpl(n,i,!1),a.setRuntimeTypeInfo(n,[null]),s=this.get$_refreshButtonClick(),s=new S._EventStreamSubscription(0,n._html$_target,n._eventType,S._wrapZone(s),n._useCapture),a.setRuntimeTypeInfo(s,[a.getRuntimeTypeArgument(n,"_EventStream",0)]),s._tryResume$0(),this._togglePaneButton=document.createElement("button",null),s=f.get$classes$x(this._togglePaneButton),s.addAll$1(s,["btn","btn-primary","btn-xs"]),this._togglePaneButton.textContent="Show preview",f.set$type$x(this._togglePaneButton,"button"),s=this._togglePaneButton,s.toString,i=new S._ElementEventStreamImpl(s,i,!1),a.setRuntimeTypeInfo(i,[null]),s=this.get$_toggleButtonClick(),s=new S._EventStreamSubscription(0,i._html$_target,i._eventType,S._wrapZone(s),i._useCapture),a.setRuntimeTypeInfo(s,[a.getRuntimeTypeArgument(i,"_EventStream",0)]),s._tryResume$0(),o=document.createElement("div",null),o.appendChild(this._refreshButton),o.appendChild(this._togglePaneButton),s=f.get$classes$x(o),s.add$1(s,"pull-right"),this._htmlOutputMaster.appendChild(o),this._renderedField=document.createElement("div",null),s=f.get$classes$x(this._renderedField),s.add$1(s,"render-field"),this._htmlOutputMaster.appendChild(this._renderedField),this.hidePreview$0(),s=S._FrozenElementList$_wrap(document.querySelectorAll("[name=csrfmiddlewaretoken]"),null)._nodeList;if(0>=s.length)throw a.ioore(s,0);this._csrfToken=f.get$value$x(s[0]),s=f.get$onKeyDown$x(this._textInput),i=this.get$_textInputKeyDown(),i=new S._EventStreamSubscription(0,s._html$_target,s._eventType,S._wrapZone(i),s._useCapture),a.setRuntimeTypeInfo(i,[a.getRuntimeTypeArgument(s,"_EventStream",0)]),i._tryResume$0(),i=f.get$onKeyUp$x(this._textInput),s=this.get$_textInputKeyUp(),s=new S._EventStreamSubscription(0,i._html$_target,i._eventType,S._wrapZone(s),i._useCapture),a.setRuntimeTypeInfo(s,[a.getRuntimeTypeArgument(i,"_EventStream",0)]),s._tryResume$0()},"static":{MarkdownHTMLConverter$:function(e,t){var n=new b.MarkdownHTMLConverter(null,null,null,null,null,null,null,null,null,null);return n.MarkdownHTMLConverter$2(e,t),n}}},MarkdownHTMLConverter__textInputKeyUp_closure:{"":"Closure;this_0",call$1:function(e){return this.this_0.refreshMarkdownContent$0()},$is_args1:!0},MarkdownHTMLConverter_refreshMarkdownContent_closure:{"":"Closure;this_0,markdown_1",call$1:function(e){return this.this_0._htmlContentReceived$2(e,this.markdown_1)},$is_args1:!0}},1]]),C.$finishClasses(k,e,null),k=null,A.globalFunctions.IsolateNatives__processWorkerMessage$closure=a.IsolateNatives__processWorkerMessage$closure=new a.Closure$2(a.IsolateNatives__processWorkerMessage,"IsolateNatives__processWorkerMessage$closure"),A.globalFunctions.toStringWrapper$closure=a.toStringWrapper$closure=new 
 a.Closure$0(a.toStringWrapper,"toStringWrapper$closure"),A.globalFunctions.invokeClosure$closure=a.invokeClosure$closure=new a.Closure$7(a.invokeClosure,"invokeClosure$closure"),A.globalFunctions._asyncRunCallback$closure=v._asyncRunCallback$closure=new a.Closure$0(v._asyncRunCallback,"_asyncRunCallback$closure"),A.globalFunctions._nullDataHandler$closure=v._nullDataHandler$closure=new v.Closure$1(v._nullDataHandler,"_nullDataHandler$closure"),A.globalFunctions._nullErrorHandler$closure=v._nullErrorHandler$closure=new v.Closure$20(v._nullErrorHandler,"_nullErrorHandler$closure"),A.globalFunctions._nullDoneHandler$closure=v._nullDoneHandler$closure=new a.Closure$0(v._nullDoneHandler,"_nullDoneHandler$closure"),A.globalFunctions._defaultEquals$closure=v._defaultEquals$closure=new a.Closure$2(v._defaultEquals,"_defaultEquals$closure"),A.globalFunctions._defaultHashCode$closure=v._defaultHashCode$closure=new v.Closure$1(v._defaultHashCode,"_defaultHashCode$closure"),A.globalFunctions.identical$closure=v.identical$closure=new a.Closure$2(v.identical,"identical$closure"),A.globalFunctions.identityHashCode$closure=v.identityHashCode$closure=new v.Closure$1(v.identityHashCode,"identityHashCode$closure"),A.globalFunctions._Html5NodeValidator__standardAttributeValidator$closure=S._Html5NodeValidator__standardAttributeValidator$closure=new S.Closure$4(S._Html5NodeValidator__standardAttributeValidator,"_Html5NodeValidator__standardAttributeValidator$closure"),A.globalFunctions._Html5NodeValidator__uriAttributeValidator$closure=S._Html5NodeValidator__uriAttributeValidator$closure=new S.Closure$4(S._Html5NodeValidator__uriAttributeValidator,"_Html5NodeValidator__uriAttributeValidator$closure"),A.globalFunctions.main$closure=b.main$closure=new a.Closure$0(b.main,"main$closure"),S.Node.$isNode=!0,S.Node.$isObject=!0,f.JSInt.$isint=!0,f.JSInt.$isObject=!0,f.JSString.$isString=!0,f.JSString.$isObject=!0,f.JSNumber.$isObject=!0,v.Object.$isObject=!0,v.Duration.$isObject=!0,S.NodeValidator.$isNodeValidator=!0,S.NodeValidator.$isObject=!0,S.HttpRequest.$isHttpRequest=!0,S.HttpRequest.$isObject=!0,S.ProgressEvent.$isEvent=!0,S.ProgressEvent.$isObject=!0,S.MouseEvent.$isEvent=!0,S.MouseEvent.$isObject=!0,S.KeyboardEvent.$isEvent=!0,S.KeyboardEvent.$isObject=!0,v.ReceivePort.$isStream=!0,v.ReceivePort.$asStream=[null],v.ReceivePort.$isObject=!0,a._IsolateEvent.$isObject=!0,a._IsolateContext.$isObject=!0,f.JSArray.$isObject=!0,v.Symbol.$isSymbol=!0,v.Symbol.$isObject=!0,v.StackTrace.$isStackTrace=!0,v.StackTrace.$isObject=!0,v.Stream.$isStream=!0,v.Stream.$isObject=!0,f.JSBool.$isbool=!0,f.JSBool.$isObject=!0,S.Element.$isElement=!0,S.Element.$isNode=!0,S.Element.$isObject=!0,S._Html5NodeValidator.$is_Html5NodeValidator=!0,S._Html5NodeValidator.$isNodeValidator=!0,S._Html5NodeValidator.$isObject=!0,v.Function.$isFunction=!0,v.Function.$isObject=!0,v.Future.$isFuture=!0,v.Future.$isObject=!0,v.StreamSubscription.$isStreamSubscription=!0,v.StreamSubscription.$isObject=!0,v._EventSink.$is_EventSink=!0,v._EventSink.$isObject=!0,S.Event.$isEvent=!0,S.Event.$isObject=!0,v._DelayedEvent.$is_DelayedEvent=!0,v._DelayedEvent.$isObject=!0,f.getInterceptor=function(e){return typeof e=="number"?Math.floor(e)==e?f.JSInt.prototype:f.JSDouble.prototype:typeof e=="string"?f.JSString.prototype:e==null?f.JSNull.prototype:typeof e=="boolean"?f.JSBool.prototype:e.constructor==Array?f.JSArray.prototype:typeof e!="object"?e:e instanceof v.Object?e:f.getNativeInterceptor(e)},f.getInterceptor$asx=function(e){return typeof e=="string"?f.JSString.prototype:e==null?e:e.constructor==Array?f.JSArray.prototype:typeof e!="object"?e:e instanceof v.Object?e:f.getNativeInterceptor(e)},f.getInterceptor$ax=function(e){return e==null?e:e.constructor==Array?f.JSArray.prototype:typeof e!="object"?e:e instanceof v.Object?e:f.getNativeInterceptor(e)},f.getInterceptor$n=function(e){return typeof e=="number"?f.JSNumber.prototype:e==null?e:e instanceof v.Object?e:f.UnknownJavaScriptObject.prototype},f.getInterceptor$s=function(e){return typeof e=="string"?f.JSString.prototype:e==null?e:e instanceof v.Object?e:f.UnknownJavaScriptObject.prototype},f.getInterceptor$x=function(e){return e==null?e:typeof e!="object"?e:e instanceof v.Object?e:f.getNativeInterceptor(e)},r.C_JsonCodec=new v.JsonCodec,r.C__DelayedDone=new v._DelayedDone,r.C__RootZone=new v._RootZone,r.Duration_0=new v.Duration(0),r.Duration_300000=new v.Duration(3e5),r.EventStreamProvider_click=new S.EventStreamProvider("click"),r.EventStreamProvider_error=new S.EventStreamProvider("error"),r.EventStreamProvider_keydown=new S.EventStreamProvider("keydown"),r.EventStreamProvider_keyup=new S.EventStreamProvider("keyup"),r.EventStreamProvider_load=new S.EventStreamProvider("load"),r.HttpRequest_methods=S.HttpRequest.prototype,r.JSArray_methods=f.JSArray.prototype,r.JSInt_methods=f.JSInt.prototype,r.JSNumber_methods=f.JSNumber.prototype,r.JSString_methods=f.JSString.prototype,r.JS_CONST_0=function(e){if(typeof dartExperimentalFixupGetTag!="function")return e;e.getTag=dartExperimentalFixupGetTag(e.getTag)},r.JS_CONST_6qb=function(e){function i(e){var t=n(e);return r[t]||t}var t=typeof navigator=="object"?navigator.userAgent:"";if(t.indexOf("Firefox")==-1)return e;var n=e.getTag,r={BeforeUnloadEvent:"Event",DataTransfer:"Clipboard",GeoGeolocation:"Geolocation",WorkerMessageEvent:"MessageEvent",XMLDocument:"Document"};e.getTag=i},r.JS_CONST_86y=function(t){if(t==null)return"Null";var n=t.constructor;if(typeof n=="function"){var r=n.builtin$cls;if(typeof r=="string")return r;r=n.name;if(typeof r=="string"&&r!==""&&r!=="Object"&&r!=="Function.prototype")return r}var i=Object.prototype.toString.call(t);return i.substring(8,i.length-1)},r.JS_CONST_Cbr=function(e){return function(t){if(typeof navigator!="object")return t;var n=navigator.userAgent;if(n.indexOf("Chrome")>=0||n.indexOf("DumpRenderTree")>=0)return t;t.getTag=e}},r.JS_CONST_Fs4=function(e){return e},r.JS_CONST_TtD=function(){function e(e){return e.constructor.name}function t(e,t){if(/^HTML[A-Z].*Element$/.test(t)){var n=Object.prototype.toString.call(e);return n=="[object Object]"?null:"HTMLElement"}}function n(e,n){return e instanceof HTMLElement?"HTMLElement":t(e,n)}function r(e){if(typeof window=="undefined")return null;if(typeof window[e]=="undefined")return null;var t=window[e];return typeof t!="function"?null:t.prototype}function i(e){return null}var s=typeof navigator=="object";return{getTag:e,getUnknownTag:s?n:t,prototypeForTag:r,discriminator:i}},r.JS_CONST_ZYJ=typeof version=="function"&&typeof os=="object"&&"system"in os||typeof navigator=="object"&&navigator.userAgent.indexOf("Chrome")!=-1?function(e){return e.$dartCachedLength||e.length}:function(e){return e.length},r.JS_CONST_rD3=function(e){function i(e){var t=n(e),i=r[t];return i?i:t=="Document"?e.xmlVersion?"!Document":"!HTMLDocument":t=="Object"&&window.DataView&&e instanceof window.DataView?"DataView":t}function s(e){if(e=="Document")return null;var t=window[e];return t==null?null:t.prototype}var t=typeof navigator=="object"?navigator.userAgent:"";if(t.indexOf("Trident/")==-1)return e;var n=e.getTag,r={BeforeUnloadEvent:"Event",DataTransfer:"Clipboard",HTMLDDElement:"HTMLElement",HTMLDTElement:"HTMLElement",HTMLPhraseElement:"HTMLElement",Position:"Geoposition"};e.getTag=i,e.prototypeForTag=s},r.JsonDecoder_null=new v.JsonDecoder(null),C.makeConstantList=function(e){return e.immutable$list=!0,e.fixed$length=!0,e},r.List_1GN=a.setRuntimeTypeInfo(C.makeConstantList(["*::class","*::dir","*::draggable","*::hidden","*::id","*::inert","*::itemprop","*::itemref","*::itemscope","*::lang","*::spellcheck","*::title","*::translate","A::accesskey","A::coords","A::hreflang","A::name","A::shape","A::tabindex","A::target","A::type","AREA::accesskey","AREA::alt","AREA::coords","AREA::nohref","AREA::shape","AREA::tabindex","AREA::target","AUDIO::controls","AUDIO::loop","AUDIO::mediagroup","AUDIO::muted","AUDIO::preload","BDO::dir","BODY::alink","BODY::bgcolor","BODY::link","BODY::text","BODY::vlink","BR::clear","BUTTON::accesskey","BUTTON::disabled","BUTTON::name","BUTTON::tabindex","BUTTON::type","BUTTON::value","CANVAS::height","CANVAS::width","CAPTION::align","COL::align","COL::char","COL::charoff","COL::span","COL::valign","COL::width","COLGROUP::align","COLGROUP::char","COLGROUP::charoff","COLGROUP::span","COLGROUP::valign","COLGROUP::width","COMMAND::checked","COMMAND::command","COMMAND::disabled","COMMAND::label","COMMAND::radiogroup","COMMAND::type","DATA::value","DEL::datetime","DETAILS::open","DIR::compact","DIV::align","DL::compact","FIELDSET::disabled","FONT::color","FONT::face","FONT::size","FORM::accept","FORM::autocomplete","FORM::enctype","FORM::method","FORM::name","FORM::novalidate","FORM::target","FRAME::name","H1::align","H2::align","H3::align","H4::align","H5::align","H6::align","HR::align","HR::noshade","HR::size","HR::width","HTML::version","IFRAME::align","IFRAME::frameborder","IFRAME::height","IFRAME::marginheight","IFRAME::marginwidth","IFRAME::width","IMG::align","IMG::alt","IMG::border","IMG::height","IMG::hspace","IMG::ismap","IMG::name","IMG::usemap","IMG::vspace","IMG::width","INPUT::accept","INPUT::accesskey","INPUT::align","INPUT::alt","INPUT::autocomplete","INPUT::checked","INPUT::disabled","INPUT::inputmode","INPUT::ismap","INPUT::list","INPUT::max","INPUT::maxlength","INPUT::min","INPUT::multiple","INPUT::name","INPUT::placeholder","INPUT::readonly","INPUT::required","INPUT::size","INPUT::step","INPUT::tabindex","INPUT::type","INPUT::usemap","INPUT::value","INS::datetime","KEYGEN::disabled","KEYGEN::keytype","KEYGEN::name","LABEL::accesskey","LABEL::for","LEGEND::accesskey","LEGEND::align","LI::type","LI::value","LINK::sizes","MAP::name","MENU::compact","MENU::label","MENU::type","METER::high","METER::low","METER::max","METER::min","METER::value","OBJECT::typemustmatch","OL::compact","OL::reversed","OL::start","OL::type","OPTGROUP::disabled","OPTGROUP::label","OPTION::disabled","OPTION::label","OPTION::selected","OPTION::value","OUTPUT::for","OUTPUT::name","P::align","PRE::width","PROGRESS::max","PROGRESS::min","PROGRESS::value","SELECT::autocomplete","SELECT::disabled","SELECT::multiple","SELECT::name","SELECT::required","SELECT::size","SELECT::tabindex","SOURCE::type","TABLE::align","TABLE::bgcolor","TABLE::border","TABLE::cellpadding","TABLE::cellspacing","TABLE::frame","TABLE::rules","TABLE::summary","TABLE::width","TBODY::align","TBODY::char","TBODY::charoff","TBODY::valign","TD::abbr","TD::align","TD::axis","TD::bgcolor","TD::char","TD::charoff","TD::colspan","TD::headers","TD::height","TD::nowrap","TD::rowspan","TD::scope","TD::valign","TD::width","TEXTAREA::accesskey","TEXTAREA::autocomplete","TEXTAREA::cols","TEXTAREA::disabled","TEXTAREA::inputmode","TEXTAREA::name","TEXTAREA::placeholder","TEXTAREA::readonly","TEXTAREA::required","TEXTAREA::rows","TEXTAREA::tabindex","TEXTAREA::wrap","TFOOT::align","TFOOT::char","TFOOT::charoff","TFOOT::valign","TH::abbr","TH::align","TH::axis","TH::bgcolor","TH::char","TH::charoff","TH::colspan","TH::headers","TH::height","TH::nowrap","TH::rowspan","TH::scope","TH::valign","TH::width","THEAD::align","THEAD::char","THEAD::charoff","THEAD::valign","TR::align","TR::bgcolor","TR::char","TR::charoff","TR::valign","TRACK::default","TRACK::kind","TRACK::label","TRACK::srclang","UL::compact","UL::type","VIDEO::controls","VIDEO::height","VIDEO::loop","VIDEO::mediagroup","VIDEO::muted","VIDEO::preload","VIDEO::width"]),[f.JSString]),r.List_empty=C.makeConstantList([]),r.List_wSV=a.setRuntimeTypeInfo(C.makeConstantList(["bind","if","ref","repeat","syntax"]),[f.JSString]),r.List_yrN=a.setRuntimeTypeInfo(C.makeConstantList(["A::href","AREA::href","BLOCKQUOTE::cite","BODY::background","COMMAND::icon","DEL::cite","FORM::action","IMG::src","INPUT::src","INS::cite","Q::cite","VIDEO::poster"]),[f.JSString]),r.NodeList_methods=S.NodeList.prototype,r.UnknownJavaScriptObject_methods=f.UnknownJavaScriptObject.prototype,r.Window_methods=S.Window.prototype,e.lazyPort=null,e.ReceivePortImpl__nextFreeId=1,e.Primitives_mirrorFunctionCacheName="$cachedFunction",e.Primitives_mirrorInvokeCacheName="$cachedInvocation",e.getTagFunction=null,e.alternateTagFunction=null,e.prototypeForTagFunction=null,e.dispatchRecordsForInstanceTags=null,e.interceptorsForUncacheableTags=null,e.initNativeDispatchFlag=null,e.printToZone=null,e._callbacksAreEnqueued=!1,e.Zone__current=r.C__RootZone,e.Expando__keyCount=0,e.Element__parseDocument=null,e.Element__parseRange=null,e.Element__defaultValidator=null,e.Element__defaultSanitizer=null,e.Device__isOpera=null,e.Device__isWebKit=null,f.$eq=function(e,t){return e==null?t==null:typeof e!="object"?t!=null&&e===t:f.getInterceptor(e).$eq(e,t)},f.$ge$n=function(e,t){return typeof e=="number"&&typeof t=="number"?e>=t:f.getInterceptor$n(e).$ge(e,t)},f.$index$asx=function(e,t){if(e.constructor==Array||typeof e=="string"||a.isJsIndexable(e,e[A.dispatchPropertyName]))if(t>>>0===t&&t<e.length)return e[t];return f.getInterceptor$asx(e).$index(e,t)},f.$indexSet$ax=function(e,t,n){return(e.constructor==Array||a.isJsIndexable(e,e[A.dispatchPropertyName]))&&!e.immutable$list&&t>>>0===t&&t<e.length?e[t]=n:f.getInterceptor$ax(e).$indexSet(e,t,n)},f.add$1$ax=function(e,t){return f.getInterceptor$ax(e).add$1(e,t)},f.addAll$1$ax=function(e,t){return f.getInterceptor$ax(e).addAll$1(e,t)},f.addEventListener$3$x=function(e,t,n,r){return f.getInterceptor$x(e).addEventListener$3(e,t,n,r)},f.appendHtml$1$x=function(e,t){return f.getInterceptor$x(e).appendHtml$1(e,t)},f.createFragment$2$treeSanitizer$x=function(e,t,n){return f.getInterceptor$x(e).createFragment$2$treeSanitizer(e,t,n)},f.createFragment$3$treeSanitizer$validator$x=function(e,t,n,r){return f.getInterceptor$x(e).createFragment$3$treeSanitizer$validator(e,t,n,r)},f.elementAt$1$ax=function(e,t){return f.getInterceptor$ax(e).elementAt$1(e,t)},f.forEach$1$ax=function(e,t){return f.getInterceptor$ax(e).forEach$1(e,t)},f.get$className$x=function(e){return f.getInterceptor$x(e).get$className(e)},f.get$classes$x=function(e){return f.getInterceptor$x(e).get$classes(e)},f.get$error$x=function(e){return f.getInterceptor$x(e).get$error(e)},f.get$hashCode$=function(e){return f.getInterceptor(e).get$hashCode(e)},f.get$iterator$ax=function(e){return f.getInterceptor$ax(e).get$iterator(e)},f.get$lastChild$x=function(e){return f.getInterceptor$x(e).get$lastChild(e)},f.get$length$asx=function(e){return f.getInterceptor$asx(e).get$length(e)},f.get$name$x=function(e){return f.getInterceptor$x(e).get$name(e)},f.get$nodes$x=function(e){return f.getInterceptor$x(e).get$nodes(e)},f.get$onKeyDown$x=function(e){return f.getInterceptor$x(e).get$onKeyDown(e)},f.get$onKeyUp$x=function(e){return f.getInterceptor$x(e).get$onKeyUp(e)},f.get$responseText$x=function(e){return f.getInterceptor$x(e).get$responseText(e)},f.get$value$x=function(e){return f.getInterceptor$x(e).get$value(e)},f.remove$0$ax=function(e){return f.getInterceptor$ax(e).remove$0(e)},f.removeEventListener$3$x=function(e,t,n,r){return f.getInterceptor$x(e).removeEventListener$3(e,t,n,r)},f.send$1$x=function(e,t){return f.getInterceptor$x(e).send$1(e,t)},f.set$className$x=function(e,t){return f.getInterceptor$x(e).set$className(e,t)},f.set$href$x=function(e,t){return f.getInterceptor$x(e).set$href(e,t)},f.set$type$x=function(e,t){return f.getInterceptor$x(e).set$type(e,t)},f.setInnerHtml$2$validator$x=function(e,t,n){return f.getInterceptor$x(e).setInnerHtml$2$validator(e,t,n)},f.toList$0$ax=function(e){return f.getInterceptor$ax(e).toList$0(e)},f.toLowerCase$0$s=function(e){return f.getInterceptor$s(e).toLowerCase$0(e)},f.toString$0=function(e){return f.getInterceptor(e).toString$0(e)},f.trim$0$s=function(e){return f.getInterceptor$s(e).trim$0(e)},C.$lazy(e,"globalThis","globalThis","get$globalThis",function(){return function(){return this}()}),C.$lazy(e,"globalWindow","globalWindow","get$globalWindow",function(){return e.get$globalThis().window}),C.$lazy(e,"globalWorker","globalWorker","get$globalWorker",function(){return e.get$globalThis().Worker}),C.$lazy(e,"globalPostMessageDefined","globalPostMessageDefined","get$globalPostMessageDefined",function(){return e.get$globalThis().postMessage!==void 0}),C.$lazy(e,"thisScript","IsolateNatives_thisScript","get$IsolateNatives_thisScript",function(){return a.IsolateNatives_computeThisScript()}),C.$lazy(e,"workerIds","IsolateNatives_workerIds","get$IsolateNatives_workerIds",function(){return new v.Expando(null)}),C.$lazy(e,"noSuchMethodPattern","TypeErrorDecoder_noSuchMethodPattern","get$TypeErrorDecoder_noSuchMethodPattern",function(){return a.TypeErrorDecoder_extractPattern(a.TypeErrorDecoder_provokeCallErrorOn({toString:function(){return"$receiver$"}}))}),C.$lazy(e,"notClosurePattern","TypeErrorDecoder_notClosurePattern","get$TypeErrorDecoder_notClosurePattern",function(){return a.TypeErrorDecoder_extractPattern(a.TypeErrorDecoder_provokeCallErrorOn({$method$:null,toString:function(){return"$receiver$"}}))}),C.$lazy(e,"nullCallPattern","TypeErrorDecoder_nullCallPattern","get$TypeErrorDecoder_nullCallPattern",function(){return a.TypeErrorDecoder_extractPattern(a.TypeErrorDecoder_provokeCallErrorOn(null))}),C.$lazy(e,"nullLiteralCallPattern","TypeErrorDecoder_nullLiteralCallPattern","get$TypeErrorDecoder_nullLiteralCallPattern",function(){return a.TypeErrorDecoder_extractPattern(a.TypeErrorDecoder_provokeCallErrorOnNull())}),C.$lazy(e,"undefinedCallPattern","TypeErrorDecoder_undefinedCallPattern","get$TypeErrorDecoder_undefinedCallPattern",function(){return a.TypeErrorDecoder_extractPattern(a.TypeErrorDecoder_provokeCallErrorOn(void 0))}),C.$lazy(e,"undefinedLiteralCallPattern","TypeErrorDecoder_undefinedLiteralCallPattern","get$TypeErrorDecoder_undefinedLiteralCallPattern",function(){return a.TypeErrorDecoder_extractPattern(a.TypeErrorDecoder_provokeCallErrorOnUndefined())}),C.$lazy(e,"nullPropertyPattern","TypeErrorDecoder_nullPropertyPattern","get$TypeErrorDecoder_nullPropertyPattern",function(){return a.TypeErrorDecoder_extractPattern(a.TypeErrorDecoder_provokePropertyErrorOn(null))}),C.$lazy(e,"nullLiteralPropertyPattern","TypeErrorDecoder_nullLiteralPropertyPattern","get$TypeErrorDecoder_nullLiteralPropertyPattern",function(){return a.TypeErrorDecoder_extractPattern(a.TypeErrorDecoder_provokePropertyErrorOnNull())}),C.$lazy(e,"undefinedPropertyPattern","TypeErrorDecoder_undefinedPropertyPattern","get$TypeErrorDecoder_undefinedPropertyPattern",function(){return a.TypeErrorDecoder_extractPattern(a.TypeErrorDecoder_provokePropertyErrorOn(void 0))}),C.$lazy(e,"undefinedLiteralPropertyPattern","TypeErrorDecoder_undefinedLiteralPropertyPattern","get$TypeErrorDecoder_undefinedLiteralPropertyPattern",function(){return a.TypeErrorDecoder_extractPattern(a.TypeErrorDecoder_provokePropertyErrorOnUndefined())}),C.$lazy(e,"_toStringList","IterableMixinWorkaround__toStringList","get$IterableMixinWorkaround__toStringList",function(){return v.List_List(null,null)}),C.$lazy(e,"_asyncCallbacks","_asyncCallbacks","get$_asyncCallbacks",function(){return v.ListQueue$(null,{func:"void_","void":!0})}),C.$lazy(e,"_toStringVisiting","_toStringVisiting","get$_toStringVisiting",function(){return v.HashSet_HashSet$identity(null)}),C.$lazy(e,"_toStringList","Maps__toStringList","get$Maps__toStringList",function(){return v.List_List(null,null)}),C.$lazy(e,"_safeConsole","Console__safeConsole","get$Console__safeConsole",function(){return new S.Console}),C.$lazy(e,"_allowedElements","_Html5NodeValidator__allowedElements","get$_Html5NodeValidator__allowedElements",function(){var e=v.LinkedHashSet_LinkedHashSet(null,null,null,null);return e.addAll$1(e,["A","ABBR","ACRONYM","ADDRESS","AREA","ARTICLE","ASIDE","AUDIO","B","BDI","BDO","BIG","BLOCKQUOTE","BR","BUTTON","CANVAS","CAPTION","CENTER","CITE","CODE","COL","COLGROUP","COMMAND","DATA","DATALIST","DD","DEL","DETAILS","DFN","DIR","DIV","DL","DT","EM","FIELDSET","FIGCAPTION","FIGURE","FONT","FOOTER","FORM","H1","H2","H3","H4","H5","H6","HEADER","HGROUP","HR","I","IFRAME","IMG","INPUT","INS","KBD","LABEL","LEGEND","LI","MAP","MARK","MENU","METER","NAV","NOBR","OL","OPTGROUP","OPTION","OUTPUT","P","PRE","PROGRESS","Q","S","SAMP","SECTION","SELECT","SMALL","SOURCE","SPAN","STRIKE","STRONG","SUB","SUMMARY","SUP","TABLE","TBODY","TD","TEXTAREA","TFOOT","TH","THEAD","TIME","TR","TRACK","TT","U","UL","VAR","VIDEO","WBR"]),e}),C.$lazy(e,"_attributeValidators","_Html5NodeValidator__attributeValidators","get$_Html5NodeValidator__attributeValidators",function(){return a.fillLiteralMap([],v.LinkedHashMap_LinkedHashMap(null,null,null,null,null))}),A.functionAliases={},A.metadata=[],e=null,C=C.$finishIsolateConstructor(C),e=new C,t=L(t),n=L(n),r=L(r),i=L(i),s=L(s),o=L(o),u=L(u),a=L(a),f=L(f),l=L(l),c=L(c),h=L(h),p=L(p),d=L(d),v=L(v),m=L(m),g=L(g),y=L(y),b=L(b),w=L(w),E=L(E),S=L(S),x=L(x),T=L(T),N=L(N),!function(){var e=Object.prototype;for(var t=0;;t++){var n="___dart_dispatch_record_ZxYxX_0_";t>0&&(n=rootProperty+"_"+t);if(!(n in e))return A.dispatchPropertyName=n}}(),function(e){function n(r){for(var i=0;i<t.length;++i)t[i].removeEventListener("load",n,!1);e(r.target)}if(typeof document=="undefined"){e(null);return}if(document.currentScript){e(document.currentScript);return}var t=document.scripts;for(var r=0;r<t.length;++r)t[r].addEventListener("load",n,!1)}(function(e){A.currentScript=e,typeof dartMainRunner=="function"?dartMainRunner(function(){a.startRootIsolate(b.main$closure)}):a.startRootIsolate(b.main$closure)})})();
\ No newline at end of file
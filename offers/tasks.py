@@ -2,25 +2,37 @@ from celery import task
 from django.template.loader import render_to_string
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives, EmailMessage
-from offers.models import Comment, Offer, Like
+from django.utils import timezone
+from datetime import timedelta
+import uuid
+from offers.models import Comment, Offer, Like, FollowerMailing, NotificationEvent, Provider
+from accounts.models import UserProfile
 from django.contrib.auth.models import User
+from django.db.models import F, Min
+from offers.mail import mail_pool
+from offers.mail_templates import mail_renderer, get_site_url
+from offers.search_queue import process_queue
+from offers.logo_thumbnails import make_thumbnails, store_thumbnails
 
 
 def advanced_render_to_string(template_name, dictionary, context_instance=None):
-    context = dictionary
+    if context_instance is None:
+        return mail_renderer.render(template_name, dictionary)
 
-    if settings.SITE_URL.endswith('/'):
-        site_url = 'http://' + settings.SITE_URL[:-1]
-    else:
-        site_url = 'http://' + settings.SITE_URL
-
-    context.update({"site_url": site_url})
+    # Copy the dictionary so the caller's context is never changed
+    context = dict(dictionary)
+    context.update({"site_url": get_site_url()})
 
     return render_to_string(template_name, context, context_instance)
 
 
-@task()
-def send_mail(subject, message, message_plain, to):
+def build_mail(subject, message_plain, to, message=None):
+    """
+    Builds a mail with a plain text body and an optional html alternative
+    """
+    if message is None:
+        return EmailMessage(subject=subject, body=message_plain, from_email=settings.DEFAULT_FROM_EMAIL, to=[to])
+
     msg = EmailMultiAlternatives(
         subject,
         message_plain,
@@ -31,13 +43,36 @@ def send_mail(subject, message, message_plain, to):
         message,
         "text/html"
     )
-    msg.send()
+    return msg
+
+
+def wants_digest(user):
+    """
+    Whether the user gets their notifications in a digest instead of right away
+    """
+    return UserProfile.objects.filter(user=user, notification_mode=UserProfile.DIGEST).exists()
+
+
+@task()
+def send_mail(subject, message, message_plain, to):
+    mail_pool.send([build_mail(subject, message_plain, to, message)])
 
 
 @task()
 def send_plain_mail(subject, message, to):
-    email = EmailMessage(subject=subject, body=message, from_email=settings.DEFAULT_FROM_EMAIL, to=[to])
-    email.send()
+    mail_pool.send([build_mail(subject, message, to)])
+
+
+@task()
+def send_many(messages):
+    """
+    Sends a list of prepared mails over one connection. Every mail is a dict with a subject, a plain text body
+    (message_plain), a recipient (to) and an optional html body (message).
+    """
+    return mail_pool.send([
+        build_mail(message["subject"], message["message_plain"], message["to"], message.get("message"))
+        for message in messages
+    ])
 
 
 @task()
@@ -50,6 +85,15 @@ def send_comment_mail(comment_pk):
     if comment.reply_to is None:
         return
 
+    if wants_digest(comment.reply_to.commenter):
+        NotificationEvent.objects.create(
+            recipient=comment.reply_to.commenter,
+            kind=NotificationEvent.REPLY,
+            comment=comment,
+            actor_name=comment.commenter.username
+        )
+        return
+
     context = {"comment": comment}
 
     message = advanced_render_to_string('offers/email/comment_reply.html', context)
@@ -67,35 +111,111 @@ def send_new_comment_followers_mail(comment_pk, user_pk=None):
     if not Comment.objects.filter(pk=comment_pk).exists():
         return
 
-    current_user = None
-    if user_pk is not None:
-        current_user = User.objects.get(pk=user_pk)
-
-    comment = Comment.objects.get(pk=comment_pk)
-    context = {"comment": comment}
+    mailing = FollowerMailing.objects.create(
+        comment_id=comment_pk,
+        exclude_user_id=user_pk,
+        chain_token=uuid.uuid4().hex
+    )
+    send_followers_mail_chunk.delay(mailing.pk, mailing.chain_token, mailing.last_follower_pk)
+
+
+@task(acks_late=True)
+def send_followers_mail_chunk(mailing_pk, chain_token='', last_follower_pk=None):
+    """
+    Mails the next chunk of followers of a mailing over one connection and schedules the chunk after it. The next
+    chunk is delayed so no more than FOLLOWER_MAIL_RATE mails are sent per second.
+
+    :param chain_token: The chain of the mailing the task belongs to, the chain of a resumed mailing stops
+    :param last_follower_pk: The follower the chunk continues after, a chunk that was already sent is skipped
+    """
+    mailings = FollowerMailing.objects.filter(pk=mailing_pk, is_done=False, chain_token=chain_token)
+    if last_follower_pk is not None:
+        mailings = mailings.filter(last_follower_pk=last_follower_pk)
+    mailings = list(mailings.select_related('comment__offer', 'comment__commenter'))
+    if not mailings:
+        return
+    mailing = mailings[0]
+    # Progress is only recorded while the mailing is still where this task found it
+    claimed = FollowerMailing.objects.filter(
+        pk=mailing.pk, is_done=False, chain_token=chain_token, last_follower_pk=mailing.last_follower_pk
+    )
 
-    for countdown, user in enumerate(comment.offer.followers.all()):
+    followers = mailing.get_next_followers(settings.FOLLOWER_MAIL_CHUNK_SIZE)
+    if not followers:
+        claimed.update(is_done=True, updated_at=timezone.now())
+        return
 
-        if current_user == user:
+    comment = mailing.comment
+    subject = comment.commenter.username + ' replied to an offer you follow!'
+
+    contexts = []
+    events = []
+    for pk, email, first_name, last_name, notification_mode in followers:
+        if notification_mode == UserProfile.DIGEST:
+            events.append(NotificationEvent(
+                recipient_id=pk,
+                kind=NotificationEvent.NEW_COMMENT,
+                comment=comment,
+                actor_name=comment.commenter.username
+            ))
             continue
 
-        new_context = context
-        new_context.update({"email_user": user})
+        contexts.append({
+            "comment": comment,
+            "email_user": User(pk=pk, email=email, first_name=first_name, last_name=last_name),
+        })
+
+    messages = [
+        build_mail(subject, message_plain, context["email_user"].email, message)
+        for context, message_plain, message in zip(
+            contexts,
+            mail_renderer.render_many('offers/email/comment_new_plain.txt', contexts),
+            mail_renderer.render_many('offers/email/comment_new.html', contexts),
+        )
+    ]
+
+    # The chunk is claimed before it is sent, so of two tasks that found the mailing at the same place only one
+    # sends it. A chunk whose sending fails is not sent again.
+    if not claimed.update(
+        last_follower_pk=followers[-1][0],
+        sent_count=F('sent_count') + len(followers),
+        updated_at=timezone.now()
+    ):
+        # Claimed by another task or resumed by another chain meanwhile, which continues the mailing
+        return
+
+    NotificationEvent.objects.bulk_create(events)
+    mail_pool.send(messages)
+
+    send_followers_mail_chunk.apply_async(
+        args=[mailing.pk, chain_token, followers[-1][0]],
+        countdown=float(len(messages)) / settings.FOLLOWER_MAIL_RATE
+    )
 
-        message = advanced_render_to_string('offers/email/comment_new.html', new_context)
-        message_plain = advanced_render_to_string('offers/email/comment_new_plain.txt', new_context)
 
-        send_mail.s(
-            subject=comment.commenter.username + ' replied to an offer you follow!',
-            message=message,
-            message_plain=message_plain,
-            to=user.email,
-        ).apply_async(countdown=countdown)
+@task()
+def resume_follower_mailings():
+    """
+    Restarts the mailings that didn't make progress for a while, for example because their worker crashed. A resumed
+    mailing gets a new chain, so a chunk task of the old chain that is still waiting in the broker stops instead of
+    mailing the followers a second time.
+    """
+    stalled_at = timezone.now() - timedelta(seconds=settings.FOLLOWER_MAIL_RESUME_AFTER)
+    stalled = FollowerMailing.objects.filter(is_done=False, updated_at__lt=stalled_at).values_list(
+        'pk', 'updated_at', 'last_follower_pk'
+    )
+    for mailing_pk, updated_at, last_follower_pk in stalled:
+        chain_token = uuid.uuid4().hex
+        # Only one run claims a mailing, a mailing that made progress meanwhile isn't stalled
+        if FollowerMailing.objects.filter(pk=mailing_pk, updated_at=updated_at).update(
+                chain_token=chain_token, updated_at=timezone.now()):
+            send_followers_mail_chunk.delay(mailing_pk, chain_token, last_follower_pk)
 
 
 @task()
 def publish_latest_offer():
-    offers = Offer.objects.filter(status=Offer.UNPUBLISHED, is_request=True, is_ready=True).order_by('readied_at')
+    # The first ready request in the publish queue
+    offers = Offer.objects.filter(queue_rank__isnull=False).order_by('queue_rank')
     if not offers.exists():
         return
 
@@ -115,14 +235,17 @@ def publish_offer(offer_pk):
 
     offer = offers[0]
 
-    for user_profile in offer.provider.owners.all():
-        user = user_profile.user
-        offer.followers.add(user)
-        send_plain_mail.s(
-            'Your offer has been published!',
-            advanced_render_to_string('offers/email/provider_offer_published.txt', {"offer": offer, "user": user}),
-            user.email
-        ).apply_async(countdown=5)
+    users = [user_profile.user for user_profile in offer.provider.owners.select_related('user')]
+    if not users:
+        return
+    offer.followers.add(*users)
+
+    messages = mail_renderer.render_many(
+        'offers/email/provider_offer_published.txt',
+        [{"offer": offer, "user": user} for user in users]
+    )
+    for user, message in zip(users, messages):
+        send_plain_mail.s('Your offer has been published!', message, user.email).apply_async(countdown=5)
 
 
 @task()
@@ -131,6 +254,15 @@ def send_comment_like(like_pk):
         return
     like = Like.objects.get(pk=like_pk)
 
+    if wants_digest(like.comment.commenter):
+        NotificationEvent.objects.create(
+            recipient=like.comment.commenter,
+            kind=NotificationEvent.LIKE,
+            comment=like.comment,
+            actor_name=like.user.username
+        )
+        return
+
     send_plain_mail.s(
         like.user.username + u' has liked your comment!',
         advanced_render_to_string('offers/email/comment_like.txt', {"comment": like.comment, "liker": like.user}),
@@ -144,6 +276,15 @@ def send_comment_unlike(comment_pk, liker_name):
         return
     comment = Comment.objects.get(pk=comment_pk)
 
+    if wants_digest(comment.commenter):
+        NotificationEvent.objects.create(
+            recipient=comment.commenter,
+            kind=NotificationEvent.UNLIKE,
+            comment=comment,
+            actor_name=liker_name
+        )
+        return
+
     send_plain_mail.s(
         liker_name + u' has unliked your comment!',
         advanced_render_to_string('offers/email/comment_unlike.txt', {
@@ -153,3 +294,97 @@ def send_comment_unlike(comment_pk, liker_name):
         comment.commenter.email
     ).apply_async()
 
+
+@task()
+def send_notification_digests():
+    """
+    Mails the digest of every user whose oldest waiting notification is older than NOTIFICATION_DIGEST_WINDOW. Likes
+    and unlikes that cancel each other out are left out, and a user with nothing left isn't mailed at all. The users
+    are mailed in batches of NOTIFICATION_DIGEST_BATCH_SIZE, which keeps the queries below the parameter limit of
+    SQLite.
+    """
+    window_start = timezone.now() - timedelta(seconds=settings.NOTIFICATION_DIGEST_WINDOW)
+    recipient_pks = NotificationEvent.objects.filter(sent_at__isnull=True).values('recipient').annotate(
+        first_created_at=Min('created_at')
+    ).filter(first_created_at__lte=window_start).values_list('recipient', flat=True)
+    recipient_pks = sorted(recipient_pks)
+
+    batch_size = settings.NOTIFICATION_DIGEST_BATCH_SIZE
+    for start in range(0, len(recipient_pks), batch_size):
+        send_notification_digest_batch(recipient_pks[start:start + batch_size])
+
+
+def send_notification_digest_batch(recipient_pks):
+    """
+    Mails the digests of a batch of users and marks their notifications as sent
+    """
+    events_by_recipient = {}
+    last_event_pk = None
+    events = NotificationEvent.objects.filter(sent_at__isnull=True, recipient__in=recipient_pks).select_related(
+        'recipient', 'comment__offer'
+    ).order_by('created_at', 'pk')
+    for event in events:
+        events_by_recipient.setdefault(event.recipient_id, []).append(event)
+        last_event_pk = max(last_event_pk, event.pk)
+    if last_event_pk is None:
+        return
+
+    contexts = []
+    for recipient_events in events_by_recipient.values():
+        notifications = NotificationEvent.coalesce(recipient_events)
+        if notifications:
+            contexts.append({"recipient": recipient_events[0].recipient, "notifications": notifications})
+
+    messages = []
+    for context, message in zip(contexts, mail_renderer.render_many('offers/email/notification_digest.txt', contexts)):
+        count = len(context["notifications"])
+        subject = u'You have {0} new notification{1}'.format(count, 's' if count > 1 else '')
+        messages.append(build_mail(subject, message, context["recipient"].email))
+
+    mail_pool.send(messages)
+    # Notifications created meanwhile come after the ones that were mailed, they wait for the next digest
+    NotificationEvent.objects.filter(
+        sent_at__isnull=True, recipient__in=recipient_pks, pk__lte=last_event_pk
+    ).update(sent_at=timezone.now())
+
+
+@task()
+def update_search_index():
+    """
+    Indexes the queued offers in batches of SEARCH_INDEX_BATCH_SIZE. Offers queued while the task runs are left for
+    the next run.
+
+    :return: The number of offers indexed
+    """
+    started_at = timezone.now()
+    total = 0
+    while True:
+        count = process_queue(settings.SEARCH_INDEX_BATCH_SIZE, queued_before=started_at)
+        total += count
+        if count < settings.SEARCH_INDEX_BATCH_SIZE:
+            return total
+
+
+@task()
+def generate_logo_thumbnails(provider_pk, logo_name=None, attempt=0):
+    """
+    Generates the thumbnails of the current logo of a provider and stores them on the provider
+
+    :param logo_name: The logo the thumbnails are for. The task is queued before the transaction that saves the logo
+                      commits, while the provider has another logo it tries again later. Without a name the stored
+                      logo is used.
+    :param attempt: The number of times the task already waited for the logo
+    :return: If the thumbnails were stored
+    """
+    logos = Provider.objects.filter(pk=provider_pk).values_list('logo', flat=True)
+    if not logos:
+        return False
+
+    if logo_name is not None and logos[0] != logo_name:
+        # Not committed yet, or replaced meanwhile by a logo that queued its own task
+        if attempt < settings.PROVIDER_LOGO_RETRIES:
+            generate_logo_thumbnails.apply_async(
+                args=[provider_pk, logo_name, attempt + 1], countdown=settings.PROVIDER_LOGO_RETRY_DELAY
+            )
+        return False
+    return store_thumbnails(provider_pk, make_thumbnails(logos[0]))
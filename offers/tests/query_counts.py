@@ -0,0 +1,44 @@
+from django.core.cache import get_cache
+from django.db import connection
+from django.templatetags import cache as cache_tags
+from django.test.utils import CaptureQueriesContext
+from offers import models as offer_models
+
+
+class QueryCountMixin(object):
+    """
+    Checks that a page loads its rows in a fixed number of queries, no matter how many rows it shows. The offer html
+    and template fragment caches are swapped for a local memory cache so that only the queries of the page are
+    counted. The test case makes its rows with ``make_rows``.
+    """
+    # The number of rows added to the first one before counting again
+    more_rows = 4
+
+    def setUp(self):
+        super(QueryCountMixin, self).setUp()
+        self.old_cache = offer_models.cache
+        self.old_fragment_cache = cache_tags.cache
+        offer_models.cache = cache_tags.cache = get_cache('django.core.cache.backends.locmem.LocMemCache')
+
+    def tearDown(self):
+        offer_models.cache = self.old_cache
+        cache_tags.cache = self.old_fragment_cache
+        super(QueryCountMixin, self).tearDown()
+
+    def make_rows(self, quantity):
+        raise NotImplementedError
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def assert_constant_queries(self, url):
+        self.make_rows(1)
+        # Warm up the per process caches (such as the current site) first
+        self.client.get(url)
+        single_row_queries = self.count_queries(url)
+
+        self.make_rows(self.more_rows)
+        self.assertEqual(self.count_queries(url), single_row_queries)
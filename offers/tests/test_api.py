@@ -0,0 +1,111 @@
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from offers.models import Offer, Plan, Provider, Location, Datacenter
+from model_mommy import mommy
+import json
+
+
+class PlanSearchResourceTests(TestCase):
+    url = '/find/data/main/plan_search/'
+
+    def setUp(self):
+        self.provider = mommy.make(Provider)
+        self.datacenter = mommy.make(Datacenter)
+
+    def make_plans(self, quantity, **kwargs):
+        offer = mommy.make(Offer, provider=self.provider, status=Offer.PUBLISHED, is_active=True, is_request=False)
+        locations = mommy.make(Location, _quantity=2, provider=self.provider, datacenter=self.datacenter)
+        kwargs.setdefault('is_active', True)
+        return [mommy.make(Plan, offer=offer, locations=locations, **kwargs) for i in range(quantity)]
+
+    def get(self, url=None, **params):
+        """
+        Gets the search results, the next links already contain their parameters
+        """
+        if url is None:
+            response = self.client.get(self.url, dict({"format": "json"}, **params))
+        else:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content)
+
+    def count_queries(self, **params):
+        with CaptureQueriesContext(connection) as context:
+            self.get(**params)
+        return len(context.captured_queries)
+
+    def test_queries_do_not_grow_with_plans(self):
+        """
+        Test that a page of 2 plans uses the same number of queries as a page of 20 plans
+        """
+        self.make_plans(2)
+        self.get()
+        two_plan_queries = self.count_queries()
+
+        for i in range(6):
+            self.make_plans(3)
+        self.assertEqual(self.count_queries(), two_plan_queries)
+        self.assertLessEqual(two_plan_queries, 3)
+
+    def test_html_is_rendered(self):
+        """
+        Test that the listing html is rendered for every plan, unless it isn't wanted
+        """
+        plan = self.make_plans(1)[0]
+
+        data = self.get()
+        self.assertEqual(len(data["objects"]), 1)
+        self.assertIn(plan.offer.name, data["objects"][0]["html"])
+        self.assertEqual(len(data["objects"][0]["locations"]), 2)
+
+        data = self.get(html='false')
+        self.assertNotIn("html", data["objects"][0])
+
+    def test_inactive_plans_are_not_listed(self):
+        """
+        Test that only active plans of published offers are found
+        """
+        self.make_plans(1, is_active=False)
+        self.assertEqual(self.get()["objects"], [])
+
+    def test_cursor_pagination(self):
+        """
+        Test that following the next links returns every plan once in order
+        """
+        costs = [5, 5, 10, 3, 8, 5, 12]
+        for cost in costs:
+            self.make_plans(1, cost=cost)
+
+        data = self.get(order_by='cost', limit=2)
+        seen = []
+        while True:
+            seen.extend(plan["id"] for plan in data["objects"])
+            if data["meta"]["next"] is None:
+                break
+            data = self.get(data["meta"]["next"])
+
+        expected = list(Plan.objects.order_by('cost', 'pk').values_list('pk', flat=True))
+        self.assertEqual(seen, expected)
+
+    def test_cursor_pagination_descending(self):
+        """
+        Test that the cursor pagination works with a descending order
+        """
+        plans = self.make_plans(5)
+        # Plans created at the same time are ordered by their primary key
+        Plan.objects.update(created_at=plans[0].created_at)
+
+        first_page = self.get(order_by='-created_at', limit=3)
+        second_page = self.get(first_page["meta"]["next"])
+
+        self.assertEqual([plan["id"] for plan in first_page["objects"]], [plan.pk for plan in reversed(plans)][:3])
+        self.assertEqual([plan["id"] for plan in second_page["objects"]], [plan.pk for plan in reversed(plans)][3:])
+        self.assertIsNone(second_page["meta"]["next"])
+
+    def test_invalid_cursor(self):
+        """
+        Test that an invalid cursor is refused
+        """
+        response = self.client.get(self.url, {"format": "json", "cursor": "invalid"})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,146 @@
+from unittest import skipUnless
+from django.test import TestCase
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from StringIO import StringIO
+from offers.models import Offer, Plan, Comment, Like, Location
+from offers.benchmark_data import seed
+from offers.benchmarks import compare, load_results
+from offers.sqlite_search import get_missing_features
+import os
+import shutil
+import tempfile
+
+
+class BenchmarkDataTests(TestCase):
+    def test_seed_creates_the_dataset(self):
+        """
+        Test that seeding creates the offers with their plans and comments, with their dates spread out
+        """
+        created = seed(offers=40, plans_per_offer=2, comments_per_offer=3)
+
+        self.assertEqual(created["offers"], 40)
+        self.assertEqual(Offer.objects.count(), 40)
+        self.assertEqual(Plan.objects.count(), 80)
+        self.assertEqual(Comment.objects.count(), 120)
+        self.assertTrue(Offer.active_offers.exists())
+
+        first, last = Offer.objects.order_by('pk')[0], Offer.objects.order_by('-pk')[0]
+        self.assertLess(first.published_at, last.published_at)
+
+    def test_seed_creates_the_relations(self):
+        """
+        Test that the plans are placed in the locations of their provider and that the comments get likes and the
+        offers followers
+        """
+        created = seed(offers=20, plans_per_offer=2, comments_per_offer=2, likes_per_comment=1,
+                       followers_per_offer=2, users=10, datacenters=3, locations_per_provider=2)
+
+        self.assertEqual(Location.objects.count(), created["locations"])
+        self.assertEqual(Like.objects.count(), created["likes"])
+        self.assertEqual(Offer.followers.through.objects.count(), 40)
+        for plan in Plan.objects.prefetch_related('locations'):
+            self.assertTrue(plan.locations.all())
+            for location in plan.locations.all():
+                self.assertEqual(location.provider_id, plan.offer.provider_id)
+
+    def test_seeds_do_not_collide(self):
+        """
+        Test that the dataset can be seeded more than once
+        """
+        seed(offers=5)
+        seed(offers=5)
+        self.assertEqual(Offer.objects.count(), 10)
+
+
+class ExplainQueriesCommandTests(TestCase):
+    def test_explains_every_manager_query(self):
+        """
+        Test that the command prints a timing and a query plan for the manager queries
+        """
+        out = StringIO()
+        call_command('explain_queries', seed=20, repeat=1, stdout=out)
+        output = out.getvalue()
+
+        self.assertIn('Created', output)
+        for name in ('visible offers', 'active offers', 'requests of a provider', 'active plans of an offer',
+                     'visible comments of an offer'):
+            self.assertIn('== ' + name + ':', output)
+        self.assertIn('offers_offer', output)
+
+
+class BenchmarkSuiteTests(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.baseline = os.path.join(self.directory, 'baseline.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_compare(self):
+        """
+        Test that values that grew more than the tolerance are regressions
+        """
+        baseline = {"view_offer": {"p50": 10.0, "p95": 20.0, "queries": 5}}
+        results = {"view_offer": {"p50": 11.0, "p95": 30.0, "queries": 5}, "search": {"p50": 1.0}}
+
+        comparison = dict((row["field"], row) for row in compare(results, baseline, tolerance=0.2))
+        self.assertEqual(sorted(comparison), ['p50', 'p95', 'queries'])
+        self.assertFalse(comparison["p50"]["regressed"])
+        self.assertTrue(comparison["p95"]["regressed"])
+        self.assertAlmostEqual(comparison["p95"]["change"], 0.5)
+
+    def test_commands(self):
+        """
+        Test that a generated dataset can be benchmarked, stored as a baseline and compared with it
+        """
+        out = StringIO()
+        call_command('generate_benchmark_data', scale='tiny', offers=10, stdout=out)
+        self.assertIn('10 offers', out.getvalue())
+        self.assertEqual(Offer.objects.count(), 10)
+
+        out = StringIO()
+        call_command('run_benchmarks', requests=2, warmup=0, save_baseline=self.baseline, stdout=out)
+        results = load_results(self.baseline)
+
+        for name in ('list_offers', 'view_offer', 'provider_profile', 'plan_api', 'search', 'feeds',
+                     'like_comment'):
+            self.assertIn(name, results)
+            self.assertEqual(results[name]["errors"], 0)
+            self.assertGreater(results[name]["queries"], 0)
+            self.assertIn(name, out.getvalue())
+
+        # Typed by several clients at once, the suggestions come from the search index
+        self.assertEqual(results["autocomplete"]["concurrency"], 4)
+        self.assertEqual(results["autocomplete"]["errors"], 0)
+        self.assertIsNotNone(results["autocomplete"]["p95"])
+
+        out = StringIO()
+        call_command('run_benchmarks', requests=2, warmup=0, scenarios=['feeds'], baseline=self.baseline, stdout=out)
+        self.assertIn('feeds              queries', out.getvalue())
+        self.assertNotIn('view_offer', out.getvalue())
+
+        self.assertRaises(CommandError, call_command, 'run_benchmarks', scenarios=['unknown'], stdout=StringIO())
+
+    @skipUnless(not get_missing_features(), 'The SQLite of this Python has no FTS5 or JSON1')
+    def test_compare_search_backends(self):
+        """
+        Test that every search backend indexes the same offers and is timed for every kind of search
+        """
+        call_command('generate_benchmark_data', scale='tiny', offers=10, stdout=StringIO())
+        results_path = os.path.join(self.directory, 'search.json')
+
+        out = StringIO()
+        call_command('compare_search_backends', requests=2, save=results_path, stdout=out)
+        results = load_results(results_path)
+
+        self.assertEqual(sorted(results), ['sqlite', 'whoosh'])
+        for name in ('sqlite', 'whoosh'):
+            self.assertEqual(results[name]["documents"], Offer.visible_offers.count())
+            self.assertGreater(results[name]["size"], 0)
+            for kind in ('text', 'prefix', 'filtered', 'text_during_writes'):
+                self.assertIsNotNone(results[name][kind]["p95"])
+        self.assertIn('text_during_writes   sqlite', out.getvalue())
+
+        self.assertRaises(CommandError, call_command, 'compare_search_backends', backends=['unknown'],
+                          stdout=StringIO())
@@ -0,0 +1,165 @@
+from io import BytesIO
+from PIL import Image
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.core.urlresolvers import reverse
+from django.test import TestCase
+from django.test.utils import override_settings
+from model_mommy import mommy
+from offers.models import Offer, Provider, SearchIndexQueue
+from offers.tasks import generate_logo_thumbnails
+from StringIO import StringIO
+import json
+import shutil
+import tempfile
+
+
+def make_logo(size=(600, 300), mode='RGB', image_format='JPEG'):
+    content = BytesIO()
+    Image.new(mode, size).save(content, image_format)
+    return ContentFile(content.getvalue())
+
+
+class LogoThumbnailTests(TestCase):
+    """
+    The logos and their thumbnails are stored in a temporary media directory for every test.
+    """
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.directory, MEDIA_URL='/media/')
+        self.settings_override.enable()
+        self.provider = mommy.make(Provider, name=u'Logo Hosting')
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.directory)
+
+    def thumbnail_names(self, provider):
+        return json.loads(Provider.objects.get(pk=provider.pk).logo_thumbnails_data).get("files", [])
+
+    def test_thumbnails_are_generated_when_the_logo_changes(self):
+        """
+        Test that a new logo is cropped to every size, in its own format and as WebP, and that the provider shows them
+        """
+        offer = mommy.make(Offer, status=Offer.PUBLISHED, provider=self.provider)
+        SearchIndexQueue.objects.all().delete()
+        updated_at = Provider.objects.get(pk=self.provider.pk).updated_at
+
+        self.provider.logo.save('logo.jpg', make_logo())
+        provider = Provider.objects.get(pk=self.provider.pk)
+
+        small = provider.get_small_profile_image()
+        large = provider.get_large_profile_image()
+        self.assertEqual((small["width"], small["height"]), (200, 200))
+        self.assertEqual((large["width"], large["height"]), (400, 400))
+        self.assertTrue(small["url"].startswith('/media/provider_logos/thumbnails/'))
+        self.assertTrue(small["url"].endswith('_200x200.jpg'))
+        self.assertTrue(small["webp_url"].endswith('_200x200.webp'))
+
+        self.assertEqual(len(self.thumbnail_names(provider)), 4)
+        for name in self.thumbnail_names(provider):
+            self.assertTrue(default_storage.exists(name))
+        self.assertEqual(Image.open(default_storage.open(large["url"][len('/media/'):])).size, (400, 400))
+
+        # The cached cards and the search documents show the thumbnails
+        self.assertGreater(provider.updated_at, updated_at)
+        self.assertEqual(list(SearchIndexQueue.objects.values_list('offer_id', flat=True)), [offer.pk])
+
+    def test_transparent_logos_stay_transparent(self):
+        """
+        Test that the thumbnails of a logo with transparency are saved as PNG
+        """
+        self.provider.logo.save('logo.png', make_logo(mode='RGBA', image_format='PNG'))
+        small = Provider.objects.get(pk=self.provider.pk).get_small_profile_image()
+        self.assertTrue(small["url"].endswith('_200x200.png'))
+
+    def test_replaced_logos_lose_their_thumbnails(self):
+        """
+        Test that the thumbnails of a replaced or removed logo are deleted and that the provider shows the new logo
+        """
+        self.provider.logo.save('logo.jpg', make_logo())
+        old_names = self.thumbnail_names(self.provider)
+
+        self.provider.logo.save('new.jpg', make_logo())
+        new_names = self.thumbnail_names(self.provider)
+        self.assertFalse(set(old_names) & set(new_names))
+        for name in old_names:
+            self.assertFalse(default_storage.exists(name))
+
+        provider = Provider.objects.get(pk=self.provider.pk)
+        provider.logo = ''
+        provider.save()
+        provider = Provider.objects.get(pk=self.provider.pk)
+        self.assertEqual(provider.get_small_profile_image()["url"], '/static/img/no_logo_small.png')
+        for name in new_names:
+            self.assertFalse(default_storage.exists(name))
+
+    def test_logos_without_thumbnails_are_shown_as_they_are(self):
+        """
+        Test that the logo itself is shown until its thumbnails are generated
+        """
+        self.provider.logo.save('logo.jpg', make_logo())
+        Provider.objects.filter(pk=self.provider.pk).update(logo_thumbnails_data='{}')
+        provider = Provider.objects.get(pk=self.provider.pk)
+
+        self.assertEqual(provider.get_large_profile_image(), {"url": provider.logo.url, "width": 400, "height": 400})
+
+    def test_the_task_waits_for_the_saved_logo(self):
+        """
+        Test that the task doesn't make thumbnails of another logo than the one that was saved, like the previous logo
+        while the new one isn't committed yet
+        """
+        self.provider.logo.save('logo.jpg', make_logo())
+        logo_name = Provider.objects.get(pk=self.provider.pk).logo.name
+        Provider.objects.filter(pk=self.provider.pk).update(logo_thumbnails_data='{}')
+
+        with self.settings(PROVIDER_LOGO_RETRY_DELAY=0):
+            self.assertFalse(generate_logo_thumbnails(self.provider.pk, 'provider_logos/uncommitted.jpg'))
+        self.assertEqual(self.thumbnail_names(self.provider), [])
+
+        self.assertTrue(generate_logo_thumbnails(self.provider.pk, logo_name))
+        self.assertEqual(len(self.thumbnail_names(self.provider)), 4)
+
+    def test_backfill_command(self):
+        """
+        Test that the command generates the missing thumbnails in a pool of processes and reports broken logos
+        """
+        self.provider.logo.save('logo.jpg', make_logo())
+        others = mommy.make(Provider, _quantity=3)
+        for other in others:
+            other.logo.save('logo.jpg', make_logo())
+        broken = mommy.make(Provider, name=u'Broken Hosting')
+        Provider.objects.filter(pk=broken.pk).update(
+            logo=default_storage.save('provider_logos/broken.jpg', ContentFile('not an image'))
+        )
+        Provider.objects.filter(pk__in=[other.pk for other in others]).update(logo_thumbnails_data='{}')
+
+        out, err = StringIO(), StringIO()
+        call_command('generate_logo_thumbnails', processes=2, stdout=out, stderr=err)
+        self.assertIn('Generated the thumbnails of 3 logos, 1 failed.', out.getvalue())
+        self.assertIn('Provider #{0}: '.format(broken.pk), err.getvalue())
+        for other in others:
+            self.assertIn('small', Provider.objects.get(pk=other.pk).get_logo_thumbnails())
+
+        Provider.objects.filter(pk=broken.pk).update(logo='')
+        out = StringIO()
+        call_command('generate_logo_thumbnails', stdout=out)
+        self.assertIn('All logos have their thumbnails.', out.getvalue())
+
+        # A new size is generated for every logo
+        with self.settings(PROVIDER_LOGO_SIZES={'small': (200, 200), 'large': (400, 400), 'tiny': (32, 32)}):
+            out = StringIO()
+            call_command('generate_logo_thumbnails', processes=1, stdout=out)
+            self.assertIn('Generated the thumbnails of 4 logos, 0 failed.', out.getvalue())
+
+    def test_pages_offer_the_webp_thumbnails(self):
+        """
+        Test that the profile page offers the WebP thumbnail to the browsers that support it
+        """
+        self.provider.logo.save('logo.jpg', make_logo())
+        large = Provider.objects.get(pk=self.provider.pk).get_large_profile_image()
+
+        response = self.client.get(reverse('offer:provider', args=[self.provider.name_slug]))
+        self.assertContains(response, '<source srcset="{0}" type="image/webp" />'.format(large["webp_url"]))
+        self.assertContains(response, '<img src="{0}" width="400" height="400"'.format(large["url"]))
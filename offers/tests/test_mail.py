@@ -0,0 +1,186 @@
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.template import loader
+from django.template.loaders import cached
+from django.contrib.auth.models import User
+from offers.mail import ConnectionPool, mail_pool
+from offers.mail_templates import MailRenderer, mail_renderer
+from offers.models import Comment
+from offers.tasks import send_many, send_mail, build_mail
+from model_mommy import mommy
+import smtplib
+
+
+class CountingBackend(EmailBackend):
+    """
+    A local memory backend that counts the connections it opens and can drop them like an SMTP server
+    """
+    opened = 0
+    closed = 0
+    disconnect = 0
+
+    def open(self):
+        CountingBackend.opened += 1
+        return True
+
+    def close(self):
+        CountingBackend.closed += 1
+
+    def send_messages(self, messages):
+        if CountingBackend.disconnect:
+            CountingBackend.disconnect -= 1
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        return super(CountingBackend, self).send_messages(messages)
+
+
+@override_settings(EMAIL_BACKEND='offers.tests.test_mail.CountingBackend')
+class ConnectionPoolTests(TestCase):
+    def setUp(self):
+        mail_pool.close_all()
+        CountingBackend.opened = 0
+        CountingBackend.closed = 0
+        CountingBackend.disconnect = 0
+
+    def tearDown(self):
+        mail_pool.close_all()
+
+    def make_messages(self, quantity):
+        return [build_mail('Subject', 'Body', 'user{0}@example.com'.format(i)) for i in range(quantity)]
+
+    def test_connections_are_reused(self):
+        """
+        Test that messages sent one after another share one connection
+        """
+        pool = ConnectionPool(size=1, max_messages=100, keepalive=60)
+
+        for message in self.make_messages(5):
+            pool.send([message])
+
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(CountingBackend.opened, 1)
+        self.assertEqual(CountingBackend.closed, 0)
+
+        pool.close_all()
+        self.assertEqual(CountingBackend.closed, 1)
+
+    def test_messages_per_connection_are_limited(self):
+        """
+        Test that a connection is replaced after it sent the maximum number of messages
+        """
+        pool = ConnectionPool(size=1, max_messages=2, keepalive=60)
+
+        self.assertEqual(pool.send(self.make_messages(5)), 5)
+
+        self.assertEqual(CountingBackend.opened, 3)
+        self.assertEqual(CountingBackend.closed, 2)
+
+    def test_idle_connections_expire(self):
+        """
+        Test that a connection that was idle for longer than the keepalive is not reused
+        """
+        pool = ConnectionPool(size=1, max_messages=100, keepalive=0)
+
+        pool.send(self.make_messages(1))
+        pool._idle[0].last_used -= 1
+        pool.send(self.make_messages(1))
+
+        self.assertEqual(CountingBackend.opened, 2)
+        self.assertEqual(CountingBackend.closed, 1)
+
+    def test_broken_connections_reconnect(self):
+        """
+        Test that a message is sent again over a new connection when the server dropped the connection
+        """
+        pool = ConnectionPool(size=1, max_messages=100, keepalive=60)
+        CountingBackend.disconnect = 1
+
+        self.assertEqual(pool.send(self.make_messages(2)), 2)
+
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(CountingBackend.opened, 2)
+
+    def test_send_many(self):
+        """
+        Test that send_many delivers every message over one connection
+        """
+        send_many.delay([
+            {"subject": "Plain", "message_plain": "Body", "to": "plain@example.com"},
+            {"subject": "Html", "message_plain": "Body", "message": "<p>Body</p>", "to": "html@example.com"},
+        ])
+
+        self.assertEqual([message.to for message in mail.outbox], [["plain@example.com"], ["html@example.com"]])
+        self.assertEqual(mail.outbox[1].alternatives, [("<p>Body</p>", "text/html")])
+        self.assertEqual(CountingBackend.opened, 1)
+
+    def test_mail_tasks_use_the_pool(self):
+        """
+        Test that the mail tasks reuse the pooled connection
+        """
+        for i in range(3):
+            send_mail.delay('Subject', '<p>Body</p>', 'Body', 'user@example.com')
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(CountingBackend.opened, 1)
+
+
+class MailRendererTests(TestCase):
+    def setUp(self):
+        self.compiled = []
+        self.get_template_from_string = loader.get_template_from_string
+
+        def counting_get_template_from_string(source, origin=None, name=None):
+            self.compiled.append(name)
+            return self.get_template_from_string(source, origin, name)
+
+        loader.get_template_from_string = counting_get_template_from_string
+        cached.get_template_from_string = counting_get_template_from_string
+
+        self.comment = mommy.make(Comment)
+        self.users = [User(pk=i, email='user{0}@example.com'.format(i), first_name='First{0}'.format(i))
+                      for i in range(1, 4)]
+
+    def tearDown(self):
+        loader.get_template_from_string = self.get_template_from_string
+        cached.get_template_from_string = self.get_template_from_string
+
+    def render_many(self, renderer):
+        return renderer.render_many(
+            'offers/email/comment_new.html',
+            [{"comment": self.comment, "email_user": user} for user in self.users]
+        )
+
+    def test_templates_are_compiled_once(self):
+        """
+        Test that a template and the template it extends are compiled once, no matter how often they are rendered
+        """
+        renderer = MailRenderer()
+        self.render_many(renderer)
+        self.render_many(renderer)
+
+        self.assertEqual(sorted(self.compiled), ['base_email.html', 'offers/email/comment_new.html'])
+
+    def test_every_recipient_gets_their_own_context(self):
+        """
+        Test that the templates are rendered for every context and share the base context
+        """
+        with self.settings(SITE_URL='example.com/'):
+            rendered = self.render_many(mail_renderer)
+
+        self.assertEqual(len(rendered), 3)
+        for user, html in zip(self.users, rendered):
+            self.assertIn(user.first_name, html)
+            self.assertIn('http://example.com' + self.comment.offer.get_absolute_url(), html)
+            for other in self.users:
+                if other != user:
+                    self.assertNotIn(other.first_name + ' ', html)
+
+    def test_changed_settings_reset_the_base_context(self):
+        """
+        Test that the base context is built again when the url of the site changes
+        """
+        with self.settings(SITE_URL='one.example.com'):
+            self.assertEqual(mail_renderer.get_base_context()["site_url"], 'http://one.example.com')
+        with self.settings(SITE_URL='two.example.com'):
+            self.assertEqual(mail_renderer.get_base_context()["site_url"], 'http://two.example.com')
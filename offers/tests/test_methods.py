@@ -1,5 +1,5 @@
 from django.test import TestCase
-from offers.models import Offer, Provider, Plan, Comment, Location, Like
+from offers.models import Offer, Provider, Plan, Comment, CommentThread, Location, Like
 from model_mommy import mommy
 from django.core.files import File
 from django.conf import settings
@@ -305,6 +305,84 @@ class OfferMethodTests(TestCase):
 
         self.assertEqual(self.offer.queue_position(), None)
 
+    def make_queue(self, quantity):
+        self.offer.delete()
+        offers = mommy.make(Offer, _quantity=quantity, status=Offer.UNPUBLISHED, is_ready=True, is_request=True)
+        return offers
+
+    def get_queue(self):
+        return list(Offer.objects.filter(queue_rank__isnull=False).order_by('queue_rank').values_list(
+            'pk', 'queue_rank'
+        ))
+
+    def test_queue_ranks_are_updated_incrementally(self):
+        """
+        Test that the offers after an offer that leaves the queue move up, and an offer that is readied again is
+        placed at the end
+        """
+        offers = self.make_queue(4)
+
+        offers[1].is_ready = False
+        offers[1].save()
+        self.assertEqual(self.get_queue(), [(offers[0].pk, 1), (offers[2].pk, 2), (offers[3].pk, 3)])
+        self.assertIsNone(offers[1].queue_position())
+
+        offers[1].is_ready = True
+        offers[1].save()
+        self.assertEqual(self.get_queue(), [(offers[0].pk, 1), (offers[2].pk, 2), (offers[3].pk, 3),
+                                            (offers[1].pk, 4)])
+
+        offers[2].delete()
+        self.assertEqual(self.get_queue(), [(offers[0].pk, 1), (offers[3].pk, 2), (offers[1].pk, 3)])
+
+    def test_saving_a_stale_offer_keeps_the_queue(self):
+        """
+        Test that saving an offer that was loaded before the queue moved doesn't write back its old rank
+        """
+        offers = self.make_queue(3)
+        stale = Offer.objects.get(pk=offers[2].pk)
+
+        offers[0].is_ready = False
+        offers[0].save()
+        self.assertEqual(self.get_queue(), [(offers[1].pk, 1), (offers[2].pk, 2)])
+
+        stale.name = u'Renamed'
+        stale.save()
+        self.assertEqual(self.get_queue(), [(offers[1].pk, 1), (offers[2].pk, 2)])
+        self.assertEqual(stale.queue_position(), 2)
+
+    def test_queue_position_does_not_query(self):
+        """
+        Test that the queue position of a loaded offer costs no query
+        """
+        offers = self.make_queue(3)
+        offer = Offer.objects.get(pk=offers[2].pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(offer.queue_position(), 3)
+
+    def test_rebuild_queue(self):
+        """
+        Test that the queue can be numbered again after offers were changed without their signals
+        """
+        offers = self.make_queue(3)
+        Offer.objects.filter(pk=offers[0].pk).update(is_ready=False)
+        Offer.objects.update(queue_rank=7)
+
+        Offer.rebuild_queue()
+        self.assertEqual(self.get_queue(), [(offers[1].pk, 1), (offers[2].pk, 2)])
+
+    def test_duplicate_ranks_are_repaired(self):
+        """
+        Test that a queue with a duplicate rank, like two offers readied at the same time could leave, is numbered
+        again when the next offer enters it
+        """
+        offers = self.make_queue(3)
+        Offer.objects.filter(pk=offers[2].pk).update(queue_rank=2)
+
+        offer = mommy.make(Offer, status=Offer.UNPUBLISHED, is_ready=True, is_request=True)
+        self.assertEqual(self.get_queue(), [(offers[0].pk, 1), (offers[1].pk, 2), (offers[2].pk, 3), (offer.pk, 4)])
+        self.assertEqual(offer.queue_position(), 4)
+
     def test_get_plan_locations_gets_correct_unique_locations(self):
         """
         Test that the get plan locations methods gets the correct and unique locations of the plans
@@ -783,4 +861,61 @@ class CommentMethodTests(TestCase):
         Test that the does_like method returns False if the user does not like the comment
         """
         user = User.objects.create_user('user', 'test@example.com', 'pass')
-        self.assertFalse(self.comment.does_like(user))
\ No newline at end of file
+        self.assertFalse(self.comment.does_like(user))
+
+
+class CommentThreadTests(TestCase):
+    def setUp(self):
+        self.offer = mommy.make(Offer, status=Offer.PUBLISHED)
+        self.user = User.objects.create_user('user', 'test@example.com', 'pass')
+        self.other_user = User.objects.create_user('other', 'other@example.com', 'pass')
+
+        self.comments = mommy.make(Comment, _quantity=3, offer=self.offer, status=Comment.PUBLISHED)
+        mommy.make(Comment, offer=self.offer, status=Comment.UNPUBLISHED)
+
+        mommy.make(Like, user=self.user, comment=self.comments[0])
+        mommy.make(Like, user=self.other_user, comment=self.comments[0])
+        mommy.make(Like, user=self.other_user, comment=self.comments[1])
+
+    def test_for_offer_loads_published_comments(self):
+        """
+        Test that a thread for an offer only contains the published comments of the offer, in order
+        """
+        thread = CommentThread.for_offer(self.offer, self.user)
+
+        self.assertEqual(list(thread), self.comments)
+        self.assertEqual(len(thread), 3)
+
+    def test_thread_loads_likes(self):
+        """
+        Test that the like helpers of the loaded comments match the database
+        """
+        thread = CommentThread.for_offer(self.offer, self.user)
+
+        for comment in thread:
+            fresh_comment = Comment.objects.get(pk=comment.pk)
+            self.assertEqual(comment.like_count(), fresh_comment.like_count())
+            self.assertEqual(comment.liked_users(), fresh_comment.liked_users())
+            self.assertEqual(comment.does_like(self.user), fresh_comment.does_like(self.user))
+
+        self.assertEqual(thread[0].liked_users(), 'user, other')
+
+    def test_thread_uses_a_fixed_number_of_queries(self):
+        """
+        Test that loading a thread and using the comment helpers does not query the database per comment
+        """
+        reply = mommy.make(Comment, offer=self.offer, status=Comment.PUBLISHED, reply_to=self.comments[0])
+
+        with self.assertNumQueries(2):
+            thread = CommentThread.for_offer(self.offer, self.user)
+            for comment in thread:
+                comment.like_count()
+                comment.liked_users()
+                comment.does_like(self.user)
+                comment.is_reply()
+                comment.json_data()
+                comment.commenter.user_profile.is_provider()
+                comment.offer.get_absolute_url()
+
+        self.assertTrue(thread[-1].is_reply())
+        self.assertEqual(thread[-1], reply)
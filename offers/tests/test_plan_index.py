@@ -0,0 +1,262 @@
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.db import connection
+from django.http import QueryDict
+from django.core.cache import get_cache
+from offers.models import Offer, Plan, Provider, Location, Datacenter
+from offers import plan_index as plan_index_module
+from offers.plan_index import plan_index, PlanQuery, get_facets, get_version_cache, VERSION_CACHE_KEY
+from model_mommy import mommy
+import json
+
+
+class PlanIndexTests(TestCase):
+    def setUp(self):
+        plan_index.invalidate()
+
+        self.provider = mommy.make(Provider)
+        self.other_provider = mommy.make(Provider)
+        self.datacenter = mommy.make(Datacenter)
+        self.nl = mommy.make(Location, country='NL', provider=self.provider, datacenter=self.datacenter)
+        self.us = mommy.make(Location, country='US', provider=self.other_provider)
+
+        self.offer = mommy.make(Offer, provider=self.provider, status=Offer.PUBLISHED, is_active=True,
+                                is_request=False)
+        self.other_offer = mommy.make(Offer, provider=self.other_provider, status=Offer.PUBLISHED, is_active=True,
+                                      is_request=False)
+
+        self.small = self.make_plan(self.offer, [self.nl], memory=512, cost=5, billing_time=Plan.MONTHLY)
+        self.medium = self.make_plan(self.offer, [self.nl, self.us], memory=1024, cost=10, billing_time=Plan.YEARLY)
+        self.large = self.make_plan(self.other_offer, [self.us], memory=2048, cost=20, billing_time=Plan.MONTHLY)
+
+    def make_plan(self, offer, locations, **kwargs):
+        return mommy.make(Plan, offer=offer, locations=locations, is_active=True, **kwargs)
+
+    def search(self, query_string):
+        return plan_index.search(PlanQuery.from_params(QueryDict(query_string)))
+
+    def test_numeric_ranges(self):
+        """
+        Test that the numeric filters are inclusive ranges
+        """
+        self.assertEqual(self.search('memory__gte=1024'), (2, [self.medium.pk, self.large.pk]))
+        self.assertEqual(self.search('memory__lte=1024&cost__gte=6'), (1, [self.medium.pk]))
+        self.assertEqual(self.search('cost=20'), (1, [self.large.pk]))
+        self.assertEqual(self.search('memory__gte=4096'), (0, []))
+
+    def test_sets(self):
+        """
+        Test that the categorical filters match any of their values
+        """
+        self.assertEqual(self.search('locations__country__in=US'), (2, [self.medium.pk, self.large.pk]))
+        self.assertEqual(self.search('locations__country__in=NL,US'), (3, [self.small.pk, self.medium.pk,
+                                                                           self.large.pk]))
+        self.assertEqual(self.search('offer__provider__id__in={0}'.format(self.provider.pk)),
+                         (2, [self.small.pk, self.medium.pk]))
+        self.assertEqual(self.search('locations__datacenter__id__in={0}&billing_time=m'.format(self.datacenter.pk)),
+                         (1, [self.small.pk]))
+
+    def test_matches_the_database(self):
+        """
+        Test that the index finds the same plans as the database for a combined search
+        """
+        total, plan_ids = self.search('locations__country__in=US&memory__lte=2048&billing_time__in=m,y&order_by=cost')
+        expected = list(Plan.active_plans.filter(
+            locations__country__in=['US'],
+            memory__lte=2048,
+            billing_time__in=['m', 'y'],
+        ).distinct().order_by('cost').values_list('pk', flat=True))
+
+        self.assertEqual(plan_ids, expected)
+        self.assertEqual(total, len(expected))
+
+    def test_ordering_and_pagination(self):
+        """
+        Test that the results can be ordered both ways and paginated
+        """
+        self.assertEqual(self.search('order_by=-memory'), (3, [self.large.pk, self.medium.pk, self.small.pk]))
+        self.assertEqual(self.search('order_by=-memory&limit=1&offset=1'), (3, [self.medium.pk]))
+        self.assertEqual(self.search('order_by=cost&offset=3'), (3, []))
+
+    def test_invalid_queries(self):
+        """
+        Test that invalid parameters are refused
+        """
+        self.assertRaises(ValueError, PlanQuery.from_params, QueryDict('memory__gte=abc'))
+        self.assertRaises(ValueError, PlanQuery.from_params, QueryDict('offer__provider__id__in=x'))
+        self.assertRaises(ValueError, PlanQuery.from_params, QueryDict('order_by=url'))
+        self.assertRaises(ValueError, PlanQuery.from_params, QueryDict('limit=-1'))
+
+    def test_incremental_updates(self):
+        """
+        Test that saving plans, offers and locations updates the index without a rebuild
+        """
+        self.search('')
+        version = plan_index.version
+
+        self.small.memory = 4096
+        self.small.save()
+        self.assertEqual(self.search('memory__gte=4096'), (1, [self.small.pk]))
+
+        self.other_offer.is_active = False
+        self.other_offer.save()
+        self.assertEqual(self.search(''), (2, [self.small.pk, self.medium.pk]))
+
+        self.us.country = 'DE'
+        self.us.save()
+        self.assertEqual(self.search('locations__country=DE'), (1, [self.medium.pk]))
+
+        self.medium.locations.remove(self.us)
+        self.assertEqual(self.search('locations__country=DE'), (0, []))
+
+        new_plan = self.make_plan(self.offer, [self.nl], memory=256)
+        self.assertEqual(self.search('memory__lte=256'), (1, [new_plan.pk]))
+
+        new_plan.delete()
+        self.assertEqual(self.search('memory__lte=256'), (0, []))
+
+        self.assertNotEqual(plan_index.version, version)
+
+    def test_other_processes_rebuild(self):
+        """
+        Test that a change made by another process makes the index rebuild
+        """
+        self.search('')
+        Plan.objects.filter(pk=self.small.pk).update(memory=8192)
+        self.assertEqual(self.search('memory__gte=8192'), (0, []))
+
+        # Another process changed the version
+        plan_index.invalidate()
+        self.assertEqual(self.search('memory__gte=8192'), (1, [self.small.pk]))
+
+    def test_stale_processes_rebuild_after_their_own_changes(self):
+        """
+        Test that a process that missed the changes of another process doesn't mark itself current when it changes
+        a plan itself
+        """
+        self.search('')
+        Plan.objects.filter(pk=self.large.pk).update(memory=8192)
+        # Another process changed the plan and the version
+        get_version_cache().set(VERSION_CACHE_KEY, 'other', None)
+
+        self.small.memory = 4096
+        self.small.save()
+        self.assertIsNone(plan_index.version)
+        self.assertEqual(self.search('memory__gte=4096'), (2, [self.small.pk, self.large.pk]))
+
+    @override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'shared': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'plan-index-tests'},
+    })
+    def test_version_is_read_from_the_shared_tier(self):
+        """
+        Test that a change of another process is seen at once when the cache keeps local copies
+        """
+        old_cache = plan_index_module.cache
+        plan_index_module.cache = get_cache('OfferListings.tiered_cache.TieredCache', OPTIONS={"SHARED": "shared"})
+        try:
+            plan_index.invalidate()
+            self.search('')
+            Plan.objects.filter(pk=self.large.pk).update(memory=8192)
+            # Another process changed the plan and the version
+            plan_index_module.cache.shared.set(VERSION_CACHE_KEY, 'other', None)
+
+            self.assertEqual(self.search('memory__gte=4096'), (1, [self.large.pk]))
+        finally:
+            plan_index_module.cache = old_cache
+            plan_index.invalidate()
+
+    def test_search_does_not_query(self):
+        """
+        Test that searching a built index doesn't query the plans
+        """
+        self.search('')
+        with CaptureQueriesContext(connection) as context:
+            self.search('memory__gte=1024&locations__country__in=US&order_by=-cost')
+        self.assertFalse([query for query in context.captured_queries if 'offers_plan' in query['sql']])
+
+    def test_search_view(self):
+        """
+        Test that the search endpoint returns the listing of the plans in the same structure as the plan api
+        """
+        response = self.client.get('/find/plans/', {"memory__gte": 1024, "order_by": "cost", "limit": 1})
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+
+        self.assertEqual(data["meta"]["total_count"], 2)
+        self.assertIsNone(data["meta"]["previous"])
+        self.assertEqual([plan["id"] for plan in data["objects"]], [self.medium.pk])
+        self.assertIn(self.offer.name, data["objects"][0]["html"])
+
+        data = json.loads(self.client.get(data["meta"]["next"]).content)
+        self.assertEqual([plan["id"] for plan in data["objects"]], [self.large.pk])
+        self.assertIsNone(data["meta"]["next"])
+
+        response = self.client.get('/find/plans/', {"memory__gte": "abc"})
+        self.assertEqual(response.status_code, 400)
+
+    def get_counts(self, facets, field):
+        return dict((value["value"], value["count"]) for value in facets["facets"][field])
+
+    def test_facet_counts(self):
+        """
+        Test that the facets count the matching plans per value and ignore the filter of the facet itself
+        """
+        facets = get_facets(PlanQuery.from_params(QueryDict('locations__country__in=NL&memory__lte=1024')))
+
+        self.assertEqual(facets["total_count"], 2)
+        self.assertEqual(self.get_counts(facets, "country"), {'NL': 2, 'US': 1})
+        self.assertEqual(self.get_counts(facets, "provider"), {self.provider.pk: 2, self.other_provider.pk: 0})
+        self.assertEqual(self.get_counts(facets, "billing_time"), {'m': 1, 'y': 1})
+        self.assertEqual(facets["ranges"]["cost"], {"min": 5, "max": 10})
+        self.assertEqual(facets["ranges"]["memory"], {"min": 512, "max": 1024})
+
+        names = dict((value["value"], value["name"]) for value in facets["facets"]["provider"])
+        self.assertEqual(names[self.provider.pk], self.provider.name)
+
+    def test_offer_search_and_facets(self):
+        """
+        Test that the offer search finds the offers with a matching plan and counts offers, not plans
+        """
+        self.assertEqual(plan_index.search_offers(PlanQuery.from_params(QueryDict('locations__country=US'))),
+                         set([self.offer.pk, self.other_offer.pk]))
+        self.assertEqual(plan_index.search_offers(PlanQuery.from_params(QueryDict('cost__gte=6&memory__lte=1024'))),
+                         set([self.offer.pk]))
+
+        counts = plan_index.offer_facets(PlanQuery.from_params(QueryDict('locations__country=NL')),
+                                         [self.offer.pk, self.other_offer.pk])
+        self.assertEqual(counts["country"], {'NL': 1, 'US': 2})
+
+        counts = plan_index.offer_facets(PlanQuery(), [self.other_offer.pk])
+        self.assertEqual(counts["country"], {'US': 1})
+
+    def test_facets_are_cached(self):
+        """
+        Test that the facets of a filter are cached until the index changes
+        """
+        query = PlanQuery.from_params(QueryDict('memory__gte=1024&locations__country__in=US'))
+        get_facets(query)
+
+        with CaptureQueriesContext(connection) as context:
+            same_filter = PlanQuery.from_params(QueryDict('locations__country__in=US&memory__gte=1024&offset=1'))
+            self.assertEqual(get_facets(same_filter)["total_count"], 2)
+        self.assertFalse([captured for captured in context.captured_queries if 'offers_' in captured['sql']])
+
+        self.large.memory = 256
+        self.large.save()
+        self.assertEqual(get_facets(query)["total_count"], 1)
+
+    def test_facets_view(self):
+        """
+        Test that the facets endpoint returns the facets as json
+        """
+        response = self.client.get('/find/facets/', {"billing_time__in": "m"})
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+
+        self.assertEqual(data["total_count"], 2)
+        self.assertEqual(self.get_counts(data, "billing_time"), {'m': 2, 'y': 1})
+        self.assertEqual(data["ranges"]["memory"], {"min": 512, "max": 2048})
+
+        response = self.client.get('/find/facets/', {"cost__lte": "x"})
+        self.assertEqual(response.status_code, 400)
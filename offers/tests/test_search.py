@@ -0,0 +1,229 @@
+from unittest import skipUnless
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from haystack import connections
+from model_mommy import mommy
+from offers.autocomplete import PrefixCache, prefix_cache
+from offers.models import Offer, Plan, Provider, Location, Comment
+from offers.plan_index import plan_index
+from offers.search_queue import process_queue
+from offers.sqlite_search import get_missing_features
+import json
+import os
+import shutil
+import tempfile
+
+
+class SearchTests(TestCase):
+    """
+    The search connection is pointed at a temporary Whoosh index for every test.
+    """
+    def get_connection_info(self):
+        return dict(self.old_connection, PATH=self.directory)
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.old_connection = connections.connections_info['default']
+        connections.connections_info['default'] = self.get_connection_info()
+        connections.reload('default')
+        plan_index.invalidate()
+        prefix_cache.clear()
+
+        self.provider = mommy.make(Provider, name=u'Search Hosting')
+        self.nl = mommy.make(Location, country='NL', provider=self.provider)
+        self.us = mommy.make(Location, country='US', provider=self.provider)
+
+        self.small = mommy.make(Offer, status=Offer.PUBLISHED, provider=self.provider, name=u'Small boxes',
+                                content='Tiny **boxes** & more')
+        mommy.make(Plan, offer=self.small, locations=[self.nl], is_active=True, cost=5, memory=512,
+                   server_type=Plan.OPENVZ, billing_time=Plan.MONTHLY)
+
+        self.large = mommy.make(Offer, status=Offer.PUBLISHED, provider=self.provider, name=u'Large boxes')
+        mommy.make(Plan, offer=self.large, locations=[self.us], is_active=True, cost=20, memory=4096,
+                   server_type=Plan.KVM, billing_time=Plan.MONTHLY)
+        mommy.make(Plan, offer=self.large, locations=[self.nl], is_active=True, cost=50, memory=8192,
+                   server_type=Plan.KVM, billing_time=Plan.MONTHLY)
+
+        process_queue(10)
+
+    def tearDown(self):
+        backend = connections['default'].get_backend()
+        if hasattr(backend, 'close'):
+            backend.close()
+        connections.connections_info['default'] = self.old_connection
+        connections.reload('default')
+        shutil.rmtree(self.directory)
+
+    def search(self, **params):
+        response = self.client.get('/offers/search/', params)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def found(self, response):
+        return sorted(int(result.pk) for result in response.context['page'].object_list)
+
+    def get_counts(self, response, field):
+        return dict((value["value"], value["count"]) for value in response.context['facets'][field])
+
+    def test_results_are_rendered_from_the_index(self):
+        """
+        Test that the results show the stored fields without loading the offers
+        """
+        plan_index.ensure_current()
+        with CaptureQueriesContext(connection) as context:
+            response = self.search(q='boxes')
+        self.assertFalse([query for query in context.captured_queries if 'offers_' in query['sql']])
+
+        self.assertEqual(self.found(response), [self.small.pk, self.large.pk])
+        self.assertContains(response, self.small.get_absolute_url())
+        self.assertContains(response, self.provider.get_absolute_url())
+        self.assertContains(response, 'Tiny boxes &amp; more')
+        self.assertContains(response, '$20.00 - $50.00 (Monthly)')
+        self.assertContains(response, '2 Plans listed')
+
+    def test_filters(self):
+        """
+        Test that the search only finds the offers that have a plan matching every filter
+        """
+        self.assertEqual(self.found(self.search(q='boxes', cost__lte='10')), [self.small.pk])
+        self.assertEqual(self.found(self.search(q='boxes', locations__country='NL')), [self.small.pk, self.large.pk])
+        # No single plan of the large offer is in the US and costs more than 30
+        self.assertEqual(self.found(self.search(q='boxes', locations__country='US', cost__gte='30')), [])
+        self.assertEqual(self.found(self.search(server_type=Plan.KVM, memory__gte='8192')), [self.large.pk])
+
+    def test_facets(self):
+        """
+        Test that the facets count the found offers per country and server type
+        """
+        response = self.search(q='boxes', locations__country='US')
+        self.assertEqual(self.get_counts(response, 'country'), {'NL': 2, 'US': 1})
+        self.assertEqual(self.get_counts(response, 'server_type'), {Plan.KVM: 1})
+
+        selected = [value for value in response.context['facets']['country'] if value["selected"]]
+        self.assertEqual([value["value"] for value in selected], ['US'])
+        self.assertNotIn('locations__country', selected[0]["url"])
+
+        self.assertEqual(self.get_counts(self.search(q='small'), 'server_type'), {Plan.OPENVZ: 1})
+
+    def test_pages(self):
+        """
+        Test that every page shows its part of the found offers and that the count covers all of them
+        """
+        offers = [self.small, self.large] + mommy.make(
+            Offer, status=Offer.PUBLISHED, provider=self.provider, name=u'More boxes', _quantity=8
+        )
+        process_queue(20)
+
+        first = self.search(q='boxes')
+        second = self.search(q='boxes', page='2')
+        self.assertEqual(first.context['paginator'].count, 10)
+        self.assertEqual(len(self.found(first)), 8)
+        self.assertEqual(sorted(self.found(first) + self.found(second)), sorted(offer.pk for offer in offers))
+
+    def test_changes_change_the_cached_search(self):
+        """
+        Test that the cached results of a search follow the changes of the index
+        """
+        self.assertEqual(self.found(self.search(q='boxes', cost__lte='100')), [self.small.pk, self.large.pk])
+
+        self.small.name = u'Small servers'
+        self.small.content = 'Tiny servers'
+        self.small.save()
+        process_queue(10)
+        self.assertEqual(self.found(self.search(q='boxes', cost__lte='100')), [self.large.pk])
+
+        mommy.make(Plan, offer=self.small, locations=[self.us], is_active=True, cost=5, memory=512,
+                   server_type=Plan.KVM, billing_time=Plan.MONTHLY)
+        self.assertEqual(self.get_counts(self.search(q='servers'), 'server_type'), {Plan.OPENVZ: 1, Plan.KVM: 1})
+
+    def test_comments_and_locations_change_the_results(self):
+        """
+        Test that posting or hiding a comment and changing a location update the search results
+        """
+        User.objects.create_user('user', 'user@example.com', 'password')
+        self.client.login(username='user', password='password')
+        self.client.post(self.small.get_absolute_url(), {"comment": 'Some content', "reply_to": -1})
+        self.client.logout()
+        process_queue(10)
+        self.assertContains(self.search(q='small'), '1 Comment<')
+
+        comment = Comment.objects.get(offer=self.small)
+        comment.status = Comment.UNPUBLISHED
+        comment.save()
+        process_queue(10)
+        self.assertContains(self.search(q='small'), '0 Comments<')
+
+        self.us.country = 'DE'
+        self.us.save()
+        process_queue(10)
+        result = self.search(q='large').context['page'].object_list[0]
+        self.assertEqual(sorted(result.countries), ['DE', 'NL'])
+
+    def autocomplete(self, **params):
+        response = self.client.get('/offers/search/autocomplete/', params)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content)
+
+    def test_autocomplete(self):
+        """
+        Test that the autocomplete suggests the offers and providers that have words starting with the prefix
+        """
+        suggestions = self.autocomplete(q='SMAL')
+        self.assertEqual(suggestions["offers"], [{
+            "name": "Small boxes", "url": self.small.get_absolute_url(), "provider": "Search Hosting",
+        }])
+        self.assertEqual(suggestions["providers"], [])
+
+        suggestions = self.autocomplete(q='sea hos')
+        self.assertEqual(len(suggestions["offers"]), 2)
+        self.assertEqual(suggestions["providers"], [{
+            "name": "Search Hosting", "url": self.provider.get_absolute_url(),
+        }])
+
+        self.assertEqual(len(self.autocomplete(q='box', limit=1)["offers"]), 1)
+        self.assertEqual(self.autocomplete(q='b'), {"offers": [], "providers": []})
+        self.assertEqual(self.client.get('/offers/search/autocomplete/', {"q": "box", "limit": "x"}).status_code, 400)
+
+    def test_autocomplete_answers_prefixes_from_memory(self):
+        """
+        Test that a recently requested prefix is answered from the cache of the process
+        """
+        self.assertEqual(len(self.autocomplete(q='lar')["offers"]), 1)
+
+        self.large.name = u'Huge boxes'
+        self.large.save()
+        process_queue(10)
+        self.assertEqual(len(self.autocomplete(q='  LAR ')["offers"]), 1)
+
+        prefix_cache.clear()
+        self.assertEqual(self.autocomplete(q='lar')["offers"], [])
+
+    def test_prefix_cache(self):
+        """
+        Test that the cache drops the least recently used prefix and expired prefixes
+        """
+        cache = PrefixCache(size=2, timeout=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertEqual((cache.get('a'), cache.get('b'), cache.get('c')), (1, None, 3))
+
+        cache.timeout = -1
+        cache.set('a', 1)
+        self.assertIsNone(cache.get('a'))
+
+
+@skipUnless(not get_missing_features(), 'The SQLite of this Python has no FTS5 or JSON1')
+class SQLiteSearchTests(SearchTests):
+    """
+    The same search on the SQLite FTS5 backend
+    """
+    def get_connection_info(self):
+        return {
+            'ENGINE': 'offers.sqlite_search.SQLiteSearchEngine',
+            'PATH': os.path.join(self.directory, 'index.sqlite3'),
+            'SILENTLY_FAIL': False,
+        }
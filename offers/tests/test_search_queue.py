@@ -0,0 +1,175 @@
+from unittest import skipUnless
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.core.cache import get_cache
+from django.core.management import call_command
+from haystack import connections
+from haystack.query import SearchQuerySet
+from model_mommy import mommy
+from offers.models import Offer, Plan, Provider, SearchIndexQueue, Comment, Location
+from offers import search_queue
+from offers.search_queue import process_queue, get_index_drift, update_offers, get_search_version, VERSION_CACHE_KEY
+from offers.sqlite_search import get_missing_features
+from offers.tasks import update_search_index
+from StringIO import StringIO
+import os
+import shutil
+import tempfile
+
+
+class SearchQueueTests(TestCase):
+    """
+    The search connection is pointed at a temporary Whoosh index for every test.
+    """
+    def get_connection_info(self):
+        return dict(self.old_connection, PATH=self.directory)
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.old_connection = connections.connections_info['default']
+        connections.connections_info['default'] = self.get_connection_info()
+        connections.reload('default')
+
+        self.provider = mommy.make(Provider, name=u'Queued Hosting')
+        self.offer = mommy.make(Offer, status=Offer.PUBLISHED, provider=self.provider, name='Fast boxes')
+
+    def tearDown(self):
+        backend = connections['default'].get_backend()
+        if hasattr(backend, 'close'):
+            backend.close()
+        connections.connections_info['default'] = self.old_connection
+        connections.reload('default')
+        shutil.rmtree(self.directory)
+
+    def search(self, text):
+        return sorted(int(result.pk) for result in SearchQuerySet().models(Offer).auto_query(text))
+
+    def queued(self):
+        return sorted(SearchIndexQueue.objects.values_list('offer_id', flat=True))
+
+    def test_changes_are_queued(self):
+        """
+        Test that saving or deleting an offer, its plans, comments or locations or its provider queues the offer once
+        """
+        other = mommy.make(Offer, status=Offer.PUBLISHED)
+        self.assertEqual(self.queued(), [self.offer.pk, other.pk])
+
+        SearchIndexQueue.objects.all().delete()
+        plan = mommy.make(Plan, offer=self.offer)
+        plan.delete()
+        self.assertEqual(self.queued(), [self.offer.pk])
+
+        SearchIndexQueue.objects.all().delete()
+        self.provider.save()
+        self.assertEqual(self.queued(), [self.offer.pk])
+
+        SearchIndexQueue.objects.all().delete()
+        mommy.make(Comment, offer=self.offer).delete()
+        self.assertEqual(self.queued(), [self.offer.pk])
+
+        location = mommy.make(Location, provider=self.provider)
+        mommy.make(Plan, offer=self.offer, locations=[location])
+        SearchIndexQueue.objects.all().delete()
+        location.save()
+        self.assertEqual(self.queued(), [self.offer.pk])
+        SearchIndexQueue.objects.all().delete()
+        location.delete()
+        self.assertEqual(self.queued(), [self.offer.pk])
+
+    def test_task_indexes_the_queue(self):
+        """
+        Test that the task indexes the queued offers in batches and empties the queue
+        """
+        offers = mommy.make(Offer, _quantity=4, status=Offer.PUBLISHED, provider=self.provider)
+
+        with self.settings(SEARCH_INDEX_BATCH_SIZE=2):
+            self.assertEqual(update_search_index.delay().get(), 5)
+
+        self.assertEqual(self.queued(), [])
+        self.assertEqual(self.search('Queued'), sorted([self.offer.pk] + [offer.pk for offer in offers]))
+
+    def test_unpublished_and_deleted_offers_are_removed(self):
+        """
+        Test that an offer that is no longer visible is removed from the index
+        """
+        other = mommy.make(Offer, status=Offer.PUBLISHED, provider=self.provider)
+        process_queue(10)
+        self.assertEqual(self.search('Queued'), [self.offer.pk, other.pk])
+
+        self.offer.status = Offer.UNPUBLISHED
+        self.offer.save()
+        other.delete()
+        process_queue(10)
+
+        self.assertEqual(self.search('Queued'), [])
+
+    def test_offers_queued_after_the_task_started_stay_queued(self):
+        """
+        Test that queuing an offer again moves it past the start of a running task, which leaves it for the next run
+        """
+        entry = SearchIndexQueue.objects.get(offer_id=self.offer.pk)
+        process_queue(10, queued_before=entry.queued_at)
+        self.assertEqual(self.queued(), [])
+
+        SearchIndexQueue.enqueue([self.offer.pk])
+        entry = SearchIndexQueue.objects.get(offer_id=self.offer.pk)
+        self.assertEqual(process_queue(10, queued_before=entry.queued_at.replace(year=2000)), 0)
+        self.assertEqual(self.queued(), [self.offer.pk])
+
+    def test_reconcile_fixes_only_the_drift(self):
+        """
+        Test that the reconcile command finds the missing, stale and hidden offers and fixes them
+        """
+        current = mommy.make(Offer, status=Offer.PUBLISHED, provider=self.provider)
+        hidden = mommy.make(Offer, status=Offer.PUBLISHED, provider=self.provider)
+        update_offers([current.pk, hidden.pk, self.offer.pk])
+        missing = mommy.make(Offer, status=Offer.PUBLISHED, provider=self.provider)
+
+        # Changes that never made it to the queue
+        Offer.objects.filter(pk=self.offer.pk).update(name='Renamed boxes', updated_at=self.offer.updated_at.replace(
+            year=self.offer.updated_at.year + 1
+        ))
+        Offer.objects.filter(pk=hidden.pk).update(status=Offer.UNPUBLISHED)
+
+        self.assertEqual(get_index_drift(), ([missing.pk], [self.offer.pk], [hidden.pk]))
+
+        out = StringIO()
+        call_command('reconcile_search_index', stdout=out)
+        self.assertIn('1 offer missing, 1 stale and 1 no longer visible.', out.getvalue())
+        self.assertIn('Fixed 3 offers.', out.getvalue())
+
+        self.assertEqual(get_index_drift(), ([], [], []))
+        self.assertEqual(self.search('Renamed'), [self.offer.pk])
+        self.assertEqual(self.search('Queued'), sorted([self.offer.pk, current.pk, missing.pk]))
+
+
+    @override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'shared': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'search-queue-tests'},
+    })
+    def test_version_is_read_from_the_shared_tier(self):
+        """
+        Test that the version written by another process is seen at once when the cache keeps local copies
+        """
+        old_cache = search_queue.cache
+        search_queue.cache = get_cache('OfferListings.tiered_cache.TieredCache', OPTIONS={"SHARED": "shared"})
+        try:
+            get_search_version()
+            search_queue.cache.shared.set(VERSION_CACHE_KEY, 'other', None)
+
+            self.assertEqual(get_search_version(), 'other')
+        finally:
+            search_queue.cache = old_cache
+
+
+@skipUnless(not get_missing_features(), 'The SQLite of this Python has no FTS5 or JSON1')
+class SQLiteSearchQueueTests(SearchQueueTests):
+    """
+    The same queue on the SQLite FTS5 backend
+    """
+    def get_connection_info(self):
+        return {
+            'ENGINE': 'offers.sqlite_search.SQLiteSearchEngine',
+            'PATH': os.path.join(self.directory, 'index.sqlite3'),
+            'SILENTLY_FAIL': False,
+        }
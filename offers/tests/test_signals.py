@@ -1,10 +1,14 @@
 from django.test import TestCase
-from offers.models import Offer, Provider
+from offers.models import Offer, Provider, Plan, Comment, Location, OfferSummary
 from model_mommy import mommy
 from django.utils import timezone
 from datetime import timedelta
 from django.core import mail
 from django.contrib.auth.models import User
+from django.core.management import call_command
+from StringIO import StringIO
+from offers import models as offer_models
+from template_helpers.converters import RENDERER_VERSION
 
 
 class OfferSignalTests(TestCase):
@@ -189,3 +193,168 @@ class OfferSignalTests(TestCase):
         offer = Offer.objects.get(pk=self.offer.pk)
 
         self.assertEqual(offer.readied_at, self.old_time)
+
+
+class OfferSummarySignalTests(TestCase):
+    def setUp(self):
+        self.provider = mommy.make(Provider)
+        self.offer = mommy.make(Offer, provider=self.provider, status=Offer.PUBLISHED)
+
+    def get_summary(self):
+        return OfferSummary.objects.get(offer=self.offer)
+
+    def test_summary_created_with_offer(self):
+        """
+        Test that saving a new offer creates its summary row
+        """
+        summary = self.get_summary()
+
+        self.assertEqual(summary.plan_count, 0)
+        self.assertEqual(summary.comment_count, 0)
+        self.assertEqual(summary.get_min_max_cost(), [])
+        self.assertEqual(summary.get_plan_locations(), [])
+
+    def test_summary_updated_on_plan_changes(self):
+        """
+        Test that adding, changing and deleting plans updates the plan counts and costs of the summary
+        """
+        location = mommy.make(Location, provider=self.provider, country='US')
+        plan = mommy.make(Plan, offer=self.offer, cost=10, billing_time=Plan.MONTHLY, locations=[location])
+        mommy.make(Plan, offer=self.offer, cost=20, billing_time=Plan.MONTHLY, is_active=False)
+
+        summary = self.get_summary()
+        self.assertEqual(summary.plan_count, 2)
+        self.assertEqual(summary.active_plan_count, 1)
+        self.assertEqual(summary.get_min_max_cost(), self.offer.get_min_max_cost())
+        self.assertEqual(summary.get_countries(), ['US'])
+
+        plan.delete()
+
+        summary = self.get_summary()
+        self.assertEqual(summary.plan_count, 1)
+        self.assertEqual(summary.active_plan_count, 0)
+        self.assertEqual(summary.get_plan_locations(), [])
+
+    def test_summary_updated_on_offer_status_change(self):
+        """
+        Test that deactivating an offer updates the active plan count of the summary
+        """
+        mommy.make(Plan, offer=self.offer, is_active=True, _quantity=3)
+        self.assertEqual(self.get_summary().active_plan_count, 3)
+
+        self.offer.is_active = False
+        self.offer.save()
+
+        self.assertEqual(self.get_summary().active_plan_count, 0)
+
+    def test_summary_updated_on_location_change(self):
+        """
+        Test that changing a location updates the summaries of the offers with plans in that location
+        """
+        location = mommy.make(Location, provider=self.provider, country='US')
+        mommy.make(Plan, offer=self.offer, locations=[location])
+
+        location.country = 'CA'
+        location.save()
+
+        self.assertEqual(self.get_summary().get_countries(), ['CA'])
+
+    def test_summary_counts_only_published_comments(self):
+        """
+        Test that the comment count of the summary follows the published comments of the offer
+        """
+        mommy.make(Comment, offer=self.offer, status=Comment.PUBLISHED, _quantity=3)
+        comment = mommy.make(Comment, offer=self.offer, status=Comment.UNPUBLISHED)
+
+        self.assertEqual(self.get_summary().comment_count, 3)
+
+        comment.status = Comment.PUBLISHED
+        comment.save()
+        self.assertEqual(self.get_summary().comment_count, 4)
+
+        comment.delete()
+        self.assertEqual(self.get_summary().comment_count, 3)
+
+    def test_deleting_offer_deletes_summary(self):
+        """
+        Test that deleting an offer with plans and comments does not leave a summary row behind
+        """
+        mommy.make(Plan, offer=self.offer, _quantity=2)
+        mommy.make(Comment, offer=self.offer, _quantity=2)
+
+        self.offer.delete()
+
+        self.assertFalse(OfferSummary.objects.exists())
+
+    def test_rebuild_command_recreates_missing_summaries(self):
+        """
+        Test that the rebuild_offer_summaries command recreates summary rows that are missing
+        """
+        mommy.make(Plan, offer=self.offer, _quantity=2)
+        OfferSummary.objects.all().delete()
+
+        call_command('rebuild_offer_summaries', stdout=StringIO())
+
+        self.assertEqual(self.get_summary().plan_count, 2)
+
+
+class OfferRenderedContentTests(TestCase):
+    def setUp(self):
+        self.offer = mommy.make(Offer, content='**Fast** servers')
+
+    def test_content_is_rendered_on_save(self):
+        """
+        Test that the markdown content is rendered and stored when an offer is saved
+        """
+        offer = Offer.objects.get(pk=self.offer.pk)
+        self.assertEqual(offer.rendered_content, u'<p><strong>Fast</strong> servers</p>')
+        self.assertEqual(offer.rendered_version, RENDERER_VERSION)
+
+        offer.content = 'Cheap servers'
+        offer.save()
+
+        self.assertEqual(Offer.objects.get(pk=offer.pk).rendered_content, u'<p>Cheap servers</p>')
+
+    def test_html_content_does_not_render(self):
+        """
+        Test that reading the html content of a rendered offer doesn't run the markdown converter
+        """
+        offer = Offer.objects.get(pk=self.offer.pk)
+
+        old_converter = offer_models.markdown_converter
+        offer_models.markdown_converter = None
+        try:
+            self.assertEqual(offer.html_content(), u'<p><strong>Fast</strong> servers</p>')
+        finally:
+            offer_models.markdown_converter = old_converter
+
+    def test_stale_content_is_rendered_on_read(self):
+        """
+        Test that content rendered by an older renderer is not used
+        """
+        Offer.objects.filter(pk=self.offer.pk).update(rendered_content='Old', rendered_version='old')
+        offer = Offer.objects.get(pk=self.offer.pk)
+
+        self.assertFalse(offer.has_rendered_content())
+        self.assertEqual(offer.html_content(), u'<p><strong>Fast</strong> servers</p>')
+
+    def test_rerender_command(self):
+        """
+        Test that the re-render command only updates the stale offers unless all of them are requested
+        """
+        stale_offer = mommy.make(Offer, content='Stale')
+        Offer.objects.filter(pk=stale_offer.pk).update(rendered_content='', rendered_version='old')
+        updated_at = Offer.objects.get(pk=stale_offer.pk).updated_at
+
+        out = StringIO()
+        call_command('rerender_offers', stdout=out)
+        self.assertIn("Re-rendered 1 offer.", out.getvalue())
+
+        stale_offer = Offer.objects.get(pk=stale_offer.pk)
+        self.assertEqual(stale_offer.rendered_content, u'<p>Stale</p>')
+        self.assertEqual(stale_offer.rendered_version, RENDERER_VERSION)
+        self.assertEqual(stale_offer.updated_at, updated_at)
+
+        out = StringIO()
+        call_command('rerender_offers', all=True, batch_size=1, stdout=out)
+        self.assertIn("Re-rendered 2 offers.", out.getvalue())
@@ -0,0 +1,154 @@
+from datetime import timedelta
+from unittest import skipUnless
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase
+from django.utils import timezone
+from haystack import connections
+from haystack.inputs import AutoQuery
+from haystack.query import SearchQuerySet
+from model_mommy import mommy
+from offers.models import Offer, Provider, Plan, Location
+from offers.search_queue import update_offers
+from offers import sqlite_search
+from offers.sqlite_search import get_missing_features
+import os
+import shutil
+import sqlite3
+import tempfile
+
+
+@skipUnless(not get_missing_features(), 'The SQLite of this Python has no FTS5 or JSON1')
+class SQLiteSearchBackendTests(TestCase):
+    """
+    The search connection is pointed at a temporary SQLite FTS5 index for every test.
+    """
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'index.sqlite3')
+        self.old_connection = connections.connections_info['default']
+        connections.connections_info['default'] = {
+            'ENGINE': 'offers.sqlite_search.SQLiteSearchEngine',
+            'PATH': self.path,
+            'SILENTLY_FAIL': False,
+        }
+        connections.reload('default')
+
+        self.provider = mommy.make(Provider, name=u'Lite Hosting')
+        self.other_provider = mommy.make(Provider, name=u'Other Hosting')
+        self.fast = mommy.make(Offer, status=Offer.PUBLISHED, provider=self.provider, name=u'Fast boxes',
+                               content=u'Fast fast fast boxes in Amsterdam')
+        self.slow = mommy.make(Offer, status=Offer.PUBLISHED, provider=self.provider, name=u'Slow boxes',
+                               content=u'Slow boxes, but fast support')
+        self.other = mommy.make(Offer, status=Offer.PUBLISHED, provider=self.other_provider, name=u'Storage',
+                                content=u'Big disks')
+        Offer.objects.filter(pk=self.other.pk).update(published_at=timezone.now() - timedelta(days=10))
+        update_offers([self.fast.pk, self.slow.pk, self.other.pk])
+
+    def tearDown(self):
+        connections['default'].get_backend().close()
+        connections.connections_info['default'] = self.old_connection
+        connections.reload('default')
+        shutil.rmtree(self.directory)
+
+    def pks(self, sqs):
+        return [int(result.pk) for result in sqs]
+
+    def test_ranked_text_search(self):
+        """
+        Test that the text search matches every word, excludes negated words and ranks the better matches first
+        """
+        sqs = SearchQuerySet().models(Offer)
+        self.assertEqual(self.pks(sqs.auto_query('fast')), [self.fast.pk, self.slow.pk])
+        self.assertEqual(self.pks(sqs.auto_query('fast -slow')), [self.fast.pk])
+        self.assertEqual(self.pks(sqs.auto_query('"fast support"')), [self.slow.pk])
+        self.assertEqual(self.pks(sqs.auto_query('-boxes')), [self.other.pk])
+        self.assertGreater(sqs.auto_query('fast')[0].score, sqs.auto_query('fast')[1].score)
+
+    def test_prefix_search(self):
+        """
+        Test that the n-gram fields and startswith match the beginning of words
+        """
+        sqs = SearchQuerySet().models(Offer)
+        self.assertEqual(sorted(self.pks(sqs.autocomplete(content_auto='bo fa'))), [self.fast.pk, self.slow.pk])
+        self.assertEqual(self.pks(sqs.autocomplete(provider_auto='oth')), [self.other.pk])
+        self.assertEqual(self.pks(sqs.filter(content__startswith='amst')), [self.fast.pk])
+        self.assertEqual(self.pks(sqs.filter(content=AutoQuery('amst'))), [])
+
+    def test_field_filters(self):
+        """
+        Test that the value filters compare the stored values, any value of a multi valued field can match
+        """
+        sqs = SearchQuerySet().models(Offer)
+        self.assertEqual(self.pks(sqs.filter(name__exact=u'Storage')), [self.other.pk])
+        self.assertEqual(self.pks(sqs.filter(django_id__in=[self.slow.pk, self.other.pk])),
+                         [self.slow.pk, self.other.pk])
+        self.assertEqual(self.pks(sqs.filter(published_at__lt=timezone.now() - timedelta(days=1))), [self.other.pk])
+        self.assertEqual(self.pks(sqs.exclude(provider_name__in=[u'Lite Hosting'])), [self.other.pk])
+        self.assertEqual(self.pks(sqs.filter(django_id__in=[])), [])
+
+    def test_ordering_values_and_counts(self):
+        """
+        Test that the results can be ordered by a stored field, counted and read as values
+        """
+        sqs = SearchQuerySet().models(Offer).order_by('-published_at', 'name')
+        self.assertEqual(self.pks(sqs)[-1], self.other.pk)
+        self.assertEqual(sqs.count(), 3)
+        self.assertEqual(
+            list(SearchQuerySet().models(Offer).order_by('name').values_list('name', flat=True)[:2]),
+            [u'Fast boxes', u'Slow boxes']
+        )
+        self.assertEqual(SearchQuerySet().models(Offer).order_by('name')[1:3][0].provider_name, u'Lite Hosting')
+
+    def test_multi_valued_results(self):
+        """
+        Test that the results read a multi valued field that is also searched as a list of its values
+        """
+        mommy.make(Plan, offer=self.fast, is_active=True, locations=[
+            mommy.make(Location, country='NL', provider=self.provider),
+            mommy.make(Location, country='DE', provider=self.provider),
+        ])
+        # Saving the offer updates its summary, which the document reads the countries from
+        self.fast.save()
+        update_offers([self.fast.pk])
+
+        result = SearchQuerySet().models(Offer).filter(django_id__in=[self.fast.pk])[0]
+        self.assertEqual(sorted(result.countries), [u'DE', u'NL'])
+
+    def test_remove_and_clear(self):
+        """
+        Test that documents can be removed one by one or all at once
+        """
+        backend = connections['default'].get_backend()
+        backend.remove(self.fast)
+        self.assertEqual(sorted(self.pks(SearchQuerySet().models(Offer))), [self.slow.pk, self.other.pk])
+        self.assertEqual(self.pks(SearchQuerySet().auto_query('amsterdam')), [])
+
+        backend.clear([Offer])
+        self.assertEqual(SearchQuerySet().models(Offer).count(), 0)
+
+    def test_missing_features_are_reported(self):
+        """
+        Test that a backend on an SQLite without FTS5 tells which extension it lacks instead of failing on a search
+        """
+        backend = connections['default'].get_backend()
+        backend.setup_complete = False
+        sqlite_search.get_missing_features = lambda: ['FTS5']
+        try:
+            with self.assertRaisesRegexp(ImproperlyConfigured, 'needs the FTS5 extension of SQLite'):
+                backend.setup()
+        finally:
+            sqlite_search.get_missing_features = get_missing_features
+
+    def test_searches_read_while_a_write_is_open(self):
+        """
+        Test that a search reads the last committed documents while another connection is writing
+        """
+        writer = sqlite3.connect(self.path, isolation_level=None)
+        try:
+            writer.execute('BEGIN IMMEDIATE')
+            writer.execute('DELETE FROM haystack_document')
+            self.assertEqual(SearchQuerySet().models(Offer).count(), 3)
+            writer.execute('COMMIT')
+        finally:
+            writer.close()
+        self.assertEqual(SearchQuerySet().models(Offer).count(), 0)
@@ -1,10 +1,14 @@
 from django.test import TestCase
 from model_mommy import mommy
-from offers.models import Offer, Provider
-from offers.tasks import publish_offer, publish_latest_offer
+from offers.models import Offer, Provider, Comment, FollowerMailing, Like, NotificationEvent
+from offers.tasks import publish_offer, publish_latest_offer, send_new_comment_followers_mail, resume_follower_mailings
+from offers.tasks import send_comment_like, send_comment_unlike, send_comment_mail, send_notification_digests
+from offers.tasks import send_followers_mail_chunk
+from accounts.models import UserProfile
 from django.test.utils import override_settings
 from django.contrib.auth.models import User
 from django.core import mail
+from django.utils import timezone
 from datetime import timedelta
 
 
@@ -109,3 +113,244 @@ class OfferTaskTests(TestCase):
 
         self.assertTrue(publish_latest_offer.delay().successful())
         self.assertEqual(Offer.objects.filter(status=Offer.PUBLISHED).count(), 0)
+
+
+@override_settings(FOLLOWER_MAIL_CHUNK_SIZE=2)
+class FollowerMailTaskTests(TestCase):
+    def setUp(self):
+        self.offer = mommy.make(Offer, status=Offer.PUBLISHED)
+        self.commenter = User.objects.create_user('commenter', 'commenter@example.com', 'pass')
+        self.comment = mommy.make(Comment, offer=self.offer, commenter=self.commenter)
+
+        self.followers = []
+        for i in range(5):
+            user = User.objects.create_user('follower{0}'.format(i), 'follower{0}@example.com'.format(i), 'pass')
+            user.first_name = 'First{0}'.format(i)
+            user.last_name = 'Last{0}'.format(i)
+            user.save()
+            self.followers.append(user)
+        self.offer.followers.add(self.commenter, *self.followers)
+
+    def test_followers_are_mailed_in_chunks(self):
+        """
+        Test that every follower except the commenter is mailed once and the mailing is completed
+        """
+        send_new_comment_followers_mail.delay(self.comment.pk, self.commenter.pk)
+
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox),
+                         sorted(user.email for user in self.followers))
+
+        mailing = FollowerMailing.objects.get(comment=self.comment)
+        self.assertTrue(mailing.is_done)
+        self.assertEqual(mailing.sent_count, 5)
+        self.assertEqual(mailing.last_follower_pk, self.followers[-1].pk)
+
+    def test_every_follower_gets_their_own_name(self):
+        """
+        Test that the name of one follower never ends up in the mail of another follower
+        """
+        send_new_comment_followers_mail.delay(self.comment.pk, self.commenter.pk)
+
+        for message in mail.outbox:
+            user = User.objects.get(email=message.to[0])
+            self.assertIn(u'Hello {0} {1}'.format(user.first_name, user.last_name), message.body)
+            for other in self.followers:
+                if other != user:
+                    self.assertNotIn(other.first_name + ' ', message.body)
+                    self.assertNotIn(other.first_name + ' ', message.alternatives[0][0])
+
+    def test_interrupted_mailing_resumes(self):
+        """
+        Test that a stalled mailing continues after the last follower that was mailed
+        """
+        mailing = FollowerMailing.objects.create(
+            comment=self.comment,
+            exclude_user=self.commenter,
+            last_follower_pk=self.followers[2].pk,
+            sent_count=3,
+        )
+        FollowerMailing.objects.filter(pk=mailing.pk).update(updated_at=timezone.now() - timedelta(hours=1))
+
+        resume_follower_mailings.delay()
+
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox),
+                         [self.followers[3].email, self.followers[4].email])
+        self.assertTrue(FollowerMailing.objects.get(pk=mailing.pk).is_done)
+
+    def test_resumed_mailings_stop_the_old_chain(self):
+        """
+        Test that the chunk task of a mailing that was resumed meanwhile doesn't mail the followers again
+        """
+        mailing = FollowerMailing.objects.create(
+            comment=self.comment,
+            exclude_user=self.commenter,
+            last_follower_pk=self.followers[2].pk,
+            sent_count=3,
+            chain_token='old',
+        )
+        FollowerMailing.objects.filter(pk=mailing.pk).update(updated_at=timezone.now() - timedelta(hours=1))
+
+        resume_follower_mailings.delay()
+        self.assertEqual(len(mail.outbox), 2)
+
+        # The next chunk of the old chain was still waiting in the broker
+        send_followers_mail_chunk.delay(mailing.pk, 'old', self.followers[2].pk)
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(FollowerMailing.objects.get(pk=mailing.pk).sent_count, 5)
+
+    def test_chunks_are_sent_once(self):
+        """
+        Test that a chunk task that is delivered again after it was sent doesn't mail the followers again
+        """
+        send_new_comment_followers_mail.delay(self.comment.pk, self.commenter.pk)
+        mailing = FollowerMailing.objects.get(comment=self.comment)
+        self.assertEqual(len(mail.outbox), 5)
+
+        send_followers_mail_chunk.delay(mailing.pk, mailing.chain_token, 0)
+        send_followers_mail_chunk.delay(mailing.pk, mailing.chain_token, self.followers[1].pk)
+        self.assertEqual(len(mail.outbox), 5)
+
+    def test_chunks_claimed_meanwhile_are_not_sent(self):
+        """
+        Test that a chunk task doesn't mail the followers when another task claimed the chunk after it was loaded
+        """
+        mailing = FollowerMailing.objects.create(comment=self.comment, exclude_user=self.commenter, chain_token='chain')
+        get_next_followers = FollowerMailing.get_next_followers
+
+        def claimed_meanwhile(mailing, chunk_size):
+            followers = get_next_followers(mailing, chunk_size)
+            FollowerMailing.objects.filter(pk=mailing.pk).update(last_follower_pk=followers[-1][0])
+            return followers
+
+        FollowerMailing.get_next_followers = claimed_meanwhile
+        try:
+            send_followers_mail_chunk.delay(mailing.pk, 'chain', 0)
+        finally:
+            FollowerMailing.get_next_followers = get_next_followers
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_recent_mailings_are_not_resumed(self):
+        """
+        Test that mailings that are still running are not restarted
+        """
+        FollowerMailing.objects.create(comment=self.comment, exclude_user=self.commenter)
+
+        resume_follower_mailings.delay()
+
+        self.assertEqual(len(mail.outbox), 0)
+
+
+class NotificationDigestTests(TestCase):
+    def setUp(self):
+        self.offer = mommy.make(Offer, status=Offer.PUBLISHED)
+        self.commenter = User.objects.create_user('commenter', 'commenter@example.com', 'pass')
+        self.commenter.user_profile.notification_mode = UserProfile.DIGEST
+        self.commenter.user_profile.save()
+        self.comment = mommy.make(Comment, offer=self.offer, commenter=self.commenter)
+
+        self.liker = User.objects.create_user('liker', 'liker@example.com', 'pass')
+
+    def toggle_like(self):
+        likes = Like.objects.filter(user=self.liker, comment=self.comment)
+        if likes.exists():
+            likes.delete()
+            send_comment_unlike.delay(self.comment.pk, self.liker.username)
+        else:
+            send_comment_like.delay(Like.objects.create(user=self.liker, comment=self.comment).pk)
+
+    def send_digests(self):
+        NotificationEvent.objects.update(created_at=timezone.now() - timedelta(hours=2))
+        send_notification_digests.delay()
+
+    def test_events_are_recorded_instead_of_mailed(self):
+        """
+        Test that a user who chose the digest gets no mails until the digest is sent
+        """
+        self.toggle_like()
+        reply = mommy.make(Comment, offer=self.offer, reply_to=self.comment, commenter=self.liker)
+        send_comment_mail.delay(reply.pk)
+
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(sorted(self.commenter.notification_events.values_list('kind', flat=True)),
+                         [NotificationEvent.LIKE, NotificationEvent.REPLY])
+
+        self.send_digests()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [self.commenter.email])
+        self.assertEqual(mail.outbox[0].subject, 'You have 2 new notifications')
+        self.assertIn('liker liked your comment', mail.outbox[0].body)
+        self.assertIn('liker replied to your comment', mail.outbox[0].body)
+
+        # Sent events are not sent again
+        self.send_digests()
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_like_unlike_pairs_cancel_out(self):
+        """
+        Test that liking and unliking a comment over and over only mails the end result
+        """
+        for i in range(10):
+            self.toggle_like()
+        self.send_digests()
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertFalse(NotificationEvent.objects.filter(sent_at__isnull=True).exists())
+
+        for i in range(3):
+            self.toggle_like()
+        self.send_digests()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].body.count('liked your comment'), 1)
+        self.assertNotIn('unliked', mail.outbox[0].body)
+
+    @override_settings(NOTIFICATION_DIGEST_BATCH_SIZE=2)
+    def test_digests_are_sent_in_batches(self):
+        """
+        Test that every user is mailed once when the digests are sent in batches
+        """
+        users = [self.commenter]
+        for i in range(4):
+            user = User.objects.create_user('digest{0}'.format(i), 'digest{0}@example.com'.format(i), 'pass')
+            users.append(user)
+        NotificationEvent.objects.bulk_create([
+            NotificationEvent(recipient=user, kind=NotificationEvent.LIKE, comment=self.comment, actor_name=u'liker')
+            for user in users
+        ])
+
+        self.send_digests()
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), sorted(user.email for user in users))
+        self.assertFalse(NotificationEvent.objects.filter(sent_at__isnull=True).exists())
+
+    def test_digest_waits_for_the_window(self):
+        """
+        Test that the digest isn't sent before its oldest notification is older than the digest window
+        """
+        self.toggle_like()
+        send_notification_digests.delay()
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_immediate_users_are_mailed_right_away(self):
+        """
+        Test that users who didn't choose the digest are mailed right away
+        """
+        self.commenter.user_profile.notification_mode = UserProfile.IMMEDIATE
+        self.commenter.user_profile.save()
+
+        self.toggle_like()
+        self.toggle_like()
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertFalse(NotificationEvent.objects.exists())
+
+    def test_followers_can_get_a_digest(self):
+        """
+        Test that new comments are collected for followers who chose the digest and mailed to the others
+        """
+        self.offer.followers.add(self.commenter, self.liker)
+        new_comment = mommy.make(Comment, offer=self.offer, commenter=mommy.make(User))
+        send_new_comment_followers_mail.delay(new_comment.pk)
+
+        self.assertEqual([message.to[0] for message in mail.outbox], [self.liker.email])
+        self.assertEqual(FollowerMailing.objects.get(comment=new_comment).sent_count, 2)
+
+        self.send_digests()
+        self.assertEqual(mail.outbox[-1].to, [self.commenter.email])
+        self.assertIn('an offer you follow', mail.outbox[-1].body)
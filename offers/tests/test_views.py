@@ -4,6 +4,17 @@ from model_mommy import mommy
 from django.core.urlresolvers import reverse
 from django.contrib.auth.models import User
 from django_webtest import WebTest
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.db import connection
+from django.http import HttpResponse
+from django.test.client import RequestFactory
+from django.core.cache import get_cache
+from django.core.management import call_command
+from offers import models as offer_models
+from offers import page_cache
+from offers.tests.query_counts import QueryCountMixin
+from StringIO import StringIO
+import json
 
 
 class ProviderProfileViewTests(TestCase):
@@ -238,6 +249,381 @@ class OfferListViewTests(TestCase):
                 self.assertContains(response, offer.name)
 
 
+class OfferListingQueryCountTests(QueryCountMixin, TestCase):
+    """
+    The offer listings must load a page of offers in a fixed number of queries, no matter how many offers the page
+    shows.
+    """
+    def setUp(self):
+        super(OfferListingQueryCountTests, self).setUp()
+        self.provider = mommy.make(Provider)
+        self.datacenter = mommy.make(Datacenter)
+
+    def make_offers(self, quantity):
+        for offer in mommy.make(Offer, _quantity=quantity, provider=self.provider, status=Offer.PUBLISHED):
+            locations = mommy.make(Location, _quantity=2, provider=self.provider, datacenter=self.datacenter)
+            for cost in (5, 10, 20):
+                mommy.make(Plan, offer=offer, cost=cost, locations=locations)
+            mommy.make(Comment, _quantity=2, offer=offer, status=Comment.PUBLISHED)
+    make_rows = make_offers
+
+    def test_offer_list_queries_do_not_grow_with_offers(self):
+        """
+        Test that the home page uses the same number of queries for 1 and 5 offers
+        """
+        self.assert_constant_queries(reverse('home'))
+
+    def test_provider_profile_queries_do_not_grow_with_offers(self):
+        """
+        Test that the provider profile uses the same number of queries for 1 and 5 offers
+        """
+        self.assert_constant_queries(self.provider.get_absolute_url())
+
+    def test_offer_list_does_not_load_plans(self):
+        """
+        Test that the home page renders the plans of the cards from the summaries without loading the plans
+        """
+        self.make_offers(2)
+        self.client.get(reverse('home'))
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(reverse('home'))
+        plan_table = Plan._meta.db_table
+        self.assertFalse([query for query in context.captured_queries if plan_table in query['sql']])
+
+    def test_offer_list_without_summaries(self):
+        """
+        Test that the home page shows the plans and comments of offers whose summary rows are missing
+        """
+        self.make_offers(2)
+        offer_models.OfferSummary.objects.all().delete()
+
+        response = self.client.get(reverse('home'))
+        self.assertContains(response, '3 Plans listed', count=2)
+        self.assertContains(response, '2 Comments', count=2)
+
+    def test_listing_data_matches_model_helpers(self):
+        """
+        Test that the helpers return the same values with the listing data as without it
+        """
+        self.make_offers(1)
+        offer = Offer.objects.get()
+        mommy.make(Comment, offer=offer, status=Comment.UNPUBLISHED)
+        listed_offer = Offer.visible_offers.with_listing_data().get()
+
+        self.assertEqual(listed_offer.plan_count(), offer.plan_count())
+        self.assertEqual(listed_offer.active_plan_count(), offer.active_plan_count())
+        self.assertEqual(listed_offer.comment_count(), offer.comment_count())
+        self.assertEqual(listed_offer.get_min_max_cost(), offer.get_min_max_cost())
+        self.assertEqual(listed_offer.get_plan_locations(), offer.get_plan_locations())
+        self.assertEqual(listed_offer.min_cost(), offer.min_cost())
+        self.assertEqual(listed_offer.max_cost(), offer.max_cost())
+
+
+class CommentThreadQueryCountTests(QueryCountMixin, TestCase):
+    """
+    The comment listings must not query the database per comment.
+    """
+    more_rows = 2
+
+    def setUp(self):
+        super(CommentThreadQueryCountTests, self).setUp()
+        self.offer = mommy.make(Offer, status=Offer.PUBLISHED)
+        self.commenter = User.objects.create_user('commenter', 'commenter@example.com', 'pass')
+        self.user = User.objects.create_user('user', 'test@example.com', 'pass')
+        self.client.login(username='user', password='pass')
+
+    def make_comments(self, quantity):
+        for comment in mommy.make(
+                Comment, _quantity=quantity, offer=self.offer, commenter=self.commenter, status=Comment.PUBLISHED):
+            mommy.make(Like, comment=comment, user=self.user)
+            mommy.make(Like, _quantity=2, comment=comment)
+            mommy.make(Comment, offer=self.offer, commenter=self.commenter, reply_to=comment, status=Comment.PUBLISHED)
+    make_rows = make_comments
+
+    def test_offer_comments_queries_do_not_grow_with_comments(self):
+        """
+        Test that an offer page uses the same number of queries for 2 and 6 comments
+        """
+        self.assert_constant_queries(self.offer.get_absolute_url())
+
+    def test_profile_comments_queries_do_not_grow_with_comments(self):
+        """
+        Test that a user profile uses the same number of queries for 2 and 6 comments
+        """
+        self.assert_constant_queries(reverse('profile', args=[self.commenter.username]))
+
+    def test_offer_page_shows_likes(self):
+        """
+        Test that the offer page shows the like count, the liker names and the unlike button of liked comments
+        """
+        self.make_comments(1)
+        comment = self.offer.get_comments()[0]
+
+        response = self.client.get(self.offer.get_absolute_url())
+
+        self.assertContains(response, '3 people like this.')
+        self.assertContains(response, 'user, ')
+        self.assertContains(response, 'id="button-like-{0}"'.format(comment.pk))
+        self.assertContains(response, 'Unlike')
+
+
+@override_settings(PAGE_CACHE_ENABLED=True)
+class PageCacheTests(TestCase):
+    """
+    The page cache is swapped for a local memory cache, so the cached pages never outlive a test.
+    """
+    def setUp(self):
+        self.old_cache = page_cache.cache
+        page_cache.cache = get_cache('django.core.cache.backends.locmem.LocMemCache')
+
+        self.offer = mommy.make(Offer, status=Offer.PUBLISHED)
+        self.user = User.objects.create_user('user', 'test@example.com', 'pass')
+
+    def tearDown(self):
+        page_cache.cache = self.old_cache
+
+    def count_queries(self, url, **headers):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, **headers)
+        return response, len(context.captured_queries)
+
+    def test_anonymous_pages_are_cached(self):
+        """
+        Test that the second anonymous request of a page is served from the cache with fewer queries
+        """
+        for url in [reverse('home'), self.offer.get_absolute_url(), reverse('offer:providers'),
+                    self.offer.provider.get_absolute_url()]:
+            first, rendered_queries = self.count_queries(url)
+            second, cached_queries = self.count_queries(url)
+
+            self.assertEqual(second.status_code, 200)
+            self.assertEqual(second.content, first.content)
+            self.assertEqual(second['ETag'], first['ETag'])
+            self.assertLess(cached_queries, rendered_queries)
+
+    def test_lists_are_served_without_queries(self):
+        """
+        Test that the cached lists of offers and providers are served without reading the offers or providers
+        """
+        for url in [reverse('home'), reverse('offer:providers')]:
+            self.client.get(url)
+            response, cached_queries = self.count_queries(url)
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(cached_queries, 0)
+
+    def test_changes_change_the_lists(self):
+        """
+        Test that saving an offer or a provider, or commenting on an offer, changes the lists
+        """
+        for url in [reverse('home'), reverse('offer:providers')]:
+            etag = self.client.get(url)['ETag']
+            for change in [
+                lambda: mommy.make(Comment, offer=self.offer, status=Comment.PUBLISHED),
+                lambda: self.offer.save(),
+                lambda: self.offer.provider.save(),
+            ]:
+                change()
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 200)
+                etag = response['ETag']
+
+    def test_rerendering_changes_the_lists(self):
+        """
+        Test that re-rendering the offers changes the lists, although it doesn't send the signals of the offers
+        """
+        Offer.objects.filter(pk=self.offer.pk).update(rendered_version='old')
+        etag = self.client.get(reverse('home'))['ETag']
+
+        call_command('rerender_offers', stdout=StringIO())
+        response = self.client.get(reverse('home'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_saving_changes_the_page(self):
+        """
+        Test that saving an offer or commenting on it changes its cached page
+        """
+        url = self.offer.get_absolute_url()
+        etag = self.client.get(url)['ETag']
+
+        self.offer.name = 'A new name'
+        self.offer.save()
+        response = self.client.get(url)
+        self.assertContains(response, 'A new name')
+        self.assertNotEqual(response['ETag'], etag)
+
+        etag = response['ETag']
+        mommy.make(Comment, offer=self.offer, status=Comment.PUBLISHED, bbcode_content='A new comment')
+        response = self.client.get(url)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertContains(response, 'A new comment')
+
+    def test_rerendering_changes_the_page(self):
+        """
+        Test that re-rendering an offer changes its cached page, although it doesn't change the dates of the offer
+        """
+        Offer.objects.filter(pk=self.offer.pk).update(rendered_version='old')
+        url = self.offer.get_absolute_url()
+        etag = self.client.get(url)['ETag']
+
+        call_command('rerender_offers', stdout=StringIO())
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_headers_are_cached(self):
+        """
+        Test that a cached response keeps the headers of the rendered response
+        """
+        def render():
+            response = HttpResponse('Content', content_type='text/plain')
+            response['Vary'] = 'Accept-Language'
+            return response
+
+        request = RequestFactory().get('/')
+        page_cache.get_cached_response(request, 'headers', ([1], None), render)
+        response = page_cache.get_cached_response(request, 'headers', ([1], None), lambda: self.fail('Rendered again'))
+
+        self.assertEqual(response.content, 'Content')
+        self.assertEqual(response['Content-Type'], 'text/plain')
+        self.assertEqual(response['Vary'], 'Accept-Language')
+
+    def test_not_modified(self):
+        """
+        Test that a conditional request for an unchanged page is answered without rendering it
+        """
+        response = self.client.get(reverse('home'))
+        self.assertTrue(response.has_header('Last-Modified'))
+
+        response = self.client.get(reverse('home'), HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, '')
+
+        response = self.client.get(reverse('home'), HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+
+        etag = response['ETag']
+        mommy.make(Offer, status=Offer.PUBLISHED)
+        response = self.client.get(reverse('home'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_authenticated_pages_are_not_cached(self):
+        """
+        Test that the pages of logged in users are rendered for them
+        """
+        self.client.login(username='user', password='pass')
+        response = self.client.get(self.offer.get_absolute_url())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('ETag'))
+        self.assertContains(response, 'Add a comment')
+
+    def test_missing_pages_are_not_cached(self):
+        """
+        Test that a page of an offer that is not visible is a 404
+        """
+        self.offer.status = Offer.UNPUBLISHED
+        self.offer.save()
+
+        self.assertEqual(self.client.get(self.offer.get_absolute_url()).status_code, 404)
+
+
+@override_settings(PAGE_CACHE_ENABLED=True)
+class FeedTests(TestCase):
+    """
+    The feed cache is swapped for a local memory cache, so the cached feeds never outlive a test.
+    """
+    def setUp(self):
+        self.old_cache = page_cache.cache
+        page_cache.cache = get_cache('django.core.cache.backends.locmem.LocMemCache')
+
+        self.provider = mommy.make(Provider)
+        self.offer = mommy.make(Offer, status=Offer.PUBLISHED, provider=self.provider)
+        self.other_offer = mommy.make(Offer, status=Offer.PUBLISHED)
+
+    def tearDown(self):
+        page_cache.cache = self.old_cache
+
+    def count_queries(self, url, **headers):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, **headers)
+        return response, len(context.captured_queries)
+
+    def test_feeds_are_cached(self):
+        """
+        Test that an unchanged feed is served from the cache without queries
+        """
+        for url in [reverse('offer:rss'), reverse('offer:atom')]:
+            first, rendered_queries = self.count_queries(url)
+            second, cached_queries = self.count_queries(url)
+
+            self.assertContains(first, self.offer.name)
+            self.assertEqual(second.content, first.content)
+            self.assertEqual(second['Content-Type'], first['Content-Type'])
+            self.assertEqual(cached_queries, 0)
+            self.assertLess(cached_queries, rendered_queries)
+
+    def test_updating_an_offer_changes_the_feed(self):
+        """
+        Test that the feed shows an updated or newly published offer
+        """
+        self.client.get(reverse('offer:rss'))
+
+        self.offer.name = 'A new name'
+        self.offer.save()
+        self.assertContains(self.client.get(reverse('offer:rss')), 'A new name')
+
+        offer = mommy.make(Offer, status=Offer.UNPUBLISHED)
+        self.assertNotContains(self.client.get(reverse('offer:rss')), offer.name)
+        offer.status = Offer.PUBLISHED
+        offer.save()
+        self.assertContains(self.client.get(reverse('offer:rss')), offer.name)
+
+    def test_not_modified(self):
+        """
+        Test that a reader that has the current feed gets a 304
+        """
+        response = self.client.get(reverse('offer:rss'))
+
+        response = self.client.get(reverse('offer:rss'), HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+        response = self.client.get(reverse('offer:rss'), HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_provider_feeds(self):
+        """
+        Test that the feeds of a provider only show the offers of that provider
+        """
+        for name in ['offer:provider_rss', 'offer:provider_atom']:
+            response = self.client.get(reverse(name, args=[self.provider.name_slug]))
+
+            self.assertContains(response, self.offer.name)
+            self.assertNotContains(response, self.other_offer.name)
+            self.assertContains(response, self.provider.name)
+
+        self.assertEqual(self.client.get(reverse('offer:provider_rss', args=['missing'])).status_code, 404)
+
+    def test_provider_feeds_follow_their_provider(self):
+        """
+        Test that the feed of a provider changes with the provider and with its offers
+        """
+        url = reverse('offer:provider_rss', args=[self.provider.name_slug])
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.provider.name = u'Renamed Hosting'
+        self.provider.save()
+        response = self.client.get(reverse('offer:provider_rss', args=[self.provider.name_slug]))
+        self.assertContains(response, u'Renamed Hosting')
+
+        etag = response['ETag']
+        self.offer.name = u'A new name'
+        self.offer.save()
+        response = self.client.get(reverse('offer:provider_rss', args=[self.provider.name_slug]),
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertContains(response, u'A new name')
+
+
 class PlanListViewTests(TestCase):
     def setUp(self):
         self.providers = mommy.make(Provider, _quantity=30)
@@ -515,6 +901,27 @@ class ProviderAdminRequestViewTests(TestCase):
 
         self.assertNotContains(response, self.provider.name)
 
+    def test_queue_status(self):
+        """
+        Test that the queue status shows the position of the ready requests of the provider in the publish queue
+        """
+        mommy.make(Offer, _quantity=2, is_request=True, status=Offer.UNPUBLISHED, is_ready=True)
+        self.client.get(reverse('offer:admin_request_mark', args=[self.offer.pk]))
+
+        response = self.client.get(reverse('offer:admin_requests_queue'))
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+
+        self.assertEqual(data["queue_length"], 3)
+        self.assertEqual(len(data["requests"]), 1)
+        self.assertEqual(data["requests"][0]["id"], self.offer.pk)
+        self.assertEqual(data["requests"][0]["queue_position"], 3)
+
+        self.client.get(reverse('offer:admin_request_mark', args=[self.offer.pk]))
+        data = json.loads(self.client.get(reverse('offer:admin_requests_queue')).content)
+        self.assertEqual(data["queue_length"], 2)
+        self.assertIsNone(data["requests"][0]["queue_position"])
+
 
 class ProviderAdminOfferViewTests(TestCase):
     def setUp(self):
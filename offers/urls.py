@@ -1,7 +1,8 @@
 from django.conf.urls import patterns, url, include
-from haystack.views import search_view_factory, SearchView
-from offers.feeds import OfferFeed, OfferAtomFeed
+from haystack.views import search_view_factory
+from offers.feeds import OfferFeed, OfferAtomFeed, ProviderOfferFeed, ProviderOfferAtomFeed
 from offers.forms import OfferSearchForm
+from offers.views import OfferSearchView
 
 
 urlpatterns = patterns('offers.views',
@@ -10,23 +11,29 @@ urlpatterns = patterns('offers.views',
     url(r'^comment/like/(?P<comment_pk>\d+)/', 'like_comment', name="like"),
 
     url(r'^search/$', search_view_factory(
-            view_class=SearchView,
+            view_class=OfferSearchView,
             form_class=OfferSearchForm,
             template='offers/search.html',
             results_per_page=8,
+            # The results are rendered from the search documents
+            load_all=False,
         ),
         name='search',
     ),
+    url(r'^search/autocomplete/$', 'autocomplete', name='autocomplete'),
 
     url(r'^feed/', OfferFeed(), name='rss'),
     url(r'^atom/', OfferAtomFeed(), name='atom'),
 
     url(r'^providers/$', 'provider_list', name='providers'),
     url(r'^provider/(?P<provider_name>[-\w]+)/$', 'provider_profile', name='provider'),
+    url(r'^provider/(?P<provider_name>[-\w]+)/feed/$', ProviderOfferFeed(), name='provider_rss'),
+    url(r'^provider/(?P<provider_name>[-\w]+)/atom/$', ProviderOfferAtomFeed(), name='provider_atom'),
 
     url(r'^manage/$', 'admin_provider_home', name="admin_home"),
 
     url(r'^manage/requests/$', 'admin_provider_requests', name="admin_requests"),
+    url(r'^manage/requests/queue/$', 'admin_provider_queue', name="admin_requests_queue"),
     url(r'^manage/request/$', 'admin_submit_request', name="admin_request_new"),
     url(r'^manage/request/(?P<offer_pk>\d+)/$', 'admin_edit_request', name="admin_request_edit"),
     url(r'^manage/request/(?P<offer_pk>\d+)/delete/$', 'admin_provider_delete_confirm', name="admin_request_delete"),
@@ -1,8 +1,8 @@
 from django.shortcuts import render, get_object_or_404
 from django.core.urlresolvers import reverse
-from django.http import HttpResponse, HttpResponseRedirect, HttpResponseNotFound
-from offers.models import Offer, Comment, Provider, Plan, Location, Datacenter, Like
-from django.db.models import Q
+from django.http import HttpResponse, HttpResponseRedirect, HttpResponseNotFound, HttpResponseBadRequest
+from offers.models import Offer, Comment, CommentThread, Provider, Plan, Location, Datacenter, Like
+from django.db.models import Q, Max
 from offers.forms import (
     CommentForm,
     OfferForm,
@@ -15,6 +15,16 @@ from offers.forms import (
 )
 from offers.emailers import send_comment_reply, send_comment_new, send_comment_liked, send_comment_unliked
 from offers.decorators import user_is_provider
+from offers.page_cache import (
+    cache_anonymous_page,
+    list_offers_version,
+    view_offer_version,
+    provider_list_version,
+    provider_profile_version,
+)
+from offers.plan_index import plan_index, PlanQuery, get_facets
+from offers.api import PlanSearchResource
+from offers.autocomplete import get_suggestions
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
@@ -24,12 +34,15 @@ from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
 import reversion
+from django.template import Context
 from django.template.loader import render_to_string
+from haystack.views import SearchView
 import json
 
 logger = logging.getLogger(__name__)
 
 
+@cache_anonymous_page(view_offer_version)
 def view_offer(request, offer_pk, slug=None):
     """
     The view that displays an offer. This view is only accessible if the offer exists and the offer status
@@ -80,6 +93,7 @@ def view_offer(request, offer_pk, slug=None):
 
     return render(request, 'offers/view.html', {
         "offer": offer,
+        "comments": CommentThread.for_offer(offer, request.user),
         "form": form,
     })
 
@@ -109,11 +123,12 @@ def like_comment(request, comment_pk):
     }), content_type='application/json')
 
 
+@cache_anonymous_page(list_offers_version)
 def list_offers(request, page_number=1):
     """
     Displays a list of all visible offers. Paginated for better loading times.
     """
-    offer_list = Offer.visible_offers.all()
+    offer_list = Offer.visible_offers.with_listing_data()
     paginator = Paginator(offer_list, 5)
 
     try:
@@ -121,12 +136,14 @@ def list_offers(request, page_number=1):
     except EmptyPage:
         # If page is out of range (e.g. 9999), deliver last page of results.
         offers = paginator.page(paginator.num_pages)
+    request.result_size = len(offers.object_list)
 
     next_offer = timezone.now() + timedelta(seconds=settings.PUBLISH_SCHEDULE.is_due(timezone.now())[1])
 
     return render(request, 'offers/list.html', {"offers": offers, "next_offer_date": next_offer})
 
 
+@cache_anonymous_page(provider_list_version)
 def provider_list(request):
     """
     Displays a list of all providers
@@ -138,12 +155,13 @@ def provider_list(request):
     })
 
 
+@cache_anonymous_page(provider_profile_version)
 def provider_profile(request, provider_name):
     """
     Displays the profile of a provider, including recent offers
     """
     provider = get_object_or_404(Provider, name_slug=provider_name)
-    offer_list = Offer.visible_offers.for_provider(provider)
+    offer_list = Offer.visible_offers.with_listing_data().filter(provider=provider)
 
     paginator = Paginator(offer_list, 5)
     page = request.GET.get('page')
@@ -155,6 +173,7 @@ def provider_profile(request, provider_name):
     except EmptyPage:
         # If page is out of range (e.g. 9999), deliver last page of results.
         offers = paginator.page(paginator.num_pages)
+    request.result_size = len(offers.object_list)
 
     return render(request, "offers/provider.html", {
         "provider": provider,
@@ -258,6 +277,28 @@ def admin_provider_requests(request):
     return render(request, 'offers/manage/requests.html', {"requests": requests})
 
 
+@user_is_provider
+def admin_provider_queue(request):
+    """
+    The place of the requests of the provider in the publish queue, as json
+    """
+    requests = Offer.requests.for_user(request.user).order_by('-created_at').values_list(
+        'pk', 'name', 'is_ready', 'readied_at', 'queue_rank'
+    )
+    queue_length = Offer.objects.aggregate(queue_length=Max('queue_rank'))["queue_length"] or 0
+
+    return HttpResponse(json.dumps({
+        "queue_length": queue_length,
+        "requests": [{
+            "id": pk,
+            "name": name,
+            "is_ready": is_ready,
+            "readied_at": readied_at.isoformat() if is_ready else None,
+            "queue_position": queue_rank,
+        } for pk, name, is_ready, readied_at, queue_rank in requests],
+    }), content_type='application/json')
+
+
 @user_is_provider
 def admin_mark_request(request, offer_pk):
     offer = get_object_or_404(
@@ -477,3 +518,117 @@ def plan_finder(request):
         "billing_times": billing_times,
         "server_types": server_types,
     })
+
+
+def plan_index_search(request):
+    """
+    The plan finder search, answered from the in memory plan index. It takes the same filters, ordering and
+    pagination parameters as the plan api and returns the same structure.
+    """
+    try:
+        query = PlanQuery.from_params(request.GET, default_limit=20)
+    except ValueError as e:
+        return HttpResponseBadRequest(json.dumps({"error": unicode(e)}), content_type='application/json')
+
+    total, plan_ids = plan_index.search(query)
+
+    plans = Plan.objects.filter(pk__in=plan_ids).select_related('offer__provider').prefetch_related(
+        'locations__datacenter'
+    ).in_bulk(plan_ids)
+
+    template = PlanSearchResource.get_listing_template()
+    objects = []
+    for plan_id in plan_ids:
+        if plan_id in plans:
+            objects.append({
+                "id": plan_id,
+                "html": template.render(Context({"plan": plans[plan_id]})),
+            })
+    request.result_size = len(objects)
+
+    def page_url(offset):
+        params = request.GET.copy()
+        params["offset"] = offset
+        params["limit"] = query.limit
+        return u"{0}?{1}".format(request.path, params.urlencode())
+
+    previous_url = None
+    if query.offset > 0:
+        previous_url = page_url(max(query.offset - query.limit, 0))
+
+    next_url = None
+    if query.offset + query.limit < total:
+        next_url = page_url(query.offset + query.limit)
+
+    return HttpResponse(json.dumps({
+        "meta": {
+            "limit": query.limit,
+            "offset": query.offset,
+            "total_count": total,
+            "previous": previous_url,
+            "next": next_url,
+        },
+        "objects": objects,
+    }), content_type='application/json')
+
+
+def plan_facets(request):
+    """
+    The number of matching plans for every country, provider, datacenter, billing time and server type, and the
+    range of every numeric field, for the filters of the plan finder.
+    """
+    try:
+        query = PlanQuery.from_params(request.GET)
+    except ValueError as e:
+        return HttpResponseBadRequest(json.dumps({"error": unicode(e)}), content_type='application/json')
+
+    facets = get_facets(query)
+    return HttpResponse(json.dumps(facets), content_type='application/json')
+
+
+def autocomplete(request):
+    """
+    The offer and provider suggestions for the text typed in the search box (``q``), ``limit`` of each
+    """
+    try:
+        limit = int(request.GET.get('limit') or 0)
+    except ValueError:
+        return HttpResponseBadRequest(json.dumps({"error": "Invalid limit"}), content_type='application/json')
+
+    suggestions = get_suggestions(request.GET.get('q', ''), max(limit, 0))
+    return HttpResponse(json.dumps(suggestions), content_type='application/json')
+
+
+class OfferSearchView(SearchView):
+    """
+    The offer search. The results are rendered from the stored fields of the search documents, so the offers are not
+    loaded, and every facet value links to the search with its filter toggled.
+    """
+    FACET_PARAMETERS = (
+        ('country', 'locations__country'),
+        ('server_type', 'server_type'),
+    )
+
+    def build_page(self):
+        paginator, page = super(OfferSearchView, self).build_page()
+        self.request.result_size = len(page.object_list)
+        return paginator, page
+
+    def extra_context(self):
+        facets = {}
+        for field, parameter in self.FACET_PARAMETERS:
+            facets[field] = []
+            for value in self.form.facets.get(field, []):
+                params = self.request.GET.copy()
+                params.pop('page', None)
+                selected = params.get(parameter) == value["value"]
+                if selected:
+                    params.pop(parameter)
+                else:
+                    params[parameter] = value["value"]
+                facets[field].append(dict(value, selected=selected, url=u"?{0}".format(params.urlencode())))
+
+        return {
+            "facets": facets,
+            "filtered": self.form.has_filters(),
+        }
@@ -1,6 +1,11 @@
+from collections import OrderedDict
+import hashlib
+import threading
+import time
+import markdown
 from markdown import Markdown
 
-markdown_converter = Markdown(extensions=[
+MARKDOWN_EXTENSIONS = [
     # Extensions
     'abbr',
     'attr_list',
@@ -11,4 +16,144 @@ markdown_converter = Markdown(extensions=[
     # Others
     'codehilite',
     'nl2br'
-], safe_mode="escape")
+]
+
+MARKDOWN_SAFE_MODE = "escape"
+
+# Bump this when the output of the renderer changes in a way the version stamp below cannot see
+RENDERER_REVISION = 2
+
+# The stamp stored next to pre-rendered content. It changes whenever the extensions, the safe mode or the markdown
+# library change, which marks all the stored content as stale.
+RENDERER_VERSION = hashlib.md5(repr((
+    RENDERER_REVISION,
+    markdown.version,
+    MARKDOWN_EXTENSIONS,
+    MARKDOWN_SAFE_MODE,
+))).hexdigest()[:16]
+
+
+class MarkdownConverter(object):
+    """
+    A thread safe markdown converter. ``Markdown`` instances keep state between conversions, so every thread gets its
+    own instance which is reset after each use. Recently converted texts are memoized by the hash of their content.
+    """
+    def __init__(self, extensions=None, safe_mode=MARKDOWN_SAFE_MODE, memo_size=256):
+        self.extensions = list(MARKDOWN_EXTENSIONS if extensions is None else extensions)
+        self.safe_mode = safe_mode
+        self.memo_size = memo_size
+
+        self._local = threading.local()
+        self._memo = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {}
+        self.reset_stats()
+
+    def _get_markdown(self):
+        """
+        Returns the Markdown instance of the current thread
+        """
+        converter = getattr(self._local, 'markdown', None)
+        if converter is None:
+            converter = Markdown(extensions=self.extensions, safe_mode=self.safe_mode)
+            self._local.markdown = converter
+        return converter
+
+    @staticmethod
+    def _reset_markdown(converter):
+        """
+        Resets the instance after a conversion. The abbr extension registers an inline pattern for every abbreviation
+        it finds and doesn't remove them on reset, so they are removed here.
+        """
+        converter.reset()
+        for key in list(converter.inlinePatterns.keys()):
+            if key.startswith('abbr-'):
+                del converter.inlinePatterns[key]
+
+    @staticmethod
+    def get_hash(text):
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+    def _get_memo(self, key):
+        with self._lock:
+            html = self._memo.pop(key, None)
+            if html is not None:
+                # Move the key to the most recently used end
+                self._memo[key] = html
+            return html
+
+    def _set_memo(self, key, html):
+        if self.memo_size <= 0:
+            return
+        with self._lock:
+            self._memo.pop(key, None)
+            self._memo[key] = html
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+
+    def _record(self, elapsed, memo_hit):
+        with self._lock:
+            self._stats["calls"] += 1
+            self._stats["total_time"] += elapsed
+            self._stats["max_time"] = max(self._stats["max_time"], elapsed)
+            if memo_hit:
+                self._stats["memo_hits"] += 1
+            else:
+                self._stats["renders"] += 1
+
+    def convert_timed(self, text):
+        """
+        Converts the markdown text to html.
+
+        :return: The html and the time the conversion took in seconds
+        :rtype: tuple
+        """
+        start = time.time()
+        key = self.get_hash(text)
+
+        html = self._get_memo(key)
+        memo_hit = html is not None
+        if not memo_hit:
+            converter = self._get_markdown()
+            try:
+                html = converter.convert(text)
+            finally:
+                self._reset_markdown(converter)
+            self._set_memo(key, html)
+
+        elapsed = time.time() - start
+        self._record(elapsed, memo_hit)
+        return html, elapsed
+
+    def convert(self, text):
+        return self.convert_timed(text)[0]
+
+    def get_stats(self):
+        """
+        Returns the number of calls, memo hits and renders and the total and maximum time spent converting
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memo_entries"] = len(self._memo)
+        stats["average_time"] = stats["total_time"] / stats["calls"] if stats["calls"] else 0.0
+        return stats
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {
+                "calls": 0,
+                "memo_hits": 0,
+                "renders": 0,
+                "total_time": 0.0,
+                "max_time": 0.0,
+            }
+
+    def clear(self):
+        """
+        Empties the memo of recently converted texts
+        """
+        with self._lock:
+            self._memo.clear()
+
+
+markdown_converter = MarkdownConverter()
@@ -0,0 +1,193 @@
+"""
+Rendering of the live markdown preview of the offer editor.
+
+A document is split into its top level blocks, which are rendered separately and joined. Rendered documents are kept
+in the cache by the hash of their content, so the editor can send the hash of a document it sent before together
+with the changes to it instead of the full document, and only the blocks that changed are rendered again.
+"""
+import hashlib
+import re
+import time
+from django.core.cache import cache
+from template_helpers.converters import markdown_converter
+
+# How long a rendered document is remembered
+PREVIEW_CACHE_TIMEOUT = 60 * 60
+
+LIST_ITEM_RE = re.compile(r'^\s{0,3}([*+-]|\d+\.)\s')
+FENCE_RE = re.compile(r'^(~{3,}|`{3,})')
+
+# Reference links and abbreviations are defined in one block and used in others, documents that have them can't be
+# rendered block by block
+REFERENCE_RE = re.compile(r'^\s{0,3}\*?\[[^\]]+\]:', re.MULTILINE)
+
+
+class PreviewError(Exception):
+    pass
+
+
+class UnknownDocument(PreviewError):
+    """
+    The hash of the document isn't known (anymore), the full document has to be sent
+    """
+    pass
+
+
+def get_hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def get_cache_key(document_hash):
+    return "markdown-preview-{0}".format(document_hash)
+
+
+def split_blocks(text):
+    """
+    Splits a markdown document into the top level blocks that can be rendered separately. Blocks are separated by blank
+    lines, but indented lines, list items following a list and the content of fenced code belong to the block before
+    them.
+
+    :rtype: list
+    """
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    if REFERENCE_RE.search(text):
+        return [text] if text.strip() else []
+
+    blocks = []
+    lines = []
+    fence = None
+    blank_lines = 0
+
+    for line in text.split('\n'):
+        if fence is None and not line.strip():
+            blank_lines += 1
+            continue
+
+        if lines and blank_lines and fence is None:
+            continues_block = line[0] in ' \t' or (LIST_ITEM_RE.match(lines[0]) and LIST_ITEM_RE.match(line))
+            if not continues_block:
+                blocks.append('\n'.join(lines))
+                lines = []
+
+        if lines:
+            lines.extend([''] * blank_lines)
+        blank_lines = 0
+        lines.append(line)
+
+        if fence is None:
+            match = FENCE_RE.match(line)
+            if match:
+                fence = match.group(1)
+        elif line.startswith(fence) and not line[len(fence):].strip():
+            fence = None
+
+    if lines:
+        blocks.append('\n'.join(lines))
+    return blocks
+
+
+def apply_changes(text, changes):
+    """
+    Applies a change sent by the editor to a document. The change replaces ``text[start:end]`` with ``text``. The
+    editor counts in UTF-16 code units like every JavaScript string, where a character outside of the basic
+    multilingual plane (such as an emoji) is two units, so the offsets are applied to the UTF-16 encoded document.
+
+    :param changes: A dict with start, end and text
+    :rtype: unicode
+    """
+    try:
+        start = int(changes["start"])
+        end = int(changes["end"])
+        inserted = changes["text"]
+    except (KeyError, TypeError, ValueError):
+        raise PreviewError("Invalid changes!")
+
+    encoded = text.encode('utf-16-le')
+    if not 0 <= start <= end <= len(encoded) // 2 or not isinstance(inserted, basestring):
+        raise PreviewError("Invalid changes!")
+
+    try:
+        return encoded[:start * 2].decode('utf-16-le') + inserted + encoded[end * 2:].decode('utf-16-le')
+    except UnicodeDecodeError:
+        # The change splits a surrogate pair
+        raise PreviewError("Invalid changes!")
+
+
+def render_document(text, base=None):
+    """
+    Renders a document block by block. Blocks that were already rendered in the base document are not rendered again.
+
+    :param base: A rendered document as stored in the cache
+    :return: The rendered document and the number of blocks that were rendered
+    :rtype: tuple
+    """
+    rendered_blocks = dict(base["blocks"]) if base else {}
+    blocks = []
+    render_count = 0
+
+    for block in split_blocks(text):
+        block_hash = get_hash(block)
+        html = rendered_blocks.get(block_hash)
+        if html is None:
+            html = markdown_converter.convert(block)
+            rendered_blocks[block_hash] = html
+            render_count += 1
+        blocks.append((block_hash, html))
+
+    document = {
+        "markdown": text,
+        "blocks": blocks,
+        "html": "\n".join(html for block_hash, html in blocks),
+    }
+    return document, render_count
+
+
+def get_document(document_hash):
+    document = cache.get(get_cache_key(document_hash))
+    if document is None:
+        raise UnknownDocument("Unknown document, send the full markdown!")
+    return document
+
+
+def render_preview(markdown=None, document_hash=None, base_hash=None, changes=None):
+    """
+    Renders the preview of a document. The document is either the full markdown, the hash of a document that was
+    rendered before, or the hash of an earlier document together with the changes to it. The blocks of the earlier
+    document are reused when it is still known.
+
+    :return: The html, the hash of the document and render statistics
+    :rtype: dict
+    """
+    start = time.time()
+    base = None
+    cached = False
+
+    if markdown is not None:
+        document_hash = get_hash(markdown)
+        if base_hash is not None:
+            base = cache.get(get_cache_key(base_hash))
+    elif base_hash is not None and changes is not None:
+        base = get_document(base_hash)
+        markdown = apply_changes(base["markdown"], changes)
+        document_hash = get_hash(markdown)
+    elif document_hash is None:
+        raise PreviewError("No markdown sent!")
+
+    document = cache.get(get_cache_key(document_hash))
+    if document is not None:
+        cached = True
+        render_count = 0
+    elif markdown is None:
+        raise UnknownDocument("Unknown document, send the full markdown!")
+    else:
+        document, render_count = render_document(markdown, base)
+        cache.set(get_cache_key(document_hash), document, PREVIEW_CACHE_TIMEOUT)
+
+    return {
+        "html": document["html"],
+        "hash": document_hash,
+        "cached": cached,
+        "blocks": len(document["blocks"]),
+        "rendered_blocks": render_count,
+        "render_time": round((time.time() - start) * 1000, 3),
+    }
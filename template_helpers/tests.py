@@ -6,6 +6,13 @@ Replace this with more appropriate tests for your application.
 """
 
 from django.test import TestCase
+from django.core.cache import get_cache
+from django.core.urlresolvers import reverse
+from template_helpers.converters import MarkdownConverter
+from template_helpers import previews
+import threading
+import json
+import re
 
 
 class SimpleTest(TestCase):
@@ -14,3 +21,228 @@ class SimpleTest(TestCase):
         Tests that 1 + 1 always equals 2.
         """
         self.assertEqual(1 + 1, 2)
+
+
+class MarkdownConverterTests(TestCase):
+    def setUp(self):
+        self.converter = MarkdownConverter(memo_size=2)
+
+    def test_convert(self):
+        """
+        Test that markdown is converted to html and unsafe html is escaped
+        """
+        self.assertEqual(self.converter.convert(u'**Bold**'), u'<p><strong>Bold</strong></p>')
+        self.assertEqual(self.converter.convert(u'<script>'), u'<p>&lt;script&gt;</p>')
+
+    def test_converter_is_reset_between_calls(self):
+        """
+        Test that the state of one conversion doesn't leak into the next one
+        """
+        self.converter.convert(u'Text with an abbreviation HTML\n\n*[HTML]: Hyper Text Markup Language')
+
+        self.assertEqual(self.converter.convert(u'HTML'), u'<p>HTML</p>')
+
+    def test_memoization(self):
+        """
+        Test that recently converted texts are not rendered again
+        """
+        self.converter.convert(u'First')
+        self.converter.convert(u'First')
+        self.converter.convert(u'Second')
+        self.converter.convert(u'Third')
+        self.converter.convert(u'First')
+
+        stats = self.converter.get_stats()
+        self.assertEqual(stats["calls"], 5)
+        self.assertEqual(stats["memo_hits"], 1)
+        self.assertEqual(stats["renders"], 4)
+        self.assertEqual(stats["memo_entries"], 2)
+
+    def test_timing(self):
+        """
+        Test that the time spent converting is recorded
+        """
+        html, elapsed = self.converter.convert_timed(u'Text')
+
+        self.assertEqual(html, u'<p>Text</p>')
+        self.assertGreaterEqual(elapsed, 0)
+        self.assertGreaterEqual(self.converter.get_stats()["total_time"], elapsed)
+
+        self.converter.reset_stats()
+        self.assertEqual(self.converter.get_stats()["calls"], 0)
+
+    def test_threads_use_their_own_instance(self):
+        """
+        Test that concurrent conversions in different threads give the same results as serial ones
+        """
+        converter = MarkdownConverter(memo_size=0)
+        texts = [u'Text {0} with HTML\n\n*[HTML]: Hyper Text Markup Language'.format(i) for i in range(20)]
+        expected = [converter.convert(text) for text in texts]
+        results = {}
+
+        def convert_all(name):
+            results[name] = [converter.convert(text) for text in texts]
+
+        threads = [threading.Thread(target=convert_all, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for result in results.values():
+            self.assertEqual(result, expected)
+
+
+class MarkdownPreviewTests(TestCase):
+    document = u"\n\n".join([
+        u"# Offer",
+        u"Some **text**\nover two lines",
+        u"* First\n* Second\n\n* Third\n\n    Indented paragraph",
+        u"```\ncode\n\nmore code\n```",
+        u"| A | B |\n|---|---|\n| 1 | 2 |",
+        u"Last paragraph",
+    ])
+
+    def setUp(self):
+        self.old_cache = previews.cache
+        previews.cache = get_cache('django.core.cache.backends.locmem.LocMemCache', LOCATION='preview-tests')
+        previews.cache.clear()
+        self.url = reverse('helper:markdown-to-html')
+
+    def tearDown(self):
+        previews.cache = self.old_cache
+
+    def assertHtmlEqual(self, html, text):
+        """
+        Compares the html with the document rendered at once. Markdown adds blank lines after fenced code, which are
+        ignored
+        """
+        self.assertEqual(re.sub(r'\n+', '\n', html), re.sub(r'\n+', '\n', MarkdownConverter().convert(text)))
+
+    def post(self, **data):
+        if "changes" in data:
+            data["changes"] = json.dumps(data["changes"])
+        return json.loads(self.client.post(self.url, data).content)
+
+    def test_split_blocks(self):
+        """
+        Test that a document is split on blank lines outside of lists, indented blocks and fenced code
+        """
+        blocks = previews.split_blocks(self.document)
+
+        self.assertEqual(len(blocks), 6)
+        self.assertEqual(blocks[3], u"```\ncode\n\nmore code\n```")
+
+    def test_blocks_render_like_the_full_document(self):
+        """
+        Test that rendering a document block by block gives the same html as rendering it at once
+        """
+        document, render_count = previews.render_document(self.document)
+
+        self.assertHtmlEqual(document["html"], self.document)
+        self.assertEqual(render_count, 6)
+
+    def test_references_are_rendered_at_once(self):
+        """
+        Test that documents with reference links are not split
+        """
+        document = u"A [link][1]\n\n[1]: http://example.com"
+
+        self.assertEqual(previews.split_blocks(document), [document])
+
+    def test_full_markdown(self):
+        """
+        Test that the full markdown is rendered and the hash and render time are returned
+        """
+        response = self.post(markdown=u"**Bold**")
+
+        self.assertIsNone(response["error"])
+        self.assertEqual(response["html"], u"<p><strong>Bold</strong></p>")
+        self.assertEqual(response["hash"], previews.get_hash(u"**Bold**"))
+        self.assertFalse(response["cached"])
+        self.assertIn("render_time", response)
+
+    def test_no_markdown(self):
+        """
+        Test that an error is returned when nothing is sent
+        """
+        response = self.post()
+
+        self.assertEqual(response["error"], "No markdown sent!")
+        self.assertIsNone(response["html"])
+
+    def test_known_hash(self):
+        """
+        Test that a document that was rendered before is returned from the cache by its hash
+        """
+        document_hash = self.post(markdown=self.document)["hash"]
+
+        response = self.post(hash=document_hash)
+
+        self.assertTrue(response["cached"])
+        self.assertEqual(response["rendered_blocks"], 0)
+        self.assertHtmlEqual(response["html"], self.document)
+
+    def test_unknown_hash(self):
+        """
+        Test that the full markdown is requested for unknown hashes
+        """
+        response = self.post(hash='unknown')
+
+        self.assertTrue(response["missing"])
+        self.assertIsNone(response["html"])
+
+        response = self.post(base_hash='unknown', changes={"start": 0, "end": 0, "text": u"a"})
+
+        self.assertTrue(response["missing"])
+
+    def test_incremental_update(self):
+        """
+        Test that only the changed blocks are rendered when changes are sent
+        """
+        base_hash = self.post(markdown=self.document)["hash"]
+        start = self.document.index(u"Last paragraph")
+        changed = self.document[:start] + u"Last *changed* paragraph"
+
+        response = self.post(base_hash=base_hash, changes={
+            "start": start,
+            "end": len(self.document),
+            "text": u"Last *changed* paragraph",
+        })
+
+        self.assertIsNone(response["error"])
+        self.assertEqual(response["hash"], previews.get_hash(changed))
+        self.assertEqual(response["blocks"], 6)
+        self.assertEqual(response["rendered_blocks"], 1)
+        self.assertHtmlEqual(response["html"], changed)
+
+    def test_changes_count_utf16_code_units(self):
+        """
+        Test that the offsets of the changes count a character outside of the basic multilingual plane as two units,
+        like the editor does
+        """
+        document = u"Smile \U0001F600 please\n\nSecond paragraph"
+        base_hash = self.post(markdown=document)["hash"]
+
+        # "please" starts at unit 9 in the editor: 6 for "Smile ", 2 for the emoji and 1 for the space
+        response = self.post(base_hash=base_hash, changes={"start": 9, "end": 15, "text": u"now"})
+        changed = u"Smile \U0001F600 now\n\nSecond paragraph"
+        self.assertIsNone(response["error"])
+        self.assertEqual(response["hash"], previews.get_hash(changed))
+        self.assertHtmlEqual(response["html"], changed)
+
+        # A change can't split the emoji
+        response = self.post(base_hash=base_hash, changes={"start": 7, "end": 7, "text": u"a"})
+        self.assertEqual(response["error"], "Invalid changes!")
+
+    def test_invalid_changes(self):
+        """
+        Test that changes outside of the document are refused
+        """
+        base_hash = self.post(markdown=u"Text")["hash"]
+
+        response = self.post(base_hash=base_hash, changes={"start": 2, "end": 10, "text": u"a"})
+        self.assertEqual(response["error"], "Invalid changes!")
+
+        response = self.client.post(self.url, {"base_hash": base_hash, "changes": "not json"})
+        self.assertEqual(json.loads(response.content)["error"], "Invalid changes!")
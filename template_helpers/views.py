@@ -1,9 +1,15 @@
+import json
 from django.views.generic import View
 from braces.views import JSONResponseMixin
-from template_helpers.converters import markdown_converter
+from template_helpers.previews import render_preview, PreviewError, UnknownDocument
 
 
 class MarkdownToHtmlView(JSONResponseMixin, View):
+    """
+    Renders the live preview of the markdown editor. The editor sends either the full ``markdown``, the ``hash`` of a
+    document it sent before, or the ``base_hash`` of a document it sent before with the ``changes`` to it as JSON.
+    When the server doesn't know the hash (anymore) ``missing`` is set and the full markdown has to be sent.
+    """
     def post(self, request, *args, **kwargs):
 
         return_html = {
@@ -11,10 +17,23 @@ class MarkdownToHtmlView(JSONResponseMixin, View):
             "error": None
         }
 
-        if "markdown" not in request.POST:
-            return_html["error"] = "No markdown sent!"
-        else:
-            markdown = request.POST["markdown"]
-            return_html["html"] = markdown_converter.convert(markdown)
+        changes = request.POST.get("changes")
+        try:
+            if changes is not None:
+                changes = json.loads(changes)
+
+            return_html.update(render_preview(
+                markdown=request.POST.get("markdown"),
+                document_hash=request.POST.get("hash"),
+                base_hash=request.POST.get("base_hash"),
+                changes=changes,
+            ))
+        except ValueError:
+            return_html["error"] = "Invalid changes!"
+        except UnknownDocument as e:
+            return_html["error"] = unicode(e)
+            return_html["missing"] = True
+        except PreviewError as e:
+            return_html["error"] = unicode(e)
 
         return self.render_json_response(return_html)